@@ -9,9 +9,184 @@ This script instruments the GCR ABM to show:
 """
 
 import numpy as np
-from gcr_model import GCR_ABM_Simulation, ChannelType
-
-def run_agent_diagnostics(years=20):
+from gcr_model import GCR_ABM_Simulation, ChannelType, ProjectStatus
+
+
+class AgentDecisionTracer:
+    """Observer printing each agent's decisions during tracked years
+
+    Subscribes to the simulation's phase hooks, so the decisions shown are
+    the ones the real step_year loop makes.
+    """
+
+    def __init__(self, track_years):
+        self.track_years = set(track_years)
+        self._before = {}  # Values captured by before_* hooks for the matching after_* hook
+
+    def attach(self, sim: GCR_ABM_Simulation) -> "AgentDecisionTracer":
+        for hook in ("before_adoption", "after_adoption", "before_inflation", "after_inflation",
+                     "before_market", "after_market", "before_initiation", "after_initiation",
+                     "before_audit_mint", "after_audit_mint", "after_cea_policy", "after_cqe"):
+            sim.observe(hook, getattr(self, hook))
+        return self
+
+    # ------------------------------------------------------------------------
+    # 0. Country adoption
+    # ------------------------------------------------------------------------
+
+    def before_adoption(self, sim, year, state):
+        if year not in self.track_years:
+            return
+        print(f"\n{'='*80}")
+        print(f"YEAR {year}")
+        print(f"{'='*80}")
+
+        # State before decisions
+        print(f"\nSystem State:")
+        print(f"  CO2: {sim.co2_level:.2f} ppm")
+        print(f"  Inflation: {sim.global_inflation*100:.2f}%")
+        print(f"  XCR Supply: {sim.total_xcr_supply:.2e}")
+        print(f"  Market Price: ${sim.investor_market.market_price_xcr:.2f}")
+        print(f"  Projects: {sim.projects_broker.projects.total_projects()} total")
+
+    def after_adoption(self, sim, year, state):
+        if year in self.track_years and state["newly_adopted"]:
+            print(f"\n  → Country Adoption Agent: {len(state['newly_adopted'])} countries joined")
+
+    # ------------------------------------------------------------------------
+    # 1. Chaos monkey and inflation correction
+    # ------------------------------------------------------------------------
+
+    def before_inflation(self, sim, year, state):
+        self._before["inflation"] = sim.global_inflation
+
+    def after_inflation(self, sim, year, state):
+        if year not in self.track_years or not state["system_active"]:
+            return
+        old_inflation = self._before["inflation"]
+        shocked = state["shocked_inflation"]
+        if shocked != old_inflation:
+            print(f"\n  → Chaos Monkey: Inflation shock +{(shocked - old_inflation)*100:.1f}%")
+        print(f"\n  → Central Banks (Monetary Policy): Corrected inflation {shocked*100:.2f}% → "
+              f"{sim.global_inflation*100:.2f}%")
+
+    # ------------------------------------------------------------------------
+    # 2. Investor sentiment and capital market
+    # ------------------------------------------------------------------------
+
+    def before_market(self, sim, year, state):
+        self._before["sentiment"] = sim.investor_market.sentiment
+
+    def after_market(self, sim, year, state):
+        if year not in self.track_years or not state["market_active"]:
+            return
+        old_sentiment = self._before["sentiment"]
+        sentiment_change = sim.investor_market.sentiment - old_sentiment
+        decision = "DECAY" if sentiment_change < 0 else "RECOVERY" if sentiment_change > 0 else "STABLE"
+        print(f"\n  → InvestorMarket DECISION: {decision}")
+        print(f"     Reason: ", end="")
+        if sim.cea.warning_8to1_active:
+            print(f"CEA 8:1 warning active (decay)")
+        elif sim.global_inflation > 0.06:
+            print(f"High inflation ({sim.global_inflation*100:.1f}% > 6%)")
+        elif sim.global_inflation <= 0.025 and not sim.cea.warning_8to1_active:
+            print(f"System stable, recovering confidence")
+        else:
+            print(f"Moderate conditions")
+        print(f"     Sentiment: {old_sentiment:.3f} → {sim.investor_market.sentiment:.3f}")
+        print(f"     Market Price: ${sim.investor_market.market_price_xcr:.2f}")
+        print(f"     Net Capital Flow: ${state['net_capital_flow']/1e9:.2f}B")
+
+    # ------------------------------------------------------------------------
+    # 3. CEA policy
+    # ------------------------------------------------------------------------
+
+    def after_cea_policy(self, sim, year, state):
+        if year not in self.track_years or not state["market_active"]:
+            return
+        if sim.cea.warning_8to1_active or sim.cea.brake_10to1_active:
+            market_cap = sim.total_xcr_supply * sim.investor_market.market_price_xcr
+            budget = sim.central_bank.total_cqe_budget
+            print(f"\n  → CEA DECISION: STABILITY WARNING")
+            if budget > 0:
+                print(f"     Ratio: {market_cap/budget:.2f}:1 (threshold: 8:1)")
+        if state["revision_occurred"]:
+            print(f"\n  → CEA DECISION: PRICE FLOOR REVISION")
+            print(f"     Old: ${state['price_floor_prev']:.2f} → New: ${sim.price_floor:.2f}")
+        else:
+            print(f"\n  → CEA: Monitoring (no action)")
+
+    # ------------------------------------------------------------------------
+    # 4. Project initiation
+    # ------------------------------------------------------------------------
+
+    def before_initiation(self, sim, year, state):
+        self._before["projects"] = sim.projects_broker.projects.total_projects()
+
+    def after_initiation(self, sim, year, state):
+        if year not in self.track_years:
+            return
+        projects_initiated = sim.projects_broker.projects.total_projects() - self._before["projects"]
+        print(f"\n  → ProjectsBroker DECISIONS:")
+
+        # Check each channel's profitability
+        broker = sim.projects_broker
+        benchmark_cdr_cost = broker.calculate_marginal_cost(ChannelType.CDR)
+        for channel in ChannelType:
+            cost = broker.calculate_marginal_cost(channel)
+            r_base, r_eff = sim.cea.calculate_project_r_value(channel, cost, benchmark_cdr_cost, year)
+            revenue = sim.investor_market.market_price_xcr * r_eff * sim.cea.brake_factor
+            profit = revenue - cost
+
+            # Check capacity for conventional
+            capacity_ok = True
+            if channel == ChannelType.CONVENTIONAL:
+                capacity_ok = broker.is_conventional_capacity_available(year)
+
+            decision = "INITIATE" if profit >= 0 and capacity_ok else "SKIP"
+            print(f"     {channel.name}: {decision}")
+            print(f"       Cost: ${cost:.2f}/tonne, Revenue: ${revenue:.2f}/tonne, Profit: ${profit:.2f}/tonne")
+            if channel == ChannelType.CONVENTIONAL:
+                print(f"       Capacity: {broker.get_conventional_capacity_utilization(year)*100:.1f}% "
+                      f"({'OK' if capacity_ok else 'FULL'})")
+
+        if projects_initiated > 0:
+            print(f"     → Result: {projects_initiated} new projects initiated")
+
+    # ------------------------------------------------------------------------
+    # 6. Audits and minting
+    # ------------------------------------------------------------------------
+
+    def before_audit_mint(self, sim, year, state):
+        self._before["failed"] = sim.projects_broker.projects.count(ProjectStatus.FAILED)
+
+    def after_audit_mint(self, sim, year, state):
+        if year not in self.track_years or state["operational_projects"] == 0:
+            return
+        failed = sim.projects_broker.projects.count(ProjectStatus.FAILED) - self._before["failed"]
+        print(f"\n  → Auditor DECISIONS: {state['operational_projects']} audits conducted")
+        print(f"     PASS: {state['operational_projects'] - failed} projects (mint {state['xcr_minted']:.2e} XCR)")
+        print(f"     FAIL: {failed} projects (clawback 50% lifetime XCR, {state['xcr_burned']:.2e} burned)")
+
+    # ------------------------------------------------------------------------
+    # 7. Central bank floor defense
+    # ------------------------------------------------------------------------
+
+    def after_cqe(self, sim, year, state):
+        if year not in self.track_years:
+            return
+        if state["price_support"] > 0:
+            willingness = 1 / (1 + np.exp(12.0 * (sim.global_inflation - sim.inflation_target * 1.5)))
+            print(f"\n  → CentralBankAlliance DECISION: DEFEND FLOOR (CQE intervention)")
+            print(f"     Market price ${sim.investor_market.market_price_xcr:.2f} vs Floor ${sim.price_floor:.2f}")
+            print(f"     Willingness: {willingness:.3f}")
+            print(f"     XCR purchased: {state['xcr_purchased']:.2e}")
+            print(f"     Inflation impact: +{state['inflation_impact']*100:.2f}%")
+        else:
+            print(f"\n  → CentralBankAlliance: No intervention needed (price above floor)")
+
+
+def run_agent_diagnostics(years=20, seed=42):
     """Run simulation with detailed agent decision logging"""
 
     print("="*80)
@@ -20,10 +195,8 @@ def run_agent_diagnostics(years=20):
     print("\nThis demonstrates that agents are making REAL DECISIONS based on system state,")
     print("not following predetermined scripts.\n")
 
-    # Set seed for reproducibility
-    np.random.seed(42)
-
-    sim = GCR_ABM_Simulation(years=years, enable_audits=True, price_floor=100.0)
+    # Seed for reproducibility
+    sim = GCR_ABM_Simulation(years=years, enable_audits=True, price_floor=100.0, seed=seed)
 
     print("\n" + "="*80)
     print("INITIAL AGENT STATES")
@@ -62,227 +235,8 @@ def run_agent_diagnostics(years=20):
     print("="*80)
 
     track_years = [0, 5, 10, 15] if years >= 15 else [0, years//2, years-1]
-
-    for year in range(years):
-        # Run one step manually to track decisions
-        sim.step = year
-
-        # Track decisions if this is a tracked year
-        if year in track_years:
-            print(f"\n{'='*80}")
-            print(f"YEAR {year}")
-            print(f"{'='*80}")
-
-            # State before decisions
-            print(f"\nSystem State:")
-            print(f"  CO2: {sim.co2_level:.2f} ppm")
-            print(f"  Inflation: {sim.global_inflation*100:.2f}%")
-            print(f"  XCR Supply: {sim.total_xcr_supply:.2e}")
-            print(f"  Market Price: ${sim.investor_market.market_price_xcr:.2f}")
-            print(f"  Projects: {len(sim.projects_broker.projects)} total")
-
-        # Agent actions (following simulation order)
-
-        # 0. Country adoption
-        capacity = sim.get_capacity_multiplier(year)
-        if capacity > 0:
-            newly_adopted = sim.adopt_countries(year)
-            if year in track_years and newly_adopted:
-                print(f"\n  → Country Adoption Agent: {len(newly_adopted)} countries joined")
-
-        # 1. Chaos monkey
-        old_inflation = sim.global_inflation
-        sim.chaos_monkey()
-        if year in track_years and sim.global_inflation != old_inflation:
-            print(f"\n  → Chaos Monkey: Inflation shock +{(sim.global_inflation - old_inflation)*100:.1f}%")
-
-        # 1b. Inflation correction
-        inflation_gap = sim.global_inflation - sim.inflation_target
-        correction_rate = 0.4 if abs(inflation_gap) > 0.02 else 0.25
-        old_inflation = sim.global_inflation
-        sim.global_inflation -= inflation_gap * correction_rate
-        if year in track_years:
-            print(f"\n  → Central Banks (Monetary Policy): Corrected inflation {old_inflation*100:.2f}% → {sim.global_inflation*100:.2f}%")
-
-        # 2. Investor sentiment update
-        old_sentiment = sim.investor_market.sentiment
-        sim.investor_market.update_sentiment(
-            sim.cea.warning_8to1_active,
-            sim.global_inflation,
-            sim.inflation_target,
-            sim.co2_level,
-            sim.cea.initial_co2_ppm
-        )
-
-        # 2b. Capital market update (drives available capital + price premium)
-        roadmap_target = sim.cea.calculate_roadmap_target(year, sim.years)
-        roadmap_gap = sim.co2_level - roadmap_target
-        market_age_years = max(0, year - sim.xcr_start_year)
-        net_capital_flow, capital_demand_premium, _ = sim.capital_market.update_capital_flows(
-            sim.co2_level,
-            year,
-            sim.years,
-            roadmap_gap,
-            sim.global_inflation,
-            sim.inflation_target,
-            sim.investor_market.sentiment,
-            sim.total_xcr_supply,
-            sim.price_floor,
-            market_age_years
-        )
-        sim.investor_market.calculate_price(capital_demand_premium)
-        annual_inflow = max(net_capital_flow, 0.0)
-        sim.central_bank.update_cqe_budget(annual_inflow)
-        if year in track_years:
-            sentiment_change = sim.investor_market.sentiment - old_sentiment
-            decision = "DECAY" if sentiment_change < 0 else "RECOVERY" if sentiment_change > 0 else "STABLE"
-            print(f"\n  → InvestorMarket DECISION: {decision}")
-            print(f"     Reason: ", end="")
-            if sim.cea.warning_8to1_active:
-                print(f"CEA 8:1 warning active (decay)")
-            elif sim.global_inflation > 0.06:
-                print(f"High inflation ({sim.global_inflation*100:.1f}% > 6%)")
-            elif sim.global_inflation <= 0.025 and not sim.cea.warning_8to1_active:
-                print(f"System stable, recovering confidence")
-            else:
-                print(f"Moderate conditions")
-            print(f"     Sentiment: {old_sentiment:.3f} → {sim.investor_market.sentiment:.3f}")
-            print(f"     Market Price: ${sim.investor_market.market_price_xcr:.2f}")
-
-        # 3. CEA policy update
-        market_cap = sim.total_xcr_supply * sim.investor_market.market_price_xcr
-        budget_utilization = (
-            sim.central_bank.annual_cqe_spent / sim.central_bank.total_cqe_budget
-            if sim.central_bank.total_cqe_budget > 0 else 0.0
-        )
-        sim.cea.update_policy(
-            sim.co2_level,
-            market_cap,
-            sim.central_bank.total_cqe_budget,
-            sim.global_inflation,
-            budget_utilization
-        )
-
-        old_floor = sim.price_floor
-        sim.price_floor, revision = sim.cea.adjust_price_floor(sim.co2_level, sim.price_floor, year, sim.years)
-        if year in track_years:
-            if sim.cea.warning_8to1_active or sim.cea.brake_10to1_active:
-                print(f"\n  → CEA DECISION: STABILITY WARNING")
-                print(f"     Ratio: {market_cap/sim.central_bank.total_cqe_budget:.2f}:1 (threshold: 8:1)")
-            if revision:
-                print(f"\n  → CEA DECISION: PRICE FLOOR REVISION")
-                print(f"     Old: ${old_floor:.2f} → New: ${sim.price_floor:.2f}")
-            else:
-                print(f"\n  → CEA: Monitoring (no action)")
-
-        sim.central_bank.price_floor_rcc = sim.price_floor
-        sim.investor_market.price_floor = sim.price_floor
-
-        # 4. Projects broker initiates projects
-        if capacity > 0:
-            projects_before = len(sim.projects_broker.projects)
-            available_capital_usd = max(net_capital_flow, 0.0)
-            structural_conventional_gt = sim.structural_conventional_capacity_tonnes / 1e9
-            remaining_conventional_need_gt = max(
-                0.0, sim.bau_emissions_gt_per_year - structural_conventional_gt
-            )
-            land_use_change_gtco2 = (
-                sim.land_use_change_gtc * sim.carbon_cycle.params.gtco2_per_gtc
-            )
-            planned_avoided_deforestation_gt = sim.projects_broker.get_planned_sequestration_rate(
-                ChannelType.AVOIDED_DEFORESTATION
-            )
-            remaining_luc_emissions_gt = max(
-                0.0, land_use_change_gtco2 - planned_avoided_deforestation_gt
-            )
-            sim.projects_broker.initiate_projects(
-                sim.investor_market.market_price_xcr,
-                sim.price_floor,
-                sim.cea,
-                year,
-                sim.co2_level,
-                sim.global_inflation,
-                available_capital_usd,
-                sim.cea.brake_factor,
-                residual_emissions_gt=remaining_conventional_need_gt,
-                residual_luc_emissions_gt=remaining_luc_emissions_gt
-            )
-            projects_initiated = len(sim.projects_broker.projects) - projects_before
-
-            if year in track_years:
-                print(f"\n  → ProjectsBroker DECISIONS:")
-
-                # Check each channel's profitability
-                benchmark_cdr_cost = sim.projects_broker.calculate_marginal_cost(ChannelType.CDR)
-                for channel in ChannelType:
-                    cost = sim.projects_broker.calculate_marginal_cost(channel)
-                    r_base, r_eff = sim.cea.calculate_project_r_value(
-                        channel, cost, benchmark_cdr_cost, year
-                    )
-                    revenue = sim.investor_market.market_price_xcr * r_eff * sim.cea.brake_factor
-                    profit = revenue - cost
-
-                    # Check capacity for conventional
-                    capacity_ok = True
-                    if channel == ChannelType.CONVENTIONAL:
-                        capacity_ok = sim.projects_broker.is_conventional_capacity_available(year)
-
-                    decision = "INITIATE" if profit >= 0 and capacity_ok else "SKIP"
-                    print(f"     {channel.name}: {decision}")
-                    print(f"       Cost: ${cost:.2f}/tonne, Revenue: ${revenue:.2f}/tonne, Profit: ${profit:.2f}/tonne")
-                    if channel == ChannelType.CONVENTIONAL:
-                        print(f"       Capacity: {sim.projects_broker.get_conventional_capacity_utilization(year)*100:.1f}% ({'OK' if capacity_ok else 'FULL'})")
-
-                if projects_initiated > 0:
-                    print(f"     → Result: {projects_initiated} new projects initiated")
-
-        # 5. Step projects
-        sim.projects_broker.step_projects(sim.co2_level, sim.global_inflation)
-
-        # 6. Auditor verifications
-        operational_projects = sim.projects_broker.get_operational_projects()
-        xcr_minted = 0.0
-        passed = 0
-        failed = 0
-
-        if sim.enable_audits and capacity > 0:
-            for project in operational_projects:
-                audit_result = sim.auditor.audit_project(project)
-                if audit_result == "PASS":
-                    xcr_change = project.annual_sequestration_tonnes / project.r_effective
-                    xcr_minted += xcr_change * capacity
-                    passed += 1
-                else:
-                    failed += 1
-
-        if year in track_years and len(operational_projects) > 0:
-            print(f"\n  → Auditor DECISIONS: {len(operational_projects)} audits conducted")
-            print(f"     PASS: {passed} projects (mint XCR)")
-            print(f"     FAIL: {failed} projects (clawback 50% lifetime XCR)")
-
-        sim.total_xcr_supply += xcr_minted
-
-        # 7. Central bank defends floor
-        price_support, inflation_impact, xcr_purchased = sim.central_bank.defend_floor(
-            sim.investor_market.market_price_xcr,
-            sim.total_xcr_supply,
-            sim.global_inflation
-        )
-
-        if year in track_years:
-            if price_support > 0:
-                print(f"\n  → CentralBankAlliance DECISION: DEFEND FLOOR (CQE intervention)")
-                print(f"     Market price ${sim.investor_market.market_price_xcr:.2f} < Floor ${sim.price_floor:.2f}")
-                print(f"     Willingness: {1 / (1 + np.exp(12.0 * (sim.global_inflation - 0.03))):.3f}")
-                print(f"     XCR purchased: {xcr_purchased:.2e}")
-                print(f"     Inflation impact: +{inflation_impact*100:.2f}%")
-            else:
-                print(f"\n  → CentralBankAlliance: No intervention needed (price above floor)")
-
-        # Apply impacts
-        if price_support > 0:
-            sim.investor_market.market_price_xcr += price_support
-            sim.global_inflation += inflation_impact
+    AgentDecisionTracer(track_years).attach(sim)
+    sim.run_simulation()
 
     # Final analysis
     print("\n" + "="*80)
@@ -0,0 +1,1017 @@
+"""
+Vectorized Monte Carlo ensemble of the GCR simulation
+
+BatchSimulation advances `runs` ensemble members of GCR_ABM_Simulation in
+lockstep. The macro agents' state (inflation, investor sentiment and price,
+capital flows, the CEA brake and price floor, CQE budgets, country adoption
+and both carbon cycles) is held as one length-runs array per variable and
+stepped with array versions of the agent rules, so a year of the whole
+ensemble costs a few hundred NumPy calls instead of runs × the scalar step.
+
+Project portfolios are aggregated per (member, channel) instead of kept as
+rows:
+
+- development pipeline: counts and tonnes indexed by the year the projects
+  become operational
+- operational projects: cohort groups holding the survivor count, tonnes,
+  lifetime totals and the distribution of the survivors' health over a grid
+  of health bins (each decay event multiplies health by U(0.8, 0.95)).
+  Channels whose projects reach end of life inside the horizon keep a ring
+  of one group per operational start year, so a cohort completes whole, with
+  its own survivors; cohorts outliving the horizon are grouped by ten start
+  years. Groups of the capped channels (conventional, avoided deforestation)
+  also keep the split of their tonnes by creation year, so the crediting
+  caps fill in creation order like the scalar model's.
+
+Project-level draws (sizes, development times, audit failures, retirements)
+are taken per bucket from the matching binomial/multinomial/normal
+distributions. Decay is not drawn: it only matters through audits, and
+projects are independent, so each group's health distribution is stepped
+forward and conditioned on passing audits (survivors are the healthier
+projects), and audit failures are binomial in the group's mean failure
+probability. Members follow the scalar model in distribution, not draw for
+draw (see cohort_validation.py for the same kind of check).
+Not modelled: GOVT funding mode, LLM agents, per-country ledgers and events.
+
+Results come back as a (runs × years × metrics) cube:
+
+    batch = BatchSimulation(runs=10_000, seed=42, years=50)
+    cube = batch.run()
+    co2 = batch.metric("CO2_ppm")  # (runs, years)
+"""
+
+import argparse
+import math
+import time
+from typing import Callable, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from climate import BatchCarbonCycle
+from gcr_model import (
+    GCR_ABM_Simulation, ChannelType, RESULT_SCHEMA, RESULT_PROFILES, BAU_STATE_FIELDS,
+    get_failure_reversal_fraction, seed_sequence, bau_trajectory, health_grid, _normalized_sigmoid
+)
+
+
+# Initiated channels in ProjectsBroker.initiate_projects order (axis 1 of portfolio arrays)
+CHANNELS = (ChannelType.CDR, ChannelType.CONVENTIONAL, ChannelType.AVOIDED_DEFORESTATION)
+_CDR, _CONV, _AD = range(len(CHANNELS))
+MAX_OPERATIONAL_YEARS = (100, 25, 50)  # Per channel, as in initiate_projects
+DEVELOPMENT_YEARS = (2, 3, 4)  # Uniform, as in _create_projects_bulk
+LONG_LIVED_SPAN = 10  # Operational start years per group for cohorts outliving the horizon
+# Creation years feeding one group: its start years, each reached after any of the development times
+CREATION_SLOTS = LONG_LIVED_SPAN + max(DEVELOPMENT_YEARS) - min(DEVELOPMENT_YEARS)
+_SIZE_LOW, _SIZE_HIGH = 1e7, 1e8  # Base project size U(10, 100) Mt/year
+
+# Result columns the ensemble produces (RESULT_SCHEMA order)
+_BATCH_COLUMNS = {
+    "CO2_ppm", "BAU_CO2_ppm", "CO2_Avoided", "Inflation", "XCR_Supply", "XCR_Minted", "XCR_Burned_Annual",
+    "XCR_Burned_Cumulative", "Cobenefit_Bonus_XCR", "Market_Price", "Price_Floor", "Sentiment",
+    "Projects_Total", "Projects_Operational", "Projects_Development", "Projects_Failed", "Projects_Completed",
+    "Sequestration_Tonnes", "CDR_Sequestration_Tonnes", "Conventional_Mitigation_Tonnes",
+    "Avoided_Deforestation_Tonnes", "Reversal_Tonnes", "Human_Emissions_GtCO2", "Conventional_Installed_GtCO2",
+    "CEA_Warning", "CQE_Spent", "XCR_Purchased", "Active_Countries", "CQE_Budget_Total", "Capacity",
+    "CDR_Cost_Per_Tonne", "Conventional_Cost_Per_Tonne", "CDR_Cumulative_GtCO2",
+    "Conventional_Cumulative_GtCO2", "CDR_Buildout_Stopped", "Net_Capital_Flow", "Capital_Demand_Premium",
+    "Forward_Guidance", "Capital_Inflow_Cumulative", "Capital_Outflow_Cumulative", "CEA_Brake_Factor",
+    "Annual_CQE_Spent", "Annual_CQE_Budget", "CQE_Budget_Utilization", "Investor_Sentiment",
+}
+_CLIMATE_COLUMNS = (
+    "Temperature_Anomaly", "Ocean_Uptake_GtC", "Land_Uptake_GtC", "Airborne_Fraction", "Ocean_Sink_Capacity",
+    "Land_Sink_Capacity", "Permafrost_Emissions_GtC", "Fire_Emissions_GtC", "Cumulative_Emissions_GtC",
+    "Climate_Risk_Multiplier", "C_Ocean_Surface_GtC", "C_Land_GtC",
+)
+_BATCH_COLUMNS.update(_CLIMATE_COLUMNS)
+BATCH_METRICS = tuple(name for name, _ in RESULT_SCHEMA if name in _BATCH_COLUMNS)
+
+
+_erf = np.frompyfunc(math.erf, 1, 1)
+
+
+def _normal_cdf(z: np.ndarray) -> np.ndarray:
+    """Standard normal CDF (NumPy has no erf)"""
+    return 0.5 * (1.0 + _erf(z / np.sqrt(2.0)).astype(float))
+
+
+class BatchSimulation:
+    """Ensemble of GCR simulations stepped together as arrays
+
+    Parameters come from a template GCR_ABM_Simulation(**config); `setup`,
+    if given, is called on the template first, so scenario tweaks that set
+    agent attributes (e.g. sim.central_bank.cqe_ratio) apply to every member.
+    Tweaks that replace agent methods are not seen by the array rules.
+    """
+
+    def __init__(self, runs: int = 1000, seed=None, metrics=None,
+                 setup: Optional[Callable[[GCR_ABM_Simulation], None]] = None, **config):
+        if runs < 1:
+            raise ValueError("runs must be at least 1")
+        if config.get("llm_enabled", False):
+            raise ValueError("BatchSimulation has no LLM agents")
+        template = GCR_ABM_Simulation(seed=0, event_level=None, output_profile="metrics-only", **config)
+        if setup is not None:
+            setup(template)
+        if template.funding_mode != "XCR":
+            raise ValueError("BatchSimulation models the XCR funding mode only")
+
+        self.template = template
+        self.runs = runs
+        self.years = template.years
+        self.metrics = self._select_metrics(metrics)
+        self._metric_index = {name: j for j, name in enumerate(self.metrics)}
+        self.cube = np.zeros((runs, self.years, len(self.metrics)))
+        self.next_year = 0
+
+        # One stream per scalar-model agent: shocks/adoption, project lifecycle, audits
+        sim_seed, broker_seed, auditor_seed = seed_sequence(seed).spawn(3)
+        self.rng = np.random.default_rng(sim_seed)
+        self.broker_rng = np.random.default_rng(broker_seed)
+        self.auditor_rng = np.random.default_rng(auditor_seed)
+
+        broker, cea = template.projects_broker, template.cea
+        self.base_costs = np.array([broker.base_costs[c] for c in CHANNELS])
+        self.learning_rates = np.array([broker.learning_rates[c] for c in CHANNELS])
+        self.reversal_fractions = np.array([get_failure_reversal_fraction(c) for c in CHANNELS])
+        self.channel_risk = np.array([template.carbon_cycle.get_channel_risk_multiplier(c.name.lower())
+                                      for c in CHANNELS])
+        # Group health distributions are float32: they are renormalized every audit
+        _, self.health_failure_probability, self.health_transition = (
+            array.astype(np.float32) for array in health_grid(template.auditor.error_rate))
+        self.gtco2_per_gtc = template.carbon_cycle.params.gtco2_per_gtc
+        self.land_use_change_gtc = template.land_use_change_gtc
+        self.gdp_tril = template.all_countries.gdp_tril
+        self.max_year_index = self.years + max(DEVELOPMENT_YEARS)
+
+        n, c, k = runs, len(CHANNELS), len(self.health_failure_probability)
+
+        def full(value, dtype=float):
+            return np.full(n, value, dtype=dtype)
+
+        # Global state
+        self.co2_level = full(template.co2_level)
+        self.global_inflation = full(template.global_inflation)
+        self.total_xcr_supply = full(template.total_xcr_supply)
+        self.bau_emissions_gt_per_year = full(template.bau_emissions_gt_per_year)
+        self.net_zero_ever_reached = full(template.net_zero_ever_reached, bool)
+        self.cdr_buildout_stopped = full(template.cdr_buildout_stopped, bool)
+        self.active_mask = np.tile(template.all_countries.active_mask, (n, 1))
+        self.price_floor = full(template.price_floor)
+
+        # Agents
+        self.sentiment = full(template.investor_market.sentiment)
+        self.market_price = full(template.investor_market.market_price_xcr)
+        self.last_warning = full(template.investor_market.last_warning, bool)
+        self.warning = full(cea.warning_8to1_active, bool)
+        self.brake_factor = full(cea.brake_factor)
+        self.locked_annual_yield = full(cea.locked_annual_yield)
+        self.total_cqe_budget = full(template.central_bank.total_cqe_budget)
+        self.annual_cqe_spent = full(template.central_bank.annual_cqe_spent)
+        self.total_cqe_spent = full(template.central_bank.total_cqe_spent)
+        self.current_budget_year = template.central_bank.current_budget_year
+        self.capital_inflow = full(template.capital_market.cumulative_capital_inflow)
+        self.capital_outflow = full(template.capital_market.cumulative_capital_outflow)
+        self.seed_capital_deployed = template.capital_market.seed_capital_deployed
+        self.total_xcr_burned = full(template.auditor.total_xcr_burned)
+        self.emissions_to_sinks_ratio = full(broker.current_emissions_to_sinks_ratio)
+
+        # Portfolios: learning-curve state, then the pipeline and operational buckets
+        self.cumulative_deployment = np.zeros((n, c))
+        self.reference_capacity = np.full((n, c), np.nan)  # Set by the first credit
+        self.first_project_tonnes = np.full((n, c), np.nan)  # Size of each channel's first opened project
+        self.r_history = np.zeros((n, c, self.years))  # R of each creation year's projects
+        self.projects_created = np.zeros((n, c), dtype=np.int64)
+        self.dev_count = np.zeros((n, c, self.max_year_index), dtype=np.int64)
+        self.dev_amounts = np.zeros((2, n, c, self.max_year_index))  # Annual tonnes, tonnes × R
+        self.dev_first_tonnes = np.full((n, c, self.max_year_index), np.nan)  # Size of each year's first opening
+        # Annual tonnes by development time for the next max(DEVELOPMENT_YEARS) start years (ring by start year)
+        self.dev_delay_tonnes = np.zeros((n, c, max(DEVELOPMENT_YEARS), len(DEVELOPMENT_YEARS)))
+        self.dev_count_total = np.zeros((n, c), dtype=np.int64)
+        self.dev_tonnes_total = np.zeros((n, c))
+        # Operational cohort groups (axis 1), contiguous per channel: ring_sizes[c] groups indexed by
+        # operational start year modulo the lifespan, then one group per LONG_LIVED_SPAN start years
+        # for cohorts outliving the horizon (starting from long_lived_start[c])
+        self.ring_sizes = tuple(life if life < self.years else 0 for life in MAX_OPERATIONAL_YEARS)
+        self.long_lived_start = tuple(max(0, self.years - life) for life in MAX_OPERATIONAL_YEARS)
+        self.group_sizes = tuple(ring - (first - self.years) // LONG_LIVED_SPAN
+                                 for ring, first in zip(self.ring_sizes, self.long_lived_start))
+        self.group_start = np.concatenate(([0], np.cumsum(self.group_sizes)[:-1]))
+        self.group_channel = np.repeat(np.arange(c), self.group_sizes)
+        g = len(self.group_channel)
+        self.op_count = np.zeros((n, g), dtype=np.int64)
+        # Annual tonnes, tonnes × R, lifetime sequestered tonnes, lifetime XCR
+        self.op_amounts = np.zeros((4, n, g))
+        self.op_health = np.zeros((n, g, k), dtype=np.float32)  # Health bin distribution of each group
+        # Capped channels' groups (the last ones): shares of annual tonnes by creation year, from the
+        # group's earliest start year - max(DEVELOPMENT_YEARS) + 1 on (pro rata removals keep them)
+        self.capped_start = self.group_start[_CONV]
+        self.op_created_shares = np.zeros((n, g - self.capped_start, CREATION_SLOTS), dtype=np.float32)
+        self.capped_units = {}  # Channel -> (group, slot) pairs that can hold tonnes (ring groups fill 3 slots)
+        for channel in (_CONV, _AD):
+            ring, start = self.ring_sizes[channel], self.group_start[channel]
+            slots = [(group, slot) for group in range(start, start + self.group_sizes[channel])
+                     for slot in range(len(DEVELOPMENT_YEARS) if group < start + ring else CREATION_SLOTS)]
+            self.capped_units[channel] = tuple(np.array(column) for column in zip(*slots))
+        self.group_opened = np.zeros(g, dtype=np.int64)  # Earliest start year in each group (crediting order)
+        for channel, (ring, first) in enumerate(zip(self.ring_sizes, self.long_lived_start)):
+            spans = np.arange(self.group_sizes[channel] - ring)
+            self.group_opened[self.group_start[channel] + ring + spans] = first + LONG_LIVED_SPAN * spans
+        self.completed_total = np.zeros((n, c), dtype=np.int64)
+        self.completed_tonnes = np.zeros((n, c))
+        self.failed_total = np.zeros(n, dtype=np.int64)
+
+        self.carbon_cycle = BatchCarbonCycle.from_cycle(template.carbon_cycle, n)
+        self.bau_carbon_cycle = BatchCarbonCycle.from_cycle(template.bau_carbon_cycle, n)
+        # Shared BAU path while every member's BAU flow follows it (see GCR_ABM_Simulation._step_bau_climate)
+        self._bau_path = None
+        if template.memoize_bau:
+            self._bau_path = bau_trajectory(
+                template.bau_carbon_cycle.params, self.years, template.bau_carbon_cycle.co2_ppm,
+                template.bau_emissions_gt_per_year, template.bau_peak_year, template.bau_growth_rate_pre_peak,
+                template.bau_decline_start_year, template.bau_post_peak_plateau_rate,
+                template.bau_decline_rate_post_peak, template.land_use_change_gtc)
+        self.bau_co2_ppm = self.bau_carbon_cycle.co2_ppm
+
+    def _select_metrics(self, metrics) -> tuple:
+        """Metric names for axis 2 of the cube: all, a result profile's, or an explicit list"""
+        if metrics is None:
+            return BATCH_METRICS
+        if isinstance(metrics, str):
+            if metrics not in RESULT_PROFILES:
+                raise ValueError(f"Unknown result profile {metrics!r}; choose from {sorted(RESULT_PROFILES)}")
+            wanted = RESULT_PROFILES[metrics]
+            return BATCH_METRICS if wanted is None else tuple(m for m in BATCH_METRICS if m in wanted)
+        metrics = tuple(metrics)
+        unsupported = [name for name in metrics if name not in _BATCH_COLUMNS]
+        if unsupported:
+            raise ValueError(f"BatchSimulation does not produce {unsupported}")
+        return metrics
+
+    # ------------------------------------------------------------------------
+    # Broker rules
+    # ------------------------------------------------------------------------
+
+    def _deployment_sigmoid(self, deployment_gt: np.ndarray) -> np.ndarray:
+        broker = self.template.projects_broker
+        full_scale = broker.full_scale_deployment_gt
+        steepness = broker.damping_steepness / max(full_scale, 1e-6)
+        return _normalized_sigmoid(deployment_gt, full_scale * 0.3, steepness, full_scale)
+
+    def _damper(self, min_factor: float) -> np.ndarray:
+        """Scale/count damper from industry-wide deployment (ProjectsBroker._project_scale_damper)"""
+        total_gt = self.cumulative_deployment.sum(axis=1) / 1e9
+        full_scale = self.template.projects_broker.full_scale_deployment_gt
+        damper = min_factor + (1.0 - min_factor) * self._deployment_sigmoid(total_gt)
+        return np.where(total_gt <= 0, min_factor, np.where(total_gt >= full_scale, 1.0, damper))
+
+    @staticmethod
+    def _budget_factor(utilization: np.ndarray, midpoint: float, steepness: float, limit: float) -> np.ndarray:
+        """Budget-depletion factor going from 1 at zero utilization to `limit` at full utilization"""
+        normalized = _normalized_sigmoid(np.clip(utilization, 0.0, 1.0), midpoint, steepness)
+        factor = 1.0 + (limit - 1.0) * normalized
+        return np.where(utilization <= 0, 1.0, np.where(utilization >= 1.0, limit, factor))
+
+    def _utilization(self, channel: int, budget_gt: float) -> np.ndarray:
+        if budget_gt <= 0:
+            return np.zeros(self.runs)
+        return self.cumulative_deployment[:, channel] / 1e9 / budget_gt
+
+    def _marginal_costs(self) -> np.ndarray:
+        """ProjectsBroker.calculate_marginal_cost per member and channel, shape (runs, channels)"""
+        broker = self.template.projects_broker
+        cumulative, reference = self.cumulative_deployment, self.reference_capacity
+
+        learning_rates = np.broadcast_to(self.learning_rates, cumulative.shape).copy()
+        cdr_gt = cumulative[:, _CDR] / 1e9
+        lr = self.learning_rates[_CDR]
+        floor = lr * broker.cdr_learning_floor_factor
+        tapered = lr - (lr - floor) * self._deployment_sigmoid(cdr_gt)
+        learning_rates[:, _CDR] = np.where(
+            cdr_gt <= 0, lr, np.where(cdr_gt >= broker.full_scale_deployment_gt, floor, tapered))
+        exponent = np.log(1 - learning_rates) / np.log(2)
+
+        deployed = ~np.isnan(reference) & (reference != 0) & (cumulative != 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            learning = np.where(deployed, cumulative / np.where(deployed, reference, 1.0), 1.0) ** exponent
+        depletion = 1.0 + 0.15 * np.log10(self.projects_created + 1)
+
+        budget = np.ones_like(cumulative)
+        budget[:, _CONV] = self._budget_factor(self._utilization(_CONV, broker.conventional_budget_gt), 0.60, 15.0,
+                                               broker.conventional_budget_cost_multiplier)
+        ratio = self.emissions_to_sinks_ratio
+        budget[:, _CONV] *= np.where(ratio >= 4.0, 1.0, np.where(ratio <= 1.0, 5.0, 1.0 + 4.0 * (4.0 - ratio) / 3.0))
+        budget[:, _CDR] = self._budget_factor(self._utilization(_CDR, broker.cdr_material_budget_gt), 0.60, 15.0,
+                                              broker.cdr_material_cost_multiplier)
+        return np.where(deployed, self.base_costs * learning * depletion * budget, self.base_costs)
+
+    def _urgency_factor(self) -> np.ndarray:
+        """ProjectsBroker._calculate_project_capacity per member"""
+        inflation_ratio = np.maximum(self.global_inflation, 0.0) / 0.02
+        taper_start = np.where(inflation_ratio < 0.5, 370.0, np.where(
+            inflation_ratio < 1.5, 370.0 + 20.0 * (inflation_ratio - 0.5),
+            np.minimum(425.0, 390.0 + 15.0 * (inflation_ratio - 1.5))))
+        co2 = self.co2_level
+        progress = np.maximum(co2 - 350.0, 0.0) / (taper_start - 350.0)
+        return np.where(co2 >= taper_start, 1.0, np.where(co2 > 350.0, np.sqrt(progress), 0.0))
+
+    def _by_channel(self, values: np.ndarray) -> np.ndarray:
+        """Sum per-group values (last axis) into per-channel totals"""
+        return np.add.reduceat(values, self.group_start, axis=-1)
+
+    def _created_base(self, groups) -> np.ndarray:
+        """Creation year of slot 0 of op_created_shares for the given groups"""
+        return self.group_opened[groups] - max(DEVELOPMENT_YEARS) + 1
+
+    def _add_created_shares(self, group: int, year: int, delay_tonnes: np.ndarray):
+        """Fold projects opening this year (annual tonnes by development time) into a capped group's shares"""
+        shares = self.op_created_shares[:, group - self.capped_start]
+        before = self.op_amounts[0, :, group]
+        after = before + delay_tonnes.sum(axis=1)
+        keep = np.divide(before, after, out=np.zeros(self.runs), where=after > 0)
+        shares *= keep[:, None].astype(np.float32)
+        slots = year - np.array(DEVELOPMENT_YEARS) + 1 - self._created_base(group)
+        shares[:, slots] += np.divide(delay_tonnes, after[:, None], out=np.zeros(delay_tonnes.shape),
+                                      where=after[:, None] > 0)
+
+    def _fill_cap_in_creation_order(self, channel: int, cap: np.ndarray, fraction: np.ndarray,
+                                    r_fraction: np.ndarray):
+        """Credited shares of a capped channel's groups' tonnes (fraction) and tonnes × R (r_fraction)
+
+        _sequential_cap over projects in creation order: each group's tonnes are
+        split by creation year (op_created_shares), whose R is r_history. Only
+        members whose channel total exceeds the cap are touched.
+        """
+        groups = slice(self.group_start[channel], self.group_start[channel] + self.group_sizes[channel])
+        total = self.op_amounts[0][:, groups].sum(axis=1)
+        nothing = (cap <= 0) & (total > 0)  # Nothing credited, whatever the order
+        fraction[nothing, groups] = 0.0
+        r_fraction[nothing, groups] = 0.0
+        members = np.flatnonzero((cap > 0) & (total > cap))
+        if len(members) == 0:
+            return
+        unit_groups, slots = self.capped_units[channel]
+        held = (self.op_amounts[0][members, groups] > 0).any(axis=0)[unit_groups - self.group_start[channel]]
+        unit_groups, slots = unit_groups[held], slots[held]
+        created = self._created_base(unit_groups) + slots
+        order = np.argsort(created, kind="stable")
+        unit_groups, slots, created = unit_groups[order], slots[order], created[order]
+        rows = members[:, None]
+        units = self.op_amounts[0][rows, unit_groups] * self.op_created_shares[rows, unit_groups - self.capped_start,
+                                                                                slots]
+        r_units = units * self.r_history[rows, channel, np.clip(created, 0, self.years - 1)]
+        spent_before = np.cumsum(units, axis=1) - units
+        unit_fraction = np.divide(np.clip(cap[rows] - spent_before, 0.0, units), units,
+                                  out=np.ones(units.shape), where=units > 0)
+        width = self.group_sizes[channel]
+        to_group = np.zeros((len(slots), width))  # One-hot unit -> group matrix for per-group sums
+        to_group[np.arange(len(slots)), unit_groups - self.group_start[channel]] = 1.0
+        credited, total, r_credited, r_total = (values @ to_group for values in (
+            units * unit_fraction, units, r_units * unit_fraction, r_units))
+        block = np.arange(self.group_start[channel], self.group_start[channel] + width)
+        fraction[rows, block] = np.divide(credited, total, out=np.ones(total.shape), where=total > 0)
+        r_fraction[rows, block] = np.divide(r_credited, r_total, out=np.ones(r_total.shape), where=r_total > 0)
+
+    def _planned_gt(self) -> np.ndarray:
+        """Development + operational + completed annual tonnes per channel, in Gt"""
+        operational = self._by_channel(self.op_amounts[0])
+        return (self.dev_tonnes_total + operational + self.completed_tonnes) / 1e9
+
+    def _initiate_projects(self, year: int):
+        """ProjectsBroker.initiate_projects for all members (XCR mode)"""
+        broker, rng = self.template.projects_broker, self.broker_rng
+        costs = self._marginal_costs()
+        benchmark = costs[:, _CDR]
+        effective_price = self.market_price * self.brake_factor
+        urgency = self._urgency_factor()
+        scale_damper = self._damper(0.50) if broker.scale_damping_enabled else np.ones(self.runs)
+        count_damper = (self._damper(broker.count_damping_min_factor) if broker.count_damping_enabled
+                        else np.ones(self.runs))
+        planned = self._planned_gt()
+        ratio = self.emissions_to_sinks_ratio
+        luc_gtco2 = self.land_use_change_gtc * self.gtco2_per_gtc
+        residual_conventional = np.maximum(
+            self.bau_emissions_gt_per_year - self._by_channel(self.op_amounts[0])[:, _CONV] / 1e9, 0.0)
+
+        for c, channel in enumerate(CHANNELS):
+            allowed = effective_price >= costs[:, c]
+            ramp = 1.0
+            capacity_factor = 1.0
+            if c == _CDR:
+                allowed &= ~self.cdr_buildout_stopped
+                material = self._budget_factor(self._utilization(_CDR, broker.cdr_material_budget_gt), 0.60, 15.0,
+                                               broker.cdr_material_capacity_floor)
+                max_capacity = broker._cdr_ramp_table(year, broker.max_capacity_gt_per_year[channel]) * material
+            else:
+                max_capacity = broker.max_capacity_gt_per_year[channel]
+            remaining = max_capacity - planned[:, c]
+            allowed &= remaining > 0
+            if c == _CONV:
+                allowed &= ~(self.net_zero_ever_reached | (ratio <= 1.0))
+                ramp = np.where(ratio < 2.0, ratio - 1.0, 1.0)
+                remaining = np.minimum(remaining, residual_conventional)
+                time_factor = broker._conventional_time_factor_table(
+                    year, broker.conventional_capacity_limit_year, broker.conventional_capacity_limit,
+                    broker.conventional_capacity_min_factor)
+                budget_factor = self._budget_factor(self._utilization(_CONV, broker.conventional_budget_gt),
+                                                    0.70, 10.0, broker.conventional_budget_capacity_floor)
+                capacity_factor = np.maximum(broker.conventional_capacity_min_factor,
+                                             np.minimum(time_factor, budget_factor))
+            elif c == _AD:
+                remaining = np.minimum(remaining, max(luc_gtco2, 0.0))
+            allowed &= remaining > 0
+            if not allowed.any():
+                continue
+
+            r_value = 1.0 if c == _CDR else np.where(benchmark > 0, np.maximum(0.1, costs[:, c] / benchmark), 1.0)
+            budget_tonnes = np.where(allowed, remaining, 0.0) * 1e9
+            max_by_capacity = np.floor(budget_tonnes / np.maximum(1e6 * scale_damper, 1.0))
+            max_projects = np.maximum(np.minimum(1000, max_by_capacity), 0)
+            num = np.floor(max_projects * urgency * capacity_factor * count_damper * ramp * self.brake_factor)
+            num = np.where(allowed, np.maximum(num, 0), 0).astype(np.int64)
+
+            # num U(10, 100) Mt × scale projects filling the capacity budget in order: the project that
+            # exhausts it is shrunk and later ones are dropped. One normal z per member drives the partial
+            # sums S_j ~ j·mean + z·sd·√j, so created = min(num, 1 + #{j ≥ 1: S_j < budget}) gets
+            # P(S_j < budget) right for every j (S_1, a plain uniform, exactly) and agrees with the total
+            low, high = _SIZE_LOW * scale_damper, _SIZE_HIGH * scale_damper
+            mean, sd = (low + high) / 2, (high - low) / np.sqrt(12.0)
+            z = rng.standard_normal(self.runs)
+            total = np.clip(num * mean + np.sqrt(num) * sd * z, num * low, num * high)
+            root = (np.sqrt(z * z * sd * sd + 4 * mean * budget_tonnes) - z * sd) / (2 * mean)
+            under_budget = np.maximum(np.ceil(root * root) - 1, 0)
+            small = budget_tonnes < high
+            if small.any():
+                first_fits = _normal_cdf(z[small]) < np.maximum(budget_tonnes[small] - low[small], 0.0) / (
+                    high[small] - low[small])
+                under_budget[small] = np.where(first_fits, np.maximum(under_budget[small], 1), 0)
+            created = np.minimum(num, under_budget + 1).astype(np.int64)
+            tonnes = np.minimum(total, budget_tonnes)
+
+            by_delay = rng.multinomial(created, np.full(len(DEVELOPMENT_YEARS), 1.0 / len(DEVELOPMENT_YEARS)))
+            share = by_delay / np.maximum(created, 1)[:, None]
+            self.r_history[:, c, year] = r_value
+            # One project size per start year (a lone project is S_1 shrunk to the budget): the first
+            # project to open sets the learning-curve reference with its own size, not the mean size
+            sizes = low[:, None] + (high - low)[:, None] * rng.random((self.runs, len(DEVELOPMENT_YEARS)))
+            sizes[created == 1] = np.minimum(low + (high - low) * _normal_cdf(z), budget_tonnes)[created == 1, None]
+            for j, development_years in enumerate(DEVELOPMENT_YEARS):
+                t = year + development_years - 1  # Operational from that year's project step
+                unset = np.isnan(self.dev_first_tonnes[:, c, t]) & (by_delay[:, j] > 0)
+                self.dev_first_tonnes[:, c, t] = np.where(unset, sizes[:, j], self.dev_first_tonnes[:, c, t])
+                self.dev_delay_tonnes[:, c, t % max(DEVELOPMENT_YEARS), j] += tonnes * share[:, j]
+                self.dev_count[:, c, t] += by_delay[:, j]
+                self.dev_amounts[0, :, c, t] += tonnes * share[:, j]
+                self.dev_amounts[1, :, c, t] += tonnes * share[:, j] * r_value
+            self.dev_count_total[:, c] += created
+            self.dev_tonnes_total[:, c] += tonnes
+            self.projects_created[:, c] += created
+
+    # ------------------------------------------------------------------------
+    # Portfolio buckets
+    # ------------------------------------------------------------------------
+
+    def _take_projects(self, moved: np.ndarray) -> np.ndarray:
+        """Remove `moved` projects per operational group with their pro rata amounts; return the amounts"""
+        count = self.op_count
+        share = np.divide(moved, count, out=np.zeros(count.shape), where=count > 0)
+        taken = self.op_amounts * share
+        self.op_amounts -= taken
+        self.op_count = count - moved
+        return taken
+
+    def _remove_failed(self, failed: np.ndarray) -> np.ndarray:
+        """Drop failed/retired projects (health-independent, so group health distributions are unchanged)"""
+        taken = self._take_projects(failed)
+        self.failed_total += failed.sum(axis=1)
+        return taken
+
+    def _step_projects(self, year: int) -> np.ndarray:
+        """ProjectsBroker.step_projects on the aggregated portfolios; returns reversal tonnes"""
+        rng = self.broker_rng
+        reversal = np.zeros(self.runs)
+        reversal_fractions = self.reversal_fractions[self.group_channel]
+
+        # Target-achieved retirement
+        retiring = self.co2_level < 350.0
+        if retiring.any():
+            overshoot = 350.0 - self.co2_level
+            inflation_ratio = np.maximum(self.global_inflation, 0.0) / 0.02
+            base_rate = np.where(overshoot <= 10, 0.02, np.where(overshoot <= 30, 0.05, 0.10))
+            multiplier = np.where(inflation_ratio > 2.5, 1.4, np.where(
+                inflation_ratio > 1.5, 1.2, np.where(inflation_ratio < 0.5, 0.8, 1.0)))
+            probability = np.where(retiring, np.minimum(0.5, base_rate * multiplier), 0.0)
+            retired = rng.binomial(self.op_count, probability[:, None])
+            taken = self._remove_failed(retired)
+            reversal += (taken[2] * reversal_fractions).sum(axis=1)
+
+        # End of life: the ring group that started max_years ago completes with its survivors
+        for c, (ring, max_years) in enumerate(zip(self.ring_sizes, MAX_OPERATIONAL_YEARS)):
+            if ring and year >= max_years:
+                group = self.group_start[c] + year % ring
+                self.completed_total[:, c] += self.op_count[:, group]
+                self.completed_tonnes[:, c] += self.op_amounts[0, :, group]
+                self.op_count[:, group] = 0
+                self.op_amounts[:, :, group] = 0.0
+                self.op_health[:, group] = 0.0
+
+        # Decay events move health down the grid (newly operational projects are not decayed)
+        failure_rates = np.minimum(np.maximum(
+            0.02 * self.carbon_cycle.get_project_risk_multiplier()[:, None] * self.channel_risk, 0.0), 0.5)
+        health = self.op_health
+        decayed = (health.reshape(-1, health.shape[2]) @ self.health_transition).reshape(health.shape)
+        decayed -= health
+        decayed *= failure_rates[:, self.group_channel, None]
+        health += decayed
+
+        # Development → operational, into the start year's ring group (or its long-lived group)
+        arriving = self.dev_count[:, :, year]
+        for c, (ring, first) in enumerate(zip(self.ring_sizes, self.long_lived_start)):
+            if year < first:
+                group = self.group_start[c] + year % ring
+                self.group_opened[group] = year
+            else:
+                group = self.group_start[c] + ring + (year - first) // LONG_LIVED_SPAN
+            total = self.op_count[:, group] + arriving[:, c]
+            weight = np.divide(arriving[:, c], total, out=np.zeros(self.runs), where=total > 0)
+            self.op_health[:, group] *= (1.0 - weight)[:, None]
+            self.op_health[:, group, 0] += weight
+            self.op_count[:, group] = total
+            if group >= self.capped_start:
+                self._add_created_shares(group, year, self.dev_delay_tonnes[:, c, year % max(DEVELOPMENT_YEARS)])
+            self.op_amounts[:2, :, group] += self.dev_amounts[:, :, c, year]
+        self.dev_delay_tonnes[:, :, year % max(DEVELOPMENT_YEARS)] = 0.0
+        self.dev_count_total -= arriving
+        first = np.isnan(self.first_project_tonnes) & (arriving > 0)
+        self.first_project_tonnes = np.where(first, self.dev_first_tonnes[:, :, year], self.first_project_tonnes)
+        self.dev_tonnes_total -= self.dev_amounts[0, :, :, year]
+        return reversal
+
+    def _verify_and_mint(self, capacity: float) -> Dict[str, np.ndarray]:
+        """Sim.verify_and_mint_batch on the aggregated portfolios"""
+        runs = self.runs
+        reversal = np.zeros(runs)
+        clawback = np.zeros(runs)
+        if self.template.enable_audits:
+            p = self.health_failure_probability
+            failure = self.op_health @ p
+            failed = np.zeros_like(self.op_count)
+            live = self.op_count > 0
+            failed[live] = self.auditor_rng.binomial(self.op_count[live], failure[live])
+            taken = self._remove_failed(failed)
+            clawback = (taken[3] * 0.5).sum(axis=1)
+            reversal = (taken[2] * self.reversal_fractions[self.group_channel]).sum(axis=1)
+            self.total_xcr_burned += clawback
+            # Survivors' health distribution, conditioned on passing (its mass was 1 - failure)
+            self.op_health *= 1.0 - p
+            self.op_health /= (1.0 - failure)[:, :, None]
+
+        # Crediting caps: conventional up to this year's BAU (none after net zero), AD up to LUC, filled
+        # in creation order like _sequential_cap fills them in project order. R is set at creation, so
+        # the credited share of a group's tonnes × R (r_fraction) can differ from that of its tonnes
+        tonnes = self.op_amounts[0]
+        fraction = np.ones(tonnes.shape)
+        r_fraction = np.ones(tonnes.shape)
+        bau_tonnes = np.where(self.net_zero_ever_reached, 0.0, self.bau_emissions_gt_per_year * 1e9)
+        luc_tonnes = np.full(runs, max(0.0, self.land_use_change_gtc * self.gtco2_per_gtc * 1e9))
+        for c, cap in ((_CONV, bau_tonnes), (_AD, luc_tonnes)):
+            self._fill_cap_in_creation_order(c, cap, fraction, r_fraction)
+        credited = tonnes * fraction
+        self.op_amounts[2] += credited
+        credited_channel = self._by_channel(credited)
+
+        first = np.isnan(self.reference_capacity) & (credited_channel > 0)
+        if first.any():
+            # The earliest-created project of the first start year is credited first: only the cap cuts it
+            caps = np.full(credited_channel.shape, np.inf)
+            caps[:, _CONV], caps[:, _AD] = bau_tonnes, luc_tonnes
+            first_credit = np.minimum(self.first_project_tonnes, caps)
+            self.reference_capacity = np.where(first, first_credit, self.reference_capacity)
+        self.cumulative_deployment += credited_channel
+
+        # Mint (co-benefit pool redistributed over passing projects), burn clawbacks
+        scale = capacity * self.brake_factor
+        adjusted = self.op_amounts[1] * r_fraction * scale[:, None]
+        minted = adjusted.sum(axis=1)
+        pool = minted * self.template.projects_broker.cobenefit_pool_fraction
+        passing = self.op_count.sum(axis=1)
+        bonus_share = np.divide(self.op_count, passing[:, None], out=np.zeros(self.op_count.shape),
+                                where=passing[:, None] > 0)
+        self.op_amounts[3] += adjusted - adjusted * self.template.projects_broker.cobenefit_pool_fraction
+        self.op_amounts[3] += pool[:, None] * bonus_share
+        return {
+            "total_sequestration": credited_channel.sum(axis=1),
+            "cdr_sequestration": credited_channel[:, _CDR],
+            "conventional_mitigation": credited_channel[:, _CONV],
+            "avoided_deforestation_tonnes": credited_channel[:, _AD],
+            "reversal_tonnes_audits": reversal,
+            "xcr_minted": minted,
+            "xcr_burned": clawback * scale,
+            "cobenefit_bonus_xcr": np.where(passing > 0, pool, 0.0),
+        }
+
+    # ------------------------------------------------------------------------
+    # Macro agents
+    # ------------------------------------------------------------------------
+
+    def _adopt_countries(self):
+        """GCR_ABM_Simulation.adopt_countries per member (GDP^0.5-weighted draws without replacement)"""
+        inactive = ~self.active_mask
+        remaining = inactive.sum(axis=1)
+        if not remaining.any():
+            return
+        rate = self.template.adoption_rate
+        rng = self.rng
+        num = int(rate) + (rng.random(self.runs) < rate - int(rate))
+        num = np.minimum(num, remaining)
+        shape = self.active_mask.shape
+        weights = self.gdp_tril ** 0.5 * rng.uniform(0.5, 1.5, size=shape)
+        # Efraimidis-Spirakis keys: the largest log(u) / w are a weighted sample without replacement
+        with np.errstate(divide="ignore"):
+            keys = np.where(inactive, np.log(rng.random(shape)) / weights, -np.inf)
+        order = np.argsort(-keys, axis=1, kind="stable")
+        adopted = np.zeros(shape, dtype=bool)
+        np.put_along_axis(adopted, order, np.arange(shape[1]) < num[:, None], axis=1)
+        self.active_mask |= adopted
+
+    def _update_sentiment(self, target: float):
+        """InvestorMarket.update_sentiment per member"""
+        s, inflation, warning = self.sentiment, self.global_inflation, self.warning
+        s = np.where(warning, s * np.where(self.last_warning, 0.995, 0.97), s)
+        s = s * np.where(inflation > 3.0 * target, 0.94, np.where(
+            inflation > 2.0 * target, 0.97, np.where(inflation > 1.5 * target, 0.995, 1.0)))
+        recovering = ~warning & (inflation <= 1.25 * target)
+        s = np.where(recovering, np.minimum(1.0, s + (1.0 - s) * 0.02), s)
+        reduction = self.template.cea.initial_co2_ppm - self.co2_level
+        bonus = np.where(reduction > 0.5, 0.015, np.where(reduction > 0.1, 0.005, 0.0))
+        s = np.where(bonus > 0, np.minimum(1.0, s + (1.0 - s) * bonus), s)
+        self.sentiment = np.maximum(0.1, s)
+        self.last_warning = warning
+
+    def _update_capital_flows(self, year: int, roadmap_gap: np.ndarray):
+        """CapitalMarket.update_capital_flows per member; returns (flow, premium, forward guidance)"""
+        market = self.template.capital_market
+        max_gap = market.initial_co2 - market.target_co2
+        forward_guidance = (0.3 * np.minimum((self.co2_level - market.target_co2) / max_gap, 1.0)
+                            + 0.5 * (year / self.years) ** 2
+                            + 0.2 * np.clip(roadmap_gap / max_gap, 0.0, 1.0))
+        inflation = self.global_inflation
+        hedge = np.where(inflation <= 0.02, 0.5 + 0.5 * (inflation / 0.02),
+                         1.0 + np.minimum((inflation - 0.02) / 0.04, 1.5))
+        supply, floor = self.total_xcr_supply, self.price_floor
+        neutrality = market._neutrality_threshold(year - self.template.xcr_start_year)
+        attractiveness = forward_guidance * hedge * self.sentiment
+        flow = np.maximum(supply * floor, 1e9) * 0.10 * (attractiveness - neutrality) * 2
+        if not self.seed_capital_deployed and market.one_time_seed_capital > 0:
+            self.seed_capital_deployed = True
+            flow = np.full(self.runs, market.one_time_seed_capital)
+        self.capital_inflow += np.maximum(flow, 0.0)
+        self.capital_outflow += np.maximum(-flow, 0.0)
+        market_cap = np.where(supply > 0, supply * floor, 1e9)
+        intensity = np.divide(flow, market_cap, out=np.zeros(self.runs), where=market_cap > 0)
+        return flow, floor * np.clip(intensity, -0.5, 0.5), forward_guidance
+
+    def _brake_factor(self, ratio: np.ndarray, budget_utilization: np.ndarray) -> np.ndarray:
+        """CEA.calculate_brake_factor per member"""
+        cea = self.template.cea
+        if cea.inflation_target <= 0:
+            return np.zeros(self.runs)
+        r = np.maximum(self.global_inflation, 0.0) / 0.02
+        adjustment = np.where(r < 0.5, 2.0, np.where(r < 2.0, 2.0 - (r - 0.5), np.maximum(0.3, 0.5 - 0.05 * (r - 2.0))))
+        start, mid, heavy = 10.0 * adjustment, 12.0 * adjustment, 15.0 * adjustment
+        heavy_floor = np.where(r < 0.5, 0.3, np.where(r < 2.0, 0.3 - 0.167 * (r - 0.5),
+                                                      np.maximum(0.01, 0.05 - 0.01 * (r - 2.0))))
+        ratio_brake = np.where(ratio < start, 1.0, np.where(
+            ratio < mid, 1.0 - 0.5 * (ratio - start) / (mid - start), np.where(
+                ratio < heavy, 0.5 - 0.25 * (ratio - mid) / (heavy - mid), heavy_floor)))
+        utilization = np.clip(budget_utilization, 0.0, 1.0)
+        span = max(1.0 - cea.budget_brake_start, 1e-6)
+        budget_brake = np.where(utilization < cea.budget_brake_start, 1.0, np.maximum(
+            cea.budget_brake_floor, 1.0 - (utilization - cea.budget_brake_start) / span))
+        penalty = np.where(r > 1.0, np.maximum(0.2, 1.0 - 0.4 * (r - 1.0)), 1.0)
+        return np.minimum(ratio_brake, budget_brake) * penalty
+
+    def _adjust_price_floor(self, year: int):
+        """CEA.adjust_price_floor per member"""
+        cea = self.template.cea
+        if year % cea.revision_interval == 0 and year > 0:
+            roadmap_gap = self.co2_level - cea.calculate_roadmap_target(year, self.years)
+            max_gap = cea.initial_co2_ppm - cea.target_co2_ppm
+            peak_factor = 1.0 + 0.5 * np.exp(-((year - self.years / 2) ** 2) / (self.years / 4) ** 2)
+            new_yield = (0.02 + roadmap_gap / max_gap * 0.05) * peak_factor
+            if cea.inflation_target > 0:
+                gap_ratio = np.maximum(0.0, self.global_inflation - cea.inflation_target) / cea.inflation_target
+                new_yield = new_yield * np.maximum(0.25, 1.0 - 0.6 * gap_ratio)
+            temperature = self.carbon_cycle.temperature
+            new_yield = new_yield * np.where(temperature > 2.0, 0.5, np.where(temperature > 1.75, 0.7, 1.0))
+            self.locked_annual_yield = np.clip(new_yield, -0.03, 0.10)
+        floor = self.price_floor
+        self.price_floor = np.maximum(floor * (1 + self.locked_annual_yield), floor * 0.95)
+
+    def _defend_floor(self, target: float, active_gdp_usd: np.ndarray):
+        """CentralBankAlliance.defend_floor per member; returns (support, inflation impact, XCR bought)"""
+        zeros = np.zeros(self.runs)
+        if target <= 0:
+            return zeros, zeros, zeros
+        floor, price = self.price_floor, self.market_price
+        defending = (self.annual_cqe_spent < self.total_cqe_budget) & (price < floor)
+        if not defending.any():
+            return zeros, zeros, zeros
+        willingness = 1 / (1 + np.exp(12.0 * (self.global_inflation - target * 1.5)))
+        gap = np.where(defending, floor - price, 0.0)
+        strength = np.minimum(gap / floor, 0.5) * willingness
+        support = gap * strength
+        purchased = self.total_xcr_supply * strength * 0.05
+        fiat = purchased * floor
+        over = defending & (self.annual_cqe_spent + fiat > self.total_cqe_budget)
+        remaining = self.total_cqe_budget - self.annual_cqe_spent
+        fiat = np.where(over, remaining, fiat)
+        purchased = np.where(over, np.divide(remaining, floor, out=zeros.copy(), where=floor > 0), purchased)
+        spent = purchased * floor
+        support = np.where(over, np.divide(support * remaining, spent, out=zeros.copy(), where=spent > 0), support)
+        fiat = np.where(defending, fiat, 0.0)
+        self.annual_cqe_spent += fiat
+        self.total_cqe_spent += fiat
+
+        share = np.divide(fiat, active_gdp_usd, out=zeros.copy(), where=active_gdp_usd > 0)
+        impact = np.where(active_gdp_usd > 0, share * 5, 0.0)
+        impact = np.where(share > 0.001, np.maximum(impact, 0.0025), impact)
+        impact = np.clip(impact, 0.0, 0.02)
+        return (np.where(defending, support, 0.0), np.where(defending, impact, 0.0),
+                np.where(defending, purchased, 0.0))
+
+    # ------------------------------------------------------------------------
+    # Simulation loop
+    # ------------------------------------------------------------------------
+
+    def step_year(self):
+        """Advance every member by one year and record its metrics (GCR_ABM_Simulation.step_year)"""
+        year = self.next_year
+        if year >= self.years:
+            raise RuntimeError("BatchSimulation has already run all its years")
+        sim, cea = self.template, self.template.cea
+        target = sim.inflation_target
+        runs = self.runs
+        zeros = np.zeros(runs)
+
+        budget = self.total_cqe_budget
+        budget_utilization = np.divide(self.annual_cqe_spent, budget, out=zeros.copy(), where=budget > 0)
+        system_active = year >= sim.xcr_start_year
+        if year != self.current_budget_year:
+            self.annual_cqe_spent = zeros.copy()
+            self.current_budget_year = year
+
+        capacity = sim.get_capacity_multiplier(year)
+        if capacity > 0:
+            self._adopt_countries()
+        active_gdp_usd = self.active_mask @ self.gdp_tril * 1e12
+
+        # Inflation: shocks, noise and correction toward target
+        if system_active:
+            shocked = self.rng.random(runs) < 0.05
+            self.global_inflation = self.global_inflation + np.where(shocked, self.rng.uniform(0.005, 0.015, runs), 0.0)
+            self.global_inflation = self.global_inflation + self.rng.normal(0, 0.002, runs)
+            gap = self.global_inflation - target
+            self.global_inflation = self.global_inflation - gap * np.where(np.abs(gap) > 0.02, 0.4, 0.25)
+        else:
+            self.global_inflation = zeros.copy()
+
+        # Market and CEA policy
+        net_capital_flow, premium, forward_guidance = zeros, zeros, zeros
+        if system_active:
+            self._update_sentiment(target)
+            roadmap_gap = self.co2_level - cea.calculate_roadmap_target(year, self.years)
+            net_capital_flow, premium, forward_guidance = self._update_capital_flows(year, roadmap_gap)
+            self.market_price = self.price_floor + 50 * self.sentiment + premium
+            market_cap = self.total_xcr_supply * self.market_price
+            self.total_cqe_budget = np.minimum(np.maximum(net_capital_flow, 0.0) * sim.central_bank.cqe_ratio,
+                                               active_gdp_usd * sim.central_bank.gdp_cap_ratio)
+
+            ratio = np.divide(market_cap, self.total_cqe_budget, out=zeros.copy(), where=self.total_cqe_budget > 0)
+            self.warning = ratio >= 8.0
+            self.brake_factor = self._brake_factor(ratio, budget_utilization)
+            self._adjust_price_floor(year)
+
+        # Project initiation
+        if capacity > 0 and system_active:
+            operational_gt = self._by_channel(self.op_amounts[0]) / 1e9
+            remaining_conventional = np.maximum(0.0, self.bau_emissions_gt_per_year - operational_gt[:, _CONV])
+            luc_gtco2 = self.land_use_change_gtc * self.gtco2_per_gtc
+            remaining_luc = np.maximum(0.0, luc_gtco2 - self._planned_gt()[:, _AD])
+            self.emissions_to_sinks_ratio = (np.maximum(0.1, remaining_conventional + remaining_luc)
+                                             / np.maximum(0.1, operational_gt[:, _CDR] + 5.0))
+            self.net_zero_ever_reached |= self.emissions_to_sinks_ratio <= 1.0
+            self.cdr_buildout_stopped |= year >= sim.cdr_buildout_stop_year
+            if sim.cdr_buildout_stop_on_co2_peak:
+                self.cdr_buildout_stopped |= self.co2_level < 360.0
+            self._initiate_projects(year)
+
+        reversal_projects = self._step_projects(year)
+
+        # Audit and mint; status counts as of verification
+        operational = self.op_count.sum(axis=1)
+        development = self.dev_count_total.sum(axis=1)
+        failed = self.failed_total.copy()
+        completed = self.completed_total.sum(axis=1)
+        if capacity > 0:
+            totals = self._verify_and_mint(capacity)
+        else:
+            totals = dict.fromkeys(("total_sequestration", "cdr_sequestration", "conventional_mitigation",
+                                    "avoided_deforestation_tonnes", "reversal_tonnes_audits", "xcr_minted",
+                                    "xcr_burned", "cobenefit_bonus_xcr"), zeros)
+        self.total_xcr_supply = self.total_xcr_supply + totals["xcr_minted"] - totals["xcr_burned"]
+
+        # CQE floor defence
+        support, impact, purchased = self._defend_floor(target, active_gdp_usd)
+        supported = support > 0
+        self.market_price = self.market_price + np.where(supported, support, 0.0)
+        inflation = np.where(supported, self.global_inflation + impact, self.global_inflation)
+        clamped = np.minimum(inflation - (inflation - target) * 0.6, target * 1.5)
+        self.global_inflation = np.where(supported & (inflation > target), clamped, inflation)
+
+        # Climate
+        gtc_per_gtco2 = 1 / self.gtco2_per_gtc
+        bau_emissions_gt = self.bau_emissions_gt_per_year
+        operational_gt = self._by_channel(self.op_amounts[0]) / 1e9
+        human_emissions = np.maximum(0.0, self.bau_emissions_gt_per_year - operational_gt[:, _CONV])
+        self.bau_emissions_gt_per_year = np.where(
+            self.net_zero_ever_reached, np.minimum(self.bau_emissions_gt_per_year, human_emissions),
+            self.bau_emissions_gt_per_year)
+        reversal = reversal_projects + totals["reversal_tonnes_audits"]
+        climate_state = self.carbon_cycle.step(
+            emissions_gtc=human_emissions * gtc_per_gtco2 + reversal / 1e9 * gtc_per_gtco2,
+            sequestration_gtc=totals["cdr_sequestration"] / 1e9 * gtc_per_gtco2,
+            land_use_change_gtc=np.maximum(0.0, self.land_use_change_gtc - operational_gt[:, _AD] * gtc_per_gtco2)
+        )
+        self.co2_level = self.carbon_cycle.co2_ppm
+        if year < sim.bau_peak_year:
+            growth = sim.bau_growth_rate_pre_peak
+        elif year < sim.bau_decline_start_year:
+            growth = sim.bau_post_peak_plateau_rate
+        else:
+            growth = sim.bau_decline_rate_post_peak
+        self.bau_emissions_gt_per_year = np.maximum(0.0, self.bau_emissions_gt_per_year * (1 + growth))
+        self.bau_co2_ppm = self._step_bau_climate(year, bau_emissions_gt)
+
+        columns = {
+            "CO2_ppm": lambda: self.co2_level,
+            "BAU_CO2_ppm": lambda: self.bau_co2_ppm,
+            "CO2_Avoided": lambda: self.bau_co2_ppm - self.co2_level,
+            "Inflation": lambda: self.global_inflation,
+            "XCR_Supply": lambda: self.total_xcr_supply,
+            "XCR_Minted": lambda: totals["xcr_minted"],
+            "XCR_Burned_Annual": lambda: totals["xcr_burned"],
+            "XCR_Burned_Cumulative": lambda: self.total_xcr_burned,
+            "Cobenefit_Bonus_XCR": lambda: totals["cobenefit_bonus_xcr"],
+            "Market_Price": lambda: self.market_price,
+            "Price_Floor": lambda: self.price_floor,
+            "Sentiment": lambda: self.sentiment,
+            "Projects_Total": lambda: self.projects_created.sum(axis=1),
+            "Projects_Operational": lambda: operational,
+            "Projects_Development": lambda: development,
+            "Projects_Failed": lambda: failed,
+            "Projects_Completed": lambda: completed,
+            "Sequestration_Tonnes": lambda: totals["total_sequestration"],
+            "CDR_Sequestration_Tonnes": lambda: totals["cdr_sequestration"],
+            "Conventional_Mitigation_Tonnes": lambda: totals["conventional_mitigation"],
+            "Avoided_Deforestation_Tonnes": lambda: totals["avoided_deforestation_tonnes"],
+            "Reversal_Tonnes": lambda: reversal,
+            "Human_Emissions_GtCO2": lambda: human_emissions,
+            "Conventional_Installed_GtCO2": lambda: operational_gt[:, _CONV],
+            "CEA_Warning": lambda: self.warning,
+            "CQE_Spent": lambda: self.total_cqe_spent,
+            "XCR_Purchased": lambda: purchased,
+            "Active_Countries": lambda: self.active_mask.sum(axis=1),
+            "CQE_Budget_Total": lambda: self.total_cqe_budget,
+            "Capacity": lambda: capacity,
+            "CDR_Cost_Per_Tonne": lambda: self._marginal_costs()[:, _CDR],
+            "Conventional_Cost_Per_Tonne": lambda: self._marginal_costs()[:, _CONV],
+            "CDR_Cumulative_GtCO2": lambda: self.cumulative_deployment[:, _CDR] / 1e9,
+            "Conventional_Cumulative_GtCO2": lambda: self.cumulative_deployment[:, _CONV] / 1e9,
+            "CDR_Buildout_Stopped": lambda: self.cdr_buildout_stopped,
+            "Net_Capital_Flow": lambda: net_capital_flow,
+            "Capital_Demand_Premium": lambda: premium,
+            "Forward_Guidance": lambda: forward_guidance,
+            "Capital_Inflow_Cumulative": lambda: self.capital_inflow,
+            "Capital_Outflow_Cumulative": lambda: self.capital_outflow,
+            "CEA_Brake_Factor": lambda: self.brake_factor,
+            "Annual_CQE_Spent": lambda: self.annual_cqe_spent,
+            "Annual_CQE_Budget": lambda: self.total_cqe_budget,
+            "CQE_Budget_Utilization": lambda: np.divide(self.annual_cqe_spent, self.total_cqe_budget,
+                                                        out=zeros.copy(), where=self.total_cqe_budget > 0),
+            "Investor_Sentiment": lambda: self.sentiment,
+        }
+        for j, name in enumerate(self.metrics):
+            self.cube[:, year, j] = climate_state[name] if name in _CLIMATE_COLUMNS else columns[name]()
+        self.next_year += 1
+
+    def _step_bau_climate(self, year: int, bau_emissions_gt: np.ndarray) -> np.ndarray:
+        """BAU CO2 per member: the shared path until any member's BAU flow leaves it, then stepped"""
+        path = self._bau_path
+        if path is not None:
+            if year < len(path) and (bau_emissions_gt == path.emissions_gt[year]).all():
+                return np.full(self.runs, path.co2_ppm[year])
+            cycle = self.bau_carbon_cycle
+            if year > 0:
+                for name, value in zip(BAU_STATE_FIELDS, path.states[year - 1]):
+                    getattr(cycle, name)[:] = value
+                cycle.years_elapsed = year
+            self._bau_path = None
+        self.bau_carbon_cycle.step(bau_emissions_gt / self.gtco2_per_gtc, 0.0, self.land_use_change_gtc)
+        return self.bau_carbon_cycle.co2_ppm
+
+    def run(self) -> np.ndarray:
+        """Run the remaining years; returns the (runs, years, metrics) cube"""
+        while self.next_year < self.years:
+            self.step_year()
+        return self.cube
+
+    # ------------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------------
+
+    def metric(self, name: str) -> np.ndarray:
+        """(runs, years run so far) array of one metric"""
+        try:
+            j = self._metric_index[name]
+        except KeyError:
+            raise ValueError(f"{name!r} is not one of this batch's metrics") from None
+        return self.cube[:, :self.next_year, j]
+
+    def member_frame(self, run: int) -> pd.DataFrame:
+        """One member's results as a run_simulation()-style frame"""
+        df = pd.DataFrame(self.cube[run, :self.next_year], columns=list(self.metrics))
+        df.insert(0, "Year", np.arange(self.next_year))
+        return df
+
+    def quantiles(self, name: str, q: Sequence[float] = (0.05, 0.5, 0.95)) -> pd.DataFrame:
+        """Ensemble mean and quantiles of one metric by year"""
+        values = self.metric(name)
+        df = pd.DataFrame(np.quantile(values, q, axis=0).T, columns=[f"q{p:g}" for p in q])
+        df.insert(0, "mean", values.mean(axis=0))
+        df.insert(0, "Year", np.arange(values.shape[1]))
+        return df
+
+
+def compare_with_scalar(runs: int, scalar_runs: int, years: int, seed: Optional[int],
+                        z_tolerance: float = 3.0, **sim_kwargs) -> pd.DataFrame:
+    """Two-sample comparison of batch and scalar ensemble means (cohort_validation style)"""
+    from cohort_validation import METRICS, _metrics
+
+    batch = BatchSimulation(runs, seed=seed, years=years, **sim_kwargs)
+    batch.run()
+    batch_results = pd.DataFrame([_metrics(batch.member_frame(i)) for i in range(runs)])
+    scalar_results = pd.DataFrame([
+        _metrics(GCR_ABM_Simulation(years=years, output_profile="metrics-only",
+                                    seed=None if seed is None else seed + run, **sim_kwargs).run_simulation())
+        for run in range(scalar_runs)
+    ])
+    rows = []
+    for metric in METRICS:
+        a, b = scalar_results[metric], batch_results[metric]
+        stderr = np.sqrt(a.var(ddof=1) / len(a) + b.var(ddof=1) / len(b))
+        diff = b.mean() - a.mean()
+        # Metrics fixed by the configuration (e.g. pre-start CO2) differ only by summation rounding
+        z = diff / stderr if stderr > 0 and not np.isclose(b.mean(), a.mean(), rtol=1e-12, atol=0.0) else 0.0
+        rows.append({
+            "metric": metric,
+            "scalar_mean": a.mean(),
+            "batch_mean": b.mean(),
+            "relative_diff": diff / abs(a.mean()) if a.mean() != 0 else 0.0,
+            "z": z,
+            "equivalent": bool(abs(z) <= z_tolerance)
+        })
+    return pd.DataFrame(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Vectorized Monte Carlo ensemble of the GCR simulation")
+    parser.add_argument("--runs", type=int, default=10_000, help="Ensemble members")
+    parser.add_argument("--years", type=int, default=50, help="Simulation years")
+    parser.add_argument("--seed", type=int, default=42, help="Root RNG seed")
+    parser.add_argument("--compare", type=int, default=0,
+                        help="Also compare against this many scalar runs (cohort_validation-style z-test)")
+    parser.add_argument("--csv", type=str, default="", help="Optional output CSV path for CO2 quantiles")
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    batch = BatchSimulation(args.runs, seed=args.seed, years=args.years)
+    batch.run()
+    elapsed = time.perf_counter() - start
+    print(f"{args.runs} members × {args.years} years in {elapsed:.2f}s")
+    summary = batch.quantiles("CO2_ppm")
+    print(summary.iloc[::max(args.years // 10, 1)].to_string(index=False))
+    if args.csv:
+        summary.to_csv(args.csv, index=False)
+        print(f"\nSaved CO2 quantiles: {args.csv}")
+
+    if args.compare:
+        comparison = compare_with_scalar(min(args.runs, 1000), args.compare, args.years, args.seed)
+        pd.set_option("display.max_columns", None)
+        print("\nBATCH VS SCALAR (ensemble means)")
+        print(comparison.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ import math
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+import numpy as np
+
 
 @dataclass
 class CarbonCycleParams:
@@ -278,3 +280,194 @@ class CarbonCycle:
             "Net_Atmospheric_Change_GtC": net_atm_change,
         }
         return self.last_step
+
+
+class BatchCarbonCycle:
+    """CarbonCycle stepping many independent members at once.
+
+    Reservoirs, temperature and diagnostics are arrays of length `runs`;
+    each member follows exactly the scalar CarbonCycle physics. Parameters
+    may be scalars or length-`runs` arrays (parameter-uncertainty sweeps).
+    step() writes into preallocated diagnostic arrays and returns them, so
+    copy a diagnostic before the next step if it must be kept.
+    """
+
+    DIAGNOSTICS = (
+        "Temperature_Anomaly", "Ocean_Uptake_GtC", "Land_Uptake_GtC", "Airborne_Fraction",
+        "Ocean_Sink_Capacity", "Land_Sink_Capacity", "Permafrost_Emissions_GtC", "Fire_Emissions_GtC",
+        "Cumulative_Emissions_GtC", "Climate_Risk_Multiplier", "C_Ocean_Surface_GtC", "C_Ocean_Deep_GtC",
+        "C_Land_GtC", "CO2_ppm", "Net_Atmospheric_Change_GtC",
+    )
+
+    def __init__(
+        self,
+        runs: int,
+        initial_co2_ppm=420.0,
+        params: Optional[CarbonCycleParams] = None,
+    ):
+        if runs < 1:
+            raise ValueError("runs must be at least 1")
+        self.runs = runs
+        self.params = p = params or CarbonCycleParams()
+
+        # Carbon stocks (GtC)
+        self.co2_ppm = self._per_member(initial_co2_ppm)
+        self.c_atm = self.co2_ppm / p.ppm_per_gtc
+        self.c_ocean_surface = self._per_member(p.surface_ocean_eq_gtc)
+        self.c_ocean_deep = self._per_member(p.deep_ocean_gtc)
+        self.c_land = self._per_member(p.land_gtc)
+        self.c_permafrost_remaining = self._per_member(p.permafrost_vulnerable_gtc)
+
+        # Timekeeping (shared: members step together)
+        self.years_elapsed = 0
+        self.cumulative_emissions = self._per_member(p.initial_cumulative_emissions_gtc)
+
+        # Temperature offset to anchor to observed anomaly
+        base_temp = (p.tcre / 1000.0) * self.cumulative_emissions
+        self._temperature_offset = p.baseline_temp_anomaly - base_temp
+        self.temperature = self._per_member(p.baseline_temp_anomaly)
+
+        # Baseline sink capacities for degradation tracking
+        self.baseline_ocean_uptake = self._calc_ocean_uptake(self.c_atm, self.temperature)
+        self.baseline_land_uptake = np.maximum(
+            self._calc_land_flux(self.temperature, self._per_member(p.land_use_change_gtc))[1], 1e-6)
+
+        # Last-step diagnostics
+        self.diagnostics: Dict[str, np.ndarray] = {name: np.zeros(runs) for name in self.DIAGNOSTICS}
+        self.airborne_fraction = self.diagnostics["Airborne_Fraction"]
+
+    @classmethod
+    def from_cycle(cls, cycle: CarbonCycle, runs: int) -> "BatchCarbonCycle":
+        """Batch whose members all start from a scalar cycle's current state"""
+        batch = cls(runs, cycle.co2_ppm, cycle.params)
+        batch.c_atm[:] = cycle.c_atm
+        batch.c_ocean_surface[:] = cycle.c_ocean_surface
+        batch.c_ocean_deep[:] = cycle.c_ocean_deep
+        batch.c_land[:] = cycle.c_land
+        batch.c_permafrost_remaining[:] = cycle.c_permafrost_remaining
+        batch.years_elapsed = cycle.years_elapsed
+        batch.cumulative_emissions[:] = cycle.cumulative_emissions
+        batch._temperature_offset = np.full(runs, cycle._temperature_offset)
+        batch.temperature[:] = cycle.temperature
+        batch.baseline_ocean_uptake = np.full(runs, cycle.baseline_ocean_uptake)
+        batch.baseline_land_uptake = np.full(runs, cycle.baseline_land_uptake)
+        return batch
+
+    def _per_member(self, value) -> np.ndarray:
+        return np.array(np.broadcast_to(np.asarray(value, dtype=float), (self.runs,)))
+
+    @staticmethod
+    def _ratio(numerator, denominator, default: float, out: np.ndarray) -> np.ndarray:
+        """numerator / denominator where the denominator is positive, else default"""
+        out[:] = default
+        return np.divide(numerator, denominator, out=out, where=denominator > 0)
+
+    # ------------------------------------------------------------------ #
+    # Core physics (array forms of the CarbonCycle methods)
+    # ------------------------------------------------------------------ #
+    def _calc_ocean_uptake(self, c_atm: np.ndarray, temperature: np.ndarray) -> np.ndarray:
+        p = self.params
+        disequilibrium = np.maximum(c_atm - p.preindustrial_gtc, 0.0)
+        beta = np.maximum(1.0 - p.beta_temp_coeff * (temperature - p.beta_temp_ref), 0.0)
+        gamma = 1.0 / (1.0 + p.gamma_coeff * disequilibrium)
+        amoc = np.where(
+            temperature <= p.amoc_temp_threshold,
+            1.0,
+            np.maximum(1.0 - 0.1 * (temperature - p.amoc_temp_threshold), 1.0 - p.amoc_max_reduction),
+        )
+        return disequilibrium * p.k_ocean * beta * gamma * amoc
+
+    def _calc_land_flux(self, temperature: np.ndarray, land_use_change_gtc: np.ndarray):
+        """(fire, net) land fluxes (net positive = uptake)."""
+        p = self.params
+        fertilization = np.maximum(
+            p.k_land * np.log(np.maximum(self.c_atm, 1.0) / p.preindustrial_gtc) * p.forest_area_factor, 0.0)
+        respiration = p.respiration_base * (p.respiration_q10 ** ((temperature - p.respiration_t_ref) / 10.0))
+        fire = p.fire_base * (1.0 + p.fire_alpha * (np.maximum(0.0, temperature - p.fire_threshold) ** 2))
+        return fire, fertilization - respiration - fire - land_use_change_gtc
+
+    def _calc_permafrost(self, temperature: np.ndarray) -> np.ndarray:
+        p = self.params
+        remaining = self.c_permafrost_remaining
+        thawing = (temperature >= p.permafrost_threshold) & (remaining > 0)
+        release = np.where(
+            thawing, np.minimum(p.permafrost_rate * (temperature - p.permafrost_threshold) * remaining, remaining), 0.0)
+        self.c_permafrost_remaining = remaining - release
+        return release
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+    def get_project_risk_multiplier(self, temperature: Optional[np.ndarray] = None) -> np.ndarray:
+        """CarbonCycle.get_project_risk_multiplier per member."""
+        temp = self.temperature if temperature is None else np.asarray(temperature)
+        return np.where(temp < 1.5, 1.0, np.where(temp < 2.0, 1.0 + 0.2 * (temp - 1.5), np.where(
+            temp < 3.0, 1.1 + 0.3 * (temp - 2.0), 1.4 + 0.5 * (temp - 3.0))))
+
+    def get_channel_risk_multiplier(self, channel: str) -> float:
+        return CarbonCycle.get_channel_risk_multiplier(self, channel)
+
+    def step(self, emissions_gtc, sequestration_gtc, land_use_change_gtc=None) -> Dict[str, np.ndarray]:
+        """
+        Advance every member by one year (arguments are scalars or length-runs arrays).
+
+        Returns:
+            The diagnostics dictionary (same keys as CarbonCycle.last_step), updated in place.
+        """
+        p = self.params
+        emissions_gtc = np.maximum(emissions_gtc, 0.0)
+        sequestration_gtc = np.maximum(sequestration_gtc, 0.0)
+        luc = np.maximum(p.land_use_change_gtc if land_use_change_gtc is None else land_use_change_gtc, 0.0)
+        total_emissions_for_metrics = emissions_gtc + luc
+
+        self.years_elapsed += 1
+        prev_c_atm = self.c_atm
+
+        # Flux calculations
+        f_ocean = self._calc_ocean_uptake(self.c_atm, self.temperature)
+        f_mixing = p.k_mix * (self.c_ocean_surface - p.surface_ocean_eq_gtc)
+        fire, f_land_net = self._calc_land_flux(self.temperature, luc)
+        f_permafrost = self._calc_permafrost(self.temperature)
+
+        # Guard against removing more carbon than available this step
+        sink_total = np.maximum(f_ocean, 0.0) + np.maximum(f_land_net, 0.0) + sequestration_gtc
+        max_sink = emissions_gtc + luc + f_permafrost + sequestration_gtc
+        overdrawn = (sink_total > max_sink) & (sink_total > 0)
+        scale = np.where(overdrawn, max_sink / np.where(overdrawn, sink_total, 1.0), 1.0)
+        f_ocean = f_ocean * scale
+        f_land_net = np.where(f_land_net > 0, f_land_net * scale, f_land_net)
+
+        # Reservoir updates
+        self.c_ocean_surface = np.maximum(self.c_ocean_surface + f_ocean - f_mixing, 0.0)
+        self.c_ocean_deep = np.maximum(self.c_ocean_deep + f_mixing, 0.0)
+        self.c_land = np.maximum(self.c_land + f_land_net, 0.0)
+
+        net_atm_change = emissions_gtc + f_permafrost - sequestration_gtc - f_ocean - f_land_net
+        self.c_atm = np.maximum(self.c_atm + net_atm_change, 0.0)
+        self.co2_ppm = self.c_atm * p.ppm_per_gtc
+
+        net_anthro = emissions_gtc + luc + f_permafrost - sequestration_gtc
+        self.cumulative_emissions = np.maximum(self.cumulative_emissions + net_anthro, 0.0)
+
+        committed = p.committed_max * (1.0 - np.exp(-self.years_elapsed / p.committed_tau_years))
+        self.temperature = (p.tcre / 1000.0) * self.cumulative_emissions + committed + self._temperature_offset
+
+        # Diagnostics
+        d = self.diagnostics
+        d["Temperature_Anomaly"][:] = self.temperature
+        d["Ocean_Uptake_GtC"][:] = f_ocean
+        d["Land_Uptake_GtC"][:] = f_land_net
+        total_emissions = np.broadcast_to(total_emissions_for_metrics, (self.runs,))
+        self._ratio(self.c_atm - prev_c_atm, total_emissions, 0.0, out=self.airborne_fraction)
+        self._ratio(f_ocean, self.baseline_ocean_uptake, 1.0, out=d["Ocean_Sink_Capacity"])
+        self._ratio(f_land_net, self.baseline_land_uptake, 1.0, out=d["Land_Sink_Capacity"])
+        d["Permafrost_Emissions_GtC"][:] = f_permafrost
+        d["Fire_Emissions_GtC"][:] = fire
+        d["Cumulative_Emissions_GtC"][:] = self.cumulative_emissions
+        d["Climate_Risk_Multiplier"][:] = self.get_project_risk_multiplier(self.temperature)
+        d["C_Ocean_Surface_GtC"][:] = self.c_ocean_surface
+        d["C_Ocean_Deep_GtC"][:] = self.c_ocean_deep
+        d["C_Land_GtC"][:] = self.c_land
+        d["CO2_ppm"][:] = self.co2_ppm
+        d["Net_Atmospheric_Change_GtC"][:] = net_atm_change
+        return d
@@ -0,0 +1,129 @@
+"""
+Cohort mode validation - per-project vs cohort-aggregated project portfolios
+
+Runs the simulation repeatedly in both project representations
+(ProjectsBroker.cohort_mode off and on) from paired seeds and compares the
+means of the headline metrics (CO2, sequestration, reversals, XCR minted and
+supply, project counts, peak inflation) with a two-sample z test. Cohort
+mode keeps one row per cohort and draws decay, audit failures and end of
+life per cohort instead of per project, so it must match the per-project
+model in distribution, not run by run.
+
+Usage:
+    python cohort_validation.py --runs 30 --years 80 --csv results.csv
+
+Exits non-zero when any metric differs by more than --z standard errors.
+"""
+
+import argparse
+import sys
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from gcr_model import GCR_ABM_Simulation
+
+
+METRICS = [
+    "final_co2", "min_co2", "total_sequestration", "total_cdr_sequestration",
+    "total_reversal", "total_xcr_minted", "final_xcr_supply", "final_projects_total",
+    "final_projects_operational", "final_projects_failed", "peak_inflation"
+]
+
+
+def _metrics(df: pd.DataFrame) -> Dict[str, float]:
+    return {
+        "final_co2": df["CO2_ppm"].iloc[-1],
+        "min_co2": df["CO2_ppm"].min(),
+        "total_sequestration": df["Sequestration_Tonnes"].sum(),
+        "total_cdr_sequestration": df["CDR_Sequestration_Tonnes"].sum(),
+        "total_reversal": df["Reversal_Tonnes"].sum(),
+        "total_xcr_minted": df["XCR_Minted"].sum(),
+        "final_xcr_supply": df["XCR_Supply"].iloc[-1],
+        "final_projects_total": df["Projects_Total"].iloc[-1],
+        "final_projects_operational": df["Projects_Operational"].iloc[-1],
+        "final_projects_failed": df["Projects_Failed"].iloc[-1],
+        "peak_inflation": df["Inflation"].max(),
+    }
+
+
+def run_mode_pair(runs: int, years: int, seed: Optional[int], **sim_kwargs) -> pd.DataFrame:
+    """Run the simulation `runs` times in per-project and in cohort mode
+
+    Run i of both modes starts from the same seed, so the two samples are
+    paired. Returns one row of metrics per (mode, run).
+    """
+    results = []
+    for cohort_mode in (False, True):
+        for run in range(runs):
+            run_seed = None if seed is None else seed + run
+            sim = GCR_ABM_Simulation(years=years, output_profile="metrics-only", seed=run_seed, **sim_kwargs)
+            sim.projects_broker.cohort_mode = cohort_mode
+            df = sim.run_simulation()
+            metrics = _metrics(df)
+            metrics.update({
+                "mode": "cohort" if cohort_mode else "per_project",
+                "run": run,
+                "rows": len(sim.projects_broker.projects)
+            })
+            results.append(metrics)
+    return pd.DataFrame(results)
+
+
+def compare_modes(results: pd.DataFrame, z_tolerance: float = 3.0) -> pd.DataFrame:
+    """Two-sample comparison of cohort vs per-project metric means
+
+    A metric passes when the means differ by at most z_tolerance standard
+    errors of the difference (or are equal).
+    """
+    per_project = results[results["mode"] == "per_project"]
+    cohort = results[results["mode"] == "cohort"]
+    rows = []
+    for metric in METRICS:
+        a, b = per_project[metric], cohort[metric]
+        stderr = np.sqrt(a.var(ddof=1) / len(a) + b.var(ddof=1) / len(b))
+        diff = b.mean() - a.mean()
+        z = diff / stderr if stderr > 0 else 0.0
+        rows.append({
+            "metric": metric,
+            "per_project_mean": a.mean(),
+            "cohort_mean": b.mean(),
+            "relative_diff": diff / abs(a.mean()) if a.mean() != 0 else 0.0,
+            "z": z,
+            "equivalent": bool(abs(z) <= z_tolerance)
+        })
+    return pd.DataFrame(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cohort mode vs per-project mode validation")
+    parser.add_argument("--runs", type=int, default=30, help="Monte Carlo runs per mode")
+    parser.add_argument("--years", type=int, default=80, help="Simulation years")
+    parser.add_argument("--seed", type=int, default=42, help="Base RNG seed")
+    parser.add_argument("--z", type=float, default=3.0, help="Max |z| for a metric to count as equivalent")
+    parser.add_argument("--csv", type=str, default="", help="Optional output CSV path for raw results")
+
+    args = parser.parse_args()
+
+    results = run_mode_pair(args.runs, args.years, args.seed)
+    summary = compare_modes(results, args.z)
+
+    pd.set_option("display.max_columns", None)
+    print("\nCOHORT MODE VALIDATION (cohort vs per-project means)")
+    print(summary.to_string(index=False))
+    rows = results.groupby("mode")["rows"].mean()
+    print(f"\nMean store rows: per-project {rows['per_project']:.0f}, cohort {rows['cohort']:.0f}")
+
+    if args.csv:
+        results.to_csv(args.csv, index=False)
+        print(f"\nSaved raw results: {args.csv}")
+
+    if not summary["equivalent"].all():
+        print("\nFAIL: cohort mode diverges on " + ", ".join(summary.loc[~summary["equivalent"], "metric"]))
+        sys.exit(1)
+    print("\nPASS: cohort mode is statistically equivalent on all metrics")
+
+
+if __name__ == "__main__":
+    main()
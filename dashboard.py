@@ -2,8 +2,8 @@ import streamlit as st
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
-import numpy as np
-from gcr_model import GCR_ABM_Simulation
+from gcr_model import GCR_ABM_Simulation, ChannelType, ProjectStatus
+from run_cache import cached_run
 
 # Page configuration
 st.set_page_config(
@@ -126,6 +126,11 @@ enable_audits = st.sidebar.checkbox("Enable Audits", value=True)
 random_seed = st.sidebar.number_input("Random Seed (0 = random)", min_value=0, max_value=10000, value=42)
 monte_carlo_runs = st.sidebar.slider("Monte Carlo Runs", min_value=1, max_value=20, value=1, step=1,
                                      help="Number of ensemble runs (aggregates results when >1)")
+common_random_numbers = st.sidebar.checkbox(
+    "Common Random Numbers",
+    value=False,
+    help="Give run i of both funding modes the same shocks, adoptions and project draws, so XCR vs Govt differences carry less sampling noise"
+)
 st.sidebar.markdown("---")
 st.sidebar.markdown("---")
 # Remove Funding Mode Radio - we run both now.
@@ -148,35 +153,37 @@ if run_button:
         for mode in ["XCR", "GOVT"]:
             dfs = []
             for i in range(monte_carlo_runs):
-                if base_seed is not None:
-                    np.random.seed(base_seed + i)
-                sim = GCR_ABM_Simulation(years=years, enable_audits=enable_audits, price_floor=price_floor,
-                                         adoption_rate=adoption_rate, inflation_target=inflation_target,
-                                         xcr_start_year=xcr_start_year, years_to_full_capacity=years_to_full_capacity,
-                                         cdr_learning_rate=cdr_learning_rate,
-                                         conventional_learning_rate=conventional_learning_rate,
-                                         scale_full_deployment_gt=scale_full_deployment_gt,
-                                         damping_steepness=damping_steepness,
-                                         max_cdr_capacity=max_cdr_capacity,
-                                         bau_peak_year=bau_peak_year,
-                                         cdr_material_budget_gt=cdr_material_budget_gt,
-                                         cdr_material_cost_multiplier=cdr_material_cost_multiplier,
-                                         cdr_material_capacity_floor=cdr_material_capacity_floor,
-                                         one_time_seed_capital_usd=one_time_seed_capital_usd,
-                                         cdr_buildout_stop_year=cdr_buildout_stop_year,
-                                         cdr_buildout_stop_on_co2_peak=cdr_buildout_stop_on_co2_peak,
-                                         funding_mode=mode)
-                df_run = sim.run_simulation()
-                df_run["run"] = i
-                df_run["Scenario"] = "XCR Market" if mode == "XCR" else "Govt Funding"
-                dfs.append(df_run)
-                
-                # Store first run for detailed viewing
+                run_seed = None if base_seed is None else base_seed + i
+                config = dict(years=years, enable_audits=enable_audits, price_floor=price_floor,
+                              adoption_rate=adoption_rate, inflation_target=inflation_target,
+                              xcr_start_year=xcr_start_year, years_to_full_capacity=years_to_full_capacity,
+                              cdr_learning_rate=cdr_learning_rate,
+                              conventional_learning_rate=conventional_learning_rate,
+                              scale_full_deployment_gt=scale_full_deployment_gt,
+                              damping_steepness=damping_steepness,
+                              max_cdr_capacity=max_cdr_capacity,
+                              bau_peak_year=bau_peak_year,
+                              cdr_material_budget_gt=cdr_material_budget_gt,
+                              cdr_material_cost_multiplier=cdr_material_cost_multiplier,
+                              cdr_material_capacity_floor=cdr_material_capacity_floor,
+                              one_time_seed_capital_usd=one_time_seed_capital_usd,
+                              cdr_buildout_stop_year=cdr_buildout_stop_year,
+                              cdr_buildout_stop_on_co2_peak=cdr_buildout_stop_on_co2_peak,
+                              funding_mode=mode, common_random_numbers=common_random_numbers)
                 if i == 0:
+                    # Keep the first run's simulation for detailed viewing
+                    sim = GCR_ABM_Simulation(seed=run_seed, **config)
+                    df_run = sim.run_simulation()
                     if mode == "XCR":
                         st.session_state.sim_xcr = sim
                     else:
                         st.session_state.sim_govt = sim
+                else:
+                    # Ensemble members only contribute results: reuse cached runs
+                    df_run = cached_run(config, run_seed)
+                df_run["run"] = i
+                df_run["Scenario"] = "XCR Market" if mode == "XCR" else "Govt Funding"
+                dfs.append(df_run)
 
             df_mode = pd.concat(dfs, ignore_index=True)
             df_mode["Year_Calendar"] = df_mode["Year"] + BASE_YEAR
@@ -1017,7 +1024,7 @@ if st.session_state.df is not None:
             # Projects by country (pie chart)
             country_counts = {}
             for country, data in sim.countries.items():
-                country_counts[country] = len(data['projects'])
+                country_counts[country] = len(data['projects']) + data.get('archived_projects', 0)
 
             fig.add_trace(
                 go.Pie(
@@ -1030,18 +1037,15 @@ if st.session_state.df is not None:
             )
 
             # Projects by channel (pie chart)
+            # Running counts by channel include archived (compacted) projects
+            store = sim.projects_broker.projects
+            counts_by_channel = {channel: store.status_counts[channel.value].sum() for channel in ChannelType}
             channel_counts = {
-                "CDR": 0,
-                "Conventional": 0,
-                "Co-benefits": 0
+                "CDR": int(counts_by_channel[ChannelType.CDR]),
+                "Conventional": int(counts_by_channel[ChannelType.CONVENTIONAL]),
+                "Co-benefits": int(sum(count for channel, count in counts_by_channel.items()
+                                       if channel not in (ChannelType.CDR, ChannelType.CONVENTIONAL)))
             }
-            for project in sim.projects_broker.projects:
-                if project.channel.name == "CDR":
-                    channel_counts["CDR"] += 1
-                elif project.channel.name == "CONVENTIONAL":
-                    channel_counts["Conventional"] += 1
-                else:
-                    channel_counts["Co-benefits"] += 1
 
             fig.add_trace(
                 go.Pie(
@@ -1065,20 +1069,19 @@ if st.session_state.df is not None:
             st.subheader("Project Statistics")
             col1, col2, col3, col4, col5 = st.columns(5)
 
-            operational_projects = [p for p in sim.projects_broker.projects if p.status.value == "operational"]
-            development_projects = [p for p in sim.projects_broker.projects if p.status.value == "development"]
-            failed_projects = [p for p in sim.projects_broker.projects if p.status.value == "failed"]
+            total_projects = store.total_projects()
+            failed_count = store.count(ProjectStatus.FAILED)
 
             with col1:
-                st.metric("Total Initiated", len(sim.projects_broker.projects))
+                st.metric("Total Initiated", total_projects)
             with col2:
-                st.metric("Operational", len(operational_projects))
+                st.metric("Operational", store.count(ProjectStatus.OPERATIONAL))
             with col3:
-                st.metric("In Development", len(development_projects))
+                st.metric("In Development", store.count(ProjectStatus.DEVELOPMENT))
             with col4:
-                st.metric("Failed", len(failed_projects))
+                st.metric("Failed", failed_count)
             with col5:
-                failure_rate = len(failed_projects) / len(sim.projects_broker.projects) * 100 if len(sim.projects_broker.projects) > 0 else 0
+                failure_rate = failed_count / total_projects * 100 if total_projects > 0 else 0
                 st.metric("Failure Rate", f"{failure_rate:.1f}%")
 
             # Country adoption over time
@@ -1403,6 +1406,10 @@ if st.session_state.df is not None:
             st.subheader("Statistical Summary")
             st.dataframe(df.describe(), width='stretch')
 
+            # Events of the first Monte Carlo run (adoptions, shocks, policy revisions, ...)
+            st.subheader("Event Log (first run)")
+            st.dataframe(sim.events.to_frame().drop(columns="Data"), width='stretch', height=300)
+
 else:
     # Welcome screen
     st.info("👈 Configure simulation parameters in the sidebar and click 'Run Simulation' to begin.")
@@ -1,8 +1,22 @@
+import os
+import io
+import copy
+import pickle
+import time
+import shutil
+import hashlib
+import weakref
+import tempfile
+import dataclasses
 import numpy as np
 import pandas as pd
-from dataclasses import dataclass, field
 from typing import List, Dict, Optional
+from collections import deque
+from collections.abc import Mapping
+from types import MappingProxyType
 from enum import Enum
+from functools import lru_cache
+import climate
 from climate import CarbonCycle
 from country_equity_data import COUNTRY_EQUITY_DATA
 
@@ -31,32 +45,1334 @@ def get_failure_reversal_fraction(channel: ChannelType) -> float:
         return CONVENTIONAL_FAILURE_REVERSAL_FRACTION
     return CDR_FAILURE_REVERSAL_FRACTION
 
+# ============================================================================
+# RANDOM STREAMS
+# ============================================================================
+
+def seed_sequence(seed=None) -> np.random.SeedSequence:
+    """SeedSequence for an int seed, a SeedSequence or None
+
+    None takes 128 bits from the legacy global NumPy state, so calling
+    np.random.seed() before building a simulation still reproduces it.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if seed is None:
+        seed = np.random.randint(2**32, size=4, dtype=np.uint64).tolist()
+    return np.random.SeedSequence(seed)
+
+
+def make_rng(seed=None) -> np.random.Generator:
+    """Generator for an int seed, SeedSequence, Generator or None (see seed_sequence)"""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed_sequence(seed))
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer: well-mixed uint64 hash of each element"""
+    with np.errstate(over="ignore"):
+        x = x + np.uint64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+class CommonRandomNumbers:
+    """Purpose-keyed random numbers for paired scenario comparisons
+
+    Every draw is a hash of (seed, purpose, key, slot), so it does not depend
+    on how many other draws a run makes. Time is counted from the system
+    start (`epoch`, the XCR start year), so a scenario that starts later
+    replays the same sequence. Inflation shocks and country adoption are
+    keyed by system year; project creation by the project's slot (system
+    year of its start, channel and order within that year's batch,
+    ProjectStore.slot); decay, retirement and audits by the slot and the
+    project's age. Scenarios run with the same seed therefore share their
+    exogenous events, and the k-th CDR project started in a given system
+    year gets the same size, host country and fate draws at each age in
+    every scenario.
+
+    How much this narrows paired differences depends on the scenario:
+    threshold switches in the model (the CEA brake flipping on a near-zero
+    CQE budget) decouple paired runs whatever their random numbers.
+
+    With antithetic=True uniforms u become 1 - u and normals z become -z:
+    the mirror half of an antithetic pair. Cohort-mode binomial draws come
+    from per-year purpose streams (stream()) and are not mirrored.
+    """
+
+    PURPOSES = ("shock", "inflation_noise", "adoption", "creation", "creation_normal",
+                "decay", "retirement", "audit")
+
+    def __init__(self, seed=None, antithetic: bool = False):
+        self.seed_sequence = seed_sequence(seed)
+        self.antithetic = antithetic
+        self.year = 0  # Key of year-keyed draws; set by the simulation each year
+        self.epoch = 0  # Year the system starts; project slots and adoption rounds count from it
+        self._bases: Dict[tuple, np.uint64] = {}
+
+    @property
+    def system_year(self) -> int:
+        """Years since the system started: the key of shock, noise and adoption draws"""
+        return self.year - self.epoch
+
+    def _base(self, purpose: str, key: int) -> np.uint64:
+        base = self._bases.get((purpose, key))
+        if base is None:
+            seq = self.seed_sequence
+            child = np.random.SeedSequence(seq.entropy, spawn_key=(*seq.spawn_key, self.PURPOSES.index(purpose), key))
+            base = self._bases[(purpose, key)] = child.generate_state(1, np.uint64)[0]
+        return base
+
+    def stream(self, purpose: str, key: Optional[int] = None) -> np.random.Generator:
+        """Generator dedicated to (purpose, key); key defaults to the current year"""
+        key = self.year if key is None else key
+        seq = self.seed_sequence
+        return np.random.default_rng(
+            np.random.SeedSequence(seq.entropy, spawn_key=(*seq.spawn_key, self.PURPOSES.index(purpose), key))
+        )
+
+    def _raw(self, purpose: str, slots, width: int, key: Optional[int]) -> np.ndarray:
+        """Unmirrored uniforms in [0, 1), shape [len(slots), width]"""
+        key = self.year if key is None else key
+        slots = np.asarray(slots, dtype=np.int64).astype(np.uint64)
+        counters = slots[:, None] * np.uint64(width) + np.arange(width, dtype=np.uint64)
+        bits = _splitmix64(_splitmix64(counters ^ self._base(purpose, key)))
+        return (bits >> np.uint64(11)) * (1.0 / 2**53)
+
+    def uniforms(self, purpose: str, slots, width: int = 1, key: Optional[int] = None) -> np.ndarray:
+        """Uniforms in [0, 1) for each slot, shape [len(slots), width]; key defaults to the year"""
+        u = self._raw(purpose, slots, width, key)
+        return 1.0 - u if self.antithetic else u
+
+    def project_uniforms(self, purpose: str, slots, start_years, width: int = 1) -> np.ndarray:
+        """Uniforms for project slots keyed by project age (years since start) instead of the year"""
+        ages = self.year - np.asarray(start_years, dtype=np.int64)
+        return self.uniforms(purpose, np.asarray(slots, dtype=np.int64) + (ages << 48), width, key=0)
+
+    def normals(self, purpose: str, slots, key: Optional[int] = None) -> np.ndarray:
+        """Standard normals for each slot (Box-Muller on the slot's two uniforms)"""
+        u = self._raw(purpose, slots, 2, key)
+        z = np.sqrt(-2.0 * np.log1p(-u[:, 0])) * np.cos(2.0 * np.pi * u[:, 1])
+        return -z if self.antithetic else z
+
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+# Integer codes used by the columnar project store
+STATUS_CODES = {
+    ProjectStatus.DEVELOPMENT: 0,
+    ProjectStatus.OPERATIONAL: 1,
+    ProjectStatus.FAILED: 2,
+    ProjectStatus.COMPLETED: 3,
+}
+STATUS_BY_CODE = tuple(STATUS_CODES)
+CHANNEL_BY_CODE = {channel.value: channel for channel in ChannelType}
+
+_DEVELOPMENT = STATUS_CODES[ProjectStatus.DEVELOPMENT]
+_OPERATIONAL = STATUS_CODES[ProjectStatus.OPERATIONAL]
+_FAILED = STATUS_CODES[ProjectStatus.FAILED]
+_COMPLETED = STATUS_CODES[ProjectStatus.COMPLETED]
+
+# Reversal fraction looked up by channel code (index 0 unused)
+REVERSAL_FRACTION_BY_CODE = np.zeros(max(CHANNEL_BY_CODE) + 1)
+for _code, _channel in CHANNEL_BY_CODE.items():
+    REVERSAL_FRACTION_BY_CODE[_code] = get_failure_reversal_fraction(_channel)
+
+# Health below which audit failure probability starts to rise (Auditor.audit_project)
+AUDIT_HEALTH_THRESHOLD = 0.9
+HEALTH_BIN_WIDTH = 0.05  # Health grid spacing of cohort rows and batch ensemble groups
+
+
+def health_grid(error_rate: float, width: float = HEALTH_BIN_WIDTH, samples: int = 400) -> tuple:
+    """Health bins for project groups: health, audit failure probabilities and decay transitions
+
+    Bin 0 is full health (1.0); the others split [0, 0.95) into `width`-wide
+    intervals, highest first, with an edge at the audit threshold (0.9) so
+    each bin's failure probability (Auditor.audit_project's, at the bin
+    midpoint) is exact for health spread evenly over it. transition[i, j]
+    is the probability that a decay event moves a project from bin i to j,
+    integrated over health within bin i and the U(0.8, 0.95) multiplier.
+    Returns (health, failure_probability, transition).
+    """
+    health, transition = _health_bins(width, samples)
+    slope = 0.25 / AUDIT_HEALTH_THRESHOLD
+    failure_probability = np.minimum(0.3, error_rate + slope * np.maximum(0.0, AUDIT_HEALTH_THRESHOLD - health))
+    return health.copy(), failure_probability, transition.copy()
+
+
+@lru_cache(maxsize=None)
+def _health_bins(width: float, samples: int) -> tuple:
+    """Bin health values and decay transitions of health_grid (independent of the error rate, computed once)
+
+    Health is sampled at `samples` midpoints within each bin; the chance that
+    the U(0.8, 0.95) multiplier lands a sample in each target bin is exact.
+    """
+    edges = np.union1d(np.round(np.arange(0.0, 0.95, width), 12), [AUDIT_HEALTH_THRESHOLD, 0.95])[::-1]
+    upper, lower = edges[:-1], edges[1:]
+    health = np.concatenate(([1.0], (upper + lower) / 2))
+    midpoints = (np.arange(samples) + 0.5) / samples
+    start = np.vstack((np.ones(samples), lower[:, None] + (upper - lower)[:, None] * midpoints))
+    low = np.clip(lower / start[:, :, None], 0.8, 0.95)
+    high = np.clip(upper / start[:, :, None], 0.8, 0.95)
+    transition = np.zeros((len(health), len(health)))
+    transition[:, 1:] = ((high - low) / 0.15).mean(axis=1)  # Nothing decays back to full health
+    for array in (health, transition):
+        array.setflags(write=False)
+    return health, transition
+
+
+@lru_cache(maxsize=None)
+def _cohort_health_grid(error_rate: float) -> tuple:
+    """health_grid as read-only float32 arrays (cohort rows renormalize their distributions every audit)"""
+    arrays = tuple(array.astype(np.float32) for array in health_grid(error_rate))
+    for array in arrays:
+        array.setflags(write=False)
+    return arrays
+
+
+class ProjectStore:
+    """Columnar (struct-of-arrays) storage for a project portfolio
+
+    Every project attribute lives in a NumPy column so the broker's hot paths
+    (capacity sums, status scans, cost totals) run as array operations instead
+    of walking Python objects. Channel and status are stored as integer codes
+    (ChannelType.value / STATUS_CODES) and countries as indexes into
+    `country_names`.
+
+    Columns are over-allocated; only the first `size` rows are live. Use
+    `live(name)` for a slice of the live rows.
+
+    The store also behaves like the old `List[Project]`: len(), iteration,
+    indexing and append() all work in terms of Project views.
+
+    Running aggregates keyed by [channel_code, status_code] (project counts,
+    annual tonnes, annual cost) are maintained on every row append, status
+    change and tonnes/cost write, so capacity queries are O(1). Status,
+    tonnes and cost must therefore be changed through set_status()/set_value()
+    (Project views do this automatically); check_aggregates() cross-checks
+    the running totals against a full scan.
+
+    Live statuses (development, operational) are also partitioned into index
+    sets, so per-year work can visit only live rows; failed and completed
+    projects are tracked by the counters alone.
+    compact() moves them out of the columns into a ProjectArchive while
+    leaving them in the aggregates.
+
+    The deterministic part of the lifecycle runs off a calendar: the store
+    keeps a `clock` (years stepped) and, whenever a row enters development or
+    operation, files it under the tick at which it becomes operational or
+    completes its lifespan. tick() advances the clock and fires only the
+    transitions due that year. years_in_development / years_operational are
+    accrued lazily from the clock (stored value + clock - stage_tick for the
+    row's current stage) and materialized on every status change;
+    sync_counters() materializes them on demand.
+
+    A row normally holds one project. In cohort mode (ProjectsBroker.cohort_mode)
+    a row holds `project_count` projects of one cohort (`cohort_id`) that
+    become operational at the same tick; tonnes, minted XCR and sequestered
+    carbon are cohort totals, cost, R-values and co-benefit score are means,
+    and `health_bins` holds the distribution of the members' health over the
+    health_grid bins (`health` is its mean). A cohort has one operational
+    row: development rows of a cohort spanning several start ticks join it as
+    they open (open_cohort_rows). Failed and retired members leave no rows:
+    remove_members() folds them into the FAILED aggregates and the `folded`
+    counters. Counts in the aggregates are project counts, not row counts.
+    """
+
+    # (column name, dtype) - Project field names are reused for readability
+    COLUMNS = (
+        ("channel_code", np.int8),
+        ("status_code", np.int8),
+        ("country_idx", np.int32),
+        ("start_year", np.int32),
+        ("development_years", np.int32),
+        ("annual_sequestration_tonnes", np.float64),  # Once operational
+        ("marginal_cost_per_tonne", np.float64),
+        ("r_base", np.float64),  # Base R-value from cost-effectiveness
+        ("r_effective", np.float64),  # r_base × policy_multiplier - used for XCR minting
+        ("years_in_development", np.int32),
+        ("years_operational", np.int32),  # Track operational lifespan
+        ("total_xcr_minted", np.float64),
+        ("health", np.float64),  # 1.0 = healthy, decays over time with stochastic events
+        ("durability_years", np.int32),  # Minimum durability (CDR)
+        ("max_operational_years", np.int32),  # Max operational lifespan (CM=25, CDR=100)
+        ("total_sequestered_tonnes", np.float64),  # Physical carbon delivered (for reversals)
+        ("structural_credited_tonnes", np.float64),  # Structural mitigation credited once (conventional)
+        ("co_benefit_score", np.float64),  # Robin Hood overlay (0-1)
+        ("project_count", np.int32),  # Projects represented by the row (1 unless cohort mode)
+        ("cohort_id", np.int32),  # Cohort the row belongs to (0 = individual project)
+        ("stage_tick", np.int32),  # Clock tick the row's stage counter was last synced at
+        ("due_tick", np.int32),  # Clock tick of the row's next scheduled transition (-1 = none)
+        ("slot", np.int64),  # (start system year, channel, order in that year's batch) key for common random numbers
+    )
+
+    # Stage counter accrued by the clock for each live status
+    STAGE_COUNTERS = {_DEVELOPMENT: "years_in_development", _OPERATIONAL: "years_operational"}
+
+    # Columns folded into the running aggregates (writes go through set_value)
+    AGGREGATED_COLUMNS = ("annual_sequestration_tonnes", "marginal_cost_per_tonne", "project_count")
+
+    # Cohort totals: split pro rata when members leave a cohort row, summed when rows join
+    ADDITIVE_COLUMNS = ("annual_sequestration_tonnes", "total_xcr_minted",
+                        "total_sequestered_tonnes", "structural_credited_tonnes")
+    # Cohort means weighted by annual tonnes (cost, R-values) or by members (co-benefit score)
+    TONNE_WEIGHTED_COLUMNS = ("marginal_cost_per_tonne", "r_base", "r_effective")
+
+    def __init__(self, capacity: int = 256, seed=None):
+        self._seed = seed  # Project decay stream, created on first draw (see rng)
+        self._rng: Optional[np.random.Generator] = None
+        self.size = 0
+        self.capacity = max(int(capacity), 1)
+        for name, dtype in self.COLUMNS:
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+        self.ids: List[str] = []
+        self.country_names: List[str] = []
+        self._country_index: Dict[str, int] = {}
+        self._views: List[Optional["Project"]] = []
+
+        # Running aggregates indexed [channel_code, status_code]
+        shape = (max(CHANNEL_BY_CODE) + 1, len(STATUS_CODES))
+        self.status_counts = np.zeros(shape, dtype=np.int64)
+        self.status_tonnes = np.zeros(shape)  # Sum of annual_sequestration_tonnes
+        self.status_cost = np.zeros(shape)  # Sum of marginal_cost_per_tonne × annual tonnes
+
+        # Row indexes of live projects by status code (sorted arrays cached until changed)
+        self._status_index: Dict[int, set] = {_DEVELOPMENT: set(), _OPERATIONAL: set()}
+        self._sorted_index: Dict[int, np.ndarray] = {}
+
+        # Lifecycle calendar: clock tick -> arrays of rows with a transition due then.
+        # Entries go stale when a row changes status early (lazy deletion via due_tick);
+        # per-row stepping (advance_row) marks the whole calendar for a rebuild
+        self.clock = 0
+        self._calendar: Dict[int, List[np.ndarray]] = {}
+        self._calendar_stale = False
+
+        # Cohort mode: health bin distribution per row (allocated with the first cohort row),
+        # (cohort_id, operational tick) -> development row and cohort_id -> operational row
+        self.health_bins: Optional[np.ndarray] = None
+        self._cohort_intake: Dict[tuple, int] = {}
+        self._cohort_rows: Dict[int, int] = {}
+        # Failed/retired cohort members folded out of their rows, in the aggregate cells
+        self.folded_counts = np.zeros(shape, dtype=np.int64)
+        self.folded_tonnes = np.zeros(shape)
+        self.folded_cost = np.zeros(shape)
+
+        # Failed/completed rows moved out by compact() (None until the first compaction)
+        self.archive: Optional["ProjectArchive"] = None
+
+        self._slot_counts: Dict[tuple, int] = {}  # (channel code, start year) -> projects added
+        self.crn: Optional[CommonRandomNumbers] = None  # Slot-keyed decay draws when set
+
+    # ------------------------------------------------------------------ #
+    # Storage management
+    # ------------------------------------------------------------------ #
+    def _ensure_capacity(self, extra: int):
+        needed = self.size + extra
+        if needed <= self.capacity:
+            return
+        new_capacity = max(self.capacity * 2, needed)
+        for name, dtype in self.COLUMNS:
+            grown = np.zeros(new_capacity, dtype=dtype)
+            grown[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, grown)
+        if self.health_bins is not None:
+            grown = np.zeros((new_capacity, self.health_bins.shape[1]), dtype=self.health_bins.dtype)
+            grown[:self.size] = self.health_bins[:self.size]
+            self.health_bins = grown
+        self.capacity = new_capacity
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """Random stream for project decay (built lazily: detached Project stores never draw)"""
+        if self._rng is None:
+            self._rng = make_rng(self._seed)
+        return self._rng
+
+    def copy(self) -> "ProjectStore":
+        """Independent copy of the store (Project views are not carried over)"""
+        clone = ProjectStore.__new__(ProjectStore)
+        clone._seed, clone._rng = None, self.rng  # Shared stream: copies draw fresh numbers, not replays
+        clone.crn = self.crn
+        clone._slot_counts = dict(self._slot_counts)
+        clone.size = self.size
+        clone.capacity = self.capacity
+        for name, _ in self.COLUMNS:
+            setattr(clone, name, getattr(self, name).copy())
+        clone.ids = list(self.ids)
+        clone.country_names = list(self.country_names)
+        clone._country_index = dict(self._country_index)
+        clone._views = [None] * self.size
+        clone.status_counts = self.status_counts.copy()
+        clone.status_tonnes = self.status_tonnes.copy()
+        clone.status_cost = self.status_cost.copy()
+        clone._status_index = {code: set(members) for code, members in self._status_index.items()}
+        clone._sorted_index = {}
+        clone.health_bins = None if self.health_bins is None else self.health_bins.copy()
+        clone._cohort_intake = dict(self._cohort_intake)
+        clone._cohort_rows = dict(self._cohort_rows)
+        clone.folded_counts = self.folded_counts.copy()
+        clone.folded_tonnes = self.folded_tonnes.copy()
+        clone.folded_cost = self.folded_cost.copy()
+        clone.clock = self.clock
+        clone._calendar = {tick: list(entries) for tick, entries in self._calendar.items()}
+        clone._calendar_stale = self._calendar_stale
+        clone.archive = None if self.archive is None else self.archive.copy()
+        return clone
+
+    def country_code(self, country: str) -> int:
+        """Return the integer index for a country name, interning it if new"""
+        idx = self._country_index.get(country)
+        if idx is None:
+            idx = len(self.country_names)
+            self.country_names.append(country)
+            self._country_index[country] = idx
+        return idx
+
+    def live(self, name: str) -> np.ndarray:
+        """Return the live rows of a column (a view, writes go to the store)"""
+        return getattr(self, name)[:self.size]
+
+    def add_row(self, id: str, channel: ChannelType, country: str, start_year: int,
+                development_years: int, annual_sequestration_tonnes: float,
+                marginal_cost_per_tonne: float, r_base: float, r_effective: float,
+                status: ProjectStatus = ProjectStatus.DEVELOPMENT,
+                years_in_development: int = 0, years_operational: int = 0,
+                total_xcr_minted: float = 0.0, health: float = 1.0,
+                durability_years: int = 100, max_operational_years: int = 100,
+                total_sequestered_tonnes: float = 0.0,
+                structural_credited_tonnes: float = 0.0,
+                co_benefit_score: float = 0.0, project_count: int = 1) -> int:
+        """Append one project row and return its index"""
+        self._ensure_capacity(1)
+        i = self.size
+        self.channel_code[i] = channel.value
+        self.status_code[i] = STATUS_CODES[status]
+        self.country_idx[i] = self.country_code(country)
+        self.start_year[i] = start_year
+        self.development_years[i] = development_years
+        self.annual_sequestration_tonnes[i] = annual_sequestration_tonnes
+        self.marginal_cost_per_tonne[i] = marginal_cost_per_tonne
+        self.r_base[i] = r_base
+        self.r_effective[i] = r_effective
+        self.years_in_development[i] = years_in_development
+        self.years_operational[i] = years_operational
+        self.total_xcr_minted[i] = total_xcr_minted
+        self.health[i] = health
+        self.durability_years[i] = durability_years
+        self.max_operational_years[i] = max_operational_years
+        self.total_sequestered_tonnes[i] = total_sequestered_tonnes
+        self.structural_credited_tonnes[i] = structural_credited_tonnes
+        self.co_benefit_score[i] = co_benefit_score
+        self.project_count[i] = project_count
+        self.cohort_id[i] = 0
+        self.slot[i] = self._take_slots(channel.value, start_year, 1)[0]
+        self.ids.append(id)
+        self._views.append(None)
+        self.size += 1
+        self._aggregate_row(i, 1)
+        self._schedule_row(i)
+        return i
+
+    def add_rows(self, ids: List[str], channel: ChannelType, country_codes: np.ndarray,
+                 start_year: int, development_years: np.ndarray,
+                 annual_sequestration_tonnes: np.ndarray, marginal_cost_per_tonne: float,
+                 r_base: float, r_effective: float, co_benefit_score: np.ndarray,
+                 max_operational_years: int = 100, project_count=1,
+                 cohort_ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """Append a batch of new (development-stage) projects of one channel
+
+        Array arguments have one entry per id; scalars are broadcast. Remaining
+        columns take the Project defaults. With cohort_ids each row holds
+        project_count members of that cohort, opening after its development
+        years (see add_cohort_rows). Returns the new row indexes.
+        """
+        n = len(ids)
+        self._ensure_capacity(n)
+        rows = np.arange(self.size, self.size + n)
+        new = slice(self.size, self.size + n)
+        for name, _ in self.COLUMNS:
+            getattr(self, name)[new] = 0
+        self.channel_code[new] = channel.value
+        self.status_code[new] = _DEVELOPMENT
+        self.country_idx[new] = country_codes
+        self.start_year[new] = start_year
+        self.development_years[new] = development_years
+        self.annual_sequestration_tonnes[new] = annual_sequestration_tonnes
+        self.marginal_cost_per_tonne[new] = marginal_cost_per_tonne
+        self.r_base[new] = r_base
+        self.r_effective[new] = r_effective
+        self.health[new] = 1.0
+        self.durability_years[new] = 100
+        self.max_operational_years[new] = max_operational_years
+        self.co_benefit_score[new] = co_benefit_score
+        self.project_count[new] = project_count
+        self.slot[new] = self._take_slots(channel.value, start_year, n)
+        if cohort_ids is not None:
+            self.cohort_id[new] = cohort_ids
+            if self.health_bins is None:
+                self.health_bins = np.zeros((self.capacity, len(_cohort_health_grid(0.0)[0])), dtype=np.float32)
+            self.health_bins[new] = 0.0
+            self.health_bins[new, 0] = 1.0
+            opening = self.clock + np.asarray(self.development_years[new])
+            for key, row in zip(zip(np.asarray(cohort_ids).tolist(), opening.tolist()), rows.tolist()):
+                self._cohort_intake[key] = row
+        self.ids.extend(ids)
+        self._views.extend([None] * n)
+        self.size += n
+        self._aggregate_rows(rows, 1)
+        self._schedule_rows(rows)
+        return rows
+
+    def next_slots(self, channel_code: int, start_year: int, n: int) -> np.ndarray:
+        """Slots the next n projects of a channel started in start_year will get"""
+        first = self._slot_counts.get((channel_code, start_year), 0)
+        system_year = start_year - (self.crn.epoch if self.crn is not None else 0)
+        return (system_year << 32) + (channel_code << 24) + np.arange(first, first + n, dtype=np.int64)
+
+    def _take_slots(self, channel_code: int, start_year: int, n: int) -> np.ndarray:
+        slots = self.next_slots(channel_code, start_year, n)
+        self._slot_counts[(channel_code, start_year)] = self._slot_counts.get((channel_code, start_year), 0) + n
+        return slots
+
+    def append(self, project: "Project"):
+        """Copy a project into the store and rebind it as a view of the new row"""
+        source, j = project._store, project._idx
+        if source is self:
+            return
+        source._sync_row(j)
+        self._ensure_capacity(1)
+        i = self.size
+        for name, _ in self.COLUMNS:
+            getattr(self, name)[i] = getattr(source, name)[j]
+        self.country_idx[i] = self.country_code(source.country_names[source.country_idx[j]])
+        self.slot[i] = self._take_slots(int(self.channel_code[i]), int(self.start_year[i]), 1)[0]
+        self.ids.append(source.ids[j])
+        self._views.append(project)
+        self.size += 1
+        self._aggregate_row(i, 1)
+        self._schedule_row(i)
+        project._store, project._idx = self, i
+
+    # ------------------------------------------------------------------ #
+    # Running aggregates
+    # ------------------------------------------------------------------ #
+    def _aggregate_row(self, i: int, sign: int):
+        """Add (sign=1) or remove (sign=-1) row i from its aggregate cell"""
+        cell = (self.channel_code[i], self.status_code[i])
+        tonnes = self.annual_sequestration_tonnes[i]
+        members = self._status_index.get(cell[1])
+        if members is not None:
+            if sign > 0:
+                members.add(i)
+            else:
+                members.discard(i)
+            self._sorted_index.pop(cell[1], None)
+        self.status_counts[cell] += sign * int(self.project_count[i])
+        if self.status_counts[cell] == 0:
+            # Empty cell: reset instead of accumulating float drift
+            self.status_tonnes[cell] = 0.0
+            self.status_cost[cell] = 0.0
+        else:
+            self.status_tonnes[cell] += sign * tonnes
+            self.status_cost[cell] += sign * tonnes * self.marginal_cost_per_tonne[i]
+
+    def _aggregate_rows(self, rows: np.ndarray, sign: int):
+        """Vectorized _aggregate_row for an array of row indexes"""
+        if len(rows) == 0:
+            return
+        channels = self.channel_code[rows]
+        statuses = self.status_code[rows]
+        tonnes = self.annual_sequestration_tonnes[rows]
+        cells = (channels, statuses)
+        np.add.at(self.status_counts, cells, sign * self.project_count[rows].astype(np.int64))
+        np.add.at(self.status_tonnes, cells, sign * tonnes)
+        np.add.at(self.status_cost, cells, sign * tonnes * self.marginal_cost_per_tonne[rows])
+        empty = self.status_counts == 0
+        self.status_tonnes[empty] = 0.0
+        self.status_cost[empty] = 0.0
+        for code, members in self._status_index.items():
+            picked = rows[statuses == code].tolist()
+            if picked:
+                if sign > 0:
+                    members.update(picked)
+                else:
+                    members.difference_update(picked)
+                self._sorted_index.pop(code, None)
+
+    def set_status(self, i: int, status_code: int):
+        """Change a row's status code, keeping aggregates and the calendar current"""
+        if self.status_code[i] == status_code:
+            return
+        self._sync_row(i)
+        self._aggregate_row(i, -1)
+        self.status_code[i] = status_code
+        self._aggregate_row(i, 1)
+        self._schedule_row(i)
+
+    def set_status_rows(self, rows: np.ndarray, status_code: int):
+        """Change the status code of many rows at once, keeping aggregates and the calendar current"""
+        rows = rows[self.status_code[rows] != status_code]
+        self._sync_rows(rows)
+        self._aggregate_rows(rows, -1)
+        self.status_code[rows] = status_code
+        self._aggregate_rows(rows, 1)
+        self._schedule_rows(rows)
+
+    def set_value(self, name: str, i: int, value):
+        """Write an aggregated column (tonnes/cost) for one row"""
+        self._aggregate_row(i, -1)
+        getattr(self, name)[i] = value
+        self._aggregate_row(i, 1)
+
+    def total_projects(self) -> int:
+        """Number of projects in the store (rows weighted by project_count)"""
+        return int(self.status_counts.sum())
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle calendar
+    # ------------------------------------------------------------------ #
+    def _sync_row(self, i: int):
+        """Fold the years accrued since stage_tick into row i's stage counter"""
+        name = self.STAGE_COUNTERS.get(int(self.status_code[i]))
+        if name is not None:
+            getattr(self, name)[i] += self.clock - self.stage_tick[i]
+        self.stage_tick[i] = self.clock
+
+    def _sync_rows(self, rows: np.ndarray):
+        """Vectorized _sync_row"""
+        if len(rows) == 0:
+            return
+        status = self.status_code[rows]
+        for code, name in self.STAGE_COUNTERS.items():
+            staged = rows[status == code]
+            getattr(self, name)[staged] += self.clock - self.stage_tick[staged]
+        self.stage_tick[rows] = self.clock
+
+    def _due_in(self, i: int) -> int:
+        """Years until row i's next lifecycle transition (0 = not live)"""
+        status = self.status_code[i]
+        if status == _DEVELOPMENT:
+            return max(int(self.development_years[i] - self.years_in_development[i]), 1)
+        if status == _OPERATIONAL:
+            return max(int(self.max_operational_years[i] - self.years_operational[i]), 1)
+        return 0
+
+    def _schedule_row(self, i: int):
+        """File a (synced) row under the tick of its next transition"""
+        self.stage_tick[i] = self.clock
+        wait = self._due_in(i)
+        if wait == 0:
+            self.due_tick[i] = -1
+            return
+        due = self.clock + wait
+        self.due_tick[i] = due
+        self._calendar.setdefault(due, []).append(np.array([i], dtype=np.intp))
+
+    def _schedule_rows(self, rows: np.ndarray):
+        """Vectorized _schedule_row"""
+        if len(rows) == 0:
+            return
+        self.stage_tick[rows] = self.clock
+        status = self.status_code[rows]
+        wait = np.where(status == _DEVELOPMENT,
+                        self.development_years[rows] - self.years_in_development[rows],
+                        self.max_operational_years[rows] - self.years_operational[rows])
+        due = np.where((status == _DEVELOPMENT) | (status == _OPERATIONAL),
+                       self.clock + np.maximum(wait, 1), -1)
+        self.due_tick[rows] = due
+        for tick in np.unique(due[due > 0]).tolist():
+            self._calendar.setdefault(tick, []).append(rows[due == tick])
+
+    def _rebuild_calendar(self):
+        """Reschedule every live row (after per-row stepping moved counters by hand)"""
+        live = self.live_indexes()
+        self._sync_rows(live)
+        self._calendar = {}
+        self._schedule_rows(live)
+        self._calendar_stale = False
+
+    def sync_counters(self):
+        """Materialize the lazily accrued stage counters of all live rows"""
+        self._sync_rows(self.live_indexes())
+
+    def stage_counter(self, name: str, i: int) -> int:
+        """Current value of a stage counter (years_in_development/years_operational)"""
+        value = int(getattr(self, name)[i])
+        if self.STAGE_COUNTERS.get(int(self.status_code[i])) == name:
+            value += self.clock - int(self.stage_tick[i])
+        return value
+
+    def set_stage_counter(self, name: str, i: int, value: int):
+        """Write a stage counter and reschedule the row's next transition"""
+        self._sync_row(i)
+        getattr(self, name)[i] = value
+        if self.status_code[i] in self.STAGE_COUNTERS:
+            self._schedule_row(i)
+
+    def tick(self) -> np.ndarray:
+        """Advance the clock one year and fire the lifecycle transitions due
+
+        Development rows due become operational and operational rows due are
+        completed (in row order, development first). Returns the completed rows.
+        """
+        if self._calendar_stale:
+            self._rebuild_calendar()
+        self.clock += 1
+        entries = self._calendar.pop(self.clock, None)
+        if not entries:
+            return np.empty(0, dtype=np.intp)
+        due = np.unique(np.concatenate(entries))
+        due = due[self.due_tick[due] == self.clock]  # Drop entries superseded by a status change
+        status = self.status_code[due]
+        self.set_status_rows(due[status == _DEVELOPMENT], _OPERATIONAL)
+        completed = due[status == _OPERATIONAL]
+        self.set_status_rows(completed, _COMPLETED)
+        return completed
+
+    def count(self, status: ProjectStatus, channel: Optional[ChannelType] = None) -> int:
+        """Number of projects with a status (optionally within one channel)"""
+        column = self.status_counts[:, STATUS_CODES[status]]
+        return int(column.sum() if channel is None else column[channel.value])
+
+    def indexes(self, status: ProjectStatus) -> np.ndarray:
+        """Sorted row indexes of live projects (development or operational)"""
+        code = STATUS_CODES[status]
+        cached = self._sorted_index.get(code)
+        if cached is None:
+            cached = np.fromiter(self._status_index[code], dtype=np.intp)
+            cached.sort()
+            self._sorted_index[code] = cached
+        return cached
+
+    def live_indexes(self) -> np.ndarray:
+        """Sorted row indexes of all live (development + operational) projects"""
+        live = np.concatenate((self.indexes(ProjectStatus.DEVELOPMENT),
+                               self.indexes(ProjectStatus.OPERATIONAL)))
+        live.sort()
+        return live
+
+    def tonnes(self, channel: ChannelType, *statuses: ProjectStatus) -> float:
+        """Total annual tonnes for a channel across the given statuses"""
+        return float(sum(self.status_tonnes[channel.value, STATUS_CODES[s]] for s in statuses))
+
+    def cost(self, channels, *statuses: ProjectStatus) -> float:
+        """Total annual cost (marginal cost × tonnes) for channels/statuses"""
+        return float(sum(self.status_cost[c.value, STATUS_CODES[s]] for c in channels for s in statuses))
+
+    def check_aggregates(self, rtol: float = 1e-9, atol: float = 1e-3):
+        """Cross-check running aggregates against a full scan (debug mode)
+
+        Raises RuntimeError if any cell disagrees.
+        """
+        cells = (self.live("channel_code").astype(np.intp), self.live("status_code").astype(np.intp))
+        tonnes = self.live("annual_sequestration_tonnes")
+        counts = np.zeros_like(self.status_counts)
+        scanned_tonnes = np.zeros_like(self.status_tonnes)
+        scanned_cost = np.zeros_like(self.status_cost)
+        np.add.at(counts, cells, self.live("project_count").astype(np.int64))
+        np.add.at(scanned_tonnes, cells, tonnes)
+        np.add.at(scanned_cost, cells, tonnes * self.live("marginal_cost_per_tonne"))
+        if self.archive is not None:
+            # Archived rows left the store but are still counted in the aggregates
+            counts += self.archive.status_counts
+            scanned_tonnes += self.archive.status_tonnes
+            scanned_cost += self.archive.status_cost
+        # So are cohort members folded out of their rows
+        counts += self.folded_counts
+        scanned_tonnes += self.folded_tonnes
+        scanned_cost += self.folded_cost
+        if not np.array_equal(counts, self.status_counts):
+            raise RuntimeError(f"Project count aggregates drifted:\n{self.status_counts}\nvs scan\n{counts}")
+        status = self.live("status_code")
+        for code, members in self._status_index.items():
+            if not np.array_equal(np.flatnonzero(status == code), np.sort(np.fromiter(members, dtype=np.intp))):
+                raise RuntimeError(f"Status index for {STATUS_BY_CODE[code].value} projects drifted")
+        if not self._calendar_stale:
+            live = self.live_indexes()
+            if np.any(self.due_tick[live] <= self.clock):
+                raise RuntimeError("Lifecycle calendar has live projects with no future transition")
+        for label, running, scanned in (("tonnes", self.status_tonnes, scanned_tonnes),
+                                        ("cost", self.status_cost, scanned_cost)):
+            if not np.allclose(running, scanned, rtol=rtol, atol=atol):
+                raise RuntimeError(f"Project {label} aggregates drifted:\n{running}\nvs scan\n{scanned}")
+
+    # ------------------------------------------------------------------ #
+    # Sequence protocol (Project views)
+    # ------------------------------------------------------------------ #
+    def view(self, idx: int) -> "Project":
+        """Return the (cached) Project view for a row"""
+        project = self._views[idx]
+        if project is None:
+            project = Project.__new__(Project)
+            project._store, project._idx = self, idx
+            self._views[idx] = project
+        return project
+
+    def views(self, indexes) -> List["Project"]:
+        """Return Project views for an iterable of row indexes"""
+        return [self.view(int(i)) for i in indexes]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield self.view(i)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.views(range(*key.indices(self.size)))
+        idx = int(key)
+        if idx < 0:
+            idx += self.size
+        if not 0 <= idx < self.size:
+            raise IndexError("project index out of range")
+        return self.view(idx)
+
+    # ------------------------------------------------------------------ #
+    # Row-level lifecycle
+    # ------------------------------------------------------------------ #
+    def step_row(self, i: int, failure_multiplier: float = 1.0) -> bool:
+        """Advance one project by one year. Returns True if retired due to age."""
+        annual_failure_rate = min(max(0.02 * failure_multiplier, 0.0), 0.5)
+        return self.advance_row(i, annual_failure_rate)
+
+    def advance_row(self, i: int, annual_failure_rate: float) -> bool:
+        """step_row with the (clipped) annual failure rate already computed
+
+        Steps the row by hand, independently of the clock; the calendar is
+        rebuilt before the next tick().
+        """
+        self._sync_row(i)
+        self._calendar_stale = True
+        status = self.status_code[i]
+        if status == _DEVELOPMENT:
+            self.years_in_development[i] += 1
+            if self.years_in_development[i] >= self.development_years[i]:
+                self.set_status(i, _OPERATIONAL)
+        elif status == _OPERATIONAL:
+            self.years_operational[i] += 1
+            # Check for end-of-life retirement (natural completion of project lifespan)
+            if self.years_operational[i] >= self.max_operational_years[i]:
+                self.set_status(i, _COMPLETED)  # Completed lifespan, not a failure
+                return True
+            # Stochastic decay: natural failures (fires, leaks, tech failure)
+            if self.crn is not None:
+                u = self.crn_uniforms("decay", np.array([i]), width=2)[0]
+                if u[0] < annual_failure_rate:
+                    self.health[i] *= 0.8 + 0.15 * u[1]
+            elif self.rng.random() < annual_failure_rate:  # Climate-adjusted failure rate
+                self.health[i] *= self.rng.uniform(0.8, 0.95)
+        return False
+
+    def advance_rows(self, rows: np.ndarray, failure_rates: np.ndarray) -> np.ndarray:
+        """Vectorized advance_row for an array of live rows
+
+        failure_rates is indexed by channel code. Draws come from array RNG
+        calls, so results match the per-row path in distribution but not draw
+        for draw. Returns the rows that completed their lifespan this year.
+        """
+        completed, active = self._advance_stages(rows)
+
+        # Stochastic decay for projects still operating
+        if self.crn is not None:
+            u = self.crn_uniforms("decay", active, width=2)
+            hit = u[:, 0] < failure_rates[self.channel_code[active]]
+            self.health[active[hit]] *= 0.8 + 0.15 * u[hit, 1]
+            return completed
+        hit = active[self.rng.random(len(active)) < failure_rates[self.channel_code[active]]]
+        self.health[hit] *= self.rng.uniform(0.8, 0.95, len(hit))
+        return completed
+
+    def crn_uniforms(self, purpose: str, rows: np.ndarray, width: int = 1) -> np.ndarray:
+        """Common random numbers for rows, keyed by their slot and age (CommonRandomNumbers.project_uniforms)"""
+        return self.crn.project_uniforms(purpose, self.slot[rows], self.start_year[rows], width)
+
+    def _advance_stages(self, rows: np.ndarray) -> tuple:
+        """Deterministic part of a yearly step: development progress and end of life
+
+        Transitions come from the calendar (tick()), so only rows with a
+        transition due this year are touched. Returns (rows completed this
+        year, rows of `rows` still operating).
+        """
+        operating = rows[self.status_code[rows] == _OPERATIONAL]
+        completed = self.tick()
+        return completed, operating[self.status_code[operating] == _OPERATIONAL]
+
+    # ------------------------------------------------------------------ #
+    # Cohort rows
+    # ------------------------------------------------------------------ #
+    def add_cohort_rows(self, ids: List[str], channel: ChannelType, country_codes: np.ndarray,
+                        start_year: int, development_years: np.ndarray,
+                        annual_sequestration_tonnes: np.ndarray, marginal_cost_per_tonne: float,
+                        r_base: float, r_effective: float, co_benefit_score: np.ndarray,
+                        max_operational_years: int, project_count: np.ndarray,
+                        cohort_ids: np.ndarray) -> np.ndarray:
+        """add_rows for new cohort members, one entry per (cohort, development years)
+
+        An entry joins its cohort's development row opening at the same tick
+        if there is one (totals add up, means are reweighted); otherwise it
+        becomes a new row. Returns the row receiving each entry.
+        """
+        opening = (self.clock + np.asarray(development_years)).tolist()
+        targets = np.array([self._cohort_intake.get(key, -1) for key in zip(cohort_ids.tolist(), opening)],
+                           dtype=np.intp)
+        joining, new = np.flatnonzero(targets >= 0), np.flatnonzero(targets < 0)
+        if len(new):
+            targets[new] = self.add_rows(
+                [ids[k] for k in new.tolist()], channel, country_codes[new], start_year, development_years[new],
+                annual_sequestration_tonnes[new], marginal_cost_per_tonne, r_base, r_effective,
+                co_benefit_score[new], max_operational_years=max_operational_years,
+                project_count=project_count[new], cohort_ids=cohort_ids[new]
+            )
+        for k in joining.tolist():
+            t = int(targets[k])
+            self._aggregate_row(t, -1)
+            self._join(t, int(project_count[k]), {
+                "annual_sequestration_tonnes": annual_sequestration_tonnes[k],
+                "marginal_cost_per_tonne": marginal_cost_per_tonne, "r_base": r_base,
+                "r_effective": r_effective, "co_benefit_score": co_benefit_score[k],
+            })
+            self._aggregate_row(t, 1)
+        return targets
+
+    def _join(self, t: int, count: int, values: Dict[str, float], health_bins: Optional[np.ndarray] = None):
+        """Add `count` members to cohort row t
+
+        `values` holds the members' ADDITIVE_COLUMNS totals (missing = 0) and
+        their TONNE_WEIGHTED_COLUMNS and co_benefit_score means; health_bins
+        is their health distribution (default: full health). Callers keep the
+        aggregates current.
+        """
+        before = int(self.project_count[t])
+        total = before + count
+        tonnes_before = self.annual_sequestration_tonnes[t]
+        tonnes_total = tonnes_before + values.get("annual_sequestration_tonnes", 0.0)
+        if tonnes_total > 0:
+            for name in self.TONNE_WEIGHTED_COLUMNS:
+                column = getattr(self, name)
+                column[t] = (column[t] * tonnes_before
+                             + values[name] * values.get("annual_sequestration_tonnes", 0.0)) / tonnes_total
+        self.co_benefit_score[t] = (self.co_benefit_score[t] * before + values["co_benefit_score"] * count) / total
+        for name in self.ADDITIVE_COLUMNS:
+            getattr(self, name)[t] += values.get(name, 0.0)
+        weight = count / total
+        if health_bins is None:
+            self.health_bins[t] *= 1.0 - weight
+            self.health_bins[t, 0] += weight
+            self.health[t] += (1.0 - self.health[t]) * weight
+        else:
+            self.health_bins[t] += (health_bins - self.health_bins[t]) * weight
+            self.health[t] += (values["health"] - self.health[t]) * weight
+        self.project_count[t] = total
+
+    def _clear_rows(self, rows: np.ndarray):
+        """Mark emptied cohort rows FAILED so they drop out of the live indexes (aggregates unchanged)"""
+        if len(rows) == 0:
+            return
+        self._sync_rows(rows)
+        self._aggregate_rows(rows, -1)
+        self.status_code[rows] = _FAILED
+        self.due_tick[rows] = -1
+        self._aggregate_rows(rows, 1)
+
+    def open_cohort_rows(self, rows: np.ndarray):
+        """Join development rows that just became operational to their cohort's operational row
+
+        The first row of a cohort to open becomes its operational row and
+        keeps its own end-of-life tick; later ones merge into it and are left
+        empty.
+        """
+        merged = []
+        for i in rows.tolist():
+            cohort = int(self.cohort_id[i])
+            self._cohort_intake.pop((cohort, self.clock), None)
+            t = self._cohort_rows.get(cohort)
+            if t is None or t == i or self.status_code[t] != _OPERATIONAL:
+                self._cohort_rows[cohort] = i
+                continue
+            # Both rows are in the same aggregate cell, so the aggregates do not change
+            values = {name: getattr(self, name)[i] for name in
+                      self.ADDITIVE_COLUMNS + self.TONNE_WEIGHTED_COLUMNS + ("co_benefit_score", "health")}
+            self._join(t, int(self.project_count[i]), values, self.health_bins[i])
+            for name in self.ADDITIVE_COLUMNS:
+                getattr(self, name)[i] = 0.0
+            self.project_count[i] = 0
+            merged.append(i)
+        self._clear_rows(np.array(merged, dtype=np.intp))
+
+    def advance_cohort_rows(self, rows: np.ndarray, failure_rates: np.ndarray) -> np.ndarray:
+        """advance_rows for cohort rows
+
+        Decay is not drawn per member: projects are independent and health
+        only matters through audits, so each operational row's health
+        distribution steps forward with the channel's failure rate times the
+        health_grid transition. Development rows opening this year join their
+        cohort after the decay step (newly operational projects are not
+        decayed). Returns the rows that completed their lifespan this year.
+        """
+        opening = rows[self.status_code[rows] == _DEVELOPMENT]
+        completed, active = self._advance_stages(rows)
+        if len(active):
+            health, _, transition = _cohort_health_grid(0.0)  # Neither depends on the audit error rate
+            bins = self.health_bins[active]
+            rates = failure_rates[self.channel_code[active]].astype(np.float32)
+            bins += rates[:, None] * (bins @ transition - bins)
+            self.health_bins[active] = bins
+            self.health[active] = bins @ health
+        self.open_cohort_rows(opening[self.status_code[opening] == _OPERATIONAL])
+        return completed
+
+    def remove_members(self, rows: np.ndarray, removed: np.ndarray):
+        """Fold removed[k] failed/retired members of operational cohort row rows[k] out of the store
+
+        The members' pro rata share of every ADDITIVE_COLUMNS total leaves the
+        row (callers take the clawback/reversal first); their projects and
+        annual tonnes move to the channel's FAILED aggregate cell and the
+        `folded` counters, with no row of their own. Health distributions are
+        left as they are (audit callers condition the survivors themselves).
+        Rows left empty are marked FAILED.
+        """
+        hit = removed > 0
+        rows, removed = rows[hit], removed[hit].astype(np.int64)
+        if len(rows) == 0:
+            return
+        counts = self.project_count[rows].astype(np.int64)
+        share = removed / counts
+        tonnes = self.annual_sequestration_tonnes[rows] * share
+        channels = self.channel_code[rows]
+        for aggregate, folded, values in ((self.status_counts, self.folded_counts, removed),
+                                          (self.status_tonnes, self.folded_tonnes, tonnes),
+                                          (self.status_cost, self.folded_cost,
+                                           tonnes * self.marginal_cost_per_tonne[rows])):
+            moved = np.bincount(channels, weights=values, minlength=len(aggregate)).astype(aggregate.dtype)
+            aggregate[:, _OPERATIONAL] -= moved
+            aggregate[:, _FAILED] += moved
+            folded[:, _FAILED] += moved
+        empty = self.status_counts[:, _OPERATIONAL] == 0
+        self.status_tonnes[empty, _OPERATIONAL] = 0.0  # Reset instead of accumulating float drift
+        self.status_cost[empty, _OPERATIONAL] = 0.0
+
+        for name in self.ADDITIVE_COLUMNS:
+            getattr(self, name)[rows] *= 1.0 - share
+        self.project_count[rows] = counts - removed
+        self._clear_rows(rows[counts == removed])
+
+    # ------------------------------------------------------------------ #
+    # Compaction
+    # ------------------------------------------------------------------ #
+    def compact(self, spill_dir: Optional[str] = None, keep_rows: bool = False) -> Dict[str, np.ndarray]:
+        """Move failed and completed rows into the archive and drop them from the store
+
+        Live rows keep their relative order, so row-order dependent results
+        (crediting order, RNG draw order) are unchanged. The archived rows stay
+        in the running aggregates, which therefore still count every project
+        ever created. Project views of archived rows are rebound to a detached
+        store holding just those rows. Returns the archived columns (plus "id"
+        and "country"), or an empty dict if nothing was archived. spill_dir and
+        keep_rows apply when the archive is created (see ProjectArchive).
+        """
+        status = self.live("status_code")
+        dead_mask = (status == _FAILED) | (status == _COMPLETED)
+        dead = np.flatnonzero(dead_mask)
+        if len(dead) == 0:
+            return {}
+        if self.archive is None:
+            self.archive = ProjectArchive(spill_dir, keep_rows)
+        archived = self.archive.add(self, dead)
+
+        viewed = np.array([i for i in dead.tolist() if self._views[i] is not None], dtype=np.intp)
+        if len(viewed):
+            detached = self._take(viewed)
+            for k, i in enumerate(viewed.tolist()):
+                project = self._views[i]
+                project._store, project._idx = detached, k
+                detached._views[k] = project
+
+        keep = np.flatnonzero(~dead_mask)
+        n = len(keep)
+        new_index = np.full(self.size, -1, dtype=np.intp)
+        new_index[keep] = np.arange(n)
+        capacity = self.capacity
+        if capacity > 4 * max(n, 64):
+            capacity = 2 * max(n, 64)  # Give back memory after large die-offs
+        for name, dtype in self.COLUMNS:
+            column = getattr(self, name)
+            compacted = column if capacity == self.capacity else np.zeros(capacity, dtype=dtype)
+            compacted[:n] = column[keep]
+            setattr(self, name, compacted)
+        if self.health_bins is not None:
+            compacted = np.zeros((capacity, self.health_bins.shape[1]), dtype=self.health_bins.dtype)
+            compacted[:n] = self.health_bins[keep]
+            self.health_bins = compacted
+        self.capacity = capacity
+        self.size = n
+        self.ids = [self.ids[i] for i in keep.tolist()]
+        self._views = [self._views[i] for i in keep.tolist()]
+        for k, project in enumerate(self._views):
+            if project is not None:
+                project._idx = k
+
+        self._status_index = {
+            code: set(new_index[np.fromiter(members, dtype=np.intp, count=len(members))].tolist())
+            for code, members in self._status_index.items()
+        }
+        self._sorted_index = {}
+        calendar = {}
+        for tick, entries in self._calendar.items():
+            rows = new_index[np.concatenate(entries)]
+            rows = rows[rows >= 0]
+            if len(rows):
+                calendar[tick] = [rows]
+        self._calendar = calendar
+        self._cohort_intake = {key: int(new_index[row]) for key, row in self._cohort_intake.items()
+                               if new_index[row] >= 0}
+        self._cohort_rows = {key: int(new_index[row]) for key, row in self._cohort_rows.items()
+                             if new_index[row] >= 0}
+        return archived
+
+    def _take(self, rows: np.ndarray) -> "ProjectStore":
+        """Standalone store holding copies of the given (terminal) rows"""
+        n = len(rows)
+        store = ProjectStore(capacity=n, seed=self.rng)
+        store.crn = self.crn
+        for name, _ in self.COLUMNS:
+            getattr(store, name)[:n] = getattr(self, name)[rows]
+        store.ids = [self.ids[i] for i in rows.tolist()]
+        store.country_names = list(self.country_names)
+        store._country_index = dict(self._country_index)
+        store._views = [None] * n
+        store.size = n
+        store.clock = self.clock
+        store._aggregate_rows(np.arange(n), 1)
+        return store
+
+
+class _SpillDirectory:
+    """Temporary directory of spilled archive chunks, removed once unused
+
+    The directory is deleted when the last archive holding it is garbage
+    collected (copies and forks share it) or on close(). Pickled copies
+    (snapshots) refer to the directory without owning it.
+    """
+
+    def __init__(self, parent: str):
+        os.makedirs(parent, exist_ok=True)
+        self.path = tempfile.mkdtemp(prefix="archive_", dir=parent)
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self.path, True)
+
+    def write(self, columns: Dict[str, np.ndarray]) -> str:
+        """Write one chunk under a unique name and return its path"""
+        os.makedirs(self.path, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix="chunk_", suffix=".npz", dir=self.path)
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **columns)
+        return path
+
+    def close(self):
+        if self._cleanup is not None:
+            self._cleanup()
+
+    @classmethod
+    def _attach(cls, path: str) -> "_SpillDirectory":
+        spill = cls.__new__(cls)
+        spill.path, spill._cleanup = path, None
+        return spill
+
+    def __reduce__(self):
+        return _SpillDirectory._attach, (self.path,)
+
+
+class ProjectArchive:
+    """Columnar archive of failed and completed projects (ProjectStore.compact)
+
+    Running counters keep what the model and dashboard still need once rows
+    leave the store: [channel_code, status_code] project counts, annual tonnes
+    and cost (the same cells as the store aggregates), projects per country,
+    and cumulative sequestered tonnes and minted XCR per channel code. By
+    default only the counters are kept, so memory stays bounded on long runs.
+
+    The archived rows themselves are kept only on request: with a `spill_dir`
+    each compaction writes one .npz chunk to a temporary subdirectory of it
+    (removed with the archive, or by close()); with `keep_rows` the chunks
+    stay in memory. load() reads them back as one set of columns.
+    """
+
+    def __init__(self, spill_dir: Optional[str] = None, keep_rows: bool = False):
+        self.spill_dir = spill_dir
+        self.keep_rows = keep_rows or spill_dir is not None
+        self._spill: Optional[_SpillDirectory] = None  # Created on first spill
+        self.chunks: List = []  # Column dicts, or .npz paths once spilled
+        self.rows = 0
+        shape = (max(CHANNEL_BY_CODE) + 1, len(STATUS_CODES))
+        self.status_counts = np.zeros(shape, dtype=np.int64)
+        self.status_tonnes = np.zeros(shape)
+        self.status_cost = np.zeros(shape)
+        self.country_counts: Dict[str, int] = {}
+        self.sequestered_tonnes = np.zeros(shape[0])  # Sum of total_sequestered_tonnes
+        self.xcr_minted = np.zeros(shape[0])  # Sum of total_xcr_minted
+
+    def add(self, store: ProjectStore, rows: np.ndarray) -> Dict[str, np.ndarray]:
+        """Archive rows of a store (counters are synced) and return their columns"""
+        columns = {name: getattr(store, name)[rows].copy() for name, _ in store.COLUMNS}
+        columns["id"] = np.array([store.ids[i] for i in rows.tolist()])
+        columns["country"] = np.array(store.country_names)[columns["country_idx"]]
+
+        cells = (columns["channel_code"].astype(np.intp), columns["status_code"].astype(np.intp))
+        counts = columns["project_count"].astype(np.int64)
+        tonnes = columns["annual_sequestration_tonnes"]
+        np.add.at(self.status_counts, cells, counts)
+        np.add.at(self.status_tonnes, cells, tonnes)
+        np.add.at(self.status_cost, cells, tonnes * columns["marginal_cost_per_tonne"])
+        np.add.at(self.sequestered_tonnes, cells[0], columns["total_sequestered_tonnes"])
+        np.add.at(self.xcr_minted, cells[0], columns["total_xcr_minted"])
+        for name, count in zip(columns["country"].tolist(), counts.tolist()):
+            self.country_counts[name] = self.country_counts.get(name, 0) + count
+
+        if self.spill_dir is not None:
+            if self._spill is None:
+                self._spill = _SpillDirectory(self.spill_dir)
+            self.chunks.append(self._spill.write(columns))
+        elif self.keep_rows:
+            self.chunks.append(columns)
+        self.rows += len(rows)
+        return columns
+
+    def close(self):
+        """Drop kept rows and delete the spill directory (shared with copies and forks)"""
+        if self._spill is not None:
+            self._spill.close()
+        self.chunks = []
+        self.keep_rows = False
+
+    def load(self) -> Dict[str, np.ndarray]:
+        """All archived rows as one dict of columns (reads spilled chunks back)"""
+        if self.rows and not self.keep_rows:
+            raise ValueError("archived rows were not kept; pass keep_rows=True or a spill_dir")
+        parts = []
+        for chunk in self.chunks:
+            if isinstance(chunk, str):
+                with np.load(chunk) as data:
+                    chunk = {name: data[name] for name in data.files}
+            parts.append(chunk)
+        if not parts:
+            return {}
+        return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+    def total_projects(self) -> int:
+        """Number of archived projects (rows weighted by project_count)"""
+        return int(self.status_counts.sum())
+
+    def copy(self) -> "ProjectArchive":
+        """Copy of the counters; chunks are never modified and are shared"""
+        clone = ProjectArchive.__new__(ProjectArchive)
+        clone.__dict__.update(self.__dict__)
+        clone.chunks = list(self.chunks)
+        clone.status_counts = self.status_counts.copy()
+        clone.status_tonnes = self.status_tonnes.copy()
+        clone.status_cost = self.status_cost.copy()
+        clone.country_counts = dict(self.country_counts)
+        clone.sequestered_tonnes = self.sequestered_tonnes.copy()
+        clone.xcr_minted = self.xcr_minted.copy()
+        return clone
+
+    def __len__(self) -> int:
+        return self.rows
+
+
+def _project_column(name: str, cast):
+    def fget(self):
+        return cast(getattr(self._store, name)[self._idx])
+
+    def fset(self, value):
+        getattr(self._store, name)[self._idx] = value
+
+    def fset_aggregated(self, value):
+        self._store.set_value(name, self._idx, value)
+
+    return property(fget, fset_aggregated if name in ProjectStore.AGGREGATED_COLUMNS else fset)
+
+
+def _stage_counter_column(name: str):
+    def fget(self):
+        return self._store.stage_counter(name, self._idx)
+
+    def fset(self, value):
+        self._store.set_stage_counter(name, self._idx, value)
+
+    return property(fget, fset)
+
+
 class Project:
-    """Represents a carbon mitigation/sequestration project"""
-    id: str
-    channel: ChannelType
-    country: str
-    start_year: int
-    development_years: int
-    annual_sequestration_tonnes: float  # Once operational
-    marginal_cost_per_tonne: float
-    r_base: float  # Base R-value from cost-effectiveness
-    r_effective: float  # Effective R-value (r_base × policy_multiplier) - used for XCR minting
-    status: ProjectStatus = ProjectStatus.DEVELOPMENT
-    years_in_development: int = 0
-    years_operational: int = 0  # Track operational lifespan
-    total_xcr_minted: float = 0.0
-    health: float = 1.0  # 1.0 = healthy, decays over time with stochastic events
-    durability_years: int = 100  # Minimum durability (CDR)
-    max_operational_years: int = 100  # Max operational lifespan (CM=25, CDR=100)
-    total_sequestered_tonnes: float = 0.0  # Physical carbon delivered (for reversals)
-    structural_credited_tonnes: float = 0.0  # Structural mitigation credited once (conventional)
-    co_benefit_score: float = 0.0  # Robin Hood overlay (0-1)
+    """Represents a carbon mitigation/sequestration project
+
+    A lightweight view onto one row of a ProjectStore. Constructing a Project
+    directly creates a private single-row store; appending it to a broker's
+    store copies the row there and rebinds the view.
+    """
+    __slots__ = ("_store", "_idx")
+
+    def __init__(self, id: str, channel: ChannelType, country: str, start_year: int,
+                 development_years: int, annual_sequestration_tonnes: float,
+                 marginal_cost_per_tonne: float, r_base: float, r_effective: float,
+                 status: ProjectStatus = ProjectStatus.DEVELOPMENT,
+                 years_in_development: int = 0, years_operational: int = 0,
+                 total_xcr_minted: float = 0.0, health: float = 1.0,
+                 durability_years: int = 100, max_operational_years: int = 100,
+                 total_sequestered_tonnes: float = 0.0,
+                 structural_credited_tonnes: float = 0.0,
+                 co_benefit_score: float = 0.0):
+        store = ProjectStore(capacity=1)
+        self._idx = store.add_row(
+            id, channel, country, start_year, development_years,
+            annual_sequestration_tonnes, marginal_cost_per_tonne, r_base, r_effective,
+            status, years_in_development, years_operational, total_xcr_minted,
+            health, durability_years, max_operational_years,
+            total_sequestered_tonnes, structural_credited_tonnes, co_benefit_score
+        )
+        self._store = store
+        store._views[self._idx] = self
+
+    @property
+    def id(self) -> str:
+        return self._store.ids[self._idx]
+
+    @property
+    def channel(self) -> ChannelType:
+        return CHANNEL_BY_CODE[int(self._store.channel_code[self._idx])]
+
+    @property
+    def country(self) -> str:
+        return self._store.country_names[self._store.country_idx[self._idx]]
+
+    @property
+    def status(self) -> ProjectStatus:
+        return STATUS_BY_CODE[self._store.status_code[self._idx]]
+
+    @status.setter
+    def status(self, value: ProjectStatus):
+        self._store.set_status(self._idx, STATUS_CODES[value])
+
+    start_year = _project_column("start_year", int)
+    development_years = _project_column("development_years", int)
+    annual_sequestration_tonnes = _project_column("annual_sequestration_tonnes", float)
+    marginal_cost_per_tonne = _project_column("marginal_cost_per_tonne", float)
+    r_base = _project_column("r_base", float)
+    r_effective = _project_column("r_effective", float)
+    years_in_development = _stage_counter_column("years_in_development")
+    years_operational = _stage_counter_column("years_operational")
+    total_xcr_minted = _project_column("total_xcr_minted", float)
+    health = _project_column("health", float)
+    durability_years = _project_column("durability_years", int)
+    max_operational_years = _project_column("max_operational_years", int)
+    total_sequestered_tonnes = _project_column("total_sequestered_tonnes", float)
+    structural_credited_tonnes = _project_column("structural_credited_tonnes", float)
+    co_benefit_score = _project_column("co_benefit_score", float)
+    project_count = _project_column("project_count", int)
 
     # Backward compatibility property
     @property
@@ -66,23 +1382,425 @@ class Project:
 
     def step(self, failure_multiplier: float = 1.0) -> bool:
         """Advance project by one year. Returns True if project retired due to age."""
-        retired_due_to_age = False
-        if self.status == ProjectStatus.DEVELOPMENT:
-            self.years_in_development += 1
-            if self.years_in_development >= self.development_years:
-                self.status = ProjectStatus.OPERATIONAL
-        elif self.status == ProjectStatus.OPERATIONAL:
-            self.years_operational += 1
-            # Check for end-of-life retirement (natural completion of project lifespan)
-            if self.years_operational >= self.max_operational_years:
-                self.status = ProjectStatus.COMPLETED  # Completed lifespan, not a failure
-                retired_due_to_age = True
-            else:
-                # Stochastic decay: natural failures (fires, leaks, tech failure)
-                annual_failure_rate = np.clip(0.02 * failure_multiplier, 0.0, 0.5)
-                if np.random.rand() < annual_failure_rate:  # Climate-adjusted failure rate
-                    self.health *= np.random.uniform(0.8, 0.95)
-        return retired_due_to_age
+        return self._store.step_row(self._idx, failure_multiplier)
+
+    def __repr__(self) -> str:
+        return (f"Project(id={self.id!r}, channel={self.channel}, country={self.country!r}, "
+                f"status={self.status}, annual_sequestration_tonnes={self.annual_sequestration_tonnes:.3g}, "
+                f"health={self.health:.3f})")
+
+class YearTable:
+    """Year-indexed lookup table for a curve of (year, fixed parameters)
+
+    `curve(years, *params)` is evaluated once over integer years 0..horizon-1
+    and reused until the parameters change or a later year is requested.
+    Non-integer or negative years are evaluated directly.
+    """
+
+    def __init__(self, curve):
+        self.curve = curve
+        self.params = None
+        self.values = np.empty(0)
+
+    def __call__(self, year, *params):
+        if not isinstance(year, (int, np.integer)) or year < 0:
+            return self.curve(np.array([year], dtype=float), *params)[0]
+        if params == self.params and year < len(self.values):
+            return self.values[year]
+        horizon = max(int(year) + 1, 2 * len(self.values), 128)
+        self.values = self.curve(np.arange(horizon), *params)
+        self.params = params
+        return self.values[year]
+
+
+# ============================================================================
+# EVENT LOG
+# ============================================================================
+
+class EventType(Enum):
+    """Discrete simulation events"""
+    ADOPTION = "adoption"  # Country joins the GCR
+    SHOCK = "shock"  # Large inflation shock
+    POLICY_REVISION = "policy_revision"  # CEA price floor revision
+    NET_ZERO = "net_zero"  # Emissions-to-sinks ratio first reaches 1.0
+    BUILDOUT_STOP = "buildout_stop"  # New CDR buildout stopped near the target
+
+
+EVENT_LEVELS = {"debug": 10, "info": 20, "warning": 30}
+
+# Level of each event type (events below the log's level are not recorded)
+EVENT_TYPE_LEVELS = {
+    EventType.ADOPTION: "info",
+    EventType.SHOCK: "info",
+    EventType.POLICY_REVISION: "info",
+    EventType.NET_ZERO: "warning",
+    EventType.BUILDOUT_STOP: "warning",
+}
+
+EVENT_COLUMNS = ["Year", "Event", "Level", "Message", "Data"]
+
+
+class EventLog:
+    """Ring buffer of typed simulation events
+
+    Keeps the last `capacity` events at or above `level` ("debug", "info",
+    "warning"; None records nothing). Callers test `enabled(event_type)`
+    before formatting an event, so a silent log costs one lookup per
+    event site. With `echo` set, recorded events are also printed.
+    """
+
+    def __init__(self, level: Optional[str] = "info", capacity: int = 10_000, echo: bool = False):
+        if capacity <= 0:
+            raise ValueError(f"Event log capacity must be positive, got {capacity}")
+        self.events = deque(maxlen=capacity)
+        self.echo = echo
+        self.recorded = 0  # Events recorded, including those since evicted
+        self.set_level(level)
+
+    def set_level(self, level: Optional[str]):
+        """Change the minimum level recorded (None silences the log)"""
+        if level is not None and level not in EVENT_LEVELS:
+            raise ValueError(f"Unknown event level {level!r}; expected one of {sorted(EVENT_LEVELS)} or None")
+        self.level = level
+        threshold = EVENT_LEVELS[level] if level is not None else float("inf")
+        self._enabled = {kind: EVENT_LEVELS[EVENT_TYPE_LEVELS[kind]] >= threshold for kind in EventType}
+
+    def enabled(self, kind: EventType) -> bool:
+        return self._enabled[kind]
+
+    def record(self, year: int, kind: EventType, message: str, **data):
+        """Append an event (assumes enabled(kind) was checked)"""
+        self.events.append((year, kind.value, EVENT_TYPE_LEVELS[kind], message, data))
+        self.recorded += 1
+        if self.echo:
+            print(f"[Year {year}] {message}")
+
+    def to_frame(self) -> pd.DataFrame:
+        """Events still in the buffer, oldest first"""
+        return pd.DataFrame(list(self.events), columns=EVENT_COLUMNS)
+
+    def clear(self):
+        self.events.clear()
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __iter__(self):
+        return iter(self.events)
+
+
+# ============================================================================
+# OBSERVER HOOKS
+# ============================================================================
+
+# Phases of GCR_ABM_Simulation.step_year, in order. Each has a "before_<phase>"
+# and an "after_<phase>" hook point (see GCR_ABM_Simulation.observe)
+HOOK_PHASES = ("adoption", "inflation", "market", "cea_policy", "initiation",
+               "project_step", "audit_mint", "cqe", "climate")
+HOOK_POINTS = tuple(f"{when}_{phase}" for phase in HOOK_PHASES for when in ("before", "after"))
+
+
+class PhaseProfiler:
+    """Observer timing every step_year phase of one or more simulations
+
+    attach() subscribes to all before/after hooks; `seconds` and `calls`
+    accumulate wall time and call counts per phase.
+    """
+
+    def __init__(self):
+        self.seconds = {phase: 0.0 for phase in HOOK_PHASES}
+        self.calls = {phase: 0 for phase in HOOK_PHASES}
+        self._started: Dict[str, float] = {}
+
+    def attach(self, sim: "GCR_ABM_Simulation") -> "PhaseProfiler":
+        for phase in HOOK_PHASES:
+            sim.observe(f"before_{phase}", lambda sim, year, state, phase=phase: self._start(phase))
+            sim.observe(f"after_{phase}", lambda sim, year, state, phase=phase: self._stop(phase))
+        return self
+
+    def _start(self, phase: str):
+        self._started[phase] = time.perf_counter()
+
+    def _stop(self, phase: str):
+        self.seconds[phase] += time.perf_counter() - self._started.pop(phase)
+        self.calls[phase] += 1
+
+    def to_frame(self) -> pd.DataFrame:
+        total = sum(self.seconds.values())
+        return pd.DataFrame({
+            "Phase": list(HOOK_PHASES),
+            "Seconds": [self.seconds[phase] for phase in HOOK_PHASES],
+            "Share": [self.seconds[phase] / total if total > 0 else 0.0 for phase in HOOK_PHASES],
+            "Calls": [self.calls[phase] for phase in HOOK_PHASES]
+        })
+
+
+# ============================================================================
+# COUNTRY TABLE
+# ============================================================================
+
+# The country pool: name, GDP (USD trillion), base CQE (fraction of a
+# trillion), tier, region, founding member (active from year 0)
+_COUNTRY_ROWS = (
+    # Tier 1: High GDP economies
+    ("USA", 27.0, 0.05, 1, "North America", True),
+    ("China", 18.0, 0.034999999999999996, 1, "Asia", False),
+    ("Japan", 4.2, 0.009, 1, "Asia", False),
+    ("Germany", 4.5, 0.01, 1, "Europe", True),
+    ("UK", 3.5, 0.008, 1, "Europe", False),
+    ("France", 3.0, 0.007000000000000001, 1, "Europe", False),
+    ("India", 3.7, 0.006, 1, "Asia", False),
+    ("Italy", 2.2, 0.005, 1, "Europe", False),
+    ("Canada", 2.1, 0.005, 1, "North America", False),
+    ("South Korea", 1.7, 0.004, 1, "Asia", False),
+    ("Australia", 1.7, 0.004, 1, "Oceania", False),
+    ("Spain", 1.6, 0.0035000000000000005, 1, "Europe", False),
+
+    # Tier 2: Medium GDP economies
+    ("Brazil", 2.1, 0.005, 2, "South America", True),
+    ("Mexico", 1.5, 0.003, 2, "North America", False),
+    ("Indonesia", 1.4, 0.003, 2, "Asia", True),
+    ("Netherlands", 1.1, 0.0025, 2, "Europe", False),
+    ("Saudi Arabia", 1.1, 0.0025, 2, "Middle East", False),
+    ("Turkey", 1.0, 0.002, 2, "Middle East", False),
+    ("Switzerland", 0.9, 0.002, 2, "Europe", False),
+    ("Poland", 0.8, 0.0018, 2, "Europe", False),
+    ("Argentina", 0.6, 0.0015, 2, "South America", False),
+    ("Sweden", 0.6, 0.0015, 2, "Europe", False),
+    ("Belgium", 0.6, 0.0014, 2, "Europe", False),
+    ("Thailand", 0.5, 0.0012000000000000001, 2, "Asia", False),
+    ("Nigeria", 0.5, 0.001, 2, "Africa", False),
+    ("Austria", 0.5, 0.0012000000000000001, 2, "Europe", False),
+    ("Norway", 0.5, 0.0012000000000000001, 2, "Europe", False),
+    ("UAE", 0.5, 0.0012000000000000001, 2, "Middle East", False),
+    ("Israel", 0.5, 0.0012000000000000001, 2, "Middle East", False),
+    ("Singapore", 0.5, 0.0012000000000000001, 2, "Asia", False),
+    ("Malaysia", 0.4, 0.001, 2, "Asia", False),
+    ("Philippines", 0.4, 0.001, 2, "Asia", False),
+    ("South Africa", 0.4, 0.001, 2, "Africa", False),
+    ("Colombia", 0.4, 0.0009, 2, "South America", False),
+    ("Denmark", 0.4, 0.001, 2, "Europe", False),
+
+    # Tier 3: Lower GDP / Developing economies
+    ("Kenya", 0.13, 0.00030000000000000003, 3, "Africa", True),
+    ("Vietnam", 0.43, 0.0009, 3, "Asia", False),
+    ("Bangladesh", 0.46, 0.0008, 3, "Asia", False),
+    ("Egypt", 0.4, 0.0008, 3, "Africa", False),
+    ("Pakistan", 0.34, 0.0007, 3, "Asia", False),
+    ("Chile", 0.32, 0.0007, 3, "South America", False),
+    ("Peru", 0.26, 0.0006000000000000001, 3, "South America", False),
+    ("Czech Republic", 0.33, 0.0007, 3, "Europe", False),
+    ("Romania", 0.3, 0.0006000000000000001, 3, "Europe", False),
+    ("New Zealand", 0.25, 0.0006000000000000001, 3, "Oceania", False),
+    ("Portugal", 0.28, 0.0006000000000000001, 3, "Europe", False),
+    ("Greece", 0.24, 0.0005, 3, "Europe", False),
+    ("Iraq", 0.26, 0.0005, 3, "Middle East", False),
+    ("Kazakhstan", 0.22, 0.0005, 3, "Asia", False),
+    ("Morocco", 0.14, 0.00030000000000000003, 3, "Africa", False),
+    ("Ethiopia", 0.16, 0.00030000000000000003, 3, "Africa", False),
+    ("Ghana", 0.08, 0.0002, 3, "Africa", False),
+    ("Tanzania", 0.08, 0.0002, 3, "Africa", False),
+    ("Uganda", 0.05, 0.0001, 3, "Africa", False),
+)
+
+
+def _country_record(gdp_tril, base_cqe, tier, region, name):
+    equity = COUNTRY_EQUITY_DATA.get(name, {})
+    return MappingProxyType({
+        "gdp_tril": gdp_tril, "base_cqe": base_cqe, "tier": tier, "region": region,
+        "oecd": equity.get("oecd", False),
+        "historical_emissions_gtco2": equity.get("historical_emissions_gtco2", 0.0)
+    })
+
+
+# Read-only reference data per country, with OECD status and historical emissions
+# merged in from COUNTRY_EQUITY_DATA; shared by every simulation
+COUNTRY_TABLE = MappingProxyType({
+    name: _country_record(gdp_tril, base_cqe, tier, region, name)
+    for name, gdp_tril, base_cqe, tier, region, _ in _COUNTRY_ROWS
+})
+FOUNDING_COUNTRIES = tuple(row[0] for row in _COUNTRY_ROWS if row[5])
+
+
+REGIONS = tuple(sorted({row[4] for row in _COUNTRY_ROWS}))
+
+
+def _read_only(values, dtype) -> np.ndarray:
+    column = np.array(values, dtype=dtype)
+    column.setflags(write=False)
+    return column
+
+
+# COUNTRY_TABLE as read-only columns in table order, shared by every CountryRegistry
+_COUNTRY_COLUMNS = {
+    "gdp_tril": _read_only([r["gdp_tril"] for r in COUNTRY_TABLE.values()], np.float64),
+    "base_cqe": _read_only([r["base_cqe"] for r in COUNTRY_TABLE.values()], np.float64),
+    "tier": _read_only([r["tier"] for r in COUNTRY_TABLE.values()], np.int8),
+    "region_code": _read_only([REGIONS.index(r["region"]) for r in COUNTRY_TABLE.values()], np.int8),
+    "oecd": _read_only([r["oecd"] for r in COUNTRY_TABLE.values()], np.bool_),
+    "historical_emissions_gtco2": _read_only([r["historical_emissions_gtco2"] for r in COUNTRY_TABLE.values()],
+                                             np.float64),
+}
+
+
+class Country(Mapping):
+    """Mapping view of one CountryRegistry row (country["gdp_tril"], country["projects"], ...)
+
+    Reference fields and "active" are read-only; adoption goes through
+    CountryRegistry.adopt so the active totals stay in step.
+    """
+    __slots__ = ("_registry", "_idx")
+
+    KEYS = ("gdp_tril", "base_cqe", "tier", "region", "active", "adoption_year", "projects", "oecd",
+            "historical_emissions_gtco2", "xcr_earned", "xcr_purchased_equiv", "archived_projects")
+    WRITABLE = ("projects", "xcr_earned", "xcr_purchased_equiv", "archived_projects")
+
+    def __init__(self, registry: "CountryRegistry", idx: int):
+        self._registry = registry
+        self._idx = idx
+
+    @property
+    def name(self) -> str:
+        return self._registry.names[self._idx]
+
+    def __getitem__(self, key: str):
+        registry, idx = self._registry, self._idx
+        if key == "projects":
+            return registry.projects[idx]
+        if key == "region":
+            return REGIONS[registry.region_code[idx]]
+        if key == "adoption_year":
+            year = int(registry.adoption_year[idx])
+            return None if year < 0 else year
+        if key == "active":
+            return bool(registry.active_mask[idx])
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(registry, key)[idx].item()
+
+    def __setitem__(self, key: str, value):
+        if key not in self.WRITABLE:
+            raise TypeError(f"Country field {key!r} is read-only")
+        if key == "projects":
+            self._registry.projects[self._idx] = value
+        else:
+            getattr(self._registry, key)[self._idx] = value
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __repr__(self) -> str:
+        return f"Country({self.name!r}, {dict(self)!r})"
+
+
+class CountryRegistry(Mapping):
+    """Per-run country state in NumPy columns over the shared COUNTRY_TABLE
+
+    Reference columns (gdp_tril, base_cqe, tier, region_code, oecd,
+    historical_emissions_gtco2) are the read-only module arrays; per-run
+    columns are the active mask, adoption year (-1 before adoption), the XCR
+    ledgers and archived project counts, plus one hosted-project id list per
+    country. Running totals of active GDP and base CQE are kept up to date by
+    adopt(), so callers never re-sum them.
+
+    The registry maps every country name to a Country view in table order;
+    `active` maps the active countries in adoption order.
+    """
+
+    def __init__(self, founding=FOUNDING_COUNTRIES):
+        self.names = list(COUNTRY_TABLE)
+        self.index = {name: k for k, name in enumerate(self.names)}
+        for name, column in _COUNTRY_COLUMNS.items():
+            setattr(self, name, column)
+        n = len(self.names)
+        self.active_mask = np.zeros(n, dtype=bool)
+        self.adoption_year = np.full(n, -1, dtype=np.int32)
+        self.xcr_earned = np.zeros(n)  # XCR earned from hosted projects
+        self.xcr_purchased_equiv = np.zeros(n)  # XCR equivalent purchased via CQE
+        self.archived_projects = np.zeros(n, dtype=np.int64)  # Hosted projects moved to the store archive
+        self.projects: List[list] = [[] for _ in range(n)]  # Hosted project ids (cohort ids in cohort mode)
+        self.active_order: List[int] = []  # Active countries in adoption order
+        self.active_gdp_tril = 0.0
+        self.active_base_cqe = 0.0
+        self.active = ActiveCountries(self)
+        self.adopt([self.index[name] for name in founding], 0)
+
+    @property
+    def active_idx(self) -> np.ndarray:
+        """Indexes of active countries in adoption order"""
+        return np.array(self.active_order, dtype=np.intp)
+
+    def inactive_idx(self) -> np.ndarray:
+        """Indexes of countries not yet adopted, in table order"""
+        return np.flatnonzero(~self.active_mask)
+
+    def adopt(self, idx, year: int):
+        """Activate countries (in the given order) and update the active totals"""
+        for k in idx:
+            k = int(k)
+            if self.active_mask[k]:
+                continue
+            self.active_mask[k] = True
+            self.adoption_year[k] = year
+            self.active_order.append(k)
+            # Added in adoption order: the same sums as re-adding the active column
+            self.active_gdp_tril += float(self.gdp_tril[k])
+            self.active_base_cqe += float(self.base_cqe[k])
+
+    def credit_xcr_earned(self, names: List[str], amounts: np.ndarray):
+        """Add earned XCR to the named active countries"""
+        idx = np.fromiter((self.index.get(name, -1) for name in names), dtype=np.intp, count=len(names))
+        keep = idx >= 0
+        keep[keep] = self.active_mask[idx[keep]]
+        np.add.at(self.xcr_earned, idx[keep], np.asarray(amounts)[keep])
+
+    def attribute_cqe_purchase(self, xcr_purchased: float):
+        """Split XCR bought by CQE across active countries by base CQE share"""
+        if self.active_base_cqe <= 0:
+            return
+        active = self.active_idx
+        self.xcr_purchased_equiv[active] += xcr_purchased * (self.base_cqe[active] / self.active_base_cqe)
+
+    def __getitem__(self, name: str) -> Country:
+        return Country(self, self.index[name])
+
+    def __contains__(self, name) -> bool:
+        return name in self.index
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class ActiveCountries(Mapping):
+    """Mapping view of a registry's active countries, in adoption order"""
+    __slots__ = ("registry",)
+
+    def __init__(self, registry: CountryRegistry):
+        self.registry = registry
+
+    def __getitem__(self, name: str) -> Country:
+        idx = self.registry.index[name]
+        if not self.registry.active_mask[idx]:
+            raise KeyError(name)
+        return Country(self.registry, idx)
+
+    def __contains__(self, name) -> bool:
+        idx = self.registry.index.get(name)
+        return idx is not None and bool(self.registry.active_mask[idx])
+
+    def __iter__(self):
+        names = self.registry.names
+        return iter([names[k] for k in self.registry.active_order])
+
+    def __len__(self) -> int:
+        return len(self.registry.active_order)
+
 
 # ============================================================================
 # AGENT CLASSES
@@ -97,6 +1815,7 @@ class CEA:
         self.initial_co2_ppm = initial_co2_ppm
         self.roadmap_co2 = initial_co2_ppm  # Updated each year based on roadmap
         self.inflation_target = inflation_target  # Target inflation for brake adjustment
+        self.events: Optional[EventLog] = None  # Simulation event log (set by GCR_ABM_Simulation)
 
         # Stability monitoring
         self.warning_8to1_active = False
@@ -110,11 +1829,17 @@ class CEA:
         self.locked_annual_yield = 0.02  # Current locked-in growth rate
         self.years_until_revision = 5  # Countdown to next policy revision
         self.last_revision_year = 0
+        self._roadmap_table = YearTable(self._roadmap_curve)
+
+    @staticmethod
+    def _roadmap_curve(years: np.ndarray, total_years: int, initial_co2_ppm: float,
+                       target_co2_ppm: float) -> np.ndarray:
+        progress = years / total_years
+        return initial_co2_ppm - (initial_co2_ppm - target_co2_ppm) * progress
 
     def calculate_roadmap_target(self, year: int, total_years: int) -> float:
         """Linear roadmap from initial to target CO2"""
-        progress = year / total_years
-        return self.initial_co2_ppm - (self.initial_co2_ppm - self.target_co2_ppm) * progress
+        return self._roadmap_table(year, total_years, self.initial_co2_ppm, self.target_co2_ppm)
 
     def adjust_price_floor(self, current_co2_ppm: float, current_floor: float,
                           year: int, total_years: int, current_inflation: float = 0.02,
@@ -136,7 +1861,6 @@ class CEA:
         # Check if it's time for a policy revision
         if year % self.revision_interval == 0 and year > 0:
             revision_occurred = True
-            print(f"[Year {year}] CEA POLICY REVISION")
 
             # Calculate roadmap target
             roadmap_target = self.calculate_roadmap_target(year, total_years)
@@ -180,8 +1904,13 @@ class CEA:
             self.locked_annual_yield = new_yield
             self.last_revision_year = year
 
-            print(f"  Roadmap gap: {roadmap_gap_ppm:.2f} ppm")
-            print(f"  New annual yield: {new_yield*100:.2f}% (locked for next {self.revision_interval} years)")
+            if self.events is not None and self.events.enabled(EventType.POLICY_REVISION):
+                self.events.record(
+                    year, EventType.POLICY_REVISION,
+                    f"CEA POLICY REVISION: roadmap gap {roadmap_gap_ppm:.2f} ppm, new annual yield "
+                    f"{new_yield*100:.2f}% (locked for next {self.revision_interval} years)",
+                    roadmap_gap_ppm=float(roadmap_gap_ppm), annual_yield=float(new_yield)
+                )
 
         # Apply locked-in annual yield (whether revised or not)
         new_floor = current_floor * (1 + self.locked_annual_yield)
@@ -351,8 +2080,9 @@ class CentralBankAlliance:
     - Ensures private capital leads; public backstop remains a minority share
     """
 
-    def __init__(self, countries: Dict[str, Dict], price_floor: float = 100.0):
-        self.countries = countries
+    def __init__(self, registry: "CountryRegistry", price_floor: float = 100.0):
+        self.registry = registry  # Active GDP total for the cap and the CPI scale
+        self.countries = registry.active
         self.price_floor_rcc = price_floor
         self.total_cqe_budget = 0.0  # Calculated dynamically from private capital
         self.cqe_ratio = 0.05  # CQE = 5% of annual private capital inflow before GDP cap
@@ -371,8 +2101,7 @@ class CentralBankAlliance:
         Budget is capped by active GDP (0.5% of active GDP).
         """
         market_cap_budget = annual_private_capital_inflow * self.cqe_ratio
-        active_gdp_tril = sum(country["gdp_tril"] for country in self.countries.values())
-        gdp_cap_budget = active_gdp_tril * 1e12 * self.gdp_cap_ratio
+        gdp_cap_budget = self.registry.active_gdp_tril * 1e12 * self.gdp_cap_ratio
         self.total_cqe_budget = min(market_cap_budget, gdp_cap_budget)
 
     def defend_floor(self, market_price_xcr: float, total_xcr_supply: float,
@@ -435,8 +2164,7 @@ class CentralBankAlliance:
 
             # Inflation impact: proportional to money creation relative to real economy
             # Uses active GDP as the scale for CPI impact.
-            active_gdp_tril = sum(country["gdp_tril"] for country in self.countries.values())
-            active_gdp_usd = active_gdp_tril * 1e12
+            active_gdp_usd = self.registry.active_gdp_tril * 1e12
             inflation_impact = (fiat_created / active_gdp_usd) * 5 if active_gdp_usd > 0 else 0.0
             # Ensure material signal when spending is non-trivial
             if active_gdp_usd > 0 and (fiat_created / active_gdp_usd) > 0.001:
@@ -448,13 +2176,63 @@ class CentralBankAlliance:
         return 0.0, 0.0, 0.0
 
 
+@lru_cache(maxsize=None)
+def _sigmoid_endpoints(midpoint: float, steepness: float, upper: float) -> tuple:
+    """Logistic values at 0 and `upper` (configuration constants, computed once)"""
+    s0 = 1.0 / (1.0 + np.exp(-steepness * (0.0 - midpoint)))
+    s1 = 1.0 / (1.0 + np.exp(-steepness * (upper - midpoint)))
+    return s0, max(s1 - s0, 1e-6)
+
+
+def _normalized_sigmoid(x: float, midpoint: float, steepness: float, upper: float = 1.0) -> float:
+    """Sigmoid rescaled so x=0 maps to 0 and x=upper maps to 1, clipped to [0, 1]"""
+    s0, span = _sigmoid_endpoints(midpoint, steepness, upper)
+    s = 1.0 / (1.0 + np.exp(-steepness * (x - midpoint)))
+    return np.clip((s - s0) / span, 0.0, 1.0)
+
+
 class ProjectsBroker:
     """Projects & Broker - Manages portfolio of mitigation projects"""
 
-    def __init__(self, countries: Dict[str, Dict]):
+    LONG_RUN_YEARS = 100  # Simulations longer than this compact by default...
+    LONG_RUN_COMPACT_INTERVAL = 10  # ...every this many years
+    COHORT_SPAN = 10  # Operational start years per cohort for projects outliving cohort_horizon
+
+    def __init__(self, countries: Dict[str, Dict], seed=None):
         self.countries = countries
-        self.projects: List[Project] = []
+        broker_seed, store_seed = seed_sequence(seed).spawn(2)
+        self.rng = make_rng(broker_seed)  # Project creation and retirement draws
+        self.projects = ProjectStore(seed=store_seed)  # Columnar store; iterates as Project views
+        self.crn: Optional[CommonRandomNumbers] = None  # Purpose-keyed draws (set_common_random_numbers)
+        self.debug_aggregates = False  # Cross-check running capacity aggregates against full scans
+        self.vectorized_stepping = True  # Batch kernel for the yearly project step (False = per-project loop)
         self.next_project_id = 1
+        self.bulk_creation = True  # Create each channel's new projects as one array batch (False = one at a time)
+        # Cohort mode: store new projects as cohort rows stepped with binomial draws; set
+        # before any projects exist. A cohort is one channel's projects becoming operational
+        # at the same tick, or in the same COHORT_SPAN ticks for projects that would only
+        # complete their lifespan after cohort_horizon (the run length, set by the simulation)
+        self.cohort_mode = False
+        self.cohort_horizon: Optional[int] = None
+        self.next_cohort_id = 1
+        self._cohort_ids: Dict[tuple, int] = {}  # (channel code, spanned, opening tick or span) -> id
+        self.cohort_hosts = np.zeros((1, 0), dtype=np.int64)  # [cohort id, store country code] -> projects created
+        # Every compact_interval years, failed/completed projects move from the store to
+        # its archive (0 = keep them in the store; runs longer than LONG_RUN_YEARS default to
+        # LONG_RUN_COMPACT_INTERVAL). The archive keeps only counters unless keep_archived_rows
+        # is set (rows in memory) or archive_spill_dir is (rows spilled to .npz chunks there)
+        self.compact_interval = 0
+        self.keep_archived_rows = False
+        self.archive_spill_dir: Optional[str] = None
+        self._country_pools: Dict[ChannelType, tuple] = {}  # channel -> (active country count, pool)
+        # Memoized marginal costs, dampers and learning rates; cleared whenever
+        # deployment, project counts or the net-zero ratio change
+        self.cache_derived = True
+        self._derived_cache: Dict[tuple, float] = {}
+        # Year-indexed tables for the time-only parts of capacity curves
+        self._cdr_ramp_table = YearTable(self._cdr_ramp_curve)
+        self._conventional_utilization_table = YearTable(self._conventional_utilization_curve)
+        self._conventional_time_factor_table = YearTable(self._conventional_time_factor_curve)
         self.current_emissions_to_sinks_ratio = 10.0  # Track for net-zero proximity cost penalty
 
         # Project scale damping (learning-by-doing curve)
@@ -528,6 +2306,20 @@ class ProjectsBroker:
             ChannelType.AVOIDED_DEFORESTATION: 15.0  # Increased to 15Gt for drawdown
         }
 
+    def invalidate_derived_cache(self):
+        """Drop memoized costs/dampers (call after changing broker parameters mid-run)"""
+        self._derived_cache.clear()
+
+    def _memoized(self, key: tuple, compute, *args) -> float:
+        """Return compute(*args), cached until the next invalidate_derived_cache()"""
+        if not self.cache_derived:
+            return compute(*args)
+        try:
+            return self._derived_cache[key]
+        except KeyError:
+            value = self._derived_cache[key] = compute(*args)
+            return value
+
     def calculate_project_scale_damper(self, cumulative_deployment_gt: float = 0.0) -> float:
         """Calculate project scale damping factor based on cumulative deployment experience
 
@@ -548,6 +2340,10 @@ class ProjectsBroker:
         - 36-45 Gt: 90-100% scale (industrial)
         - 45+ Gt: 100% scale (full industrial)
         """
+        return self._memoized(("scale_damper",), self._project_scale_damper)
+
+    def _project_scale_damper(self) -> float:
+        """Uncached calculate_project_scale_damper"""
         if not self.scale_damping_enabled:
             return 1.0
 
@@ -562,14 +2358,7 @@ class ProjectsBroker:
 
         # Sigmoid curve for smooth scaling (normalized to hit min/max at endpoints)
         # Maps 0 Gt → min_scale, full_scale → 1.0
-        midpoint = self.full_scale_deployment_gt * 0.3  # Mid-commercial
-        steepness = self.damping_steepness / max(self.full_scale_deployment_gt, 1e-6)
-
-        s0 = 1.0 / (1.0 + np.exp(-steepness * (0.0 - midpoint)))
-        s1 = 1.0 / (1.0 + np.exp(-steepness * (self.full_scale_deployment_gt - midpoint)))
-        s = 1.0 / (1.0 + np.exp(-steepness * (total_deployment_gt - midpoint)))
-        normalized = (s - s0) / max(s1 - s0, 1e-6)
-        normalized = np.clip(normalized, 0.0, 1.0)
+        normalized = self._deployment_sigmoid(total_deployment_gt)
 
         return min_scale + (1.0 - min_scale) * normalized
 
@@ -579,6 +2368,10 @@ class ProjectsBroker:
         Keeps early project counts low while the industry is nascent.
         Returns multiplier from count_damping_min_factor to 1.0.
         """
+        return self._memoized(("count_damper",), self._project_count_damper)
+
+    def _project_count_damper(self) -> float:
+        """Uncached calculate_project_count_damper"""
         if not self.count_damping_enabled:
             return 1.0
 
@@ -590,14 +2383,7 @@ class ProjectsBroker:
         if total_deployment_gt >= self.full_scale_deployment_gt:
             return 1.0
 
-        midpoint = self.full_scale_deployment_gt * 0.3
-        steepness = self.damping_steepness / max(self.full_scale_deployment_gt, 1e-6)
-
-        s0 = 1.0 / (1.0 + np.exp(-steepness * (0.0 - midpoint)))
-        s1 = 1.0 / (1.0 + np.exp(-steepness * (self.full_scale_deployment_gt - midpoint)))
-        s = 1.0 / (1.0 + np.exp(-steepness * (total_deployment_gt - midpoint)))
-        normalized = (s - s0) / max(s1 - s0, 1e-6)
-        normalized = np.clip(normalized, 0.0, 1.0)
+        normalized = self._deployment_sigmoid(total_deployment_gt)
 
         return min_count + (1.0 - min_count) * normalized
 
@@ -610,6 +2396,10 @@ class ProjectsBroker:
         Learning reduces costs as deployment grows, but resource depletion
         (from project count) provides upward pressure.
         """
+        return self._memoized(("marginal_cost", channel), self._marginal_cost, channel)
+
+    def _marginal_cost(self, channel: ChannelType) -> float:
+        """Uncached calculate_marginal_cost"""
         base = self.base_costs[channel]
         cumulative = self.cumulative_deployment[channel]
         reference = self.reference_capacity[channel]
@@ -630,8 +2420,7 @@ class ProjectsBroker:
         # Logarithmic scaling: costs increase slowly with project count
         # At 100 projects: log10(100) = 2.0 → 1.3x cost
         # At 10,000 projects: log10(10000) = 4.0 → 1.6x cost
-        channel_projects = [p for p in self.projects if p.channel == channel]
-        count = len(channel_projects)
+        count = int(self.projects.status_counts[channel.value].sum())
         if count > 0:
             depletion_factor = 1.0 + (0.15 * np.log10(count + 1))
         else:
@@ -657,6 +2446,10 @@ class ProjectsBroker:
 
     def _get_effective_learning_rate(self, channel: ChannelType) -> float:
         """Return learning rate adjusted by deployment maturity."""
+        return self._memoized(("learning_rate", channel), self._effective_learning_rate, channel)
+
+    def _effective_learning_rate(self, channel: ChannelType) -> float:
+        """Uncached _get_effective_learning_rate"""
         lr = self.learning_rates[channel]
         if channel != ChannelType.CDR:
             return lr
@@ -668,37 +2461,36 @@ class ProjectsBroker:
         if deployment_gt >= self.full_scale_deployment_gt:
             return floor
 
-        midpoint = self.full_scale_deployment_gt * 0.3
-        steepness = self.damping_steepness / max(self.full_scale_deployment_gt, 1e-6)
-        s0 = 1.0 / (1.0 + np.exp(-steepness * (0.0 - midpoint)))
-        s1 = 1.0 / (1.0 + np.exp(-steepness * (self.full_scale_deployment_gt - midpoint)))
-        s = 1.0 / (1.0 + np.exp(-steepness * (deployment_gt - midpoint)))
-        normalized = (s - s0) / max(s1 - s0, 1e-6)
-        normalized = np.clip(normalized, 0.0, 1.0)
+        normalized = self._deployment_sigmoid(deployment_gt)
 
         return lr - (lr - floor) * normalized
 
+    def _deployment_sigmoid(self, deployment_gt: float) -> float:
+        """Normalized deployment sigmoid shared by scale/count damping and the CDR learning taper"""
+        midpoint = self.full_scale_deployment_gt * 0.3  # Mid-commercial
+        steepness = self.damping_steepness / max(self.full_scale_deployment_gt, 1e-6)
+        return _normalized_sigmoid(deployment_gt, midpoint, steepness, self.full_scale_deployment_gt)
+
     def get_conventional_capacity_utilization(self, current_year: int) -> float:
         """Calculate how much of conventional mitigation capacity has been utilized
 
         Returns value from 0.0 to 1.0 representing capacity utilization.
         Reaches capacity_limit (0.8) by conventional_capacity_limit_year via sigmoid taper.
         """
-        if current_year <= 0:
-            return 0.0
-        if current_year >= self.conventional_capacity_limit_year:
-            return self.conventional_capacity_limit
+        return self._conventional_utilization_table(
+            current_year, self.conventional_capacity_limit_year, self.conventional_capacity_limit
+        )
 
+    @staticmethod
+    def _conventional_utilization_curve(years: np.ndarray, limit_year: int, capacity_limit: float) -> np.ndarray:
+        if limit_year <= 0:
+            return np.where(years <= 0, 0.0, capacity_limit)
         # Sigmoid progression to limit (normalized to hit 0->1 across the window)
-        progress = current_year / self.conventional_capacity_limit_year
+        progress = years / limit_year
         k = 8.0  # Steepness of the taper curve
-        s0 = 1.0 / (1.0 + np.exp(-k * (0.0 - 0.5)))
-        s1 = 1.0 / (1.0 + np.exp(-k * (1.0 - 0.5)))
-        s = 1.0 / (1.0 + np.exp(-k * (progress - 0.5)))
-        normalized = (s - s0) / max(s1 - s0, 1e-6)
-        utilization = np.clip(normalized, 0.0, 1.0) * self.conventional_capacity_limit
-
-        return utilization
+        utilization = _normalized_sigmoid(progress, 0.5, k) * capacity_limit
+        utilization = np.where(years >= limit_year, capacity_limit, utilization)
+        return np.where(years <= 0, 0.0, utilization)
 
     def is_conventional_capacity_available(self, current_year: int) -> bool:
         """Check if conventional mitigation capacity is still available"""
@@ -710,13 +2502,10 @@ class ProjectsBroker:
         Combines time-based taper with budget-based depletion.
         """
         # Time-based taper (existing logic)
-        utilization = self.get_conventional_capacity_utilization(current_year)
-        if self.conventional_capacity_limit <= 0:
-            time_factor = 1.0
-        else:
-            utilization_ratio = min(utilization / self.conventional_capacity_limit, 1.0)
-            time_factor = 1.0 - utilization_ratio
-            time_factor = max(self.conventional_capacity_min_factor, time_factor)
+        time_factor = self._conventional_time_factor_table(
+            current_year, self.conventional_capacity_limit_year, self.conventional_capacity_limit,
+            self.conventional_capacity_min_factor
+        )
 
         # Budget-based depletion (new logic)
         budget_factor = self.get_conventional_budget_capacity_factor()
@@ -724,6 +2513,15 @@ class ProjectsBroker:
         # Combined: minimum of time-based and budget-based constraints
         return max(self.conventional_capacity_min_factor, min(time_factor, budget_factor))
 
+    @classmethod
+    def _conventional_time_factor_curve(cls, years: np.ndarray, limit_year: int, capacity_limit: float,
+                                        min_factor: float) -> np.ndarray:
+        if capacity_limit <= 0:
+            return np.ones(len(years))
+        utilization = cls._conventional_utilization_curve(years, limit_year, capacity_limit)
+        utilization_ratio = np.minimum(utilization / capacity_limit, 1.0)
+        return np.maximum(min_factor, 1.0 - utilization_ratio)
+
     def get_conventional_budget_utilization(self) -> float:
         """Return budget utilization ratio (0.0 to 1.0+).
 
@@ -784,12 +2582,8 @@ class ProjectsBroker:
         midpoint = 0.60
         steepness = 15.0
 
-        sigmoid = 1.0 / (1.0 + np.exp(-steepness * (utilization - midpoint)))
         # Normalize sigmoid to 0-1 range across 0-1 utilization
-        s0 = 1.0 / (1.0 + np.exp(-steepness * (0.0 - midpoint)))
-        s1 = 1.0 / (1.0 + np.exp(-steepness * (1.0 - midpoint)))
-        normalized = (sigmoid - s0) / max(s1 - s0, 1e-6)
-        normalized = np.clip(normalized, 0.0, 1.0)
+        normalized = _normalized_sigmoid(utilization, midpoint, steepness)
 
         # Map to cost multiplier range (1.0 to max)
         return 1.0 + (self.conventional_budget_cost_multiplier - 1.0) * normalized
@@ -810,11 +2604,7 @@ class ProjectsBroker:
         midpoint = 0.70
         steepness = 10.0
 
-        sigmoid = 1.0 / (1.0 + np.exp(-steepness * (utilization - midpoint)))
-        s0 = 1.0 / (1.0 + np.exp(-steepness * (0.0 - midpoint)))
-        s1 = 1.0 / (1.0 + np.exp(-steepness * (1.0 - midpoint)))
-        normalized = (sigmoid - s0) / max(s1 - s0, 1e-6)
-        normalized = np.clip(normalized, 0.0, 1.0)
+        normalized = _normalized_sigmoid(utilization, midpoint, steepness)
 
         # Map to capacity factor range (1.0 to floor)
         return 1.0 - (1.0 - self.conventional_budget_capacity_floor) * normalized
@@ -842,11 +2632,7 @@ class ProjectsBroker:
         midpoint = 0.60
         steepness = 15.0
 
-        sigmoid = 1.0 / (1.0 + np.exp(-steepness * (utilization - midpoint)))
-        s0 = 1.0 / (1.0 + np.exp(-steepness * (0.0 - midpoint)))
-        s1 = 1.0 / (1.0 + np.exp(-steepness * (1.0 - midpoint)))
-        normalized = (sigmoid - s0) / max(s1 - s0, 1e-6)
-        normalized = np.clip(normalized, 0.0, 1.0)
+        normalized = _normalized_sigmoid(utilization, midpoint, steepness)
 
         return 1.0 + (self.cdr_material_cost_multiplier - 1.0) * normalized
 
@@ -862,11 +2648,7 @@ class ProjectsBroker:
         midpoint = 0.60
         steepness = 15.0
 
-        sigmoid = 1.0 / (1.0 + np.exp(-steepness * (utilization - midpoint)))
-        s0 = 1.0 / (1.0 + np.exp(-steepness * (0.0 - midpoint)))
-        s1 = 1.0 / (1.0 + np.exp(-steepness * (1.0 - midpoint)))
-        normalized = (sigmoid - s0) / max(s1 - s0, 1e-6)
-        normalized = np.clip(normalized, 0.0, 1.0)
+        normalized = _normalized_sigmoid(utilization, midpoint, steepness)
 
         return 1.0 - (1.0 - self.cdr_material_capacity_floor) * normalized
 
@@ -876,29 +2658,46 @@ class ProjectsBroker:
         Call this when a project becomes operational or produces verified sequestration.
         """
         self.cumulative_deployment[channel] += tonnes
+        self.invalidate_derived_cache()
 
         # Set reference capacity on first deployment
         if self.reference_capacity[channel] is None:
             self.reference_capacity[channel] = tonnes
 
+    def update_cumulative_deployment_batch(self, channel: ChannelType, tonnes: np.ndarray,
+                                           project_counts: Optional[np.ndarray] = None):
+        """update_cumulative_deployment for several credits of one channel, in order
+
+        project_counts gives the projects behind each credit (cohort rows); the
+        reference capacity is then the first credit's per-project share.
+        """
+        if len(tonnes) == 0:
+            return
+        self.invalidate_derived_cache()
+        if self.reference_capacity[channel] is None:
+            first = float(tonnes[0])
+            if project_counts is not None:
+                first /= int(project_counts[0])
+            self.reference_capacity[channel] = first
+        self.cumulative_deployment[channel] += float(tonnes.sum())
+
     def get_current_sequestration_rate(self, channel: ChannelType) -> float:
         """Get current annual sequestration rate for a channel in Gt/year
 
         Returns the sum of annual sequestration from all operational projects in this channel.
+        Served from the store's running (channel, status) aggregates.
         """
-        total_tonnes = sum(
-            p.annual_sequestration_tonnes
-            for p in self.projects
-            if p.channel == channel and p.status == ProjectStatus.OPERATIONAL
-        )
+        if self.debug_aggregates:
+            self.projects.check_aggregates()
+        total_tonnes = self.projects.tonnes(channel, ProjectStatus.OPERATIONAL)
         return total_tonnes / 1e9  # Convert tonnes to Gt
 
     def get_planned_sequestration_rate(self, channel: ChannelType) -> float:
         """Get planned annual sequestration rate (operational + development) in Gt/year"""
-        total_tonnes = sum(
-            p.annual_sequestration_tonnes
-            for p in self.projects
-            if p.channel == channel and p.status != ProjectStatus.FAILED
+        if self.debug_aggregates:
+            self.projects.check_aggregates()
+        total_tonnes = self.projects.tonnes(
+            channel, ProjectStatus.DEVELOPMENT, ProjectStatus.OPERATIONAL, ProjectStatus.COMPLETED
         )
         return total_tonnes / 1e9  # Convert tonnes to Gt
 
@@ -953,6 +2752,14 @@ class ProjectsBroker:
         Conventional: Prefers developed economies (infrastructure)
         Co-benefits: Prefers developing countries (ecosystem restoration)
         """
+        return self.rng.choice(self._country_pool(channel))
+
+    def _country_pool(self, channel: ChannelType) -> List[str]:
+        """Candidate host countries for a channel (cached until a country joins)"""
+        cached = self._country_pools.get(channel)
+        if cached is not None and cached[0] == len(self.countries):
+            return cached[1]
+
         active_countries = list(self.countries.keys())
 
         if not active_countries:
@@ -974,7 +2781,135 @@ class ProjectsBroker:
                         if self.countries[c].get('tier') in [2, 3]]
 
         country_pool = preferred if preferred else active_countries
-        return np.random.choice(country_pool)
+        self._country_pools[channel] = (len(self.countries), country_pool)
+        return country_pool
+
+    def set_common_random_numbers(self, crn: Optional[CommonRandomNumbers]):
+        """Draw creation, retirement and (through the store) decay randomness from crn"""
+        self.crn = crn
+        self.projects.crn = crn
+
+    def _crn_creation_draws(self, pool_size: int, slots: np.ndarray) -> tuple:
+        """Common-random-numbers draws for new projects, keyed by their store slots
+
+        Returns (country pool index, development years, base annual tonnes,
+        co-benefit score) arrays with the distributions of the regular draws.
+        """
+        u = self.crn.uniforms("creation", slots, width=3, key=0)
+        picks = np.minimum((u[:, 0] * pool_size).astype(np.int64), pool_size - 1)
+        dev_years = 2 + np.minimum((u[:, 1] * 3).astype(np.int64), 2)  # 2-4 years development
+        base_seq = 1e7 + 9e7 * u[:, 2]
+        co_benefit_score = np.clip(0.6 + 0.2 * self.crn.normals("creation_normal", slots, key=0), 0.0, 1.0)
+        return picks, dev_years, base_seq, co_benefit_score
+
+    def _create_projects_bulk(self, channel: ChannelType, num_projects: int, current_year: int,
+                              scale_damper: float, marginal_cost: float, r_base: float,
+                              r_effective: float, max_op_years: int, budget_tonnes: float) -> float:
+        """Create up to num_projects projects of one channel as a single batch
+
+        Array version of the per-project loop in initiate_projects. Sizes are
+        drawn up front and clipped to budget_tonnes (remaining capacity and/or
+        capital, in tonnes/year) with a cumulative sum in creation order; the
+        project that exhausts the budget is shrunk and later ones are dropped.
+        Returns the total annual tonnes created.
+        """
+        if num_projects <= 0 or budget_tonnes <= 0:
+            return 0.0
+
+        pool = self._country_pool(channel)
+        if self.crn is not None:
+            slots = self.projects.next_slots(channel.value, current_year, num_projects)
+            picks, dev_years, annual_seq, co_benefit_score = self._crn_creation_draws(len(pool), slots)
+            annual_seq = annual_seq * scale_damper
+        else:
+            picks = self.rng.integers(len(pool), size=num_projects)
+            dev_years = self.rng.integers(2, 5, size=num_projects)  # 2-4 years development
+            annual_seq = self.rng.uniform(1e7, 1e8, size=num_projects) * scale_damper
+            co_benefit_score = np.clip(self.rng.normal(0.6, 0.2, size=num_projects), 0.0, 1.0)
+
+        if np.isfinite(budget_tonnes):
+            annual_seq = _sequential_cap(annual_seq, budget_tonnes)
+            created = int(np.count_nonzero(annual_seq > 0))  # Budget exhausted after this prefix
+        else:
+            created = num_projects
+
+        if self.cohort_mode:
+            return self._add_cohorts(channel, pool, picks[:created], dev_years[:created],
+                                     annual_seq[:created], co_benefit_score[:created], current_year,
+                                     marginal_cost, r_base, r_effective, max_op_years)
+
+        country_names = [pool[k] for k in picks[:created]]
+        ids = [f"P{n:04d}" for n in range(self.next_project_id, self.next_project_id + created)]
+        self.projects.add_rows(
+            ids, channel,
+            np.array([self.projects.country_code(name) for name in country_names], dtype=np.int32),
+            current_year, dev_years[:created], annual_seq[:created], marginal_cost,
+            r_base, r_effective, co_benefit_score[:created], max_operational_years=max_op_years
+        )
+        for name, project_id in zip(country_names, ids):
+            self.countries[name]['projects'].append(project_id)
+        self.next_project_id += created
+        self.invalidate_derived_cache()  # Project counts feed marginal cost
+        return float(annual_seq[:created].sum())
+
+    def _add_cohorts(self, channel: ChannelType, pool: List[str], picks: np.ndarray,
+                     dev_years: np.ndarray, annual_seq: np.ndarray, co_benefit_score: np.ndarray,
+                     current_year: int, marginal_cost: float, r_base: float, r_effective: float,
+                     max_op_years: int) -> float:
+        """Add one channel's new projects to their cohorts (by opening tick, see cohort_mode)
+
+        Members with the same development time join their cohort's development
+        row opening at that tick (ProjectStore.add_cohort_rows) with their count,
+        total tonnes and mean co-benefit score. cohort_hosts counts the
+        projects each country hosts per cohort, and host countries record the
+        cohort id once. Returns the total annual tonnes created.
+        """
+        if len(picks) == 0:
+            return 0.0
+        store = self.projects
+        # Members with the same development time open at the same tick, so they share a cohort
+        dev_values = np.flatnonzero(np.bincount(dev_years))
+        members = np.searchsorted(dev_values, dev_years)
+        entry_cohorts = np.empty(len(dev_values), dtype=np.int32)
+        for k, tick in enumerate((store.clock + dev_values).tolist()):
+            spanned = self.cohort_horizon is not None and tick + max_op_years > self.cohort_horizon
+            key = (channel.value, spanned, tick // self.COHORT_SPAN if spanned else tick)
+            cohort = self._cohort_ids.get(key)
+            if cohort is None:
+                cohort = self._cohort_ids[key] = self.next_cohort_id
+                self.next_cohort_id += 1
+            entry_cohorts[k] = cohort
+        cohorts = entry_cohorts[members]
+
+        codes = np.array([store.country_code(pool[k]) for k in picks.tolist()], dtype=np.int32)
+        shape = (self.next_cohort_id, len(store.country_names))
+        if self.cohort_hosts.shape != shape:
+            grown = np.zeros(shape, dtype=np.int64)
+            grown[:self.cohort_hosts.shape[0], :self.cohort_hosts.shape[1]] = self.cohort_hosts
+            self.cohort_hosts = grown
+        fresh = self.cohort_hosts[cohorts, codes] == 0
+        for cohort, pick in dict.fromkeys(zip(cohorts[fresh].tolist(), picks[fresh].tolist())):
+            self.countries[pool[pick]]['projects'].append(f"C{cohort:04d}")
+        np.add.at(self.cohort_hosts, (cohorts, codes), 1)
+
+        # One entry per development time; the row's country is its first member's
+        counts = np.bincount(members)
+        first = np.argmax(members == np.arange(len(dev_values))[:, None], axis=1)
+        store.add_cohort_rows(
+            [f"C{c:04d}" for c in entry_cohorts.tolist()], channel, codes[first], current_year, dev_values,
+            np.bincount(members, weights=annual_seq), marginal_cost, r_base, r_effective,
+            np.bincount(members, weights=co_benefit_score) / counts, max_op_years, counts, entry_cohorts
+        )
+        self.next_project_id += len(picks)
+        self.invalidate_derived_cache()  # Project counts feed marginal cost
+        return float(annual_seq.sum())
+
+    def cohort_host_shares(self, cohort_ids: np.ndarray, countries: int) -> np.ndarray:
+        """(len(cohort_ids), countries) matrix of each cohort's share of projects per store country code"""
+        hosts = np.zeros((len(cohort_ids), countries))
+        width = min(countries, self.cohort_hosts.shape[1])
+        hosts[:, :width] = self.cohort_hosts[cohort_ids, :width]
+        return hosts / np.maximum(hosts.sum(axis=1, keepdims=True), 1.0)
 
     def initiate_projects(self, market_price_xcr: float, price_floor: float, cea: CEA, current_year: int,
                           current_co2_ppm: float, current_inflation: float,
@@ -987,6 +2922,7 @@ class ProjectsBroker:
                           funding_mode: str = "XCR"):
         # Store emissions_to_sinks_ratio for cost calculation
         self.current_emissions_to_sinks_ratio = emissions_to_sinks_ratio
+        self.invalidate_derived_cache()
         """Initiate new projects where economics are favorable
 
         **XCR Mode (market-driven):**
@@ -1114,6 +3050,30 @@ class ProjectsBroker:
             max_projects = max(min(max_by_capital, max_by_capacity), 0)
             num_projects = int(max_projects * urgency_factor * capacity_factor * count_damper * net_zero_ramp_factor * brake_factor)
 
+            # Max operational lifespan by channel
+            # CM projects have ~25-year lifespan (infrastructure replacement cycle)
+            # CDR projects have longer lifespan (geological storage is permanent)
+            if channel == ChannelType.CONVENTIONAL:
+                max_op_years = 25
+            elif channel == ChannelType.AVOIDED_DEFORESTATION:
+                max_op_years = 50  # Forest protection contracts
+            else:
+                max_op_years = 100  # CDR durability requirement
+
+            if self.bulk_creation or self.cohort_mode:
+                # Capacity (Gt) and GOVT capital ($) both shrink by each project's tonnes
+                budget_tonnes = float('inf') if remaining_capacity_gt is None else remaining_capacity_gt * 1e9
+                if is_govt_mode:
+                    affordable = (remaining_capital / marginal_cost) if marginal_cost > 0 else 0.0
+                    budget_tonnes = min(budget_tonnes, affordable)
+                created_tonnes = self._create_projects_bulk(
+                    channel, num_projects, current_year, scale_damper, marginal_cost,
+                    r_base, r_effective, max_op_years, budget_tonnes
+                )
+                if is_govt_mode:
+                    remaining_capital -= created_tonnes * marginal_cost
+                continue
+
             # Inner loop: create multiple projects for this channel
             for _ in range(num_projects):
                 if is_govt_mode and remaining_capital <= 0:
@@ -1121,24 +3081,21 @@ class ProjectsBroker:
                 if remaining_capacity_gt is not None and remaining_capacity_gt <= 0:
                     break
 
-                # Select country based on channel preferences
-                country = self._select_country(channel)
-
-                # Project parameters
-                dev_years = np.random.randint(2, 5)  # 2-4 years development (credit after mitigation)
-
-                # Max operational lifespan by channel
-                # CM projects have ~25-year lifespan (infrastructure replacement cycle)
-                # CDR projects have longer lifespan (geological storage is permanent)
-                if channel == ChannelType.CONVENTIONAL:
-                    max_op_years = 25
-                elif channel == ChannelType.AVOIDED_DEFORESTATION:
-                    max_op_years = 50  # Forest protection contracts
+                if self.crn is not None:
+                    pool = self._country_pool(channel)
+                    draws = self._crn_creation_draws(len(pool), self.projects.next_slots(channel.value, current_year, 1))
+                    pick, dev_years, base_annual_seq, co_benefit_score = (d[0] for d in draws)
+                    country, dev_years, co_benefit_score = pool[pick], int(dev_years), float(co_benefit_score)
                 else:
-                    max_op_years = 100  # CDR durability requirement
+                    # Select country based on channel preferences
+                    country = self._select_country(channel)
+
+                    # Project parameters
+                    dev_years = int(self.rng.integers(2, 5))  # 2-4 years development (credit after mitigation)
 
-                # Base project scale: 10M-100M tonnes/year
-                base_annual_seq = np.random.uniform(1e7, 1e8)
+                    # Base project scale: 10M-100M tonnes/year
+                    base_annual_seq = self.rng.uniform(1e7, 1e8)
+                    co_benefit_score = None  # Drawn once the project is known to be affordable
 
                 # Apply scale damping (learning-by-doing curve)
                 # Scale increases as industry gains deployment experience
@@ -1156,7 +3113,8 @@ class ProjectsBroker:
                     if annual_seq <= 0:
                         break
 
-                co_benefit_score = float(np.clip(np.random.normal(0.6, 0.2), 0.0, 1.0))
+                if co_benefit_score is None:
+                    co_benefit_score = float(np.clip(self.rng.normal(0.6, 0.2), 0.0, 1.0))
 
                 project = Project(
                     id=f"P{self.next_project_id:04d}",
@@ -1175,6 +3133,7 @@ class ProjectsBroker:
                 self.projects.append(project)
                 self.countries[country]['projects'].append(project.id)
                 self.next_project_id += 1
+                self.invalidate_derived_cache()  # Project counts feed marginal cost
 
                 # GOVT mode: Deduct from capital budget
                 # XCR mode: No capital deduction (developers fund projects)
@@ -1199,68 +3158,203 @@ class ProjectsBroker:
 
         High inflation environments retire projects more aggressively to reduce
         ongoing minting pressure.
+
+        With vectorized_stepping (default) the year is advanced by one batch
+        kernel; otherwise projects are stepped one at a time in index order.
         """
         target_co2 = 350.0
 
         reversal_tonnes = 0.0
+        store = self.projects
+
+        # Climate-target-achieved retirement probability (same for every operational project)
+        retirement_probability = 0.0
+        if current_co2_ppm < target_co2:
+            # Retirement rate scales with how far below target
+            # AND with realized inflation (high inflation = faster retirement)
+            overshoot_ppm = target_co2 - current_co2_ppm
+            inflation_ratio = max(current_inflation, 0.0) / 0.02  # Normalize to 2%
+
+            # Base retirement rates
+            # "Great Restore" Retirement Rates (Lower to allow drawdown)
+            if overshoot_ppm <= 10:
+                base_rate = 0.02  # Minimal overshoot - keep projects!
+            elif overshoot_ppm <= 30:
+                base_rate = 0.05  # Moderate overshoot
+            else:
+                base_rate = 0.10  # Significant overshoot
+
+            # Inflation adjustment: High inflation → faster retirement
+            if inflation_ratio > 2.5:  # High inflation (>5%)
+                inflation_multiplier = 1.4  # 40% faster retirement
+            elif inflation_ratio > 1.5:  # Medium inflation (3-5%)
+                inflation_multiplier = 1.2  # 20% faster
+            elif inflation_ratio < 0.5:  # Low inflation (<1%)
+                inflation_multiplier = 0.8  # 20% slower (keep projects longer)
+            else:
+                inflation_multiplier = 1.0  # Baseline
+
+            retirement_probability = min(0.5, base_rate * inflation_multiplier)
+
+        # Annual failure rate per channel code (channel risk is a pure function of channel)
+        failure_rates = np.zeros(len(REVERSAL_FRACTION_BY_CODE))
+        for code, channel in CHANNEL_BY_CODE.items():
+            channel_factor = channel_risk_fn(channel.name.lower()) if channel_risk_fn else 1.0
+            failure_rates[code] = min(max(0.02 * climate_risk_multiplier * channel_factor, 0.0), 0.5)
+
+        retiring = current_co2_ppm < target_co2
+        if self.cohort_mode:
+            return self._step_cohorts(retiring, retirement_probability, failure_rates)
+        if self.vectorized_stepping:
+            return self._step_rows_vectorized(retiring, retirement_probability, failure_rates)
+
+        status = store.status_code
+        # Only live projects change state; failed/completed rows are never visited
+        for i in store.live_indexes():
+            i = int(i)
+            # Check for climate-target-achieved retirement
+            if retiring and status[i] == _OPERATIONAL:
+                if self._retirement_uniforms(store, np.array([i]))[0] < retirement_probability:
+                    store.set_status(i, _FAILED)
+                    reversal_fraction = REVERSAL_FRACTION_BY_CODE[store.channel_code[i]]
+                    reversal_tonnes += store.total_sequestered_tonnes[i] * reversal_fraction
+                    store.total_sequestered_tonnes[i] = 0.0
+                    # Note: This is retirement, not failure, but uses same status
+                    continue
 
-        for project in self.projects:
-            if project.status != ProjectStatus.FAILED:
-                # Check for climate-target-achieved retirement
-                if current_co2_ppm < target_co2 and project.status == ProjectStatus.OPERATIONAL:
-                    # Retirement rate scales with how far below target
-                    # AND with realized inflation (high inflation = faster retirement)
-                    overshoot_ppm = target_co2 - current_co2_ppm
-                    inflation_ratio = max(current_inflation, 0.0) / 0.02  # Normalize to 2%
-
-                    # Base retirement rates
-                    # "Great Restore" Retirement Rates (Lower to allow drawdown)
-                    if overshoot_ppm <= 10:
-                        base_rate = 0.02  # Minimal overshoot - keep projects!
-                    elif overshoot_ppm <= 30:
-                        base_rate = 0.05  # Moderate overshoot
-                    else:
-                        base_rate = 0.10  # Significant overshoot
-
-                    # Inflation adjustment: High inflation → faster retirement
-                    if inflation_ratio > 2.5:  # High inflation (>5%)
-                        inflation_multiplier = 1.4  # 40% faster retirement
-                    elif inflation_ratio > 1.5:  # Medium inflation (3-5%)
-                        inflation_multiplier = 1.2  # 20% faster
-                    elif inflation_ratio < 0.5:  # Low inflation (<1%)
-                        inflation_multiplier = 0.8  # 20% slower (keep projects longer)
-                    else:
-                        inflation_multiplier = 1.0  # Baseline
+            # Normal project step (development progress, stochastic decay)
+            store.advance_row(i, failure_rates[store.channel_code[i]])
 
-                    retirement_probability = min(0.5, base_rate * inflation_multiplier)
+        return float(reversal_tonnes)
 
-                    if np.random.random() < retirement_probability:
-                        project.status = ProjectStatus.FAILED
-                        reversal_fraction = get_failure_reversal_fraction(project.channel)
-                        reversal_tonnes += project.total_sequestered_tonnes * reversal_fraction
-                        project.total_sequestered_tonnes = 0.0
-                        # Note: This is retirement, not failure, but uses same status
-                        continue
+    def _retirement_uniforms(self, store: ProjectStore, rows: np.ndarray) -> np.ndarray:
+        """One uniform per row for target-achieved retirement (slot-keyed in CRN mode)"""
+        if self.crn is not None:
+            return store.crn_uniforms("retirement", rows)[:, 0]
+        return self.rng.random(len(rows))
 
-                # Normal project step (development progress, stochastic decay)
-                channel_factor = channel_risk_fn(project.channel.name.lower()) if channel_risk_fn else 1.0
-                project.step(failure_multiplier=climate_risk_multiplier * channel_factor)
+    def _step_rows_vectorized(self, retiring: bool, retirement_probability: float,
+                              failure_rates: np.ndarray) -> float:
+        """Batch version of the step_projects loop over all live projects"""
+        store = self.projects
+        live = store.live_indexes()
+        reversal_tonnes = 0.0
 
+        if retiring:
+            operating = live[store.status_code[live] == _OPERATIONAL]
+            retired = operating[self._retirement_uniforms(store, operating) < retirement_probability]
+            if len(retired):
+                store.set_status_rows(retired, _FAILED)
+                reversal_fraction = REVERSAL_FRACTION_BY_CODE[store.channel_code[retired]]
+                reversal_tonnes = float(np.sum(store.total_sequestered_tonnes[retired] * reversal_fraction))
+                store.total_sequestered_tonnes[retired] = 0.0
+                live = live[store.status_code[live] != _FAILED]
+
+        store.advance_rows(live, failure_rates)
         return reversal_tonnes
 
+    def _step_cohorts(self, retiring: bool, retirement_probability: float,
+                      failure_rates: np.ndarray) -> float:
+        """Cohort-mode step: binomial retirements and health decay per cohort row"""
+        store = self.projects
+        live = store.live_indexes()
+        reversal_tonnes = 0.0
+
+        if retiring:
+            operating = live[store.status_code[live] == _OPERATIONAL]
+            counts = store.project_count[operating]
+            rng = self.rng if self.crn is None else self.crn.stream("retirement")
+            retired = rng.binomial(counts, retirement_probability)
+            hit = retired > 0
+            if hit.any():
+                rows, retired, counts = operating[hit], retired[hit], counts[hit]
+                reversal_fraction = REVERSAL_FRACTION_BY_CODE[store.channel_code[rows]]
+                reversal_tonnes = float(np.sum(
+                    store.total_sequestered_tonnes[rows] * (retired / counts) * reversal_fraction
+                ))
+                store.remove_members(rows, retired)
+                live = live[store.status_code[live] != _FAILED]
+
+        store.advance_cohort_rows(live, failure_rates)
+        return reversal_tonnes
+
+    def validate_vectorized_stepping(self, current_co2_ppm: float, current_inflation: float,
+                                     climate_risk_multiplier: float = 1.0, channel_risk_fn=None,
+                                     trials: int = 200, z_tolerance: float = 5.0) -> Dict[str, tuple]:
+        """Compare one year of scalar vs vectorized stepping from the current portfolio
+
+        Runs `trials` independent single-year steps of each path on copies of
+        the store (the broker itself is left untouched) and compares the mean
+        reversal tonnes, status counts and total health. Raises RuntimeError if
+        any mean differs by more than z_tolerance standard errors.
+        Returns {metric: (scalar_mean, vectorized_mean)}.
+        """
+        original_store, original_flag = self.projects, self.vectorized_stepping
+        samples = {False: [], True: []}
+        try:
+            for vectorized in (False, True):
+                self.vectorized_stepping = vectorized
+                for _ in range(trials):
+                    self.projects = original_store.copy()
+                    reversal = self.step_projects(current_co2_ppm, current_inflation,
+                                                  climate_risk_multiplier=climate_risk_multiplier,
+                                                  channel_risk_fn=channel_risk_fn)
+                    counts = self.projects.status_counts.sum(axis=0)
+                    samples[vectorized].append(
+                        [reversal, *counts, self.projects.live("health").sum()]
+                    )
+        finally:
+            self.projects, self.vectorized_stepping = original_store, original_flag
+
+        names = ["reversal_tonnes"] + [f"{STATUS_BY_CODE[c].value}_count" for c in range(len(STATUS_CODES))]
+        names.append("total_health")
+        scalar, vector = np.array(samples[False]), np.array(samples[True])
+        summary = {}
+        for k, name in enumerate(names):
+            a, b = scalar[:, k], vector[:, k]
+            stderr = np.sqrt((a.var() + b.var()) / trials)
+            summary[name] = (float(a.mean()), float(b.mean()))
+            if abs(a.mean() - b.mean()) > z_tolerance * stderr + 1e-9 * max(abs(a.mean()), 1.0):
+                raise RuntimeError(
+                    f"Vectorized stepping diverges on {name}: scalar {a.mean():.6g} vs vectorized {b.mean():.6g}"
+                )
+        return summary
+
+    def compact(self) -> int:
+        """Archive failed and completed projects (ProjectStore.compact)
+
+        Archived ids are dropped from their country's `projects` list (cohort
+        ids only once no live row of the cohort remains) and counted in the
+        country's `archived_projects`. Returns the number of archived rows.
+        """
+        archived = self.projects.compact(self.archive_spill_dir, self.keep_archived_rows)
+        if not archived:
+            return 0
+        remaining = set(self.projects.ids)
+        gone: Dict[str, set] = {}
+        for project_id, name in zip(archived["id"].tolist(), archived["country"].tolist()):
+            if project_id not in remaining:
+                gone.setdefault(name, set()).add(project_id)
+        for name, ids in gone.items():
+            country = self.countries.get(name)
+            if country is None:
+                continue
+            kept = [project_id for project_id in country['projects'] if project_id not in ids]
+            country['archived_projects'] = country.get('archived_projects', 0) + len(country['projects']) - len(kept)
+            country['projects'] = kept
+        return len(archived["id"])
+
     def get_operational_projects(self) -> List[Project]:
         """Return list of operational projects ready for verification"""
-        return [p for p in self.projects if p.status == ProjectStatus.OPERATIONAL]
+        return self.projects.views(self.projects.indexes(ProjectStatus.OPERATIONAL))
 
     def get_total_operational_cost(self, exclude_channels: List[ChannelType] = None) -> float:
         """Calculate total annual cost for all active projects (operational + development)"""
-        total_cost = 0.0
         exclude = exclude_channels or []
-        for project in self.projects:
-            if project.status in (ProjectStatus.OPERATIONAL, ProjectStatus.DEVELOPMENT):
-                if project.channel not in exclude:
-                    total_cost += project.marginal_cost_per_tonne * project.annual_sequestration_tonnes
-        return total_cost
+        if self.debug_aggregates:
+            self.projects.check_aggregates()
+        channels = [c for c in ChannelType if c not in exclude]
+        return self.projects.cost(channels, ProjectStatus.OPERATIONAL, ProjectStatus.DEVELOPMENT)
 
     def get_cdr_capacity_limit(self, current_year: int) -> float:
         """Calculate dynamic CDR capacity limit based on sigmoid ramp-up and material constraints
@@ -1271,12 +3365,8 @@ class ProjectsBroker:
         Max: ~60 Gt/year (from dashboard/const)
         Material factor: Reduces capacity as material budget depletes
         """
-        max_cap = self.max_capacity_gt_per_year[ChannelType.CDR]
-        midpoint = 30.0
-        k = 0.15
-
         # Time-based ramp-up
-        capacity_limit = max_cap / (1.0 + np.exp(-k * (current_year - midpoint)))
+        capacity_limit = self._cdr_ramp_table(current_year, self.max_capacity_gt_per_year[ChannelType.CDR])
 
         # Apply material constraints (limestone, energy, water, steel)
         material_capacity_factor = self.get_cdr_material_capacity_factor()
@@ -1284,6 +3374,12 @@ class ProjectsBroker:
 
         return capacity_limit
 
+    @staticmethod
+    def _cdr_ramp_curve(years: np.ndarray, max_cap: float) -> np.ndarray:
+        midpoint = 30.0
+        k = 0.15
+        return max_cap / (1.0 + np.exp(-k * (years - midpoint)))
+
 
 class InvestorMarket:
     """Investor Market - Aggregate sentiment and price discovery"""
@@ -1546,11 +3642,21 @@ class CapitalMarket:
         return net_capital_flow, capital_demand_premium, forward_guidance
 
 
+def _sequential_cap(amounts: np.ndarray, cap: float) -> np.ndarray:
+    """Vectorized `credit = min(amount, remaining); remaining -= credit` over amounts in order"""
+    if cap <= 0:
+        return np.minimum(amounts, cap)  # Nothing left: remaining never shrinks
+    spent_before = np.cumsum(amounts) - amounts
+    return np.clip(cap - spent_before, 0.0, amounts)
+
+
 class Auditor:
     """Auditor (MRV) - Verification and risk management"""
 
-    def __init__(self, error_rate: float = 0.01):
+    def __init__(self, error_rate: float = 0.01, seed=None):
         self.error_rate = error_rate
+        self.rng = make_rng(seed)  # Audit failure draws
+        self.crn: Optional[CommonRandomNumbers] = None  # Slot-keyed audit draws when set
         self.total_xcr_burned = 0.0
 
     def audit_project(self, project: Project) -> str:
@@ -1560,7 +3666,11 @@ class Auditor:
         """
         health_gap = max(0.0, 0.9 - project.health) / 0.9
         failure_probability = min(0.3, self.error_rate + (health_gap * 0.25))
-        if np.random.rand() < failure_probability:
+        if self.crn is not None:
+            u = project._store.crn_uniforms("audit", np.array([project._idx]))[0, 0]
+        else:
+            u = self.rng.random()
+        if u < failure_probability:
             return "FAIL"
         return "PASS"
 
@@ -1582,6 +3692,523 @@ class Auditor:
             project.status = ProjectStatus.FAILED
             return -clawback_amount, reversal_tonnes  # Negative = burn
 
+    def verify_and_mint_rows(self, store: ProjectStore, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Batched verify_and_mint_xcr over store rows
+
+        Draws one uniform per row in row order, the same random stream as
+        calling verify_and_mint_xcr on each project in turn. Failed rows are
+        clawed back and marked FAILED. Returns (xcr_change, reversal_tonnes) arrays.
+        """
+        health_gap = np.maximum(0.0, 0.9 - store.health[rows]) / 0.9
+        failure_probability = np.minimum(0.3, self.error_rate + health_gap * 0.25)
+        if self.crn is not None:
+            failed = store.crn_uniforms("audit", rows)[:, 0] < failure_probability
+        else:
+            failed = self.rng.random(len(rows)) < failure_probability
+
+        xcr_change = store.annual_sequestration_tonnes[rows] * store.r_effective[rows]
+        reversal_tonnes = np.zeros(len(rows))
+        bad = rows[failed]
+        if len(bad):
+            # FAIL - clawback (burn 50% of lifetime rewards)
+            clawback = store.total_xcr_minted[bad] * 0.5
+            self.total_xcr_burned += float(clawback.sum())
+            reversal_fraction = REVERSAL_FRACTION_BY_CODE[store.channel_code[bad]]
+            reversal_tonnes[failed] = store.total_sequestered_tonnes[bad] * reversal_fraction
+            store.total_sequestered_tonnes[bad] = 0.0
+            store.set_status_rows(bad, _FAILED)
+            xcr_change[failed] = -clawback
+        return xcr_change, reversal_tonnes
+
+    def verify_and_mint_cohorts(self, store: ProjectStore, rows: np.ndarray) -> tuple:
+        """verify_and_mint_rows for cohort rows
+
+        Audit failures are drawn per row as Binomial(project_count, p), p being
+        the failure probability averaged over the row's health bins. Failing
+        is more likely for the less healthy members, so the survivors' health
+        distribution is conditioned on passing (bin weights × (1 - p_bin),
+        renormalized). Failed members take their pro rata share of lifetime
+        XCR (50% clawed back) and sequestered carbon (reversed) and are folded
+        out of the store (ProjectStore.remove_members). Returns (rows,
+        xcr_change, reversal_tonnes) where rows is the input followed once more
+        by each row with failures, carrying the (negative) clawback and the
+        reversal.
+        """
+        health, bin_failure, _ = _cohort_health_grid(self.error_rate)
+        bins = store.health_bins[rows]
+        failure_probability = (bins @ bin_failure).astype(float)
+        counts = store.project_count[rows]
+        rng = self.rng if self.crn is None else self.crn.stream("audit")
+        failed = rng.binomial(counts, failure_probability)
+
+        hit = failed > 0
+        bad, failed, counts = rows[hit], failed[hit], counts[hit]
+        share = failed / counts
+        clawback = store.total_xcr_minted[bad] * share * 0.5  # Burn 50% of lifetime rewards
+        self.total_xcr_burned += float(clawback.sum())
+        reversal_fraction = REVERSAL_FRACTION_BY_CODE[store.channel_code[bad]]
+        reversal_tonnes = store.total_sequestered_tonnes[bad] * share * reversal_fraction
+        store.remove_members(bad, failed)
+
+        bins *= 1.0 - bin_failure
+        bins /= np.maximum(1.0 - failure_probability, 1e-12).astype(np.float32)[:, None]
+        store.health_bins[rows] = bins
+        store.health[rows] = bins @ health
+
+        xcr_change = store.annual_sequestration_tonnes[rows] * store.r_effective[rows]
+        return (np.concatenate((rows, bad)),
+                np.concatenate((xcr_change, -clawback)),
+                np.concatenate((np.zeros(len(rows)), reversal_tonnes)))
+
+
+# ============================================================================
+# STOP CONDITIONS
+# ============================================================================
+
+class StopCondition:
+    """Ends a run early (GCR_ABM_Simulation.iter_years / run_simulation)
+
+    Called with each year's record; returning True stops the run after that
+    year. reset() is called at the start of every run, so one instance can
+    be reused across a sweep.
+    """
+
+    def reset(self):
+        pass
+
+    def __call__(self, record: Dict) -> bool:
+        raise NotImplementedError
+
+
+class TargetReached(StopCondition):
+    """Stop once a column reaches a target (default: CO2 at or below 350.5 ppm)"""
+
+    def __init__(self, target: float = 350.5, column: str = "CO2_ppm", below: bool = True):
+        self.target = target
+        self.column = column
+        self.below = below  # Reached when value <= target (False: value >= target)
+
+    def __call__(self, record: Dict) -> bool:
+        value = record[self.column]
+        return value <= self.target if self.below else value >= self.target
+
+    def __repr__(self) -> str:
+        return f"TargetReached({self.column} {'<=' if self.below else '>='} {self.target})"
+
+
+class SustainedAbove(StopCondition):
+    """Stop once a column stays above a threshold for `years` consecutive years"""
+
+    def __init__(self, column: str, threshold: float, years: int = 1):
+        if years < 1:
+            raise ValueError("years must be at least 1")
+        self.column = column
+        self.threshold = threshold
+        self.years = years
+        self.run_length = 0  # Consecutive years the condition has held
+
+    def reset(self):
+        self.run_length = 0
+
+    def _holds(self, record: Dict) -> bool:
+        return record[self.column] > self.threshold
+
+    def __call__(self, record: Dict) -> bool:
+        self.run_length = self.run_length + 1 if self._holds(record) else 0
+        return self.run_length >= self.years
+
+    def __repr__(self) -> str:
+        return f"SustainedAbove({self.column} > {self.threshold} for {self.years} years)"
+
+
+class FloorBreach(SustainedAbove):
+    """Stop once the XCR price trades below the floor for `years` consecutive years
+
+    `tolerance` is the fractional shortfall ignored (0.05 = breach below 95%
+    of the floor). GOVT-mode records (no XCR market) never breach.
+    """
+
+    def __init__(self, tolerance: float = 0.0, years: int = 1):
+        super().__init__("Market_Price", 0.0, years)
+        self.tolerance = tolerance
+
+    def _holds(self, record: Dict) -> bool:
+        price = record["Market_Price"]
+        return 0.0 < price < record["Price_Floor"] * (1.0 - self.tolerance)
+
+    def __repr__(self) -> str:
+        return f"FloorBreach(tolerance={self.tolerance} for {self.years} years)"
+
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+
+# Per-year output columns of GCR_ABM_Simulation.run_simulation, in DataFrame order
+RESULT_SCHEMA = (
+    # Core state, market and projects
+    ("Year", np.int32),
+    ("CO2_ppm", np.float64),
+    ("BAU_CO2_ppm", np.float64),
+    ("CO2_Avoided", np.float64),
+    ("Inflation", np.float64),
+    ("XCR_Supply", np.float64),
+    ("XCR_Minted", np.float64),
+    ("XCR_Burned_Annual", np.float64),
+    ("XCR_Burned_Cumulative", np.float64),
+    ("Cobenefit_Bonus_XCR", np.float64),
+    ("Market_Price", np.float64),
+    ("Price_Floor", np.float64),
+    ("Sentiment", np.float64),
+    ("Projects_Total", np.int32),
+    ("Projects_Operational", np.int32),
+    ("Projects_Development", np.int32),
+    ("Projects_Failed", np.int32),
+    ("Projects_Completed", np.int32),
+    ("Sequestration_Tonnes", np.float64),
+    ("CDR_Sequestration_Tonnes", np.float64),
+    ("Conventional_Mitigation_Tonnes", np.float64),
+    ("Avoided_Deforestation_Tonnes", np.float64),
+    ("Reversal_Tonnes", np.float64),
+    ("Human_Emissions_GtCO2", np.float64),
+    ("Conventional_Installed_GtCO2", np.float64),
+    ("CEA_Warning", np.bool_),
+    ("CQE_Spent", np.float64),
+    ("XCR_Purchased", np.float64),
+    ("Active_Countries", np.int32),
+    ("CQE_Budget_Total", np.float64),
+    ("Capacity", np.float64),
+
+    # Climate physics
+    ("Temperature_Anomaly", np.float64),
+    ("Ocean_Uptake_GtC", np.float64),
+    ("Land_Uptake_GtC", np.float64),
+    ("Airborne_Fraction", np.float64),
+    ("Ocean_Sink_Capacity", np.float64),
+    ("Land_Sink_Capacity", np.float64),
+    ("Permafrost_Emissions_GtC", np.float64),
+    ("Fire_Emissions_GtC", np.float64),
+    ("Cumulative_Emissions_GtC", np.float64),
+    ("Climate_Risk_Multiplier", np.float64),
+    ("C_Ocean_Surface_GtC", np.float64),
+    ("C_Land_GtC", np.float64),
+
+    # Technology costs, deployment, policy and profitability
+    ("CDR_Cost_Per_Tonne", np.float64),
+    ("Conventional_Cost_Per_Tonne", np.float64),
+    ("CDR_Cumulative_GtCO2", np.float64),
+    ("Conventional_Cumulative_GtCO2", np.float64),
+    ("CDR_Policy_Multiplier", np.float64),
+    ("Conventional_Policy_Multiplier", np.float64),
+    ("CDR_R_Base", np.float64),
+    ("CDR_R_Effective", np.float64),
+    ("Conventional_R_Base", np.float64),
+    ("Conventional_R_Effective", np.float64),
+    ("CDR_Profitability", np.float64),
+    ("Conventional_Profitability", np.float64),
+
+    # Capacity constraints and CDR buildout controls
+    ("Conventional_Capacity_Utilization", np.float64),
+    ("Conventional_Capacity_Available", np.bool_),
+    ("Conventional_Capacity_Factor", np.float64),
+    ("CDR_Material_Utilization", np.float64),
+    ("CDR_Material_Cost_Factor", np.float64),
+    ("CDR_Material_Capacity_Factor", np.float64),
+    ("CDR_Buildout_Stopped", np.bool_),
+    ("CDR_Buildout_Stop_Year", np.int32),
+
+    # Capital markets, CQE and government funding
+    ("Net_Capital_Flow", np.float64),
+    ("Capital_Demand_Premium", np.float64),
+    ("Forward_Guidance", np.float64),
+    ("Capital_Inflow_Cumulative", np.float64),
+    ("Capital_Outflow_Cumulative", np.float64),
+    ("CEA_Brake_Factor", np.float64),
+    ("Annual_CQE_Spent", np.float64),
+    ("Annual_CQE_Budget", np.float64),
+    ("CQE_Budget_Utilization", np.float64),
+    ("Gov_Debt_USD", np.float64),
+    ("Annual_Gov_Spending", np.float64),
+    ("Gov_Brake_Factor", np.float64),
+    ("Investor_Sentiment", np.float64),
+)
+
+# Named output profiles: the columns recorded (None = the whole schema).
+# "dashboard" covers dashboard.py; "metrics-only" covers ensemble reductions
+# (stress_harness, cohort_validation, optimize_drawdown).
+RESULT_PROFILES = {
+    "full": None,
+    "dashboard": (
+        "Year", "CO2_ppm", "BAU_CO2_ppm", "CO2_Avoided", "Inflation", "XCR_Supply", "XCR_Minted",
+        "XCR_Burned_Annual", "XCR_Burned_Cumulative", "Market_Price", "Price_Floor", "Sentiment",
+        "Projects_Total", "Projects_Operational", "Projects_Development", "Projects_Failed",
+        "Sequestration_Tonnes", "CDR_Sequestration_Tonnes", "Conventional_Mitigation_Tonnes",
+        "Avoided_Deforestation_Tonnes", "CEA_Warning", "CQE_Spent", "XCR_Purchased", "Active_Countries",
+        "CQE_Budget_Total", "Capacity", "CDR_Cost_Per_Tonne", "Conventional_Cost_Per_Tonne",
+        "CDR_Policy_Multiplier", "Conventional_Policy_Multiplier", "CDR_Profitability",
+        "Conventional_Profitability", "Conventional_Capacity_Factor", "Net_Capital_Flow", "Forward_Guidance",
+        "Capital_Inflow_Cumulative", "Capital_Outflow_Cumulative", "CQE_Budget_Utilization", "Gov_Debt_USD",
+        "Annual_Gov_Spending",
+    ),
+    "metrics-only": (
+        "Year", "CO2_ppm", "Inflation", "XCR_Supply", "XCR_Minted", "Market_Price", "Price_Floor",
+        "Projects_Total", "Projects_Operational", "Projects_Failed", "Sequestration_Tonnes",
+        "CDR_Sequestration_Tonnes", "Reversal_Tonnes", "CQE_Spent", "XCR_Purchased",
+        "Temperature_Anomaly", "Net_Capital_Flow", "CQE_Budget_Utilization",
+    ),
+}
+
+
+class ResultRow(Mapping):
+    """Read-only mapping view of one recorded year (column name -> value)"""
+    __slots__ = ("_columns", "_idx")
+
+    def __init__(self, columns: Dict[str, np.ndarray], idx: int):
+        self._columns = columns
+        self._idx = idx
+
+    def __getitem__(self, name: str):
+        return self._columns[name][self._idx]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return f"ResultRow({dict(self)!r})"
+
+
+class ResultsRecorder:
+    """Preallocated typed columns for per-year simulation results
+
+    One NumPy column per recorded schema entry, allocated for `length` rows up
+    front (grown by doubling if more rows are written). The simulation writes
+    each year's values by row index; to_frame() hands the filled part of the
+    columns to pandas without copying.
+
+    `profile` selects the recorded columns: a RESULT_PROFILES name or a list
+    of column names ("Year" is always kept). `every` records only every k-th
+    year (plus the horizon's last year). `buffers` maps every schema column to
+    its array, with unrecorded columns pointing at shared scratch arrays, so
+    writers need not check the profile; wants() tells whether a diagnostic is
+    worth computing at all.
+    """
+
+    def __init__(self, length: int, schema: tuple = RESULT_SCHEMA, profile="full", every: int = 1):
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.schema = tuple(schema)
+        self.every = int(every)
+        recorded = self._profile_columns(profile)
+        self.size = 0
+        self.capacity = max(int(length), 1)
+        self.columns: Dict[str, np.ndarray] = {name: np.zeros(self.capacity, dtype=dtype)
+                                               for name, dtype in self.schema if name in recorded}
+        self._scratch: Dict[np.dtype, np.ndarray] = {}
+        self.buffers: Dict[str, np.ndarray] = {}
+        self._bind_buffers()
+
+    def _profile_columns(self, profile) -> set:
+        names = RESULT_PROFILES.get(profile, ()) if isinstance(profile, str) else profile
+        if isinstance(profile, str) and profile not in RESULT_PROFILES:
+            raise ValueError(f"Unknown output profile {profile!r} (choose from {sorted(RESULT_PROFILES)} "
+                             f"or pass a list of columns)")
+        known = [name for name, _ in self.schema]
+        if names is None:
+            return set(known)
+        unknown = sorted(set(names) - set(known))
+        if unknown:
+            raise ValueError(f"Unknown result columns: {unknown}")
+        return set(names) | {"Year"}
+
+    def _bind_buffers(self):
+        for name, dtype in self.schema:
+            column = self.columns.get(name)
+            if column is None:
+                key = np.dtype(dtype)
+                column = self._scratch.get(key)
+                if column is None or len(column) != self.capacity:
+                    column = self._scratch[key] = np.zeros(self.capacity, dtype=dtype)
+            self.buffers[name] = column
+
+    def wants(self, *names: str) -> bool:
+        """True if any of the columns is recorded"""
+        return any(name in self.columns for name in names)
+
+    def records_year(self, year: int, horizon: int) -> bool:
+        """True if `year` gets a row (every k-th year and the horizon's last year)"""
+        return year % self.every == 0 or year == horizon - 1
+
+    def new_row(self) -> int:
+        """Reserve the next row and return its index"""
+        if self.size == self.capacity:
+            self.capacity *= 2
+            for name, column in self.columns.items():
+                grown = np.zeros(self.capacity, dtype=column.dtype)
+                grown[:self.size] = column[:self.size]
+                self.columns[name] = grown
+            self._bind_buffers()
+        self.size += 1
+        return self.size - 1
+
+    def row(self, idx: int) -> ResultRow:
+        """Mapping view of one recorded row"""
+        if not 0 <= idx < self.size:
+            raise IndexError("result row out of range")
+        return ResultRow(self.columns, idx)
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame of the recorded rows backed by the recorder's arrays"""
+        return pd.DataFrame({name: column[:self.size] for name, column in self.columns.items()}, copy=False)
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """Pickler that stores the LLM engine as a reference instead of its state"""
+
+    def __init__(self, file, llm_engine):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.llm_engine = llm_engine
+
+    def persistent_id(self, obj):
+        if obj is not None and obj is self.llm_engine:
+            return "llm_engine"
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler that reattaches the restoring simulation's LLM engine"""
+
+    def __init__(self, file, llm_engine):
+        super().__init__(file)
+        self.llm_engine = llm_engine
+
+    def persistent_load(self, pid):
+        if pid == "llm_engine":
+            return self.llm_engine
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+
+
+# ============================================================================
+# BAU COUNTERFACTUAL
+# ============================================================================
+
+# CarbonCycle state recorded after each BAU year (BauTrajectory.states columns)
+BAU_STATE_FIELDS = ("c_atm", "c_ocean_surface", "c_ocean_deep", "c_land", "c_permafrost_remaining",
+                    "cumulative_emissions", "temperature", "co2_ppm")
+BAU_CACHE_DIR = os.environ.get("GCR_BAU_CACHE")  # Optional on-disk store of BAU trajectories
+_BAU_TRAJECTORIES: Dict[tuple, "BauTrajectory"] = {}  # Process-wide memo by bau_trajectory() key
+
+
+class BauTrajectory:
+    """No-intervention climate path of one set of BAU settings
+
+    emissions_gt[t] is the BAU flow (GtCO2/year) the BAU carbon cycle is
+    stepped with in year t, and states[t] the cycle's state after that step.
+    Arrays are read-only: one trajectory is shared by every simulation with
+    the same settings.
+    """
+
+    def __init__(self, emissions_gt: np.ndarray, states: np.ndarray, land_use_change_gtc: float):
+        self.emissions_gt = _read_only(emissions_gt, np.float64)
+        self.states = _read_only(states, np.float64)
+        self.co2_ppm = self.states[:, BAU_STATE_FIELDS.index("co2_ppm")]
+        self.land_use_change_gtc = land_use_change_gtc
+
+    def __len__(self) -> int:
+        return len(self.emissions_gt)
+
+    def restore(self, cycle: CarbonCycle, year: int):
+        """Put a fresh BAU cycle into its state at the end of `year` (-1 = unchanged)"""
+        if year < 0:
+            return
+        for name, value in zip(BAU_STATE_FIELDS, self.states[year]):
+            setattr(cycle, name, float(value))
+        cycle.years_elapsed = year + 1
+
+
+def _bau_growth_rate(year: int, peak_year: int, pre_peak: float, decline_start: int, plateau: float,
+                     decline: float) -> float:
+    if year < peak_year:
+        return pre_peak
+    if year < decline_start:
+        return plateau
+    return decline
+
+
+def bau_trajectory(params, years: int, initial_co2_ppm: float, initial_emissions_gt: float, peak_year: int,
+                   pre_peak_rate: float, decline_start_year: int, plateau_rate: float, decline_rate: float,
+                   land_use_change_gtc: float, cache_dir: Optional[str] = BAU_CACHE_DIR) -> BauTrajectory:
+    """BAU climate path of GCR_ABM_Simulation.step_year, computed once per settings
+
+    Steps a fresh CarbonCycle with the BAU flow exactly as step_year does
+    (no ratchet), memoized process-wide and, with cache_dir, on disk.
+    Parameters that are arrays (parameter sweeps) are computed uncached.
+    """
+    schedule = (peak_year, pre_peak_rate, decline_start_year, plateau_rate, decline_rate)
+    key = (dataclasses.astuple(params), years, initial_co2_ppm, initial_emissions_gt, schedule,
+           land_use_change_gtc)
+    try:
+        cached = _BAU_TRAJECTORIES.get(key)
+    except TypeError:  # Unhashable (array-valued) parameters
+        key, cached = None, None
+    if cached is not None:
+        return cached
+
+    path = None
+    if key is not None and cache_dir:
+        digest = hashlib.sha256(repr((key, _climate_code_digest())).encode()).hexdigest()
+        path = os.path.join(cache_dir, f"bau_{digest}.npz")
+        try:
+            with np.load(path) as data:
+                trajectory = BauTrajectory(data["emissions_gt"], data["states"], land_use_change_gtc)
+            _BAU_TRAJECTORIES[key] = trajectory
+            return trajectory
+        except (OSError, ValueError, KeyError):
+            pass
+
+    cycle = CarbonCycle(initial_co2_ppm=initial_co2_ppm, params=params)
+    gtc_per_gtco2 = 1 / params.gtco2_per_gtc
+    emissions_gt = np.empty(years)
+    states = np.empty((years, len(BAU_STATE_FIELDS)))
+    emissions = initial_emissions_gt
+    for year in range(years):
+        emissions_gt[year] = emissions
+        bau_emissions_gtc = emissions * gtc_per_gtco2
+        emissions = max(0.0, emissions * (1 + _bau_growth_rate(year, *schedule)))
+        cycle.step(emissions_gtc=bau_emissions_gtc, sequestration_gtc=0.0, land_use_change_gtc=land_use_change_gtc)
+        states[year] = [getattr(cycle, name) for name in BAU_STATE_FIELDS]
+    trajectory = BauTrajectory(emissions_gt, states, land_use_change_gtc)
+
+    if key is not None:
+        _BAU_TRAJECTORIES[key] = trajectory
+    if path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, emissions_gt=emissions_gt, states=states)
+            os.replace(tmp, path)
+        except OSError:
+            os.unlink(tmp)
+    return trajectory
+
+
+@lru_cache(maxsize=None)
+def _climate_code_digest() -> str:
+    """Hash of climate.py, so on-disk trajectories follow the carbon-cycle code"""
+    with open(climate.__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def clear_bau_cache():
+    """Forget the process-wide BAU trajectories (on-disk entries are kept)"""
+    _BAU_TRAJECTORIES.clear()
+
 
 # ============================================================================
 # MAIN SIMULATION
@@ -1608,6 +4235,14 @@ class GCR_ABM_Simulation:
                  cdr_buildout_stop_year: int = 25,  # Stop NEW CDR project initiation after this year (default 25)
                  cdr_buildout_stop_on_co2_peak: bool = True,  # Also stop buildout when approaching 350 ppm target
                  funding_mode: str = "XCR",
+                 output_profile="full",  # RESULT_PROFILES name or list of result columns
+                 record_every: int = 1,  # Record every k-th year (plus the last year)
+                 event_level: Optional[str] = "info",  # Minimum event level logged (None = silent)
+                 event_capacity: int = 10_000,  # Events kept in the ring buffer
+                 echo_events: bool = False,  # Also print events as they happen
+                 seed=None,  # int or SeedSequence; None draws a seed from the global NumPy state
+                 common_random_numbers: bool = False,  # Purpose-keyed draws for paired scenario runs
+                 antithetic: bool = False,  # Mirror all common random numbers (antithetic partner run)
                  # LLM agent parameters
                  llm_enabled: bool = False,
                  llm_model: str = "llama3.2",
@@ -1630,6 +4265,19 @@ class GCR_ABM_Simulation:
             damping_steepness: Sigmoid slope for scale/count damping and CDR learning taper
             max_cdr_capacity: Maximum annual CDR sequestration capacity (GtCO2/year)
             funding_mode: Scheme for funding projects ("XCR" or "GOVT")
+            output_profile: Result columns to record ("full", "dashboard", "metrics-only" or a list)
+            record_every: Record only every k-th year (and the final year)
+            event_level: Minimum level of events kept in the event log ("debug", "info", "warning" or None)
+            event_capacity: Maximum number of events kept (oldest are dropped first)
+            echo_events: Print events to stdout as they are recorded
+            seed: Root seed of the simulation's random streams (int or np.random.SeedSequence).
+                  Each stochastic agent draws from its own spawned child stream, so a given
+                  seed reproduces a run regardless of threads or processes. None takes the
+                  seed from the global NumPy state (np.random.seed() still works).
+            common_random_numbers: Key every draw by purpose, year and project slot
+                  (CommonRandomNumbers) so scenarios sharing a seed share their random events
+            antithetic: With common_random_numbers, use mirrored draws (1 - u); pair with the
+                  unmirrored run of the same seed for antithetic variates
             llm_enabled: Use LLM-powered agents (requires Ollama)
             llm_model: Ollama model name (llama3.2, mistral, etc.)
             llm_cache_mode: Cache mode (disabled, read_write, read_only, write_only)
@@ -1643,7 +4291,20 @@ class GCR_ABM_Simulation:
         self.funding_mode = funding_mode  # "XCR" or "GOVT"
         self.xcr_start_year = xcr_start_year  # Year when XCR system starts
         self.years_to_full_capacity = years_to_full_capacity  # Ramp-up period
-        self.step = 0
+        self.batched_audits = True  # Verify and mint operational projects in one array pass (False = per-project loop)
+        self._capacity_table = YearTable(self._capacity_curve)
+        self.step = 0  # Year being simulated
+        self.next_year = 0  # Next year step_year() will simulate
+        self.set_output_profile(output_profile, record_every)  # Typed per-year output columns (self.results)
+        self.stop_reason = None  # Stop condition that ended the last iter_years()/run_simulation()
+        self.events = EventLog(event_level, event_capacity, echo_events)  # Adoption, shock, revision, ... events
+        self._hooks: Dict[str, list] = {}  # Observer callbacks by hook point (observe()); empty = no dispatch
+        self.seed_sequence = seed_sequence(seed)  # Root of the per-agent random streams
+        sim_seed, broker_seed, auditor_seed, crn_seed = self.seed_sequence.spawn(4)
+        self.rng = make_rng(sim_seed)  # Country adoption and economic shocks
+        if antithetic and not common_random_numbers:
+            raise ValueError("antithetic=True requires common_random_numbers=True")
+        self.crn = CommonRandomNumbers(crn_seed, antithetic) if common_random_numbers else None
 
         # LLM configuration
         self.llm_enabled = llm_enabled
@@ -1675,6 +4336,10 @@ class GCR_ABM_Simulation:
         self.bau_decline_start_year = 60  # Late-century population decline begins
         self.bau_post_peak_plateau_rate = 0.0  # Flat emissions until population decline
         self.bau_decline_rate_post_peak = -0.002  # 0.2% annual decline after population decline begins
+        # BAU CO2 comes from the shared bau_trajectory() while the BAU flow follows it; bau_carbon_cycle is
+        # only stepped once it diverges (post-net-zero ratchet, changed settings). False = always step it
+        self.memoize_bau = True
+        self._bau_path = None  # BauTrajectory in use (set in year 0, dropped on divergence)
 
         # CDR buildout stop (prevent overshoot below 350 ppm target)
         self.cdr_buildout_stop_year = cdr_buildout_stop_year
@@ -1682,80 +4347,11 @@ class GCR_ABM_Simulation:
         self.cdr_buildout_stopped = False  # Track if buildout has been stopped
         self.cdr_buildout_stop_trigger_year = None  # Year when buildout stopped
 
-        # Expanded country pool (50 countries with varied characteristics)
-        # Format: gdp_tril, base_cqe (as fraction of trillion), tier, region, active, adoption_year
-        self.all_countries = {
-            # Tier 1: High GDP economies
-            "USA": {"gdp_tril": 27.0, "base_cqe": 0.05, "tier": 1, "region": "North America", "active": True, "adoption_year": 0, "projects": []},
-            "China": {"gdp_tril": 18.0, "base_cqe": 0.034999999999999996, "tier": 1, "region": "Asia", "active": False, "adoption_year": None, "projects": []},
-            "Japan": {"gdp_tril": 4.2, "base_cqe": 0.009, "tier": 1, "region": "Asia", "active": False, "adoption_year": None, "projects": []},
-            "Germany": {"gdp_tril": 4.5, "base_cqe": 0.01, "tier": 1, "region": "Europe", "active": True, "adoption_year": 0, "projects": []},
-            "UK": {"gdp_tril": 3.5, "base_cqe": 0.008, "tier": 1, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "France": {"gdp_tril": 3.0, "base_cqe": 0.007000000000000001, "tier": 1, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "India": {"gdp_tril": 3.7, "base_cqe": 0.006, "tier": 1, "region": "Asia", "active": False, "adoption_year": None, "projects": []},
-            "Italy": {"gdp_tril": 2.2, "base_cqe": 0.005, "tier": 1, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "Canada": {"gdp_tril": 2.1, "base_cqe": 0.005, "tier": 1, "region": "North America", "active": False, "adoption_year": None, "projects": []},
-            "South Korea": {"gdp_tril": 1.7, "base_cqe": 0.004, "tier": 1, "region": "Asia", "active": False, "adoption_year": None, "projects": []},
-            "Australia": {"gdp_tril": 1.7, "base_cqe": 0.004, "tier": 1, "region": "Oceania", "active": False, "adoption_year": None, "projects": []},
-            "Spain": {"gdp_tril": 1.6, "base_cqe": 0.0035000000000000005, "tier": 1, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-
-            # Tier 2: Medium GDP economies
-            "Brazil": {"gdp_tril": 2.1, "base_cqe": 0.005, "tier": 2, "region": "South America", "active": True, "adoption_year": 0, "projects": []},
-            "Mexico": {"gdp_tril": 1.5, "base_cqe": 0.003, "tier": 2, "region": "North America", "active": False, "adoption_year": None, "projects": []},
-            "Indonesia": {"gdp_tril": 1.4, "base_cqe": 0.003, "tier": 2, "region": "Asia", "active": True, "adoption_year": 0, "projects": []},
-            "Netherlands": {"gdp_tril": 1.1, "base_cqe": 0.0025, "tier": 2, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "Saudi Arabia": {"gdp_tril": 1.1, "base_cqe": 0.0025, "tier": 2, "region": "Middle East", "active": False, "adoption_year": None, "projects": []},
-            "Turkey": {"gdp_tril": 1.0, "base_cqe": 0.002, "tier": 2, "region": "Middle East", "active": False, "adoption_year": None, "projects": []},
-            "Switzerland": {"gdp_tril": 0.9, "base_cqe": 0.002, "tier": 2, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "Poland": {"gdp_tril": 0.8, "base_cqe": 0.0018, "tier": 2, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "Argentina": {"gdp_tril": 0.6, "base_cqe": 0.0015, "tier": 2, "region": "South America", "active": False, "adoption_year": None, "projects": []},
-            "Sweden": {"gdp_tril": 0.6, "base_cqe": 0.0015, "tier": 2, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "Belgium": {"gdp_tril": 0.6, "base_cqe": 0.0014, "tier": 2, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "Thailand": {"gdp_tril": 0.5, "base_cqe": 0.0012000000000000001, "tier": 2, "region": "Asia", "active": False, "adoption_year": None, "projects": []},
-            "Nigeria": {"gdp_tril": 0.5, "base_cqe": 0.001, "tier": 2, "region": "Africa", "active": False, "adoption_year": None, "projects": []},
-            "Austria": {"gdp_tril": 0.5, "base_cqe": 0.0012000000000000001, "tier": 2, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "Norway": {"gdp_tril": 0.5, "base_cqe": 0.0012000000000000001, "tier": 2, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "UAE": {"gdp_tril": 0.5, "base_cqe": 0.0012000000000000001, "tier": 2, "region": "Middle East", "active": False, "adoption_year": None, "projects": []},
-            "Israel": {"gdp_tril": 0.5, "base_cqe": 0.0012000000000000001, "tier": 2, "region": "Middle East", "active": False, "adoption_year": None, "projects": []},
-            "Singapore": {"gdp_tril": 0.5, "base_cqe": 0.0012000000000000001, "tier": 2, "region": "Asia", "active": False, "adoption_year": None, "projects": []},
-            "Malaysia": {"gdp_tril": 0.4, "base_cqe": 0.001, "tier": 2, "region": "Asia", "active": False, "adoption_year": None, "projects": []},
-            "Philippines": {"gdp_tril": 0.4, "base_cqe": 0.001, "tier": 2, "region": "Asia", "active": False, "adoption_year": None, "projects": []},
-            "South Africa": {"gdp_tril": 0.4, "base_cqe": 0.001, "tier": 2, "region": "Africa", "active": False, "adoption_year": None, "projects": []},
-            "Colombia": {"gdp_tril": 0.4, "base_cqe": 0.0009, "tier": 2, "region": "South America", "active": False, "adoption_year": None, "projects": []},
-            "Denmark": {"gdp_tril": 0.4, "base_cqe": 0.001, "tier": 2, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-
-            # Tier 3: Lower GDP / Developing economies
-            "Kenya": {"gdp_tril": 0.13, "base_cqe": 0.00030000000000000003, "tier": 3, "region": "Africa", "active": True, "adoption_year": 0, "projects": []},
-            "Vietnam": {"gdp_tril": 0.43, "base_cqe": 0.0009, "tier": 3, "region": "Asia", "active": False, "adoption_year": None, "projects": []},
-            "Bangladesh": {"gdp_tril": 0.46, "base_cqe": 0.0008, "tier": 3, "region": "Asia", "active": False, "adoption_year": None, "projects": []},
-            "Egypt": {"gdp_tril": 0.4, "base_cqe": 0.0008, "tier": 3, "region": "Africa", "active": False, "adoption_year": None, "projects": []},
-            "Pakistan": {"gdp_tril": 0.34, "base_cqe": 0.0007, "tier": 3, "region": "Asia", "active": False, "adoption_year": None, "projects": []},
-            "Chile": {"gdp_tril": 0.32, "base_cqe": 0.0007, "tier": 3, "region": "South America", "active": False, "adoption_year": None, "projects": []},
-            "Peru": {"gdp_tril": 0.26, "base_cqe": 0.0006000000000000001, "tier": 3, "region": "South America", "active": False, "adoption_year": None, "projects": []},
-            "Czech Republic": {"gdp_tril": 0.33, "base_cqe": 0.0007, "tier": 3, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "Romania": {"gdp_tril": 0.3, "base_cqe": 0.0006000000000000001, "tier": 3, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "New Zealand": {"gdp_tril": 0.25, "base_cqe": 0.0006000000000000001, "tier": 3, "region": "Oceania", "active": False, "adoption_year": None, "projects": []},
-            "Portugal": {"gdp_tril": 0.28, "base_cqe": 0.0006000000000000001, "tier": 3, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "Greece": {"gdp_tril": 0.24, "base_cqe": 0.0005, "tier": 3, "region": "Europe", "active": False, "adoption_year": None, "projects": []},
-            "Iraq": {"gdp_tril": 0.26, "base_cqe": 0.0005, "tier": 3, "region": "Middle East", "active": False, "adoption_year": None, "projects": []},
-            "Kazakhstan": {"gdp_tril": 0.22, "base_cqe": 0.0005, "tier": 3, "region": "Asia", "active": False, "adoption_year": None, "projects": []},
-            "Morocco": {"gdp_tril": 0.14, "base_cqe": 0.00030000000000000003, "tier": 3, "region": "Africa", "active": False, "adoption_year": None, "projects": []},
-            "Ethiopia": {"gdp_tril": 0.16, "base_cqe": 0.00030000000000000003, "tier": 3, "region": "Africa", "active": False, "adoption_year": None, "projects": []},
-            "Ghana": {"gdp_tril": 0.08, "base_cqe": 0.0002, "tier": 3, "region": "Africa", "active": False, "adoption_year": None, "projects": []},
-            "Tanzania": {"gdp_tril": 0.08, "base_cqe": 0.0002, "tier": 3, "region": "Africa", "active": False, "adoption_year": None, "projects": []},
-            "Uganda": {"gdp_tril": 0.05, "base_cqe": 0.0001, "tier": 3, "region": "Africa", "active": False, "adoption_year": None, "projects": []},
-        }
-
-        # Enhance countries with equity data (OECD status, historical emissions, XCR tracking)
-        for country_name, country_data in self.all_countries.items():
-            equity_data = COUNTRY_EQUITY_DATA.get(country_name, {})
-            country_data["oecd"] = equity_data.get("oecd", False)
-            country_data["historical_emissions_gtco2"] = equity_data.get("historical_emissions_gtco2", 0.0)
-            country_data["xcr_earned"] = 0.0  # Track XCR earned from projects
-            country_data["xcr_purchased_equiv"] = 0.0  # Track XCR equivalent purchased via CQE
-
-        # Start with 5 founding countries active (USA, Germany, Brazil, Indonesia, Kenya)
-        self.countries = {k: v for k, v in self.all_countries.items() if v["active"]}
+        # Per-run country state over the shared COUNTRY_TABLE; the founding
+        # countries (USA, Germany, Brazil, Indonesia, Kenya) start active.
+        # all_countries maps every name to a Country view, countries the active ones
+        self.all_countries = CountryRegistry()
+        self.countries = self.all_countries.active
 
         # Initialize LLM engine if enabled
         if self.llm_enabled:
@@ -1804,7 +4400,7 @@ class GCR_ABM_Simulation:
                     price_floor=price_floor
                 )
             else:
-                self.central_bank = CentralBankAlliance(self.countries, price_floor=price_floor)
+                self.central_bank = CentralBankAlliance(self.all_countries, price_floor=price_floor)
 
             # Investor Market agent
             if 'investor' in self.llm_agents:
@@ -1829,7 +4425,7 @@ class GCR_ABM_Simulation:
         else:
             # Rule-based agents (default)
             self.cea = CEA(target_co2_ppm=350.0, initial_co2_ppm=420.0, inflation_target=self.inflation_target)
-            self.central_bank = CentralBankAlliance(self.countries, price_floor=price_floor)
+            self.central_bank = CentralBankAlliance(self.all_countries, price_floor=price_floor)
             self.investor_market = InvestorMarket(price_floor=price_floor)
             self.capital_market = CapitalMarket(
                 initial_co2=420.0,
@@ -1837,8 +4433,11 @@ class GCR_ABM_Simulation:
                 one_time_seed_capital=one_time_seed_capital_usd
             )
 
+        self.cea.events = self.events
+
         # ProjectsBroker and Auditor always rule-based
-        self.projects_broker = ProjectsBroker(self.countries)
+        self.projects_broker = ProjectsBroker(self.countries, seed=broker_seed)
+        self.projects_broker.set_common_random_numbers(self.crn)
         # Allow learning-rate overrides for scenario tuning
         self.projects_broker.learning_rates[ChannelType.CDR] = cdr_learning_rate
         self.projects_broker.learning_rates[ChannelType.CONVENTIONAL] = conventional_learning_rate
@@ -1849,7 +4448,11 @@ class GCR_ABM_Simulation:
         self.projects_broker.cdr_material_budget_gt = cdr_material_budget_gt
         self.projects_broker.cdr_material_cost_multiplier = cdr_material_cost_multiplier
         self.projects_broker.cdr_material_capacity_floor = cdr_material_capacity_floor
-        self.auditor = Auditor(error_rate=0.01)
+        self.projects_broker.cohort_horizon = years
+        if years > ProjectsBroker.LONG_RUN_YEARS:
+            self.projects_broker.compact_interval = ProjectsBroker.LONG_RUN_COMPACT_INTERVAL
+        self.auditor = Auditor(error_rate=0.01, seed=auditor_seed)
+        self.auditor.crn = self.crn
 
     def should_stop_cdr_buildout(self, year: int, current_co2: float) -> bool:
         """Determine if NEW CDR project initiation should stop.
@@ -1886,7 +4489,12 @@ class GCR_ABM_Simulation:
                 if not self.cdr_buildout_stopped:
                     self.cdr_buildout_stopped = True
                     self.cdr_buildout_stop_trigger_year = year
-                    print(f"[Year {year}] CDR BUILDOUT STOPPED: Approaching target (CO2 = {current_co2:.1f} ppm, target = {target_co2} ppm)")
+                    if self.events.enabled(EventType.BUILDOUT_STOP):
+                        self.events.record(
+                            year, EventType.BUILDOUT_STOP,
+                            f"CDR BUILDOUT STOPPED: Approaching target (CO2 = {current_co2:.1f} ppm, target = {target_co2} ppm)",
+                            co2_ppm=float(current_co2)
+                        )
                 return True
 
         return False
@@ -1897,14 +4505,26 @@ class GCR_ABM_Simulation:
         Models external economic events (oil shocks, supply chain disruptions, etc.)
         that cause temporary inflation spikes.
         """
+        if self.crn is not None:
+            shock_draw, size_draw = self.crn.uniforms("shock", [0], width=2, key=self.crn.system_year)[0]
+        else:
+            shock_draw, size_draw = self.rng.random(), None
+
         # Large shocks are rare (major economic disruptions)
-        if np.random.rand() < 0.05:  # 5% chance per year (was 10%)
-            shock = np.random.uniform(0.005, 0.015)  # 0.5-1.5% (was 1-4%)
+        if shock_draw < 0.05:  # 5% chance per year (was 10%)
+            if size_draw is None:
+                shock = self.rng.uniform(0.005, 0.015)  # 0.5-1.5% (was 1-4%)
+            else:
+                shock = 0.005 + 0.01 * size_draw
             self.global_inflation += shock
-            print(f"[Year {self.step}] SHOCK: Inflation +{shock*100:.1f}%")
+            if self.events.enabled(EventType.SHOCK):
+                self.events.record(self.step, EventType.SHOCK, f"SHOCK: Inflation +{shock*100:.1f}%", inflation_shock=shock)
 
         # Normal economic noise around baseline (small variations)
-        noise = np.random.normal(0, 0.002)  # ±0.2% typical variation
+        if self.crn is not None:
+            noise = 0.002 * self.crn.normals("inflation_noise", [0], key=self.crn.system_year)[0]
+        else:
+            noise = self.rng.normal(0, 0.002)  # ±0.2% typical variation
         self.global_inflation += noise
 
     def adopt_countries(self, current_year: int) -> List[str]:
@@ -1912,16 +4532,24 @@ class GCR_ABM_Simulation:
 
         Returns list of newly adopted country names
         """
-        # Get list of inactive countries
-        inactive = {k: v for k, v in self.all_countries.items() if not v["active"]}
+        registry = self.all_countries
+        inactive = registry.inactive_idx()
 
-        if not inactive:
+        if len(inactive) == 0:
             return []  # All countries already adopted
 
+        if self.crn is not None:
+            # Slot 0: fractional adoption; slot k + 1: (weight factor, selection key) of country k
+            u = self.crn.uniforms("adoption", np.concatenate(([0], inactive + 1)), width=2,
+                                  key=self.crn.system_year)
+            fractional_draw, factor_draws, key_draws = u[0, 0], u[1:, 0], u[1:, 1]
+        else:
+            fractional_draw = self.rng.random()
+
         # Determine number to adopt this year (fractional adoption_rate handled probabilistically)
         num_to_adopt = int(self.adoption_rate)
         fractional = self.adoption_rate - num_to_adopt
-        if np.random.rand() < fractional:
+        if fractional_draw < fractional:
             num_to_adopt += 1
 
         num_to_adopt = min(num_to_adopt, len(inactive))
@@ -1930,35 +4558,58 @@ class GCR_ABM_Simulation:
             return []
 
         # Weight adoption probability by GDP (larger economies more likely to join early)
-        # But include randomness for diversity
-        weights = []
-        country_names = list(inactive.keys())
-        for name in country_names:
-            gdp_weight = inactive[name]["gdp_tril"] ** 0.5  # Square root to reduce dominance
-            random_factor = np.random.uniform(0.5, 1.5)  # ±50% randomness
-            weights.append(gdp_weight * random_factor)
-
-        # Normalize weights
-        weights = np.array(weights)
+        # But include randomness for diversity: ±50% per country
+        if self.crn is not None:
+            random_factor = 0.5 + factor_draws
+        else:
+            random_factor = self.rng.uniform(0.5, 1.5, size=len(inactive))
+        weights = registry.gdp_tril[inactive] ** 0.5 * random_factor  # Square root to reduce dominance
         weights = weights / weights.sum()
 
         # Select countries to adopt
-        adopted_names = np.random.choice(country_names, size=num_to_adopt, replace=False, p=weights)
-
-        # Mark as active and add to countries dict
-        newly_adopted = []
-        for name in adopted_names:
-            self.all_countries[name]["active"] = True
-            self.all_countries[name]["adoption_year"] = current_year
-            self.countries[name] = self.all_countries[name]
-            newly_adopted.append(name)
-            # Note: CQE budget now calculated dynamically from private capital (15% ratio)
-            print(f"[Year {current_year}] {name} joined GCR (GDP: ${self.all_countries[name]['gdp_tril']}T)")
+        if self.crn is not None:
+            # Weighted sampling without replacement via exponential keys (Efraimidis-Spirakis)
+            with np.errstate(divide="ignore"):
+                keys = np.log(key_draws) / weights
+            adopted = inactive[np.argsort(-keys, kind="stable")[:num_to_adopt]]
+        else:
+            adopted = self.rng.choice(inactive, size=num_to_adopt, replace=False, p=weights)
+
+        registry.adopt(adopted, current_year)
+        newly_adopted = [registry.names[k] for k in adopted]
+        if self.events.enabled(EventType.ADOPTION):
+            for k, name in zip(adopted, newly_adopted):
+                gdp = float(registry.gdp_tril[k])
+                self.events.record(current_year, EventType.ADOPTION, f"{name} joined GCR (GDP: ${gdp}T)",
+                                   country=name, gdp_tril=gdp)
 
         # CQE budget now updated in main simulation loop based on cumulative private capital
 
         return newly_adopted
 
+    def _step_bau_climate(self, year: int, bau_emissions_gt: float) -> float:
+        """BAU CO2 (ppm) after this year's BAU flow (GtCO2): from the memoized path while BAU follows it"""
+        cycle = self.bau_carbon_cycle
+        if year == 0 and self.memoize_bau and cycle.years_elapsed == 0:
+            self._bau_path = bau_trajectory(
+                cycle.params, self.years, cycle.co2_ppm, bau_emissions_gt, self.bau_peak_year,
+                self.bau_growth_rate_pre_peak, self.bau_decline_start_year, self.bau_post_peak_plateau_rate,
+                self.bau_decline_rate_post_peak, self.land_use_change_gtc)
+        path = self._bau_path
+        if path is not None:
+            if (year < len(path) and bau_emissions_gt == path.emissions_gt[year]
+                    and self.land_use_change_gtc == path.land_use_change_gtc):
+                return float(path.co2_ppm[year])
+            path.restore(cycle, year - 1)  # Diverged: step the cycle from here on
+            self._bau_path = None
+        gtc_per_gtco2 = 1 / self.carbon_cycle.params.gtco2_per_gtc
+        bau_climate = cycle.step(
+            emissions_gtc=bau_emissions_gt * gtc_per_gtco2,
+            sequestration_gtc=0.0,
+            land_use_change_gtc=self.land_use_change_gtc
+        )
+        return bau_climate["CO2_ppm"]
+
     def get_capacity_multiplier(self, current_year: int) -> float:
         """Calculate system capacity based on institutional learning curve
 
@@ -1973,600 +4624,927 @@ class GCR_ABM_Simulation:
         Returns:
             Capacity multiplier (0.0 to 1.0)
         """
-        if current_year < self.xcr_start_year:
-            return 0.0  # System hasn't started yet
+        return self._capacity_table(current_year, self.xcr_start_year, self.years_to_full_capacity)
 
-        years_since_start = current_year - self.xcr_start_year
-
-        if years_since_start >= self.years_to_full_capacity:
-            return 1.0  # Full capacity reached
+    @staticmethod
+    def _capacity_curve(years: np.ndarray, xcr_start_year: int, years_to_full_capacity: int) -> np.ndarray:
+        years_since_start = years - xcr_start_year
 
         # Linear ramp from 0.2 to 1.0 (founding countries have initial capacity)
         # This ensures seed capital can be deployed at year 0
         initial_capacity = 0.2  # 20% initial capacity from founding members
-        progress = years_since_start / self.years_to_full_capacity
-        return initial_capacity + (1.0 - initial_capacity) * progress
-
-    def run_simulation(self):
-        """Execute multi-agent simulation"""
-        results = []
-        bau_co2 = self.bau_carbon_cycle.co2_ppm  # BAU trajectory via carbon cycle
-
-        for year in range(self.years):
-            self.step = year
-
-            # Capture prior-year CQE utilization before reset
-            budget_utilization = (
-                self.central_bank.annual_cqe_spent / self.central_bank.total_cqe_budget
-                if self.central_bank.total_cqe_budget > 0 else 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            progress = years_since_start / years_to_full_capacity
+        capacity = initial_capacity + (1.0 - initial_capacity) * progress
+        capacity = np.where(years_since_start >= years_to_full_capacity, 1.0, capacity)  # Full capacity reached
+        return np.where(years < xcr_start_year, 0.0, capacity)  # System hasn't started yet
+
+    def verify_and_mint_batch(self, rows: np.ndarray, capacity: float, gov_funding_active: bool,
+                              gov_inflation_brake_factor: float, remaining_conventional_tonnes: float,
+                              remaining_luc_tonnes: float) -> Dict[str, float]:
+        """Audit, credit and mint all operational project rows in one pass
+
+        Array version of the per-project verification loop in run_simulation:
+        audit draws come from one array call in project order, the conventional
+        (BAU) and avoided-deforestation (LUC) crediting caps are applied with
+        cumulative sums in project order, country earnings are accumulated with
+        bincount and the co-benefit pool is allocated in one proportional step.
+        Returns the year's verification totals.
+        """
+        store = self.projects_broker.projects
+        if self.projects_broker.cohort_mode:
+            # Credit in cohort creation order: a cohort's operational row may be appended late
+            rows = rows[np.argsort(store.cohort_id[rows], kind="stable")]
+        if self.enable_audits and self.projects_broker.cohort_mode:
+            # Rows with failed members come back a second time, as failed entries
+            rows, xcr_change_raw, reversal = self.auditor.verify_and_mint_cohorts(store, rows)
+            audit_passed = xcr_change_raw > 0
+        elif self.enable_audits:
+            xcr_change_raw, reversal = self.auditor.verify_and_mint_rows(store, rows)
+            audit_passed = xcr_change_raw > 0
+        else:
+            xcr_change_raw, reversal = np.zeros(len(rows)), np.zeros(len(rows))
+            audit_passed = np.ones(len(rows), dtype=bool)
+        n = len(rows)
+
+        channel = store.channel_code[rows]
+        effective_sequestration = store.annual_sequestration_tonnes[rows]
+        if gov_funding_active:
+            effective_sequestration = effective_sequestration * gov_inflation_brake_factor
+
+        credited = np.zeros(n)
+        cdr = audit_passed & (channel == ChannelType.CDR.value)
+        credited[cdr] = effective_sequestration[cdr]
+        conventional = audit_passed & (channel == ChannelType.CONVENTIONAL.value)
+        if not self.net_zero_ever_reached:  # CM credits terminate permanently at net-zero
+            credited[conventional] = _sequential_cap(
+                effective_sequestration[conventional], remaining_conventional_tonnes
+            )
+        avoided = audit_passed & (channel == ChannelType.AVOIDED_DEFORESTATION.value)
+        credited[avoided] = _sequential_cap(effective_sequestration[avoided], remaining_luc_tonnes)
+
+        xcr_change_raw = np.where(audit_passed, credited * store.r_effective[rows], xcr_change_raw)
+
+        # Verified sequestration and learning-curve deployment
+        counted = audit_passed & (credited > 0)
+        store.total_sequestered_tonnes[rows[counted]] += credited[counted]
+        counts = store.project_count[rows] if self.projects_broker.cohort_mode else None
+        for channel_type in (ChannelType.CDR, ChannelType.CONVENTIONAL, ChannelType.AVOIDED_DEFORESTATION):
+            credits = counted & (channel == channel_type.value)
+            self.projects_broker.update_cumulative_deployment_batch(
+                channel_type, credited[credits], None if counts is None else counts[credits]
             )
-            system_active = year >= self.xcr_start_year
-
-            # Annual CQE budget reset
-            if year != self.central_bank.current_budget_year:
-                self.central_bank.annual_cqe_spent = 0.0
-                self.central_bank.current_budget_year = year
 
-            gov_funding_active = self.funding_mode == "GOVT"
-            
-            # Global Fiscal Brake for GOVT scenario (Sigmoid-based)
-            gov_inflation_brake_factor = 1.0
-            if gov_funding_active:
-                # Sigmoid damping: willingness decreases as inflation rises above target
-                # Center at 1.5x target, sharpness k=12 (mimicking XCR Central Bank)
-                k_brake = 12.0
-                brake_center = self.inflation_target * 1.5
-                
-                # Calculate sigmoid willingness (brake factor)
-                # 1.0 at target, ~0.5 at 1.5x target, ~0.0 at 2.0x target
-                gov_inflation_brake_factor = 1.0 / (1.0 + np.exp(k_brake * (self.global_inflation - brake_center)))
-                
-                # Safety clip: allow tiny bit of maintenance but can effectively hit 0.0
-                gov_inflation_brake_factor = float(np.clip(gov_inflation_brake_factor, 0.001, 1.0))
-
-                # Update prev_inflation for logging/diagnostics (though not used fortiered logic anymore)
-                self.prev_global_inflation = self.global_inflation
-
-            # 0. Get capacity multiplier for this year (institutional learning)
-            capacity = self.get_capacity_multiplier(year)
-
-            # 0a. Country adoption - new countries join GCR system
-            # Apply capacity multiplier to adoption rate
-            if capacity > 0:
-                newly_adopted = self.adopt_countries(year)
-            else:
-                newly_adopted = []  # No adoption before XCR starts
-
-            # 1. Inflation dynamics (only after GCR starts)
-            if system_active:
-                # Chaos monkey - stochastic shocks
-                self.chaos_monkey()
-
-                # Inflation correction toward target
-                inflation_gap = self.global_inflation - self.inflation_target
-                correction_rate = 0.25
-                if abs(inflation_gap) > 0.02:
-                    correction_rate = 0.4
-                self.global_inflation -= inflation_gap * correction_rate
+        totals = {
+            "total_sequestration": float(credited[counted].sum()),
+            "cdr_sequestration": float(credited[counted & cdr].sum()),
+            "conventional_mitigation": float(credited[counted & conventional].sum()),
+            "avoided_deforestation_tonnes": float(credited[avoided].sum()),
+            "reversal_tonnes_audits": float(reversal.sum()),
+            "xcr_minted": 0.0,
+            "xcr_burned": 0.0,
+            "cobenefit_bonus_xcr": 0.0,
+        }
+        if gov_funding_active:
+            return totals
+
+        # MINT XCR (hold back a co-benefit pool slice); failed audits BURN
+        xcr_change_adjusted = xcr_change_raw * capacity * self.cea.brake_factor
+        minted_rows = rows[audit_passed]
+        pool_contribution = xcr_change_adjusted[audit_passed] * self.projects_broker.cobenefit_pool_fraction
+        project_mint = xcr_change_adjusted[audit_passed] - pool_contribution
+        store.total_xcr_minted[minted_rows] += project_mint
+        earned = self._earned_by_country(store, minted_rows, project_mint)
+        totals["xcr_minted"] = float(project_mint.sum())
+        totals["xcr_burned"] = float(np.abs(xcr_change_adjusted[~audit_passed]).sum())
+
+        # Redistribute co-benefit pool proportionally to scores (a cohort row
+        # scores as the sum of its members)
+        cobenefit_pool = float(pool_contribution.sum())
+        scores = store.co_benefit_score[minted_rows] * store.project_count[minted_rows]
+        candidates = scores > 0
+        total_score = scores[candidates].sum()
+        if cobenefit_pool > 0 and total_score > 0:
+            bonus = cobenefit_pool * (scores[candidates] / total_score)
+            store.total_xcr_minted[minted_rows[candidates]] += bonus
+            earned += self._earned_by_country(store, minted_rows[candidates], bonus)
+            totals["cobenefit_bonus_xcr"] = float(bonus.sum())
+            totals["xcr_minted"] += totals["cobenefit_bonus_xcr"]
+
+        # Track XCR earned by country
+        hosts = np.flatnonzero(earned)
+        self.all_countries.credit_xcr_earned([store.country_names[idx] for idx in hosts], earned[hosts])
+        return totals
+
+    def _earned_by_country(self, store: ProjectStore, rows: np.ndarray, amounts: np.ndarray) -> np.ndarray:
+        """XCR amounts per store country code (cohort rows split theirs over their host countries)"""
+        countries = len(store.country_names)
+        if self.projects_broker.cohort_mode:
+            return amounts @ self.projects_broker.cohort_host_shares(store.cohort_id[rows], countries)
+        return np.bincount(store.country_idx[rows], weights=amounts, minlength=countries)
+
+    def verify_and_mint_loop(self, rows: np.ndarray, capacity: float, gov_funding_active: bool,
+                             gov_inflation_brake_factor: float, remaining_conventional_tonnes: float,
+                             remaining_luc_tonnes: float) -> Dict[str, float]:
+        """Audit, credit and mint operational project rows one project at a time
+
+        Reference implementation of verify_and_mint_batch (used when
+        batched_audits is False). Returns the year's verification totals.
+        """
+        total_sequestration = 0.0
+        cdr_sequestration = 0.0
+        conventional_mitigation = 0.0
+        avoided_deforestation_tonnes = 0.0
+        reversal_tonnes_audits = 0.0
+        xcr_minted_this_year = 0.0
+        xcr_burned_this_year = 0.0
+        cobenefit_pool = 0.0
+        cobenefit_bonus_xcr = 0.0
+        cobenefit_candidates = []
+
+        for project in self.projects_broker.projects.views(rows):
+            if self.enable_audits:
+                xcr_change_raw, reversal = self.auditor.verify_and_mint_xcr(project)
+                audit_passed = xcr_change_raw > 0
             else:
-                self.global_inflation = 0.0
-
-            # 2. Update investor sentiment & market (SKIP IN GOVT MODE)
-            price_floor_prev = self.price_floor
-            net_capital_flow, capital_demand_premium, forward_guidance = (0.0, 0.0, 0.0)
-            market_cap = 0.0
-
-            if system_active and not gov_funding_active:
-                self.investor_market.update_sentiment(
-                    self.cea.warning_8to1_active,
-                    self.global_inflation,
-                    self.inflation_target,
-                    self.co2_level,
-                    self.cea.initial_co2_ppm
-                )
+                audit_passed = True
+                xcr_change_raw = 0.0
+                reversal = 0.0
 
-                # Update capital market (private investors)
-                roadmap_target = self.cea.calculate_roadmap_target(year, self.years)
-                roadmap_gap = self.co2_level - roadmap_target
-                
-                market_age_years = year - self.xcr_start_year
-                net_capital_flow, capital_demand_premium, forward_guidance = self.capital_market.update_capital_flows(
-                    self.co2_level, year, self.years, roadmap_gap,
-                    self.global_inflation, self.inflation_target,
-                    self.investor_market.sentiment, self.total_xcr_supply,
-                    self.price_floor, market_age_years
-                )
+            # Apply capacity multiplier and brake factor to XCR minting
+            # Capacity: institutional learning (0-100% over 5 years)
+            # Brake: CEA stability control (reduces when ratio > 10:1)
+            brake_factor = self.cea.brake_factor
+            reversal_tonnes_audits += reversal
+
+            credited_tonnes = 0.0
+            if audit_passed:
+                # Apply GOVT fiscal brake to physical sequestration if active
+                effective_sequestration = project.annual_sequestration_tonnes
+                if gov_funding_active:
+                    effective_sequestration *= gov_inflation_brake_factor
+
+                if project.channel == ChannelType.CDR:
+                    # CDR continues earning XCR post-net-zero (active removal)
+                    credited_tonnes = effective_sequestration
+                elif project.channel == ChannelType.CONVENTIONAL:
+                    # CM credits terminate permanently once net-zero achieved
+                    if self.net_zero_ever_reached:
+                        credited_tonnes = 0.0  # Net-zero reached, CM job done (permanent)
+                    else:
+                        # Credit annually, capped by annual BAU emissions
+                        credit = min(effective_sequestration, remaining_conventional_tonnes)
+                        credited_tonnes = credit
+                        if credit > 0:
+                            remaining_conventional_tonnes -= credit
+                elif project.channel == ChannelType.AVOIDED_DEFORESTATION:
+                    # Avoided deforestation continues post-net-zero (stores carbon in biomass)
+                    credit = min(effective_sequestration, remaining_luc_tonnes)
+                    credited_tonnes = credit
+                    remaining_luc_tonnes -= credit
+                    avoided_deforestation_tonnes += credit
+
+                xcr_change_raw = credited_tonnes * project.r_value
+
+                xcr_change_adjusted = xcr_change_raw * capacity * brake_factor
+
+                if audit_passed and credited_tonnes > 0:
+                    # Successful verification - SEQUESTRATION COUNTED
+                    total_sequestration += credited_tonnes
+                    project.total_sequestered_tonnes += credited_tonnes
+
+                    # Update cumulative deployment for learning curves
+                    self.projects_broker.update_cumulative_deployment(
+                        project.channel,
+                        credited_tonnes
+                    )
+
+                    if project.channel == ChannelType.CDR:
+                        cdr_sequestration += credited_tonnes
+                    elif project.channel == ChannelType.CONVENTIONAL:
+                        conventional_mitigation += credited_tonnes
+
+                if not gov_funding_active:
+                    # MINT XCR (hold back a co-benefit pool slice)
+                    brake_factor = self.cea.brake_factor
+                    xcr_change_adjusted = xcr_change_raw * capacity * brake_factor
+
+                    pool_contribution = xcr_change_adjusted * self.projects_broker.cobenefit_pool_fraction
+                    project_mint = xcr_change_adjusted - pool_contribution
+                    xcr_minted_this_year += project_mint
+                    project.total_xcr_minted += project_mint
+
+                    cobenefit_pool += pool_contribution
+                    if project.co_benefit_score > 0:
+                        cobenefit_candidates.append((project, project.co_benefit_score))
+
+                    # Track XCR earned by country
+                    if project.country in self.countries:
+                        self.countries[project.country]["xcr_earned"] += project_mint
+            elif not audit_passed and not gov_funding_active:
+                # Failed audit - BURN XCR (only in XCR mode)
+                brake_factor = self.cea.brake_factor
+                xcr_change_adjusted = xcr_change_raw * capacity * brake_factor
+                xcr_burned_this_year += abs(xcr_change_adjusted)
+
+        # Redistribute co-benefit pool (SKIP IN GOVT MODE)
+        if not gov_funding_active and cobenefit_pool > 0 and cobenefit_candidates:
+            total_score = sum(score for _, score in cobenefit_candidates)
+            if total_score > 0:
+                for project, score in cobenefit_candidates:
+                    bonus = cobenefit_pool * (score / total_score)
+                    xcr_minted_this_year += bonus
+                    cobenefit_bonus_xcr += bonus
+                    project.total_xcr_minted += bonus
+                    if project.country in self.countries:
+                        self.countries[project.country]["xcr_earned"] += bonus
 
-                # Calculate market price (sentiment + capital demand)
-                self.investor_market.calculate_price(capital_demand_premium)
-                market_cap = self.total_xcr_supply * self.investor_market.market_price_xcr
-
-                # Update CQE budget (5% of annual private capital inflow)
-                annual_private_inflow = max(net_capital_flow, 0.0)
-                self.central_bank.update_cqe_budget(annual_private_inflow)
-
-                # CEA updates policy
-                self.cea.update_policy(
-                    self.co2_level,
-                    market_cap,
-                    self.central_bank.total_cqe_budget,
-                    self.global_inflation,
-                    budget_utilization
-                )
+        return {
+            "total_sequestration": total_sequestration,
+            "cdr_sequestration": cdr_sequestration,
+            "conventional_mitigation": conventional_mitigation,
+            "avoided_deforestation_tonnes": avoided_deforestation_tonnes,
+            "reversal_tonnes_audits": reversal_tonnes_audits,
+            "xcr_minted": xcr_minted_this_year,
+            "xcr_burned": xcr_burned_this_year,
+            "cobenefit_bonus_xcr": cobenefit_bonus_xcr,
+        }
 
-                # CEA adjusts price floor
-                self.price_floor, revision_occurred = self.cea.adjust_price_floor(
-                    self.co2_level,
-                    self.price_floor,
-                    year,
-                    self.years,
-                    current_inflation=self.global_inflation,
-                    temperature_anomaly=self.carbon_cycle.temperature
-                )
-                # Update agents
-                self.central_bank.price_floor_rcc = self.price_floor
-                self.investor_market.price_floor = self.price_floor
-            else:
-                revision_occurred = False
+    def set_output_profile(self, profile="full", every: int = 1):
+        """Choose the recorded result columns and years (before the first step)
 
-            # 4. Projects broker initiates new projects
-            # Only initiate projects if capacity > 0 (system active)
-            # In GOVT mode, use a high effective price to ensure economic initiation
-            effective_init_price = 1000.0 if gov_funding_active else (self.investor_market.market_price_xcr * self.cea.brake_factor)
+        Diagnostics outside the profile are not computed at all. With every > 1
+        only every k-th year is recorded, so stop conditions only see those years.
+        """
+        if self.next_year > 0:
+            raise RuntimeError("Output profile must be set before the first simulated year")
+        self.results = ResultsRecorder(-(-self.years // max(int(every), 1)) + 1, profile=profile, every=every)
+
+    # ------------------------------------------------------------------ #
+    # Snapshots and forks
+    # ------------------------------------------------------------------ #
+    SNAPSHOT_VERSION = 4
+
+    def snapshot(self) -> bytes:
+        """Serialize the full simulation state to bytes (pickle, highest protocol)
+
+        Covers every agent, both carbon cycles, the country tables, the project
+        store and archive counters, recorded results and every agent's random
+        stream. The LLM engine is not serialized; restore() reattaches the
+        restoring simulation's engine, and observers (observe()) are left
+        out. Instance attributes holding local functions (monkeypatched
+        methods) cannot be pickled.
+        """
+        buffer = io.BytesIO()
+        pickler = _SnapshotPickler(buffer, self.llm_engine)
+        state = {name: value for name, value in self.__dict__.items() if name != "_hooks"}
+        pickler.dump({"version": self.SNAPSHOT_VERSION, "state": state})
+        return buffer.getvalue()
+
+    def restore(self, snapshot: bytes):
+        """Replace this simulation's state with a snapshot"""
+        payload = _SnapshotUnpickler(io.BytesIO(snapshot), self.__dict__.get("llm_engine")).load()
+        if payload.get("version") != self.SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {payload.get('version')!r}")
+        self.__dict__.clear()
+        self.__dict__.update(payload["state"])
+        self._hooks = {}
+
+    @classmethod
+    def from_snapshot(cls, snapshot: bytes) -> "GCR_ABM_Simulation":
+        """New simulation restored from a snapshot"""
+        sim = cls.__new__(cls)
+        sim.restore(snapshot)
+        return sim
+
+    def fork(self) -> "GCR_ABM_Simulation":
+        """Independent in-memory copy of the simulation for branching scenarios
+
+        A deep copy that shares data never modified in place: year-indexed
+        schedule tables, archived project chunks, the country reference
+        columns, the memoized BAU path and the LLM engine. The fork
+        copies every random stream, so left unchanged it replays the parent's
+        continuation draw for draw. Instance-level
+        overrides (monkeypatched methods) are shared rather than copied, so
+        apply scenario mutations after forking. The fork starts without
+        observers.
+        """
+        shared = [self.llm_engine, self._bau_path, *_COUNTRY_COLUMNS.values()]
+        for owner in (self, self.cea, self.projects_broker):
+            shared.extend(table.values for table in vars(owner).values() if isinstance(table, YearTable))
+        archive = self.projects_broker.projects.archive
+        if archive is not None:
+            shared.extend([*archive.chunks, archive._spill])
+        memo = {id(obj): obj for obj in shared if obj is not None}
+        memo[id(self._hooks)] = {}
+        return copy.deepcopy(self, memo)
+
+    def run_simulation(self, stop_conditions=None, return_events: bool = False):
+        """Execute multi-agent simulation
+
+        Runs the remaining years (all of them on a fresh simulation), or until
+        a stop condition fires, and returns one DataFrame row per year run so
+        far (columns per RESULT_SCHEMA, backed by the results recorder).
+        With return_events, returns (results, events) where events is the
+        event log as a DataFrame (EVENT_COLUMNS).
+        """
+        for _ in self.iter_years(stop_conditions):
+            pass
+        if return_events:
+            return self.results.to_frame(), self.events.to_frame()
+        return self.results.to_frame()
+
+    def iter_years(self, stop_conditions=None):
+        """Step the simulation year by year, yielding each recorded year's record (a ResultRow)
+
+        Stops after `self.years` years or after the first recorded year for
+        which one of `stop_conditions` (callables taking the year's record,
+        e.g. StopCondition instances) returns True; that year's record is
+        still yielded and the condition is kept in `stop_reason`.
+        """
+        stop_conditions = list(stop_conditions or [])
+        for condition in stop_conditions:
+            if hasattr(condition, "reset"):
+                condition.reset()
+        self.stop_reason = None
+        while self.next_year < self.years:
+            record = self.step_year()
+            if record is None:
+                continue  # Year not recorded (record_every > 1)
+            yield record
+            for condition in stop_conditions:
+                if condition(record):
+                    self.stop_reason = condition
+                    return
+
+    def observe(self, hook: str, callback):
+        """Call callback(sim, year, state) at a hook point of every simulated year
+
+        Hook points are "before_<phase>" and "after_<phase>" for each of
+        HOOK_PHASES (adoption, inflation, market, cea_policy, initiation,
+        project_step, audit_mint, cqe, climate), in step_year order. `state`
+        is a dict of the phase's intermediate values (after hooks) or empty
+        (before hooks); the simulation itself carries the agents' state.
+        Callbacks run inline and may read anything; changing the simulation
+        changes the run. Observers are not carried over by fork() or
+        snapshot().
+        """
+        if hook not in HOOK_POINTS:
+            raise ValueError(f"Unknown hook point {hook!r} (choose from {HOOK_POINTS})")
+        self._hooks.setdefault(hook, []).append(callback)
+
+    def unobserve(self, hook: str, callback):
+        """Remove a callback added with observe()"""
+        callbacks = self._hooks.get(hook, [])
+        callbacks.remove(callback)
+        if not callbacks:
+            del self._hooks[hook]
+
+    def _notify(self, hook: str, year: int, **state):
+        for callback in self._hooks.get(hook, ()):
+            callback(self, year, state)
+
+    def step_year(self) -> Optional[ResultRow]:
+        """Advance the simulation by one year and return that year's record
+
+        Returns None for years the output profile does not record. Observer
+        hooks (observe()) fire around each phase; with none registered the
+        only cost is one empty-dict check per hook point.
+        """
+        year = self.next_year
+        hooks = self._hooks
+        self.step = year
+        if self.crn is not None:
+            self.crn.year = year
+            self.crn.epoch = self.xcr_start_year
+
+        # Capture prior-year CQE utilization before reset
+        budget_utilization = (
+            self.central_bank.annual_cqe_spent / self.central_bank.total_cqe_budget
+            if self.central_bank.total_cqe_budget > 0 else 0.0
+        )
+        system_active = year >= self.xcr_start_year
+
+        # Annual CQE budget reset
+        if year != self.central_bank.current_budget_year:
+            self.central_bank.annual_cqe_spent = 0.0
+            self.central_bank.current_budget_year = year
+
+        gov_funding_active = self.funding_mode == "GOVT"
+        
+        # Global Fiscal Brake for GOVT scenario (Sigmoid-based)
+        gov_inflation_brake_factor = 1.0
+        if gov_funding_active:
+            # Sigmoid damping: willingness decreases as inflation rises above target
+            # Center at 1.5x target, sharpness k=12 (mimicking XCR Central Bank)
+            k_brake = 12.0
+            brake_center = self.inflation_target * 1.5
             
-            if capacity > 0 and system_active:
-                available_capital_usd = 1e15 if gov_funding_active else max(net_capital_flow, 0.0) # Unlimited govt credit
-                # Use operational conventional capacity to cap new project initiation
-                operational_conventional_gt = self.projects_broker.get_current_sequestration_rate(ChannelType.CONVENTIONAL)
-                remaining_conventional_need_gt = max(
-                    0.0, self.bau_emissions_gt_per_year - operational_conventional_gt
-                )
-                land_use_change_gtco2 = (
-                    self.land_use_change_gtc * self.carbon_cycle.params.gtco2_per_gtc
-                )
-                planned_avoided_deforestation_gt = self.projects_broker.get_planned_sequestration_rate(
-                    ChannelType.AVOIDED_DEFORESTATION
-                )
-                remaining_luc_emissions_gt = max(
-                    0.0, land_use_change_gtco2 - planned_avoided_deforestation_gt
-                )
-
-                # Calculate emissions-to-sinks ratio for net-zero transition
-                # Total emissions = BAU - conv mitigation + land use (net of avoided deforestation)
-                # Total sinks = CDR operational capacity + natural sinks (~3 Gt/yr ocean + ~2 Gt/yr land)
-                # Note: Avoided deforestation prevents emissions (already in effective_emissions), not a sink
-                operational_cdr_gt = self.projects_broker.get_current_sequestration_rate(ChannelType.CDR)
-                operational_avoided_def_gt = self.projects_broker.get_current_sequestration_rate(ChannelType.AVOIDED_DEFORESTATION)
-                effective_emissions_gt = max(0.1, remaining_conventional_need_gt + remaining_luc_emissions_gt)
-                total_sinks_gt = max(0.1, operational_cdr_gt + 5.0)  # CDR + natural sinks only
-                emissions_to_sinks_ratio = effective_emissions_gt / total_sinks_gt
-
-                # Check if net-zero achieved for the first time (permanent CM credit termination)
-                # "Great Restore" Hard Stop: EXACTLY at 1.0 ratio
-                if emissions_to_sinks_ratio <= 1.0 and not self.net_zero_ever_reached:
-                    self.net_zero_ever_reached = True
-                    print(f"[Year {year}] NET-ZERO ACHIEVED: Conventional mitigation credits permanently terminated (E:S ratio = {emissions_to_sinks_ratio:.3f})")
-
-                # Check if CDR buildout should stop (prevent overshoot)
-                cdr_buildout_stopped = self.should_stop_cdr_buildout(year, self.co2_level)
-
-                self.projects_broker.initiate_projects(
-                    available_capital_usd=available_capital_usd,
-                    market_price_xcr=1000.0 if gov_funding_active else self.investor_market.market_price_xcr,
-                    price_floor=self.price_floor,
-                    brake_factor=gov_inflation_brake_factor if gov_funding_active else self.cea.brake_factor,
-                    current_year=year,
-                    current_co2_ppm=self.co2_level,
-                    current_inflation=self.global_inflation,
-                    emissions_to_sinks_ratio=emissions_to_sinks_ratio,
-                    net_zero_ever_reached=self.net_zero_ever_reached,
-                    cdr_buildout_stopped=cdr_buildout_stopped,
-                    cea=self.cea,
-                    residual_emissions_gt=remaining_conventional_need_gt,
-                    residual_luc_emissions_gt=land_use_change_gtco2,
-                    funding_mode=self.funding_mode
-                )
-            else:
-                emissions_to_sinks_ratio = 10.0  # Default high ratio before system active
-
-            # 5. Step all projects (development progress, stochastic decay, retirement)
-            climate_risk_multiplier = self.carbon_cycle.get_project_risk_multiplier()
-            channel_risk_fn = self.carbon_cycle.get_channel_risk_multiplier
-            reversal_tonnes_projects = self.projects_broker.step_projects(
-                self.co2_level,
-                self.global_inflation,
-                climate_risk_multiplier=climate_risk_multiplier,
-                channel_risk_fn=channel_risk_fn
-            )
-
-            # 6. Auditor verifies operational projects and mints XCR
-            operational_projects = self.projects_broker.get_operational_projects()
-            development_projects = [p for p in self.projects_broker.projects if p.status == ProjectStatus.DEVELOPMENT]
-            failed_projects = [p for p in self.projects_broker.projects if p.status == ProjectStatus.FAILED]
-            completed_projects = [p for p in self.projects_broker.projects if p.status == ProjectStatus.COMPLETED]
-            total_sequestration = 0.0
-            cdr_sequestration = 0.0
-            conventional_mitigation = 0.0
-            xcr_minted_this_year = 0.0
-            xcr_burned_this_year = 0.0  # Track burning separately
-            cobenefit_pool = 0.0
-            cobenefit_bonus_xcr = 0.0
-            cobenefit_candidates = []
-            cdr_sequestration_tonnes = 0.0
-            conv_sequestration_tonnes = 0.0
+            # Calculate sigmoid willingness (brake factor)
+            # 1.0 at target, ~0.5 at 1.5x target, ~0.0 at 2.0x target
+            gov_inflation_brake_factor = 1.0 / (1.0 + np.exp(k_brake * (self.global_inflation - brake_center)))
+            
+            # Safety clip: allow tiny bit of maintenance but can effectively hit 0.0
+            gov_inflation_brake_factor = float(np.clip(gov_inflation_brake_factor, 0.001, 1.0))
 
-            reversal_tonnes_audits = 0.0
+            # Update prev_inflation for logging/diagnostics (though not used fortiered logic anymore)
+            self.prev_global_inflation = self.global_inflation
 
-            avoided_deforestation_tonnes = 0.0
-            # Annual cap for conventional: can't avoid more emissions than BAU produces this year
-            remaining_conventional_tonnes = self.bau_emissions_gt_per_year * 1e9
-            land_use_change_gtco2 = self.land_use_change_gtc * self.carbon_cycle.params.gtco2_per_gtc
-            remaining_luc_tonnes = max(0.0, land_use_change_gtco2 * 1e9)
-
-            if capacity > 0:
-                for project in operational_projects:
-                    if self.enable_audits:
-                        xcr_change_raw, reversal = self.auditor.verify_and_mint_xcr(project)
-                        audit_passed = xcr_change_raw > 0
-                    else:
-                        audit_passed = True
-                        xcr_change_raw = 0.0
-                        reversal = 0.0
+        # 0. Get capacity multiplier for this year (institutional learning)
+        capacity = self.get_capacity_multiplier(year)
 
-                    # Apply capacity multiplier and brake factor to XCR minting
-                    # Capacity: institutional learning (0-100% over 5 years)
-                    # Brake: CEA stability control (reduces when ratio > 10:1)
-                    brake_factor = self.cea.brake_factor
-                    reversal_tonnes_audits += reversal
-
-                    credited_tonnes = 0.0
-                    if audit_passed:
-                        # Apply GOVT fiscal brake to physical sequestration if active
-                        effective_sequestration = project.annual_sequestration_tonnes
-                        if gov_funding_active:
-                            effective_sequestration *= gov_inflation_brake_factor
-
-                        if project.channel == ChannelType.CDR:
-                            # CDR continues earning XCR post-net-zero (active removal)
-                            credited_tonnes = effective_sequestration
-                        elif project.channel == ChannelType.CONVENTIONAL:
-                            # CM credits terminate permanently once net-zero achieved
-                            if self.net_zero_ever_reached:
-                                credited_tonnes = 0.0  # Net-zero reached, CM job done (permanent)
-                            else:
-                                # Credit annually, capped by annual BAU emissions
-                                credit = min(effective_sequestration, remaining_conventional_tonnes)
-                                credited_tonnes = credit
-                                if credit > 0:
-                                    remaining_conventional_tonnes -= credit
-                        elif project.channel == ChannelType.AVOIDED_DEFORESTATION:
-                            # Avoided deforestation continues post-net-zero (stores carbon in biomass)
-                            credit = min(effective_sequestration, remaining_luc_tonnes)
-                            credited_tonnes = credit
-                            remaining_luc_tonnes -= credit
-                            avoided_deforestation_tonnes += credit
-
-                        xcr_change_raw = credited_tonnes * project.r_value
-
-                        xcr_change_adjusted = xcr_change_raw * capacity * brake_factor
-
-                        if audit_passed and credited_tonnes > 0:
-                            # Successful verification - SEQUESTRATION COUNTED
-                            total_sequestration += credited_tonnes
-                            project.total_sequestered_tonnes += credited_tonnes
-
-                            # Update cumulative deployment for learning curves
-                            self.projects_broker.update_cumulative_deployment(
-                                project.channel,
-                                credited_tonnes
-                            )
-
-                            if project.channel == ChannelType.CDR:
-                                cdr_sequestration += credited_tonnes
-                                cdr_sequestration_tonnes += credited_tonnes
-                            elif project.channel == ChannelType.CONVENTIONAL:
-                                conventional_mitigation += credited_tonnes
-                                conv_sequestration_tonnes += credited_tonnes
-                        
-                        if not gov_funding_active:
-                            # MINT XCR (hold back a co-benefit pool slice)
-                            brake_factor = self.cea.brake_factor
-                            xcr_change_adjusted = xcr_change_raw * capacity * brake_factor
-                            
-                            pool_contribution = xcr_change_adjusted * self.projects_broker.cobenefit_pool_fraction
-                            project_mint = xcr_change_adjusted - pool_contribution
-                            xcr_minted_this_year += project_mint
-                            project.total_xcr_minted += project_mint
-                            
-                            cobenefit_pool += pool_contribution
-                            if project.co_benefit_score > 0:
-                                cobenefit_candidates.append((project, project.co_benefit_score))
-
-                            # Track XCR earned by country
-                            if project.country in self.countries:
-                                self.countries[project.country]["xcr_earned"] += project_mint
-                    elif not audit_passed and not gov_funding_active:
-                        # Failed audit - BURN XCR (only in XCR mode)
-                        brake_factor = self.cea.brake_factor
-                        xcr_change_adjusted = xcr_change_raw * capacity * brake_factor
-                        xcr_burned_this_year += abs(xcr_change_adjusted)
-
-                # Redistribute co-benefit pool (SKIP IN GOVT MODE)
-                if not gov_funding_active and cobenefit_pool > 0 and cobenefit_candidates:
-                    total_score = sum(score for _, score in cobenefit_candidates)
-                    if total_score > 0:
-                        for project, score in cobenefit_candidates:
-                            bonus = cobenefit_pool * (score / total_score)
-                            xcr_minted_this_year += bonus
-                            cobenefit_bonus_xcr += bonus
-                            project.total_xcr_minted += bonus
-                            if project.country in self.countries:
-                                self.countries[project.country]["xcr_earned"] += bonus
-            # 6. Economic cleanup and audit handling (burn XCR for failures)
-            if gov_funding_active:
-                # In GOVT mode, total cost is the annual spending for CDR and Avoided Deforestation
-                # Conventional Mitigation costs are assumed covered by existing markets (Cap & Trade, CBAM)
-                # Apply Global Fiscal Brake to the operational costs
-                annual_gov_spending = self.projects_broker.get_total_operational_cost(
-                    exclude_channels=[ChannelType.CONVENTIONAL]
-                ) * gov_inflation_brake_factor
-                
-                self.total_gov_debt += annual_gov_spending
-                
-                # Direct inflation impact from deficit spending
-                active_gdp_tril = sum(country["gdp_tril"] for country in self.countries.values())
-                active_gdp_usd = active_gdp_tril * 1e12
-                gov_inflation_impact = (annual_gov_spending / active_gdp_usd) * 5 if active_gdp_usd > 0 else 0.0
-                gov_inflation_impact = float(np.clip(gov_inflation_impact, 0.0, 0.05)) # Cap at 5% per year
-                self.global_inflation = max(0.0, self.global_inflation + gov_inflation_impact)
-                
-                annual_total_cost = annual_gov_spending # For result logging
-                
-                xcr_minted_this_year = 0.0
-                xcr_burned_this_year = 0.0
-                reversal_tonnes_audits = 0.0
-                reversal_tonnes_projects = 0.0
-                cobenefit_bonus_xcr = 0.0
-                xcr_purchased = 0.0
-            else:
-                # XCR Market mode (Standard)
-                # Update XCR supply from minting and burning
-                self.total_xcr_supply += xcr_minted_this_year - xcr_burned_this_year
-
-            # 7. Central bank defends floor with CQE
-            price_support, inflation_impact, xcr_purchased = self.central_bank.defend_floor(
-                self.investor_market.market_price_xcr,
-                self.total_xcr_supply,
+        # 0a. Country adoption - new countries join GCR system
+        # Apply capacity multiplier to adoption rate
+        if hooks:
+            self._notify("before_adoption", year)
+        if capacity > 0:
+            newly_adopted = self.adopt_countries(year)
+        else:
+            newly_adopted = []  # No adoption before XCR starts
+        if hooks:
+            self._notify("after_adoption", year, capacity=capacity, newly_adopted=newly_adopted)
+
+        # 1. Inflation dynamics (only after GCR starts)
+        if hooks:
+            self._notify("before_inflation", year)
+        shocked_inflation = 0.0
+        if system_active:
+            # Chaos monkey - stochastic shocks
+            self.chaos_monkey()
+            shocked_inflation = self.global_inflation
+
+            # Inflation correction toward target
+            inflation_gap = self.global_inflation - self.inflation_target
+            correction_rate = 0.25
+            if abs(inflation_gap) > 0.02:
+                correction_rate = 0.4
+            self.global_inflation -= inflation_gap * correction_rate
+        else:
+            self.global_inflation = 0.0
+        if hooks:
+            self._notify("after_inflation", year, system_active=system_active, shocked_inflation=shocked_inflation)
+
+        # 2. Update investor sentiment & market (SKIP IN GOVT MODE)
+        price_floor_prev = self.price_floor
+        net_capital_flow, capital_demand_premium, forward_guidance = (0.0, 0.0, 0.0)
+        market_cap = 0.0
+        market_active = system_active and not gov_funding_active
+
+        if hooks:
+            self._notify("before_market", year)
+        if market_active:
+            self.investor_market.update_sentiment(
+                self.cea.warning_8to1_active,
                 self.global_inflation,
                 self.inflation_target,
-                year
+                self.co2_level,
+                self.cea.initial_co2_ppm
             )
 
-            # Track XCR purchased by countries (distributed proportionally to CQE contributions)
-            if xcr_purchased > 0:
-                total_cqe = sum(c['base_cqe'] for c in self.countries.values())
-                for country_name, country_data in self.countries.items():
-                    country_share = country_data['base_cqe'] / total_cqe if total_cqe > 0 else 0
-                    country_data['xcr_purchased_equiv'] += xcr_purchased * country_share
-
-            # Apply price support and inflation impact
-            if price_support > 0:
-                # CQE buying pressure pushes price toward floor
-                self.investor_market.market_price_xcr += price_support
-                self.global_inflation += inflation_impact
-                # Hard mean-reversion clamp toward target to avoid runaway CPI
-                if self.global_inflation > self.inflation_target:
-                    over_shoot = self.global_inflation - self.inflation_target
-                    self.global_inflation -= over_shoot * 0.6  # Pull 60% back toward target
-                    self.global_inflation = min(self.global_inflation, self.inflation_target * 1.5)
-
-            # No hard clamp: floor can slip if CQE is unwilling or budget-limited
-
-            # 8. Update climate state using carbon cycle (emissions, sinks, feedbacks)
-            ppm_per_gtc = self.carbon_cycle.params.ppm_per_gtc
-            gtc_per_gtco2 = 1 / self.carbon_cycle.params.gtco2_per_gtc
-            bau_emissions_gtc = self.bau_emissions_gt_per_year * gtc_per_gtco2
-            bau_increase_ppm = bau_emissions_gtc * ppm_per_gtc
-
-            # Conventional mitigation reduces human emissions baseline
-            # Use OPERATIONAL capacity (not credited tonnes) - infrastructure continues
-            # reducing emissions even after net-zero when XCR crediting stops
-            operational_conv_gt = self.projects_broker.get_current_sequestration_rate(ChannelType.CONVENTIONAL)
-            operational_avoided_gt = self.projects_broker.get_current_sequestration_rate(ChannelType.AVOIDED_DEFORESTATION)
-            human_emissions_gtco2 = max(
-                0.0, self.bau_emissions_gt_per_year - operational_conv_gt
+            # Update capital market (private investors)
+            roadmap_target = self.cea.calculate_roadmap_target(year, self.years)
+            roadmap_gap = self.co2_level - roadmap_target
+            
+            market_age_years = year - self.xcr_start_year
+            net_capital_flow, capital_demand_premium, forward_guidance = self.capital_market.update_capital_flows(
+                self.co2_level, year, self.years, roadmap_gap,
+                self.global_inflation, self.inflation_target,
+                self.investor_market.sentiment, self.total_xcr_supply,
+                self.price_floor, market_age_years
             )
- 
-            # "Great Restore" Stability Lock: 
-            # Post-net-zero, any emission avoidance becomes permanent structural change.
-            # If CM retires, it is replaced by zero-emission tech (represented by lowering BAU).
-            if self.net_zero_ever_reached:
-                # Ratchet BAU down to the human emissions floor
-                self.bau_emissions_gt_per_year = min(self.bau_emissions_gt_per_year, human_emissions_gtco2)
- 
-            actual_emissions_gtc = human_emissions_gtco2 * gtc_per_gtco2
 
-            # CDR removes CO2 from stock (active removal)
-            removal_gtc = cdr_sequestration / 1e9 * gtc_per_gtco2
-
-            reversal_tonnes_total = reversal_tonnes_projects + reversal_tonnes_audits
-            reversal_gtc = reversal_tonnes_total / 1e9 * gtc_per_gtco2
-
-            net_emissions_gtc = actual_emissions_gtc + reversal_gtc
-            # Avoided deforestation reduces land use emissions (use operational capacity)
-            land_use_change_gtc_effective = max(
-                0.0, self.land_use_change_gtc - (operational_avoided_gt * gtc_per_gtco2)
+            # Calculate market price (sentiment + capital demand)
+            self.investor_market.calculate_price(capital_demand_premium)
+            market_cap = self.total_xcr_supply * self.investor_market.market_price_xcr
+
+            # Update CQE budget (5% of annual private capital inflow)
+            annual_private_inflow = max(net_capital_flow, 0.0)
+            self.central_bank.update_cqe_budget(annual_private_inflow)
+        if hooks:
+            self._notify("after_market", year, market_active=market_active, net_capital_flow=net_capital_flow,
+                         capital_demand_premium=capital_demand_premium, forward_guidance=forward_guidance,
+                         market_cap=market_cap)
+
+        # 3. CEA updates policy and the price floor
+        if hooks:
+            self._notify("before_cea_policy", year)
+        if market_active:
+            self.cea.update_policy(
+                self.co2_level,
+                market_cap,
+                self.central_bank.total_cqe_budget,
+                self.global_inflation,
+                budget_utilization
             )
 
-            climate_state = self.carbon_cycle.step(
-                emissions_gtc=net_emissions_gtc,
-                sequestration_gtc=removal_gtc,
-                land_use_change_gtc=land_use_change_gtc_effective
+            # CEA adjusts price floor
+            self.price_floor, revision_occurred = self.cea.adjust_price_floor(
+                self.co2_level,
+                self.price_floor,
+                year,
+                self.years,
+                current_inflation=self.global_inflation,
+                temperature_anomaly=self.carbon_cycle.temperature
             )
-            self.co2_level = climate_state["CO2_ppm"]
-
-            # BAU emissions peak then plateau, then decline late-century (population-driven)
-            if year < self.bau_peak_year:
-                bau_growth_rate = self.bau_growth_rate_pre_peak
-            elif year < self.bau_decline_start_year:
-                bau_growth_rate = self.bau_post_peak_plateau_rate
-            else:
-                bau_growth_rate = self.bau_decline_rate_post_peak
-
-            self.bau_emissions_gt_per_year = max(
-                0.0, self.bau_emissions_gt_per_year * (1 + bau_growth_rate)
+            # Update agents
+            self.central_bank.price_floor_rcc = self.price_floor
+            self.investor_market.price_floor = self.price_floor
+        else:
+            revision_occurred = False
+        if hooks:
+            self._notify("after_cea_policy", year, market_active=market_active, price_floor_prev=price_floor_prev,
+                         revision_occurred=revision_occurred, budget_utilization=budget_utilization)
+
+        # 4. Projects broker initiates new projects
+        # Only initiate projects if capacity > 0 (system active)
+        # In GOVT mode, use a high effective price to ensure economic initiation
+        effective_init_price = 1000.0 if gov_funding_active else (self.investor_market.market_price_xcr * self.cea.brake_factor)
+        
+        if hooks:
+            self._notify("before_initiation", year)
+        if capacity > 0 and system_active:
+            available_capital_usd = 1e15 if gov_funding_active else max(net_capital_flow, 0.0) # Unlimited govt credit
+            # Use operational conventional capacity to cap new project initiation
+            operational_conventional_gt = self.projects_broker.get_current_sequestration_rate(ChannelType.CONVENTIONAL)
+            remaining_conventional_need_gt = max(
+                0.0, self.bau_emissions_gt_per_year - operational_conventional_gt
+            )
+            land_use_change_gtco2 = (
+                self.land_use_change_gtc * self.carbon_cycle.params.gtco2_per_gtc
+            )
+            planned_avoided_deforestation_gt = self.projects_broker.get_planned_sequestration_rate(
+                ChannelType.AVOIDED_DEFORESTATION
+            )
+            remaining_luc_emissions_gt = max(
+                0.0, land_use_change_gtco2 - planned_avoided_deforestation_gt
             )
 
-            # 9. Update BAU trajectory (no intervention scenario, with natural sinks)
-            bau_climate = self.bau_carbon_cycle.step(
-                emissions_gtc=bau_emissions_gtc,
-                sequestration_gtc=0.0,
-                land_use_change_gtc=self.land_use_change_gtc
+            # Calculate emissions-to-sinks ratio for net-zero transition
+            # Total emissions = BAU - conv mitigation + land use (net of avoided deforestation)
+            # Total sinks = CDR operational capacity + natural sinks (~3 Gt/yr ocean + ~2 Gt/yr land)
+            # Note: Avoided deforestation prevents emissions (already in effective_emissions), not a sink
+            operational_cdr_gt = self.projects_broker.get_current_sequestration_rate(ChannelType.CDR)
+            operational_avoided_def_gt = self.projects_broker.get_current_sequestration_rate(ChannelType.AVOIDED_DEFORESTATION)
+            effective_emissions_gt = max(0.1, remaining_conventional_need_gt + remaining_luc_emissions_gt)
+            total_sinks_gt = max(0.1, operational_cdr_gt + 5.0)  # CDR + natural sinks only
+            emissions_to_sinks_ratio = effective_emissions_gt / total_sinks_gt
+
+            # Check if net-zero achieved for the first time (permanent CM credit termination)
+            # "Great Restore" Hard Stop: EXACTLY at 1.0 ratio
+            if emissions_to_sinks_ratio <= 1.0 and not self.net_zero_ever_reached:
+                self.net_zero_ever_reached = True
+                if self.events.enabled(EventType.NET_ZERO):
+                    self.events.record(
+                        year, EventType.NET_ZERO,
+                        f"NET-ZERO ACHIEVED: Conventional mitigation credits permanently terminated "
+                        f"(E:S ratio = {emissions_to_sinks_ratio:.3f})",
+                        emissions_to_sinks_ratio=float(emissions_to_sinks_ratio)
+                    )
+
+            # Check if CDR buildout should stop (prevent overshoot)
+            cdr_buildout_stopped = self.should_stop_cdr_buildout(year, self.co2_level)
+
+            self.projects_broker.initiate_projects(
+                available_capital_usd=available_capital_usd,
+                market_price_xcr=1000.0 if gov_funding_active else self.investor_market.market_price_xcr,
+                price_floor=self.price_floor,
+                brake_factor=gov_inflation_brake_factor if gov_funding_active else self.cea.brake_factor,
+                current_year=year,
+                current_co2_ppm=self.co2_level,
+                current_inflation=self.global_inflation,
+                emissions_to_sinks_ratio=emissions_to_sinks_ratio,
+                net_zero_ever_reached=self.net_zero_ever_reached,
+                cdr_buildout_stopped=cdr_buildout_stopped,
+                cea=self.cea,
+                residual_emissions_gt=remaining_conventional_need_gt,
+                residual_luc_emissions_gt=land_use_change_gtco2,
+                funding_mode=self.funding_mode
+            )
+        else:
+            emissions_to_sinks_ratio = 10.0  # Default high ratio before system active
+        if hooks:
+            self._notify("after_initiation", year, effective_init_price=effective_init_price,
+                         emissions_to_sinks_ratio=emissions_to_sinks_ratio)
+
+        # 5. Step all projects (development progress, stochastic decay, retirement)
+        if hooks:
+            self._notify("before_project_step", year)
+        climate_risk_multiplier = self.carbon_cycle.get_project_risk_multiplier()
+        channel_risk_fn = self.carbon_cycle.get_channel_risk_multiplier
+        reversal_tonnes_projects = self.projects_broker.step_projects(
+            self.co2_level,
+            self.global_inflation,
+            climate_risk_multiplier=climate_risk_multiplier,
+            channel_risk_fn=channel_risk_fn
+        )
+        if hooks:
+            self._notify("after_project_step", year, climate_risk_multiplier=climate_risk_multiplier,
+                         reversal_tonnes_projects=reversal_tonnes_projects)
+
+        # 6. Auditor verifies operational projects and mints XCR
+        if hooks:
+            self._notify("before_audit_mint", year)
+        operational_rows = self.projects_broker.projects.indexes(ProjectStatus.OPERATIONAL)
+        # Status counts as of verification (before this year's audit failures)
+        status_totals = self.projects_broker.projects.status_counts.sum(axis=0)
+        total_sequestration = 0.0
+        cdr_sequestration = 0.0
+        conventional_mitigation = 0.0
+        xcr_minted_this_year = 0.0
+        xcr_burned_this_year = 0.0  # Track burning separately
+        cobenefit_bonus_xcr = 0.0
+        cdr_sequestration_tonnes = 0.0
+        conv_sequestration_tonnes = 0.0
+
+        reversal_tonnes_audits = 0.0
+
+        avoided_deforestation_tonnes = 0.0
+        # Annual cap for conventional: can't avoid more emissions than BAU produces this year
+        remaining_conventional_tonnes = self.bau_emissions_gt_per_year * 1e9
+        land_use_change_gtco2 = self.land_use_change_gtc * self.carbon_cycle.params.gtco2_per_gtc
+        remaining_luc_tonnes = max(0.0, land_use_change_gtco2 * 1e9)
+
+        if capacity > 0:
+            # Cohort rows are only handled by the batched pass
+            batched = self.batched_audits or self.projects_broker.cohort_mode
+            verify_and_mint = self.verify_and_mint_batch if batched else self.verify_and_mint_loop
+            batch = verify_and_mint(
+                operational_rows,
+                capacity, gov_funding_active, gov_inflation_brake_factor,
+                remaining_conventional_tonnes, remaining_luc_tonnes
             )
-            bau_co2 = bau_climate["CO2_ppm"]
+            total_sequestration = batch["total_sequestration"]
+            cdr_sequestration = cdr_sequestration_tonnes = batch["cdr_sequestration"]
+            conventional_mitigation = conv_sequestration_tonnes = batch["conventional_mitigation"]
+            avoided_deforestation_tonnes = batch["avoided_deforestation_tonnes"]
+            reversal_tonnes_audits = batch["reversal_tonnes_audits"]
+            xcr_minted_this_year = batch["xcr_minted"]
+            xcr_burned_this_year = batch["xcr_burned"]
+            cobenefit_bonus_xcr = batch["cobenefit_bonus_xcr"]
+        # 6. Economic cleanup and audit handling (burn XCR for failures)
+        if gov_funding_active:
+            # In GOVT mode, total cost is the annual spending for CDR and Avoided Deforestation
+            # Conventional Mitigation costs are assumed covered by existing markets (Cap & Trade, CBAM)
+            # Apply Global Fiscal Brake to the operational costs
+            annual_gov_spending = self.projects_broker.get_total_operational_cost(
+                exclude_channels=[ChannelType.CONVENTIONAL]
+            ) * gov_inflation_brake_factor
+            
+            self.total_gov_debt += annual_gov_spending
+            
+            # Direct inflation impact from deficit spending
+            active_gdp_usd = self.all_countries.active_gdp_tril * 1e12
+            gov_inflation_impact = (annual_gov_spending / active_gdp_usd) * 5 if active_gdp_usd > 0 else 0.0
+            gov_inflation_impact = float(np.clip(gov_inflation_impact, 0.0, 0.05)) # Cap at 5% per year
+            self.global_inflation = max(0.0, self.global_inflation + gov_inflation_impact)
+            
+            annual_total_cost = annual_gov_spending # For result logging
+            
+            xcr_minted_this_year = 0.0
+            xcr_burned_this_year = 0.0
+            reversal_tonnes_audits = 0.0
+            reversal_tonnes_projects = 0.0
+            cobenefit_bonus_xcr = 0.0
+            xcr_purchased = 0.0
+        else:
+            # XCR Market mode (Standard)
+            # Update XCR supply from minting and burning
+            self.total_xcr_supply += xcr_minted_this_year - xcr_burned_this_year
+        if hooks:
+            self._notify("after_audit_mint", year, operational_projects=len(operational_rows),
+                         total_sequestration=total_sequestration, xcr_minted=xcr_minted_this_year,
+                         xcr_burned=xcr_burned_this_year, reversal_tonnes_audits=reversal_tonnes_audits,
+                         cobenefit_bonus_xcr=cobenefit_bonus_xcr,
+                         gov_spending=annual_total_cost if gov_funding_active else 0.0)
+
+        # 7. Central bank defends floor with CQE
+        if hooks:
+            self._notify("before_cqe", year)
+        price_support, inflation_impact, xcr_purchased = self.central_bank.defend_floor(
+            self.investor_market.market_price_xcr,
+            self.total_xcr_supply,
+            self.global_inflation,
+            self.inflation_target,
+            year
+        )
+
+        # Track XCR purchased by countries (distributed proportionally to CQE contributions)
+        if xcr_purchased > 0:
+            self.all_countries.attribute_cqe_purchase(xcr_purchased)
+
+        # Apply price support and inflation impact
+        if price_support > 0:
+            # CQE buying pressure pushes price toward floor
+            self.investor_market.market_price_xcr += price_support
+            self.global_inflation += inflation_impact
+            # Hard mean-reversion clamp toward target to avoid runaway CPI
+            if self.global_inflation > self.inflation_target:
+                over_shoot = self.global_inflation - self.inflation_target
+                self.global_inflation -= over_shoot * 0.6  # Pull 60% back toward target
+                self.global_inflation = min(self.global_inflation, self.inflation_target * 1.5)
+
+        # No hard clamp: floor can slip if CQE is unwilling or budget-limited
+        if hooks:
+            self._notify("after_cqe", year, price_support=price_support, inflation_impact=inflation_impact,
+                         xcr_purchased=xcr_purchased)
+
+        # 8. Update climate state using carbon cycle (emissions, sinks, feedbacks)
+        if hooks:
+            self._notify("before_climate", year)
+        ppm_per_gtc = self.carbon_cycle.params.ppm_per_gtc
+        gtc_per_gtco2 = 1 / self.carbon_cycle.params.gtco2_per_gtc
+        bau_emissions_gt = self.bau_emissions_gt_per_year  # BAU flow before this year's ratchet and growth
+        bau_emissions_gtc = bau_emissions_gt * gtc_per_gtco2
+        bau_increase_ppm = bau_emissions_gtc * ppm_per_gtc
+
+        # Conventional mitigation reduces human emissions baseline
+        # Use OPERATIONAL capacity (not credited tonnes) - infrastructure continues
+        # reducing emissions even after net-zero when XCR crediting stops
+        operational_conv_gt = self.projects_broker.get_current_sequestration_rate(ChannelType.CONVENTIONAL)
+        operational_avoided_gt = self.projects_broker.get_current_sequestration_rate(ChannelType.AVOIDED_DEFORESTATION)
+        human_emissions_gtco2 = max(
+            0.0, self.bau_emissions_gt_per_year - operational_conv_gt
+        )
+ 
+        # "Great Restore" Stability Lock: 
+        # Post-net-zero, any emission avoidance becomes permanent structural change.
+        # If CM retires, it is replaced by zero-emission tech (represented by lowering BAU).
+        if self.net_zero_ever_reached:
+            # Ratchet BAU down to the human emissions floor
+            self.bau_emissions_gt_per_year = min(self.bau_emissions_gt_per_year, human_emissions_gtco2)
+ 
+        actual_emissions_gtc = human_emissions_gtco2 * gtc_per_gtco2
 
-            # Calculate transparency metrics for this year
-            # Technology costs (learning-adjusted)
-            cdr_cost = self.projects_broker.calculate_marginal_cost(ChannelType.CDR)
-            conv_cost = self.projects_broker.calculate_marginal_cost(ChannelType.CONVENTIONAL)
+        # CDR removes CO2 from stock (active removal)
+        removal_gtc = cdr_sequestration / 1e9 * gtc_per_gtco2
 
-            # Cumulative deployment by channel (in GtCO2 for readability)
-            cdr_cumulative = self.projects_broker.cumulative_deployment[ChannelType.CDR] / 1e9
-            conv_cumulative = self.projects_broker.cumulative_deployment[ChannelType.CONVENTIONAL] / 1e9
+        reversal_tonnes_total = reversal_tonnes_projects + reversal_tonnes_audits
+        reversal_gtc = reversal_tonnes_total / 1e9 * gtc_per_gtco2
 
-            # Policy multipliers
-            cdr_policy = self.cea.calculate_policy_r_multiplier(ChannelType.CDR, year)
-            conv_policy = self.cea.calculate_policy_r_multiplier(ChannelType.CONVENTIONAL, year)
+        net_emissions_gtc = actual_emissions_gtc + reversal_gtc
+        # Avoided deforestation reduces land use emissions (use operational capacity)
+        land_use_change_gtc_effective = max(
+            0.0, self.land_use_change_gtc - (operational_avoided_gt * gtc_per_gtco2)
+        )
 
-            # Effective R-values (base × policy)
-            benchmark_cdr_cost = cdr_cost
-            cdr_r_base, cdr_r_eff = self.cea.calculate_project_r_value(
-                ChannelType.CDR, cdr_cost, benchmark_cdr_cost, year
-            )
-            conv_r_base, conv_r_eff = self.cea.calculate_project_r_value(
-                ChannelType.CONVENTIONAL, conv_cost, benchmark_cdr_cost, year
-            )
+        climate_state = self.carbon_cycle.step(
+            emissions_gtc=net_emissions_gtc,
+            sequestration_gtc=removal_gtc,
+            land_use_change_gtc=land_use_change_gtc_effective
+        )
+        self.co2_level = climate_state["CO2_ppm"]
 
-            # Profitability signals (market_price * R_eff * brake - cost)
-            brake_factor = self.cea.brake_factor
-            cdr_profit = (self.investor_market.market_price_xcr * cdr_r_eff * brake_factor) - cdr_cost if cdr_r_eff > 0 else 0
-            conv_profit = (self.investor_market.market_price_xcr * conv_r_eff * brake_factor) - conv_cost if conv_r_eff > 0 else 0
-
-            # Conventional capacity utilization
-            conv_capacity_util = self.projects_broker.get_conventional_capacity_utilization(year)
-            conv_capacity_available = self.projects_broker.is_conventional_capacity_available(year)
-            conv_capacity_factor = self.projects_broker.get_conventional_capacity_factor(year)
-
-            # Record results with expanded transparency columns
-            results.append({
-                # Original columns
-                "Year": year,
-                "CO2_ppm": self.co2_level,
-                "BAU_CO2_ppm": bau_co2,
-                "CO2_Avoided": bau_co2 - self.co2_level,
-                "Inflation": self.global_inflation,
-                "XCR_Supply": self.total_xcr_supply,
-                "XCR_Minted": xcr_minted_this_year,
-                "XCR_Burned_Annual": xcr_burned_this_year,
-                "XCR_Burned_Cumulative": self.auditor.total_xcr_burned,
-                "Cobenefit_Bonus_XCR": cobenefit_bonus_xcr,
-                "Market_Price": self.investor_market.market_price_xcr,
-                "Price_Floor": self.price_floor,
-                "Sentiment": self.investor_market.sentiment,
-                "Projects_Total": len(self.projects_broker.projects),
-                "Projects_Operational": len(operational_projects),
-                "Projects_Development": len(development_projects),
-                "Projects_Failed": len(failed_projects),
-                "Projects_Completed": len(completed_projects),
-                "Sequestration_Tonnes": total_sequestration,
-                "CDR_Sequestration_Tonnes": cdr_sequestration_tonnes,
-                "Conventional_Mitigation_Tonnes": conv_sequestration_tonnes,
-                "Avoided_Deforestation_Tonnes": avoided_deforestation_tonnes,
-                "Reversal_Tonnes": reversal_tonnes_total,
-                "Human_Emissions_GtCO2": human_emissions_gtco2,
-                "Conventional_Installed_GtCO2": self.projects_broker.get_current_sequestration_rate(ChannelType.CONVENTIONAL),
-                "CEA_Warning": self.cea.warning_8to1_active,
-                "CQE_Spent": self.central_bank.total_cqe_spent,
-                "XCR_Purchased": xcr_purchased,
-                "Active_Countries": len(self.countries),
-                "CQE_Budget_Total": self.central_bank.total_cqe_budget,
-                "Capacity": capacity,
-
-                # Climate physics
-                "Temperature_Anomaly": climate_state["Temperature_Anomaly"],
-                "Ocean_Uptake_GtC": climate_state["Ocean_Uptake_GtC"],
-                "Land_Uptake_GtC": climate_state["Land_Uptake_GtC"],
-                "Airborne_Fraction": climate_state["Airborne_Fraction"],
-                "Ocean_Sink_Capacity": climate_state["Ocean_Sink_Capacity"],
-                "Land_Sink_Capacity": climate_state["Land_Sink_Capacity"],
-                "Permafrost_Emissions_GtC": climate_state["Permafrost_Emissions_GtC"],
-                "Fire_Emissions_GtC": climate_state["Fire_Emissions_GtC"],
-                "Cumulative_Emissions_GtC": climate_state["Cumulative_Emissions_GtC"],
-                "Climate_Risk_Multiplier": climate_state["Climate_Risk_Multiplier"],
-                "C_Ocean_Surface_GtC": climate_state["C_Ocean_Surface_GtC"],
-                "C_Land_GtC": climate_state["C_Land_GtC"],
-
-                # NEW: Technology costs (learning-adjusted)
-                "CDR_Cost_Per_Tonne": cdr_cost,
-                "Conventional_Cost_Per_Tonne": conv_cost,
-
-                # NEW: Cumulative deployment (learning curve progress)
-                "CDR_Cumulative_GtCO2": cdr_cumulative,
-                "Conventional_Cumulative_GtCO2": conv_cumulative,
-
-                # NEW: Policy multipliers (channel prioritization)
-                "CDR_Policy_Multiplier": cdr_policy,
-                "Conventional_Policy_Multiplier": conv_policy,
-
-                # NEW: Effective R-values (base × policy)
-                "CDR_R_Base": cdr_r_base,
-                "CDR_R_Effective": cdr_r_eff,
-                "Conventional_R_Base": conv_r_base,
-                "Conventional_R_Effective": conv_r_eff,
-
-                # NEW: Profitability signals
-                "CDR_Profitability": cdr_profit,
-                "Conventional_Profitability": conv_profit,
-
-                # NEW: Conventional capacity constraints
-                "Conventional_Capacity_Utilization": conv_capacity_util,
-                "Conventional_Capacity_Available": conv_capacity_available,
-                "Conventional_Capacity_Factor": conv_capacity_factor,
-
-                # NEW: CDR material constraints
-                "CDR_Material_Utilization": self.projects_broker.get_cdr_material_utilization(),
-                "CDR_Material_Cost_Factor": self.projects_broker.get_cdr_material_cost_factor(),
-                "CDR_Material_Capacity_Factor": self.projects_broker.get_cdr_material_capacity_factor(),
-
-                # NEW: CDR buildout controls
-                "CDR_Buildout_Stopped": self.cdr_buildout_stopped,
-                "CDR_Buildout_Stop_Year": self.cdr_buildout_stop_trigger_year if self.cdr_buildout_stop_trigger_year else 0,
-
-                # NEW: Capital market flows (private investor demand)
-                "Net_Capital_Flow": net_capital_flow,
-                "Capital_Demand_Premium": capital_demand_premium,
-                "Forward_Guidance": forward_guidance,
-                "Capital_Inflow_Cumulative": self.capital_market.cumulative_capital_inflow,
-                "Capital_Outflow_Cumulative": self.capital_market.cumulative_capital_outflow,
-
-                # NEW: CEA brake and CQE budget tracking
-                "CEA_Brake_Factor": 0.0 if gov_funding_active else self.cea.brake_factor,
-                "Annual_CQE_Spent": 0.0 if gov_funding_active else self.central_bank.annual_cqe_spent,
-                "Annual_CQE_Budget": 0.0 if gov_funding_active else self.central_bank.total_cqe_budget,
-                "CQE_Budget_Utilization": (0.0 if gov_funding_active else 
-                                           (self.central_bank.annual_cqe_spent / self.central_bank.total_cqe_budget
-                                           if self.central_bank.total_cqe_budget > 0 else 0.0)),
-                "Gov_Debt_USD": self.total_gov_debt,
-                "Annual_Gov_Spending": annual_total_cost if gov_funding_active else 0.0,
-                "Gov_Brake_Factor": gov_inflation_brake_factor if gov_funding_active else 1.0,
-                "Market_Price": 0.0 if gov_funding_active else self.investor_market.market_price_xcr,
-                "XCR_Supply": 0.0 if gov_funding_active else self.total_xcr_supply,
-                "XCR_Minted": 0.0 if gov_funding_active else xcr_minted_this_year,
-                "XCR_Burned_Annual": 0.0 if gov_funding_active else xcr_burned_this_year,
-                "Investor_Sentiment": 0.5 if gov_funding_active else self.investor_market.sentiment
-            })
+        # BAU emissions peak then plateau, then decline late-century (population-driven)
+        if year < self.bau_peak_year:
+            bau_growth_rate = self.bau_growth_rate_pre_peak
+        elif year < self.bau_decline_start_year:
+            bau_growth_rate = self.bau_post_peak_plateau_rate
+        else:
+            bau_growth_rate = self.bau_decline_rate_post_peak
+
+        self.bau_emissions_gt_per_year = max(
+            0.0, self.bau_emissions_gt_per_year * (1 + bau_growth_rate)
+        )
 
-        return pd.DataFrame(results)
+        # 9. Update BAU trajectory (no intervention scenario, with natural sinks)
+        bau_co2 = self._step_bau_climate(year, bau_emissions_gt)
+        if hooks:
+            self._notify("after_climate", year, climate_state=climate_state, bau_co2_ppm=bau_co2,
+                         human_emissions_gtco2=human_emissions_gtco2)
+
+        # Record results with expanded transparency columns. Only the output profile's
+        # years get a row, and diagnostics outside the profile are not computed
+        recorder = self.results
+        record = None
+        if recorder.records_year(year, self.years):
+            i = recorder.new_row()
+            columns = recorder.buffers
+            wants = recorder.wants
+
+            columns["Year"][i] = year
+            columns["CO2_ppm"][i] = self.co2_level
+            columns["BAU_CO2_ppm"][i] = bau_co2
+            columns["CO2_Avoided"][i] = bau_co2 - self.co2_level
+            columns["Inflation"][i] = self.global_inflation
+            columns["XCR_Burned_Cumulative"][i] = self.auditor.total_xcr_burned
+            columns["Cobenefit_Bonus_XCR"][i] = cobenefit_bonus_xcr
+            columns["Price_Floor"][i] = self.price_floor
+            columns["Sentiment"][i] = self.investor_market.sentiment
+            columns["Projects_Total"][i] = self.projects_broker.projects.total_projects()
+            columns["Projects_Operational"][i] = int(status_totals[_OPERATIONAL])
+            columns["Projects_Development"][i] = int(status_totals[_DEVELOPMENT])
+            columns["Projects_Failed"][i] = int(status_totals[_FAILED])
+            columns["Projects_Completed"][i] = int(status_totals[_COMPLETED])
+            columns["Sequestration_Tonnes"][i] = total_sequestration
+            columns["CDR_Sequestration_Tonnes"][i] = cdr_sequestration_tonnes
+            columns["Conventional_Mitigation_Tonnes"][i] = conv_sequestration_tonnes
+            columns["Avoided_Deforestation_Tonnes"][i] = avoided_deforestation_tonnes
+            columns["Reversal_Tonnes"][i] = reversal_tonnes_total
+            columns["Human_Emissions_GtCO2"][i] = human_emissions_gtco2
+            columns["Conventional_Installed_GtCO2"][i] = self.projects_broker.get_current_sequestration_rate(ChannelType.CONVENTIONAL)
+            columns["CEA_Warning"][i] = self.cea.warning_8to1_active
+            columns["CQE_Spent"][i] = self.central_bank.total_cqe_spent
+            columns["XCR_Purchased"][i] = xcr_purchased
+            columns["Active_Countries"][i] = len(self.countries)
+            columns["CQE_Budget_Total"][i] = self.central_bank.total_cqe_budget
+            columns["Capacity"][i] = capacity
+
+            # Climate physics
+            columns["Temperature_Anomaly"][i] = climate_state["Temperature_Anomaly"]
+            columns["Ocean_Uptake_GtC"][i] = climate_state["Ocean_Uptake_GtC"]
+            columns["Land_Uptake_GtC"][i] = climate_state["Land_Uptake_GtC"]
+            columns["Airborne_Fraction"][i] = climate_state["Airborne_Fraction"]
+            columns["Ocean_Sink_Capacity"][i] = climate_state["Ocean_Sink_Capacity"]
+            columns["Land_Sink_Capacity"][i] = climate_state["Land_Sink_Capacity"]
+            columns["Permafrost_Emissions_GtC"][i] = climate_state["Permafrost_Emissions_GtC"]
+            columns["Fire_Emissions_GtC"][i] = climate_state["Fire_Emissions_GtC"]
+            columns["Cumulative_Emissions_GtC"][i] = climate_state["Cumulative_Emissions_GtC"]
+            columns["Climate_Risk_Multiplier"][i] = climate_state["Climate_Risk_Multiplier"]
+            columns["C_Ocean_Surface_GtC"][i] = climate_state["C_Ocean_Surface_GtC"]
+            columns["C_Land_GtC"][i] = climate_state["C_Land_GtC"]
+
+            # Technology costs (learning-adjusted), effective R-values (base × policy)
+            # and profitability signals (market_price * R_eff * brake - cost)
+            if wants("CDR_Cost_Per_Tonne", "Conventional_Cost_Per_Tonne", "CDR_R_Base", "CDR_R_Effective",
+                     "Conventional_R_Base", "Conventional_R_Effective", "CDR_Profitability",
+                     "Conventional_Profitability"):
+                cdr_cost = self.projects_broker.calculate_marginal_cost(ChannelType.CDR)
+                conv_cost = self.projects_broker.calculate_marginal_cost(ChannelType.CONVENTIONAL)
+                benchmark_cdr_cost = cdr_cost
+                cdr_r_base, cdr_r_eff = self.cea.calculate_project_r_value(
+                    ChannelType.CDR, cdr_cost, benchmark_cdr_cost, year
+                )
+                conv_r_base, conv_r_eff = self.cea.calculate_project_r_value(
+                    ChannelType.CONVENTIONAL, conv_cost, benchmark_cdr_cost, year
+                )
+                brake_factor = self.cea.brake_factor
+                cdr_profit = (self.investor_market.market_price_xcr * cdr_r_eff * brake_factor) - cdr_cost if cdr_r_eff > 0 else 0
+                conv_profit = (self.investor_market.market_price_xcr * conv_r_eff * brake_factor) - conv_cost if conv_r_eff > 0 else 0
+                columns["CDR_Cost_Per_Tonne"][i] = cdr_cost
+                columns["Conventional_Cost_Per_Tonne"][i] = conv_cost
+                columns["CDR_R_Base"][i] = cdr_r_base
+                columns["CDR_R_Effective"][i] = cdr_r_eff
+                columns["Conventional_R_Base"][i] = conv_r_base
+                columns["Conventional_R_Effective"][i] = conv_r_eff
+                columns["CDR_Profitability"][i] = cdr_profit
+                columns["Conventional_Profitability"][i] = conv_profit
+
+            # Cumulative deployment (learning curve progress, in GtCO2 for readability)
+            columns["CDR_Cumulative_GtCO2"][i] = self.projects_broker.cumulative_deployment[ChannelType.CDR] / 1e9
+            columns["Conventional_Cumulative_GtCO2"][i] = self.projects_broker.cumulative_deployment[ChannelType.CONVENTIONAL] / 1e9
+
+            # Policy multipliers (channel prioritization)
+            if wants("CDR_Policy_Multiplier", "Conventional_Policy_Multiplier"):
+                columns["CDR_Policy_Multiplier"][i] = self.cea.calculate_policy_r_multiplier(ChannelType.CDR, year)
+                columns["Conventional_Policy_Multiplier"][i] = self.cea.calculate_policy_r_multiplier(ChannelType.CONVENTIONAL, year)
+
+            # Conventional capacity constraints
+            if wants("Conventional_Capacity_Utilization", "Conventional_Capacity_Available", "Conventional_Capacity_Factor"):
+                columns["Conventional_Capacity_Utilization"][i] = self.projects_broker.get_conventional_capacity_utilization(year)
+                columns["Conventional_Capacity_Available"][i] = self.projects_broker.is_conventional_capacity_available(year)
+                columns["Conventional_Capacity_Factor"][i] = self.projects_broker.get_conventional_capacity_factor(year)
+
+            # CDR material constraints
+            if wants("CDR_Material_Utilization", "CDR_Material_Cost_Factor", "CDR_Material_Capacity_Factor"):
+                columns["CDR_Material_Utilization"][i] = self.projects_broker.get_cdr_material_utilization()
+                columns["CDR_Material_Cost_Factor"][i] = self.projects_broker.get_cdr_material_cost_factor()
+                columns["CDR_Material_Capacity_Factor"][i] = self.projects_broker.get_cdr_material_capacity_factor()
+
+            # CDR buildout controls
+            columns["CDR_Buildout_Stopped"][i] = self.cdr_buildout_stopped
+            columns["CDR_Buildout_Stop_Year"][i] = self.cdr_buildout_stop_trigger_year if self.cdr_buildout_stop_trigger_year else 0
+
+            # Capital market flows (private investor demand)
+            columns["Net_Capital_Flow"][i] = net_capital_flow
+            columns["Capital_Demand_Premium"][i] = capital_demand_premium
+            columns["Forward_Guidance"][i] = forward_guidance
+            columns["Capital_Inflow_Cumulative"][i] = self.capital_market.cumulative_capital_inflow
+            columns["Capital_Outflow_Cumulative"][i] = self.capital_market.cumulative_capital_outflow
+
+            # CEA brake and CQE budget tracking; XCR market columns are zero in GOVT mode
+            columns["CEA_Brake_Factor"][i] = 0.0 if gov_funding_active else self.cea.brake_factor
+            columns["Annual_CQE_Spent"][i] = 0.0 if gov_funding_active else self.central_bank.annual_cqe_spent
+            columns["Annual_CQE_Budget"][i] = 0.0 if gov_funding_active else self.central_bank.total_cqe_budget
+            columns["CQE_Budget_Utilization"][i] = (0.0 if gov_funding_active else
+                                                    (self.central_bank.annual_cqe_spent / self.central_bank.total_cqe_budget
+                                                     if self.central_bank.total_cqe_budget > 0 else 0.0))
+            columns["Gov_Debt_USD"][i] = self.total_gov_debt
+            columns["Annual_Gov_Spending"][i] = annual_total_cost if gov_funding_active else 0.0
+            columns["Gov_Brake_Factor"][i] = gov_inflation_brake_factor if gov_funding_active else 1.0
+            columns["Market_Price"][i] = 0.0 if gov_funding_active else self.investor_market.market_price_xcr
+            columns["XCR_Supply"][i] = 0.0 if gov_funding_active else self.total_xcr_supply
+            columns["XCR_Minted"][i] = 0.0 if gov_funding_active else xcr_minted_this_year
+            columns["XCR_Burned_Annual"][i] = 0.0 if gov_funding_active else xcr_burned_this_year
+            columns["Investor_Sentiment"][i] = 0.5 if gov_funding_active else self.investor_market.sentiment
+            record = recorder.row(i)
+
+        # Archive terminal projects so long runs keep bounded memory and per-year cost
+        compact_interval = self.projects_broker.compact_interval
+        if compact_interval and (year + 1) % compact_interval == 0:
+            self.projects_broker.compact()
+
+        self.next_year += 1
+        return record
 
     def get_equity_summary(self) -> Dict:
         """Calculate equity flows between OECD and non-OECD countries
@@ -2636,7 +5614,7 @@ class GCR_ABM_Simulation:
 
 if __name__ == "__main__":
     # Initialize and run simulation
-    sim = GCR_ABM_Simulation(years=50, enable_audits=True)
+    sim = GCR_ABM_Simulation(years=50, enable_audits=True, echo_events=True)
     df = sim.run_simulation()
 
     # Display results
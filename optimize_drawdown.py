@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
-from gcr_model import GCR_ABM_Simulation
+from gcr_model import TargetReached
+from run_cache import cached_run
 import time
 
 def find_soonest_350(results_df):
@@ -13,6 +14,7 @@ def find_soonest_350(results_df):
 price_floors = [100, 200, 300, 400, 500]
 adoption_rates = [3.5, 5.0, 7.5, 10.0]
 ramp_up_years = [2, 5, 10]
+seed = 42  # Same seed for every scenario; repeated sweeps come from the run cache
 
 runs = []
 total_scenarios = len(price_floors) * len(adoption_rates) * len(ramp_up_years)
@@ -26,17 +28,19 @@ for pf in price_floors:
             current_scenario += 1
             # print(f"[{current_scenario}/{total_scenarios}] Testing PF={pf}, AR={ar}, RY={ry}...", end="\r")
             
-            sim = GCR_ABM_Simulation(
+            config = dict(
                 years=100,
                 price_floor=pf,
                 adoption_rate=ar,
-                years_to_full_capacity=ry
+                years_to_full_capacity=ry,
+                output_profile="metrics-only"
             )
-            results = sim.run_simulation()
+            # Only the first year at target matters: stop the run there
+            results = cached_run(config, seed, stop_conditions=[TargetReached(350.5)])
             df = pd.DataFrame(results)
             
             year_achieved = find_soonest_350(df)
-            final_co2 = df.iloc[-1]['CO2_ppm']
+            # The run ends at the target year, so the peak only covers the years up to it
             max_capital = df['Net_Capital_Flow'].max() / 1e9
             
             runs.append({
@@ -44,8 +48,7 @@ for pf in price_floors:
                 'adoption_rate': ar,
                 'ramp_up_years': ry,
                 'year_achieved': year_achieved,
-                'final_co2': final_co2,
-                'max_capital_b': max_capital
+                'max_capital_to_target_b': max_capital
             })
 
 runs_df = pd.DataFrame(runs)
@@ -0,0 +1,279 @@
+"""
+Content-addressed on-disk cache of simulation runs
+
+cached_run(config, seed) returns the run_simulation() frame of
+GCR_ABM_Simulation(**config, seed=seed), computing it only once. The key
+is a hash of the full constructor configuration (defaults filled in), the
+seed, the stop conditions, an optional setup key and the model code
+version, so editing the model or changing any parameter misses the cache.
+Results are stored one compressed .npz file per run, one array per column;
+the least recently used runs are evicted once the cache grows past its size
+limit. There is no shared index file, so several processes (dashboard and
+stress harness) can use one directory without losing each other's entries.
+
+Runs without a fixed int seed, and LLM-driven runs, are not reproducible
+and always run uncached. So are runs whose stop conditions cannot be keyed
+by value (see condition_key) unless the caller names them with stop_key.
+"""
+
+import os
+import json
+import time
+import hashlib
+import inspect
+import tempfile
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from gcr_model import GCR_ABM_Simulation, StopCondition
+
+# Source files whose contents define the model's results
+MODEL_FILES = ("gcr_model.py", "climate.py", "country_equity_data.py")
+DEFAULT_CACHE_DIR = os.environ.get("GCR_RUN_CACHE", ".gcr_run_cache")
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+_last_stamp = 0
+
+
+def _use_stamp() -> int:
+    """Wall-clock time in ns, strictly increasing within the process
+
+    File timestamps can be coarser than the uses they order; bumping ties to
+    last + 1 keeps every put and get distinct.
+    """
+    global _last_stamp
+    _last_stamp = max(time.time_ns(), _last_stamp + 1)
+    return _last_stamp
+
+
+@lru_cache(maxsize=None)
+def _file_digest(path: str, mtime_ns: int) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def code_version(*paths: str) -> str:
+    """Hash of the given source files (default: the model's own files)"""
+    if not paths:
+        here = os.path.dirname(os.path.abspath(__file__))
+        paths = tuple(os.path.join(here, name) for name in MODEL_FILES)
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(_file_digest(os.path.abspath(path), os.stat(path).st_mtime_ns).encode())
+    return digest.hexdigest()[:16]
+
+
+def condition_key(condition) -> Optional[str]:
+    """Value-based key of a stop condition, or None if it has none
+
+    StopCondition subclasses that define __repr__ (TargetReached,
+    SustainedAbove, FloorBreach) are keyed by it. Any other callable's
+    default repr holds a memory address, which would never hit within a
+    process and could falsely hit across processes.
+    """
+    if isinstance(condition, StopCondition) and type(condition).__repr__ is not object.__repr__:
+        return repr(condition)
+    return None
+
+
+def run_key(config: Dict, seed: int, stop_conditions: Optional[List] = None,
+            setup_key: Optional[str] = None, stop_key: Optional[str] = None) -> str:
+    """Cache key of a run: hash of its full configuration and the code version
+
+    stop_key, when given, stands in for the stop conditions; otherwise every
+    condition must have a condition_key (ValueError if not).
+    """
+    bound = inspect.signature(GCR_ABM_Simulation).bind(**config)
+    bound.apply_defaults()
+    if stop_key is not None:
+        conditions = stop_key
+    else:
+        conditions = [condition_key(condition) for condition in stop_conditions or ()]
+        if None in conditions:
+            raise ValueError("stop condition without a value-based __repr__; pass stop_key to name it")
+    payload = {
+        "config": bound.arguments,
+        "seed": int(seed),
+        "stop_conditions": conditions,
+        "setup": setup_key,
+        "code": code_version()
+    }
+    text = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class RunCache:
+    """Directory of cached run results with size-bounded LRU eviction
+
+    Each run is one <key>.npz file; the directory listing is the index. A
+    file's modification time is set to a use stamp (_use_stamp) whenever it
+    is read or written, so a hit only touches its own entry; ties between
+    processes are broken by key. Files are written to a temporary name
+    and renamed into place, so an interrupted run never leaves a partial entry.
+    """
+
+    SUFFIX = ".npz"
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------------
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def entries(self) -> Dict[str, Dict]:
+        """Current entries: key -> size in bytes and last-used time (ns)"""
+        entries = {}
+        try:
+            scan = os.scandir(self.directory)
+        except OSError:
+            return entries
+        with scan:
+            for item in scan:
+                if not item.name.endswith(self.SUFFIX):
+                    continue
+                try:
+                    stat = item.stat()
+                except OSError:  # Evicted by another process meanwhile
+                    continue
+                entries[item.name[:-len(self.SUFFIX)]] = {"bytes": stat.st_size, "last_used": stat.st_mtime_ns}
+        return entries
+
+    def _write_atomic(self, name: str, write: Callable) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            path = os.path.join(self.directory, name)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return path
+
+    def size_bytes(self) -> int:
+        return sum(entry["bytes"] for entry in self.entries().values())
+
+    def __len__(self) -> int:
+        return len(self.entries())
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    # ------------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Cached results for a key, or None (unreadable entries are dropped)"""
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                df = pd.DataFrame({name: data[name] for name in data.files})
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self._unlink(path)
+            return None
+        self._touch(path)
+        return df
+
+    def put(self, key: str, df: pd.DataFrame):
+        """Store results for a key, then evict least recently used entries over the size limit"""
+        columns = {name: df[name].to_numpy() for name in df.columns}
+        path = self._write_atomic(key + self.SUFFIX, lambda f: np.savez_compressed(f, **columns))
+        self._touch(path)
+        self._evict(keep=key)
+
+    def _evict(self, keep: Optional[str] = None):
+        entries = self.entries()
+        total = sum(entry["bytes"] for entry in entries.values())
+        for key in sorted(entries, key=lambda k: (entries[k]["last_used"], k)):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= entries[key]["bytes"]
+            self._unlink(self._path(key))
+
+    @staticmethod
+    def _touch(path: str):
+        """Mark an entry as just used"""
+        stamp = _use_stamp()
+        try:
+            os.utime(path, ns=(stamp, stamp))
+        except OSError:  # Evicted by another process meanwhile
+            pass
+
+    @staticmethod
+    def _unlink(path: str):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        for key in self.entries():
+            self._unlink(self._path(key))
+
+
+_default_cache: Optional[RunCache] = None
+
+
+def default_cache() -> RunCache:
+    """Process-wide cache in DEFAULT_CACHE_DIR (the GCR_RUN_CACHE environment variable)"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = RunCache()
+    return _default_cache
+
+
+def cached_run(config: Dict, seed: Optional[int] = None, stop_conditions: Optional[List] = None,
+               setup: Optional[Callable[[GCR_ABM_Simulation], None]] = None, setup_key: Optional[str] = None,
+               stop_key: Optional[str] = None, cache=None) -> pd.DataFrame:
+    """run_simulation() results of GCR_ABM_Simulation(**config, seed=seed), from the cache when possible
+
+    Args:
+        config: Constructor keyword arguments (everything except seed)
+        seed: Root seed; None runs uncached from the global NumPy state
+        stop_conditions: Passed to run_simulation (their condition_key is part of the key)
+        setup: Called on the new simulation before it runs (e.g. a stress scenario mutation)
+        setup_key: Identifies what setup does; required for a run with setup to be cached
+        stop_key: Identifies the stop conditions; required for a run with conditions
+            that have no condition_key to be cached
+        cache: RunCache to use; None for default_cache(), False to run uncached
+    """
+    if "seed" in config:
+        raise ValueError("pass the seed as cached_run(config, seed), not in config")
+    if cache is None:
+        cache = default_cache()
+    cacheable = (cache is not False and isinstance(seed, (int, np.integer))
+                 and not config.get("llm_enabled", False) and (setup is None or setup_key is not None)
+                 and (stop_key is not None or all(condition_key(c) is not None for c in stop_conditions or ())))
+    key = run_key(config, seed, stop_conditions, setup_key, stop_key) if cacheable else None
+    if key is not None:
+        df = cache.get(key)
+        if df is not None:
+            cache.hits += 1
+            return df
+        cache.misses += 1
+
+    sim = GCR_ABM_Simulation(seed=seed, **config)
+    if setup is not None:
+        setup(sim)
+    df = sim.run_simulation(stop_conditions=stop_conditions)
+    if key is not None:
+        cache.put(key, df)
+    return df
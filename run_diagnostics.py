@@ -1,9 +1,8 @@
 import numpy as np
 import pandas as pd
-from gcr_model import GCR_ABM_Simulation
+from run_cache import cached_run
 
-sim = GCR_ABM_Simulation(years=50, adoption_rate=10.0, price_floor=200)
-results = sim.run_simulation()
+results = cached_run(dict(years=50, adoption_rate=10.0, price_floor=200), seed=42)
 df = pd.DataFrame(results)
 
 print("--- DIAGNOSTICS ---")
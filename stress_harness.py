@@ -1,11 +1,12 @@
 import argparse
+import inspect
 from dataclasses import dataclass, field
 from typing import Callable, Dict, List, Optional
 
-import numpy as np
 import pandas as pd
 
 from gcr_model import GCR_ABM_Simulation
+from run_cache import cached_run, code_version
 
 
 @dataclass
@@ -28,16 +29,22 @@ def _scale_capital_flow(sim: GCR_ABM_Simulation, multiplier: float) -> None:
 def _override_chaos(sim: GCR_ABM_Simulation, shock_prob: float, shock_low: float,
                     shock_high: float, noise_std: float) -> None:
     def chaos_monkey():
-        if np.random.rand() < shock_prob:
-            shock = np.random.uniform(shock_low, shock_high)
+        if sim.crn is not None:
+            # Same shock draws as the unmodified model in common-random-numbers mode
+            shock_draw, size_draw = sim.crn.uniforms("shock", [0], width=2, key=sim.crn.system_year)[0]
+            if shock_draw < shock_prob:
+                sim.global_inflation += shock_low + (shock_high - shock_low) * size_draw
+            sim.global_inflation += noise_std * sim.crn.normals("inflation_noise", [0], key=sim.crn.system_year)[0]
+            return
+        if sim.rng.random() < shock_prob:
+            shock = sim.rng.uniform(shock_low, shock_high)
             sim.global_inflation += shock
-        sim.global_inflation += np.random.normal(0, noise_std)
+        sim.global_inflation += sim.rng.normal(0, noise_std)
 
     sim.chaos_monkey = chaos_monkey
 
 
-def _metrics(df: pd.DataFrame, sim: GCR_ABM_Simulation) -> Dict[str, float]:
-    inflation_target = sim.inflation_target
+def _metrics(df: pd.DataFrame, inflation_target: float) -> Dict[str, float]:
     price_floor_ratio = (df["Market_Price"] / df["Price_Floor"]).min() if (df["Price_Floor"] > 0).all() else 0.0
     co2_target_year = float((df["CO2_ppm"] < 350.0).idxmax()) if (df["CO2_ppm"] < 350.0).any() else -1.0
 
@@ -59,6 +66,15 @@ def _metrics(df: pd.DataFrame, sim: GCR_ABM_Simulation) -> Dict[str, float]:
     }
 
 
+METRICS = [
+    "peak_inflation", "mean_inflation", "inflation_years_above_target",
+    "peak_temperature", "years_above_2c", "final_co2", "min_co2",
+    "year_reach_350ppm", "total_xcr_minted", "final_xcr_supply",
+    "price_floor_ratio_min", "cqe_utilization_peak", "cqe_spend_total",
+    "cqe_spend_years"
+]
+
+
 def _summarize(results: pd.DataFrame) -> pd.DataFrame:
     def p10(x):
         return x.quantile(0.1)
@@ -66,19 +82,30 @@ def _summarize(results: pd.DataFrame) -> pd.DataFrame:
     def p90(x):
         return x.quantile(0.9)
 
-    metrics = [
-        "peak_inflation", "mean_inflation", "inflation_years_above_target",
-        "peak_temperature", "years_above_2c", "final_co2", "min_co2",
-        "year_reach_350ppm", "total_xcr_minted", "final_xcr_supply",
-        "price_floor_ratio_min", "cqe_utilization_peak", "cqe_spend_total",
-        "cqe_spend_years"
-    ]
-
-    agg = results.groupby("scenario")[metrics].agg(["mean", p10, p90])
+    agg = results.groupby("scenario")[METRICS].agg(["mean", p10, p90])
     agg.columns = [f"{metric}_{stat}" for metric, stat in agg.columns]
     return agg.reset_index()
 
 
+def _paired_differences(results: pd.DataFrame, baseline: str = "baseline") -> pd.DataFrame:
+    """Mean and standard error of each scenario's run-by-run difference from baseline
+
+    Runs are paired by run number (same seed). Antithetic partner runs share
+    a `pair` and are averaged before the standard error is taken.
+    """
+    base = results[results["scenario"] == baseline].set_index("run")[METRICS]
+    rows = []
+    for scenario, group in results[results["scenario"] != baseline].groupby("scenario", sort=False):
+        group = group.set_index("run")
+        diff = (group[METRICS] - base.loc[group.index]).groupby(group["pair"]).mean()
+        n = len(diff)
+        for metric in METRICS:
+            stderr = diff[metric].std(ddof=1) / n ** 0.5 if n > 1 else float("nan")
+            rows.append({"scenario": scenario, "metric": metric,
+                         "mean_diff": diff[metric].mean(), "stderr": stderr})
+    return pd.DataFrame(rows)
+
+
 def _build_scenarios() -> List[Scenario]:
     return [
         Scenario(
@@ -116,7 +143,35 @@ def _build_scenarios() -> List[Scenario]:
     ]
 
 
-def run_stress_suite(runs: int, years: int, seed: Optional[int], scenario_filter: Optional[List[str]]) -> pd.DataFrame:
+def run_stress_suite(runs: int, years: int, seed: Optional[int], scenario_filter: Optional[List[str]],
+                     fork_year: int = 0, common_random_numbers: bool = False,
+                     antithetic: bool = False, cache=None) -> pd.DataFrame:
+    """Run every scenario `runs` times and return one row of metrics per run
+
+    With fork_year > 0 each run simulates the first fork_year years once with
+    default parameters and forks that state for every scenario; scenario
+    kwargs and mutations then take effect from fork_year on, and all
+    scenarios of a run continue from the same random streams.
+
+    common_random_numbers keys every draw by purpose (shocks, adoption,
+    project slots), so run i of every scenario sees the same random events.
+    antithetic (implies common random numbers) pairs runs 2k and 2k + 1 on
+    one seed, the second with mirrored draws; the `pair` column records it.
+
+    Seeded runs without fork_year go through run_cache.cached_run (`cache`
+    as there: None for the default cache, False to always simulate).
+    """
+    common_random_numbers = common_random_numbers or antithetic
+    harness_version = code_version(__file__)  # Scenario mutations are defined in this file
+    default_target = inspect.signature(GCR_ABM_Simulation).parameters["inflation_target"].default
+
+    def config(run: int, **kwargs) -> Dict:
+        return dict(years=years, output_profile="metrics-only", common_random_numbers=common_random_numbers,
+                    antithetic=antithetic and run % 2 == 1, **kwargs)
+
+    def run_seed(run: int) -> Optional[int]:
+        return None if seed is None else seed + (run // 2 if antithetic else run)
+
     scenarios = _build_scenarios()
     if scenario_filter:
         scenario_filter = {name.strip() for name in scenario_filter}
@@ -124,18 +179,32 @@ def run_stress_suite(runs: int, years: int, seed: Optional[int], scenario_filter
 
     results = []
 
+    prefixes = {}
+    if fork_year > 0:
+        for run in range(runs):
+            prefix = GCR_ABM_Simulation(seed=run_seed(run), **config(run))
+            for _ in range(fork_year):
+                prefix.step_year()
+            prefixes[run] = prefix
+
     for scenario in scenarios:
         for run in range(runs):
-            if seed is not None:
-                np.random.seed(seed + run)
-            sim = GCR_ABM_Simulation(years=years, **scenario.kwargs)
-            if scenario.mutate:
-                scenario.mutate(sim)
-            df = sim.run_simulation()
-            metrics = _metrics(df, sim)
+            if run in prefixes:
+                sim = prefixes[run].fork()
+                for name, value in scenario.kwargs.items():
+                    setattr(sim, name, value)
+                if scenario.mutate:
+                    scenario.mutate(sim)
+                df = sim.run_simulation()
+            else:
+                setup_key = f"{scenario.name}@{harness_version}" if scenario.mutate else None
+                df = cached_run(config(run, **scenario.kwargs), run_seed(run),
+                                setup=scenario.mutate, setup_key=setup_key, cache=cache)
+            metrics = _metrics(df, scenario.kwargs.get("inflation_target", default_target))
             metrics.update({
                 "scenario": scenario.name,
                 "run": run,
+                "pair": run // 2 if antithetic else run,
                 "description": scenario.description
             })
             results.append(metrics)
@@ -150,16 +219,28 @@ def main() -> None:
     parser.add_argument("--seed", type=int, default=42, help="Base RNG seed")
     parser.add_argument("--scenario", action="append", help="Scenario name (can be repeated)")
     parser.add_argument("--csv", type=str, default="stress_results.csv", help="Output CSV path")
+    parser.add_argument("--fork-year", type=int, default=0,
+                        help="Share the first N years across scenarios and apply scenario changes from year N")
+    parser.add_argument("--crn", action="store_true",
+                        help="Common random numbers: the same seed drives the same random events in every scenario")
+    parser.add_argument("--antithetic", action="store_true",
+                        help="Antithetic run pairs (implies --crn; use an even --runs)")
+    parser.add_argument("--no-cache", action="store_true", help="Always simulate instead of reusing cached runs")
 
     args = parser.parse_args()
 
-    results = run_stress_suite(args.runs, args.years, args.seed, args.scenario)
+    results = run_stress_suite(args.runs, args.years, args.seed, args.scenario, args.fork_year,
+                               args.crn, args.antithetic, cache=False if args.no_cache else None)
     summary = _summarize(results)
 
     pd.set_option("display.max_columns", None)
     print("\nSTRESS TEST SUMMARY (mean/p10/p90)")
     print(summary.to_string(index=False))
 
+    if "baseline" in set(results["scenario"]) and results["scenario"].nunique() > 1:
+        print("\nDIFFERENCE FROM BASELINE (paired by run, mean ± stderr)")
+        print(_paired_differences(results).to_string(index=False))
+
     if args.csv:
         results.to_csv(args.csv, index=False)
         print(f"\nSaved raw results: {args.csv}")
@@ -0,0 +1,137 @@
+"""
+Test Batch Simulation
+
+Verifies the vectorized Monte Carlo ensemble:
+1. run() fills a (runs × years × metrics) cube for the selected metrics
+2. A root seed reproduces the ensemble; different seeds differ
+3. Ensemble means, project counts and reversals agree with independent scalar
+   runs, over 100 years and with audits off too
+4. Learning-curve costs agree with scalar runs year by year (a single
+   first-project draw sets each member's reference capacity)
+5. The shared BAU path matches stepping every member's BAU cycle
+6. Unsupported configurations and metric names are rejected
+"""
+
+import io
+import contextlib
+
+import numpy as np
+import pytest
+
+from gcr_model import GCR_ABM_Simulation, ChannelType, RESULT_PROFILES, health_grid
+from batch_simulation import BatchSimulation, BATCH_METRICS, CHANNELS, compare_with_scalar
+
+
+def test_cube_shape_and_metrics():
+    """The cube has one slice per member, year and metric; profiles pick their supported columns"""
+    batch = BatchSimulation(runs=8, seed=1, years=12)
+    cube = batch.run()
+    assert cube.shape == (8, 12, len(BATCH_METRICS))
+    assert np.isfinite(cube).all()
+    assert batch.metric("CO2_ppm").shape == (8, 12)
+    frame = batch.member_frame(3)
+    assert list(frame.columns) == ["Year"] + list(BATCH_METRICS)
+    assert frame["Year"].tolist() == list(range(12))
+    assert list(batch.quantiles("Inflation").columns) == ["Year", "mean", "q0.05", "q0.5", "q0.95"]
+    with pytest.raises(RuntimeError):
+        batch.step_year()
+
+    metrics_only = BatchSimulation(runs=2, seed=1, years=3, metrics="metrics-only")
+    assert set(metrics_only.metrics) == set(RESULT_PROFILES["metrics-only"]) - {"Year"}
+    chosen = BatchSimulation(runs=2, seed=1, years=3, metrics=["Inflation", "CO2_ppm"])
+    assert chosen.run().shape == (2, 3, 2)
+
+
+def test_seed_reproducibility():
+    """Members are independent streams of one root seed"""
+    first = BatchSimulation(runs=16, seed=5, years=20).run()
+    again = BatchSimulation(runs=16, seed=5, years=20).run()
+    other = BatchSimulation(runs=16, seed=6, years=20).run()
+    np.testing.assert_array_equal(first, again)
+    assert not np.array_equal(first, other)
+    assert not np.array_equal(first[0], first[1])
+
+
+@pytest.mark.parametrize("years, config", [
+    (40, {}),
+    (100, {}),
+    (100, {"enable_audits": False}),
+    (60, {"xcr_start_year": 8}),
+])
+def test_ensemble_matches_scalar_runs(years, config):
+    """Ensemble means, including project counts and reversals, stay within a few standard errors of scalar runs"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        comparison = compare_with_scalar(600, 30, years, seed=11, z_tolerance=4.0, **config)
+    assert set(comparison["metric"]) >= {"total_reversal", "final_projects_operational", "final_projects_failed"}
+    diverging = comparison.loc[~comparison["equivalent"], ["metric", "relative_diff", "z"]]
+    assert diverging.empty, diverging.to_string(index=False)
+
+
+def test_learning_costs_match_scalar_runs():
+    """Per-year CDR and conventional costs agree with scalar runs closely enough to catch a 2% bias"""
+    years, scalar_runs = 15, 400
+    columns = ["CDR_Cost_Per_Tonne", "Conventional_Cost_Per_Tonne"]
+    batch = BatchSimulation(4000, seed=17, years=years, metrics=columns)
+    batch.run()
+    with contextlib.redirect_stdout(io.StringIO()):
+        frames = [GCR_ABM_Simulation(years=years, seed=17_000 + run).run_simulation() for run in range(scalar_runs)]
+    for column in columns:
+        scalar = np.array([frame[column].to_numpy() for frame in frames])[:, 1:]
+        ensemble = batch.metric(column)[:, 1:]
+        stderr = np.sqrt(scalar.var(axis=0, ddof=1) / scalar_runs + ensemble.var(axis=0, ddof=1) / len(ensemble))
+        z = (ensemble.mean(axis=0) - scalar.mean(axis=0)) / stderr
+        assert np.abs(z).max() <= 3.0, (column, z.round(1))
+
+    # The reference is one project's size, U(10, 100) Mt × the starting scale damper of 0.5, not the mean size
+    reference = batch.reference_capacity[:, CHANNELS.index(ChannelType.CDR)]
+    np.testing.assert_allclose(np.quantile(reference, [0.1, 0.5, 0.9]), [9.5e6, 27.5e6, 45.5e6], rtol=0.05)
+
+
+def test_health_grid():
+    """Audit failure probability rises from the error rate as health falls; decay only moves health down"""
+    health, failure_probability, transition = health_grid(0.01)
+    assert health[0] == 1.0 and np.all(np.diff(health) < 0)
+    assert failure_probability[0] == pytest.approx(0.01)
+    assert np.all(np.diff(failure_probability) >= 0) and failure_probability.max() <= 0.3
+    np.testing.assert_allclose(transition.sum(axis=1), 1.0)
+    assert np.allclose(np.tril(transition, -1), 0.0)
+    # One decay event from full health lands in [0.8, 0.95): bins [0.9, 0.95), [0.85, 0.9), [0.8, 0.85)
+    assert transition[0, 1:4].sum() == pytest.approx(1.0)
+
+
+def test_memoized_bau_path():
+    """Reading BAU CO2 from the memoized path matches stepping the batched BAU cycle"""
+    memoized = BatchSimulation(runs=4, seed=2, years=15)
+    memoized.run()
+    stepped = BatchSimulation(runs=4, seed=2, years=15, setup=lambda sim: setattr(sim, "memoize_bau", False))
+    stepped.run()
+    assert memoized._bau_path is not None and stepped._bau_path is None
+    np.testing.assert_allclose(memoized.metric("BAU_CO2_ppm"), stepped.metric("BAU_CO2_ppm"), rtol=1e-12)
+    np.testing.assert_array_equal(memoized.metric("CO2_ppm"), stepped.metric("CO2_ppm"))
+
+
+def test_rejects_unsupported_configurations():
+    """Empty ensembles, GOVT mode, LLM agents and unknown metrics are refused"""
+    with pytest.raises(ValueError):
+        BatchSimulation(runs=0)
+    with pytest.raises(ValueError):
+        BatchSimulation(runs=2, years=5, llm_enabled=True)
+    with pytest.raises(ValueError):
+        BatchSimulation(runs=2, years=5, funding_mode="GOVT")
+    with pytest.raises(ValueError):
+        BatchSimulation(runs=2, years=5, metrics=["Gov_Debt_USD"])
+    with pytest.raises(ValueError):
+        BatchSimulation(runs=2, years=5, metrics="no-such-profile")
+    with pytest.raises(ValueError):
+        BatchSimulation(runs=2, seed=1, years=5, metrics=["CO2_ppm"]).metric("Inflation")
+
+
+if __name__ == "__main__":
+    test_cube_shape_and_metrics()
+    test_seed_reproducibility()
+    test_ensemble_matches_scalar_runs(100, {})
+    test_learning_costs_match_scalar_runs()
+    test_health_grid()
+    test_memoized_bau_path()
+    test_rejects_unsupported_configurations()
+    print("✓ Batch simulation tests passed")
@@ -0,0 +1,75 @@
+"""
+Test Climate Module
+
+Verifies the batched carbon cycle against the scalar one:
+1. Every member of a BatchCarbonCycle tracks its own scalar CarbonCycle,
+   including sink overdraw, permafrost thaw and the diagnostics
+2. Per-member parameter arrays match scalar cycles built with each value
+"""
+
+import numpy as np
+import pytest
+
+from climate import CarbonCycle, CarbonCycleParams, BatchCarbonCycle
+
+
+def _assert_member_matches(batch: BatchCarbonCycle, i: int, cycle: CarbonCycle, diagnostics=None):
+    for name in ("c_atm", "c_ocean_surface", "c_ocean_deep", "c_land", "c_permafrost_remaining",
+                 "cumulative_emissions", "temperature", "co2_ppm"):
+        assert getattr(batch, name)[i] == pytest.approx(getattr(cycle, name), rel=1e-12, abs=1e-12), name
+    for name, value in (diagnostics or {}).items():
+        assert batch.diagnostics[name][i] == pytest.approx(value, rel=1e-12, abs=1e-12), name
+
+
+def test_members_match_scalar_cycles():
+    """Random emissions paths, including removals that overdraw the sinks and warming past every threshold"""
+    rng = np.random.default_rng(3)
+    runs, years = 6, 80
+    batch = BatchCarbonCycle(runs, initial_co2_ppm=np.linspace(400, 440, runs))
+    cycles = [CarbonCycle(initial_co2_ppm=ppm) for ppm in np.linspace(400, 440, runs)]
+    for i, cycle in enumerate(cycles):
+        _assert_member_matches(batch, i, cycle)
+
+    peak_temperature = batch.temperature.copy()
+    for year in range(years):
+        emissions = rng.uniform(10, 50, runs) if year < 50 else rng.uniform(0, 2, runs)
+        sequestration = rng.uniform(0, 1, runs) if year < 50 else rng.uniform(3, 15, runs)
+        luc = rng.uniform(0, 1.5, runs)
+        batch.step(emissions, sequestration, luc)
+        for i, cycle in enumerate(cycles):
+            _assert_member_matches(batch, i, cycle, cycle.step(emissions[i], sequestration[i], luc[i]))
+        peak_temperature = np.maximum(peak_temperature, batch.temperature)
+
+    assert peak_temperature.min() > 2.0  # AMOC and permafrost feedbacks were exercised
+    assert (batch.c_permafrost_remaining < CarbonCycleParams().permafrost_vulnerable_gtc).all()
+
+    # from_cycle continues a scalar trajectory
+    resumed = BatchCarbonCycle.from_cycle(cycles[2], 3)
+    resumed.step(5.0, 0.5)
+    state = cycles[2].step(5.0, 0.5)
+    for i in range(3):
+        _assert_member_matches(resumed, i, cycles[2], state)
+
+
+def test_parameter_sweep():
+    """Length-runs parameter arrays give each member its own physics"""
+    tcre = np.array([0.35, 0.45, 0.55])
+    k_ocean = np.array([0.010, 0.012, 0.014])
+    batch = BatchCarbonCycle(3, params=CarbonCycleParams(tcre=tcre, k_ocean=k_ocean))
+    cycles = [CarbonCycle(params=CarbonCycleParams(tcre=t, k_ocean=k)) for t, k in zip(tcre, k_ocean)]
+    for year in range(40):
+        state = batch.step(12.0, 0.2)
+        for i, cycle in enumerate(cycles):
+            scalar_state = cycle.step(12.0, 0.2)
+            assert state["Temperature_Anomaly"][i] == pytest.approx(scalar_state["Temperature_Anomaly"], rel=1e-12)
+            assert state["Ocean_Uptake_GtC"][i] == pytest.approx(scalar_state["Ocean_Uptake_GtC"], rel=1e-12)
+    assert batch.temperature[0] < batch.temperature[2]
+
+    with pytest.raises(ValueError):
+        BatchCarbonCycle(0)
+
+
+if __name__ == "__main__":
+    test_members_match_scalar_cycles()
+    test_parameter_sweep()
+    print("✓ Climate tests passed")
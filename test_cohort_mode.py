@@ -0,0 +1,139 @@
+"""
+Test Cohort Project Mode
+
+Verifies the cohort-aggregated project representation:
+1. New projects are grouped into cohort rows with summed tonnes and counts
+2. Development rows of a cohort merge into one operational row
+3. Failed members are folded out of their row into the FAILED aggregates
+4. A full cohort-mode run keeps count-weighted aggregates consistent
+5. A 100-year cohort run steps at least 10x fewer rows than per-project mode
+6. Cohort mode is statistically equivalent to per-project mode (validation harness)
+"""
+
+import io
+import contextlib
+
+import numpy as np
+
+from gcr_model import GCR_ABM_Simulation, ProjectStore, ProjectStatus, ChannelType, STATUS_CODES
+from cohort_validation import run_mode_pair, compare_modes
+
+
+def _cohort_store(counts, tonnes_each: float = 1e6) -> ProjectStore:
+    store = ProjectStore()
+    n = len(counts)
+    counts = np.asarray(counts)
+    store.add_cohort_rows(
+        [f"C{k:04d}" for k in range(1, n + 1)], ChannelType.CDR,
+        np.array([store.country_code("Kenya")] * n, dtype=np.int32), 0, np.full(n, 2),
+        counts * tonnes_each, 100.0, 1.0, 1.0, np.full(n, 0.5), 100, counts, np.arange(1, n + 1)
+    )
+    return store
+
+
+def test_cohort_creation_groups_projects():
+    """Bulk creation in cohort mode stores one row per (cohort, opening tick)"""
+    np.random.seed(11)
+    sim = GCR_ABM_Simulation(years=5)
+    broker = sim.projects_broker
+    broker.cohort_mode = True
+    created = broker._create_projects_bulk(ChannelType.CDR, 200, 0, 1.0, 100.0, 1.0, 1.0, 100, float("inf"))
+
+    store = broker.projects
+    assert store.total_projects() == 200
+    assert store.count(ProjectStatus.DEVELOPMENT, ChannelType.CDR) == 200
+    assert len(store) < 200
+    assert np.isclose(store.live("annual_sequestration_tonnes").sum(), created)
+    keys = set(zip(store.live("cohort_id").tolist(), store.live("development_years").tolist()))
+    assert len(keys) == len(store)
+    assert broker.cohort_hosts.sum() == 200
+    assert broker.next_project_id == 201
+    store.check_aggregates()
+
+
+def test_cohort_rows_merge_on_opening():
+    """Development rows of one cohort join a single operational row as they open"""
+    store = _cohort_store([10])
+    store.advance_cohort_rows(store.live_indexes(), np.zeros(len(ChannelType)))
+    store.add_cohort_rows(["C0001"], ChannelType.CDR, np.array([store.country_code("Kenya")], dtype=np.int32),
+                          1, np.array([1]), np.array([4e6]), 100.0, 1.0, 1.0, np.array([0.5]), 100,
+                          np.array([4]), np.array([1]))
+    assert len(store) == 1 and store.project_count[0] == 14  # Same opening tick: joined on creation
+
+    store.add_cohort_rows(["C0001"], ChannelType.CDR, np.array([store.country_code("Kenya")], dtype=np.int32),
+                          1, np.array([3]), np.array([6e6]), 100.0, 1.0, 1.0, np.array([0.5]), 100,
+                          np.array([6]), np.array([1]))
+    assert len(store) == 2
+    for _ in range(3):
+        store.advance_cohort_rows(store.live_indexes(), np.zeros(len(ChannelType)))
+    assert len(store.live_indexes()) == 1
+    assert store.count(ProjectStatus.OPERATIONAL) == 20
+    assert np.isclose(store.live("annual_sequestration_tonnes").sum(), 2e7)
+    store.check_aggregates()
+
+
+def test_remove_members_folds_failures():
+    """Removed members leave their row and are folded into the FAILED aggregates"""
+    store = _cohort_store([10, 4])
+    store.set_status_rows(np.arange(2), STATUS_CODES[ProjectStatus.OPERATIONAL])
+    store.total_sequestered_tonnes[:2] = [5e6, 2e6]
+
+    store.remove_members(np.arange(2), np.array([3, 4]))
+    assert store.project_count[0] == 7
+    assert np.isclose(store.annual_sequestration_tonnes[0], 7e6)
+    assert np.isclose(store.total_sequestered_tonnes[0], 3.5e6)
+    assert store.project_count[1] == 0 and store.status_code[1] == STATUS_CODES[ProjectStatus.FAILED]
+    assert store.count(ProjectStatus.OPERATIONAL) == 7
+    assert store.count(ProjectStatus.FAILED) == 7
+    assert store.folded_counts.sum() == 7
+    assert list(store.live_indexes()) == [0]
+    store.check_aggregates()
+
+
+def test_cohort_mode_full_run():
+    """Cohort-mode runs keep count-weighted aggregates exact under debug checks"""
+    for mode in ("XCR", "GOVT"):
+        np.random.seed(5)
+        sim = GCR_ABM_Simulation(years=40, funding_mode=mode)
+        sim.projects_broker.cohort_mode = True
+        sim.projects_broker.debug_aggregates = True
+        with contextlib.redirect_stdout(io.StringIO()):
+            df = sim.run_simulation()
+        store = sim.projects_broker.projects
+        store.check_aggregates()
+        assert df["Projects_Total"].iloc[-1] == store.total_projects() == sim.projects_broker.next_project_id - 1
+        assert len(store) < store.total_projects()
+
+
+def test_cohort_mode_reduces_rows():
+    """A 100-year cohort run steps at least 10x fewer rows than the per-project run"""
+    stepped = {}
+    for cohort_mode in (False, True):
+        np.random.seed(3)
+        sim = GCR_ABM_Simulation(years=100)
+        sim.projects_broker.cohort_mode = cohort_mode
+        rows = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(sim.years):
+                sim.step_year()
+                rows += len(sim.projects_broker.projects.live_indexes())
+        stepped[cohort_mode] = rows
+    assert stepped[False] >= 10 * stepped[True], stepped
+
+
+def test_cohort_mode_matches_per_project():
+    """Validation harness: cohort and per-project means agree within tolerance"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = run_mode_pair(runs=12, years=40, seed=3)
+    summary = compare_modes(results, z_tolerance=3.5)
+    assert summary["equivalent"].all(), summary[~summary["equivalent"]]
+
+
+if __name__ == "__main__":
+    test_cohort_creation_groups_projects()
+    test_cohort_rows_merge_on_opening()
+    test_remove_members_folds_failures()
+    test_cohort_mode_full_run()
+    test_cohort_mode_reduces_rows()
+    test_cohort_mode_matches_per_project()
+    print("✓ Cohort mode tests passed")
@@ -0,0 +1,450 @@
+"""
+Test ProjectsBroker Portfolio Storage
+
+Verifies the columnar project store that backs ProjectsBroker:
+1. Project objects behave like the old dataclass (fields, status, step)
+2. Appending a project rebinds it as a view of the broker's store
+3. Broker capacity/cost queries agree with a plain per-project scan
+4. Running (channel, status) aggregates track creation, transitions and failures
+5. Live-status index sets follow transitions and match the Projects_* columns
+6. The vectorized stepping kernel matches the per-project loop statistically
+7. Batched verification/minting reproduces the per-project audit loop
+8. Bulk project creation respects capacity budgets and bookkeeping
+9. Memoized costs/dampers stay in step with deployment and project creation
+10. The lifecycle calendar fires transitions when due and keeps counters exact
+11. Archive compaction drops terminal projects without changing results
+12. The archive keeps only counters by default and cleans up spilled chunks
+"""
+
+import io
+import os
+import gc
+import copy
+import tempfile
+import contextlib
+
+import numpy as np
+import pytest
+
+from gcr_model import (
+    GCR_ABM_Simulation, Project, ProjectStore, ProjectStatus, ChannelType, _sequential_cap
+)
+
+
+def _make_project(idx: int, channel: ChannelType = ChannelType.CDR, **kwargs) -> Project:
+    kwargs.setdefault("development_years", 2)
+    return Project(
+        id=f"P{idx:04d}",
+        channel=channel,
+        country="Kenya",
+        start_year=0,
+        annual_sequestration_tonnes=1e7 * (idx + 1),
+        marginal_cost_per_tonne=100.0,
+        r_base=1.0,
+        r_effective=1.0,
+        **kwargs
+    )
+
+
+def _run_quiet(sim: GCR_ABM_Simulation):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return sim.run_simulation()
+
+
+def test_project_view_fields():
+    """Standalone projects expose the same fields and lifecycle as before"""
+    project = _make_project(0, co_benefit_score=0.4)
+
+    assert project.id == "P0000"
+    assert project.channel == ChannelType.CDR
+    assert project.country == "Kenya"
+    assert project.status == ProjectStatus.DEVELOPMENT
+    assert project.co_benefit_score == 0.4
+    assert project.r_value == project.r_effective
+
+    project.step()
+    assert project.years_in_development == 1
+    project.step()
+    assert project.status == ProjectStatus.OPERATIONAL
+
+    project.health *= 0.5
+    assert project.health == 0.5
+
+
+def test_store_append_rebinds_views():
+    """Appended projects become views of the store, preserving identity"""
+    store = ProjectStore(capacity=2)
+    projects = [_make_project(i) for i in range(5)]
+    for project in projects:
+        store.append(project)
+
+    assert len(store) == 5
+    assert store.capacity >= 5
+    assert store[0] is projects[0]
+    assert store[-1] is projects[-1]
+    assert list(store) == projects
+
+    # Writes through the view land in the columns
+    projects[3].status = ProjectStatus.FAILED
+    assert store.live("status_code")[3] == 2
+    assert store.live("annual_sequestration_tonnes")[4] == 5e7
+
+
+def test_broker_queries_match_scan():
+    """Array-backed broker queries agree with a per-project scan"""
+    np.random.seed(11)
+    sim = GCR_ABM_Simulation(years=20)
+    _run_quiet(sim)
+    broker = sim.projects_broker
+    projects = list(broker.projects)
+    assert projects
+
+    for channel in ChannelType:
+        operational = sum(p.annual_sequestration_tonnes for p in projects
+                          if p.channel == channel and p.status == ProjectStatus.OPERATIONAL)
+        planned = sum(p.annual_sequestration_tonnes for p in projects
+                      if p.channel == channel and p.status != ProjectStatus.FAILED)
+        assert np.isclose(broker.get_current_sequestration_rate(channel), operational / 1e9)
+        assert np.isclose(broker.get_planned_sequestration_rate(channel), planned / 1e9)
+
+    expected_cost = sum(
+        p.marginal_cost_per_tonne * p.annual_sequestration_tonnes for p in projects
+        if p.status in (ProjectStatus.OPERATIONAL, ProjectStatus.DEVELOPMENT)
+        and p.channel != ChannelType.CONVENTIONAL
+    )
+    assert np.isclose(
+        broker.get_total_operational_cost(exclude_channels=[ChannelType.CONVENTIONAL]), expected_cost
+    )
+
+    operational_ids = [p.id for p in projects if p.status == ProjectStatus.OPERATIONAL]
+    assert [p.id for p in broker.get_operational_projects()] == operational_ids
+
+
+def test_aggregates_track_transitions():
+    """Aggregates follow creation, Project.step transitions and audit failures"""
+    store = ProjectStore()
+    for i in range(3):
+        store.append(_make_project(i))
+    cdr, dev, op = ChannelType.CDR.value, 0, 1
+
+    assert store.status_counts[cdr, dev] == 3
+    assert store.tonnes(ChannelType.CDR, ProjectStatus.DEVELOPMENT) == 6e7
+
+    for project in store:
+        project.step()
+        project.step()
+    assert store.status_counts[cdr, op] == 3
+    assert store.tonnes(ChannelType.CDR, ProjectStatus.OPERATIONAL) == 6e7
+
+    store[1].status = ProjectStatus.FAILED
+    store[2].annual_sequestration_tonnes = 1e7
+    assert store.tonnes(ChannelType.CDR, ProjectStatus.OPERATIONAL) == 2e7
+    assert store.tonnes(ChannelType.CDR, ProjectStatus.FAILED) == 2e7
+    store.check_aggregates()
+
+
+def test_status_indexes_track_transitions():
+    """Development/operational index sets follow transitions; dead rows drop out"""
+    store = ProjectStore()
+    for i in range(4):
+        store.append(_make_project(i, development_years=i + 1))
+
+    assert list(store.indexes(ProjectStatus.DEVELOPMENT)) == [0, 1, 2, 3]
+    assert len(store.indexes(ProjectStatus.OPERATIONAL)) == 0
+
+    for project in store:
+        project.step()
+    assert list(store.indexes(ProjectStatus.OPERATIONAL)) == [0]
+    assert list(store.indexes(ProjectStatus.DEVELOPMENT)) == [1, 2, 3]
+
+    store[2].status = ProjectStatus.FAILED
+    store[0].status = ProjectStatus.COMPLETED
+    assert list(store.live_indexes()) == [1, 3]
+    assert store.count(ProjectStatus.FAILED) == 1
+    assert store.count(ProjectStatus.COMPLETED, ChannelType.CDR) == 1
+    store.check_aggregates()
+
+    np.random.seed(3)
+    sim = GCR_ABM_Simulation(years=30)
+    _run_quiet(sim)
+    sim.projects_broker.projects.check_aggregates()
+
+
+def test_vectorized_stepping_matches_scalar():
+    """Batch stepping kernel agrees in distribution with the per-project loop"""
+    np.random.seed(21)
+    sim = GCR_ABM_Simulation(years=25)
+    _run_quiet(sim)
+    broker = sim.projects_broker
+    before = broker.projects.status_counts.copy()
+
+    risk = sim.carbon_cycle.get_channel_risk_multiplier
+    for co2_ppm in (420.0, 320.0):  # Normal year and target-achieved retirement year
+        summary = broker.validate_vectorized_stepping(
+            co2_ppm, 0.06, climate_risk_multiplier=3.0, channel_risk_fn=risk, trials=100
+        )
+        assert summary["operational_count"][0] > 0
+
+    # Validation runs on copies; the broker's portfolio is untouched
+    assert np.array_equal(broker.projects.status_counts, before)
+
+    broker.step_projects(320.0, 0.06, climate_risk_multiplier=3.0, channel_risk_fn=risk)
+    broker.projects.check_aggregates()
+
+
+def test_sequential_cap_matches_loop():
+    """Cumulative-sum crediting caps equal the sequential min/decrement loop"""
+    amounts = np.array([3.0, 0.0, 5.0, 2.0, 4.0])
+    for cap in (0.0, 4.0, 9.5, 100.0):
+        remaining, expected = cap, []
+        for amount in amounts:
+            credit = min(amount, remaining)
+            remaining -= credit
+            expected.append(credit)
+        assert np.allclose(_sequential_cap(amounts, cap), expected)
+
+
+def test_batched_audits_match_loop():
+    """Batched verification/minting matches the per-project loop from the same state"""
+    for mode in ("XCR", "GOVT"):
+        np.random.seed(7)
+        sim = GCR_ABM_Simulation(years=15, funding_mode=mode)
+        _run_quiet(sim)
+
+        results = []
+        for verify in ("verify_and_mint_loop", "verify_and_mint_batch"):
+            clone = copy.deepcopy(sim)
+            store = clone.projects_broker.projects
+            rows = store.indexes(ProjectStatus.OPERATIONAL)
+            assert len(rows) > 0
+            totals = getattr(clone, verify)(rows, 1.0, mode == "GOVT", 0.9, 3e10, 2e9)
+            results.append((totals, clone))
+
+        (loop_totals, loop_sim), (batch_totals, batch_sim) = results
+        for key, value in loop_totals.items():
+            assert np.isclose(batch_totals[key], value, rtol=1e-9), key
+        loop_store, batch_store = loop_sim.projects_broker.projects, batch_sim.projects_broker.projects
+        for column in ("status_code", "total_xcr_minted", "total_sequestered_tonnes"):
+            assert np.allclose(loop_store.live(column), batch_store.live(column), rtol=1e-9), column
+        for name, country in loop_sim.countries.items():
+            assert np.isclose(country["xcr_earned"], batch_sim.countries[name]["xcr_earned"], rtol=1e-9)
+        for channel in ChannelType:
+            assert np.isclose(loop_sim.projects_broker.cumulative_deployment[channel],
+                              batch_sim.projects_broker.cumulative_deployment[channel], rtol=1e-9)
+        batch_store.check_aggregates()
+
+
+def test_bulk_creation_budget_and_bookkeeping():
+    """Bulk creation clips to the tonnage budget and registers every project"""
+    np.random.seed(9)
+    sim = GCR_ABM_Simulation(years=1)
+    broker = sim.projects_broker
+    first_id = broker.next_project_id
+
+    created = broker._create_projects_bulk(
+        ChannelType.CDR, 50, 0, 1.0, 200.0, 1.0, 1.0, 100, budget_tonnes=2.5e8
+    )
+    store = broker.projects
+    assert np.isclose(created, 2.5e8)
+    assert np.isclose(store.tonnes(ChannelType.CDR, ProjectStatus.DEVELOPMENT), 2.5e8)
+    assert 3 <= len(store) <= 25  # 10-100 Mt projects until the budget runs out
+    assert store.ids == [f"P{n:04d}" for n in range(first_id, broker.next_project_id)]
+    assert np.all(store.live("development_years") >= 2) and np.all(store.live("development_years") <= 4)
+
+    pool = broker._country_pool(ChannelType.CDR)
+    hosted = [pid for name in pool for pid in sim.countries[name]["projects"]]
+    assert sorted(hosted) == sorted(store.ids)
+    assert all(project.country in pool for project in store)
+
+    unlimited = broker._create_projects_bulk(
+        ChannelType.CONVENTIONAL, 10, 1, 0.5, 50.0, 1.0, 1.0, 25, budget_tonnes=float("inf")
+    )
+    assert store.count(ProjectStatus.DEVELOPMENT, ChannelType.CONVENTIONAL) == 10
+    assert np.isclose(unlimited, store.tonnes(ChannelType.CONVENTIONAL, ProjectStatus.DEVELOPMENT))
+    assert np.all(store.live("max_operational_years")[-10:] == 25)
+    store.check_aggregates()
+
+
+def test_derived_cache_invalidation():
+    """Cached marginal costs and dampers always equal a fresh computation"""
+    np.random.seed(13)
+    sim = GCR_ABM_Simulation(years=20)
+    _run_quiet(sim)
+    broker = sim.projects_broker
+
+    def assert_fresh():
+        for channel in ChannelType:
+            assert broker.calculate_marginal_cost(channel) == broker._marginal_cost(channel)
+            assert broker._get_effective_learning_rate(channel) == broker._effective_learning_rate(channel)
+        assert broker.calculate_project_scale_damper() == broker._project_scale_damper()
+        assert broker.calculate_project_count_damper() == broker._project_count_damper()
+
+    assert_fresh()
+    cdr_cost = broker.calculate_marginal_cost(ChannelType.CDR)
+
+    broker.update_cumulative_deployment(ChannelType.CDR, 5e9)
+    assert broker.calculate_marginal_cost(ChannelType.CDR) != cdr_cost
+    assert_fresh()
+
+    broker._create_projects_bulk(ChannelType.CDR, 20, 20, 1.0, 100.0, 1.0, 1.0, 100, float("inf"))
+    assert_fresh()
+
+    broker.base_costs[ChannelType.CDR] *= 2  # Parameter change needs an explicit invalidation
+    broker.invalidate_derived_cache()
+    assert_fresh()
+
+
+def test_debug_aggregates_full_run():
+    """Debug mode cross-checks aggregates on every query through a full run"""
+    for mode in ("XCR", "GOVT"):
+        np.random.seed(5)
+        sim = GCR_ABM_Simulation(years=40, funding_mode=mode)
+        sim.projects_broker.debug_aggregates = True
+        _run_quiet(sim)
+        sim.projects_broker.projects.check_aggregates()
+
+
+def test_lifecycle_calendar():
+    """Calendar-driven transitions match per-row stepping year by year"""
+    store, reference = ProjectStore(), ProjectStore()
+    for k in range(6):
+        kwargs = dict(development_years=2 + k % 3, max_operational_years=3 + k)
+        store.append(_make_project(k, **kwargs))
+        reference.append(_make_project(k, **kwargs))
+    no_decay = np.zeros(5)
+
+    for year in range(12):
+        completed = store.advance_rows(store.live_indexes(), no_decay)
+        for i in reference.live_indexes():
+            reference.advance_row(int(i), 0.0)
+        assert np.array_equal(store.live("status_code"), reference.live("status_code")), year
+        for project, expected in zip(store, reference):
+            assert project.years_in_development == expected.years_in_development
+            assert project.years_operational == expected.years_operational
+        assert all(store.status_code[i] == 3 for i in completed)
+    assert store.clock == 12
+    assert store.count(ProjectStatus.COMPLETED) == 6
+
+    # Per-row stepping in between ticks is picked up by a calendar rebuild
+    store = ProjectStore()
+    store.append(_make_project(0, development_years=3))
+    store.advance_row(0, 0.0)
+    store.advance_row(0, 0.0)
+    store.tick()
+    assert store[0].status == ProjectStatus.OPERATIONAL
+    store.check_aggregates()
+
+    # Writing a counter reschedules the row
+    store[0].years_operational = 99
+    store.tick()
+    assert store[0].status == ProjectStatus.COMPLETED
+
+
+def test_archive_compaction():
+    """Compacted runs match full-history runs; archive keeps the dropped rows' counters"""
+    np.random.seed(9)
+    reference = GCR_ABM_Simulation(years=60)
+    expected = _run_quiet(reference)
+
+    with tempfile.TemporaryDirectory() as spill_dir:
+        np.random.seed(9)
+        sim = GCR_ABM_Simulation(years=60)
+        broker = sim.projects_broker
+        broker.compact_interval = 5
+        broker.archive_spill_dir = spill_dir
+        broker.debug_aggregates = True
+        df = _run_quiet(sim)
+        assert df.equals(expected)
+
+        store, full = broker.projects, reference.projects_broker.projects
+        archive = store.archive
+        assert len(store) + len(archive) == len(full)
+        assert store.total_projects() == full.total_projects()
+        assert not np.isin(store.live("status_code"), (2, 3)).any()  # Year 60 ends with a compaction
+        store.check_aggregates()
+
+        columns = archive.load()
+        assert len(columns["id"]) == len(archive) == len(set(columns["id"]))
+        dead = np.isin(full.live("status_code"), (2, 3))
+        assert np.isclose(archive.sequestered_tonnes.sum(), full.live("total_sequestered_tonnes")[dead].sum())
+        assert np.isclose(archive.xcr_minted.sum(), full.live("total_xcr_minted")[dead].sum())
+        for name, country in sim.countries.items():
+            assert (len(country["projects"]) + country.get("archived_projects", 0)
+                    == len(reference.countries[name]["projects"]))
+            assert set(country["projects"]) <= set(store.ids)
+
+    # Views of archived rows stay readable; live views are rebound to their new rows
+    store = ProjectStore()
+    for k in range(4):
+        store.append(_make_project(k))
+    failed, live = store[1], store[2]
+    failed.status = ProjectStatus.FAILED
+    archived = store.compact()
+    assert list(archived["id"]) == [failed.id]
+    assert failed.status == ProjectStatus.FAILED and failed.id == "P0001"
+    assert live._idx == 1 and store[1] is live
+    assert store.total_projects() == 4 and store.count(ProjectStatus.FAILED) == 1
+    store.check_aggregates()
+
+
+def test_archive_memory_and_cleanup():
+    """Default archives keep counters only; spill directories go away with their archive"""
+    assert GCR_ABM_Simulation(years=50).projects_broker.compact_interval == 0
+    sim = GCR_ABM_Simulation(years=120, seed=4, output_profile="metrics-only")
+    assert sim.projects_broker.compact_interval > 0
+    for _ in range(40):
+        with contextlib.redirect_stdout(io.StringIO()):
+            sim.step_year()
+    archive = sim.projects_broker.projects.archive
+    assert len(archive) > 0 and archive.chunks == []
+    with pytest.raises(ValueError):
+        archive.load()
+
+    def spilled_store(spill_dir):
+        store = ProjectStore()
+        for k in range(4):
+            store.append(_make_project(k))
+        store[1].status = ProjectStatus.FAILED
+        store.compact(spill_dir)
+        return store
+
+    with tempfile.TemporaryDirectory() as spill_dir:
+        store = spilled_store(spill_dir)
+        kept = ProjectStore()
+        kept.append(_make_project(0, status=ProjectStatus.COMPLETED))
+        kept.compact(keep_rows=True)
+        assert list(kept.archive.load()["id"]) == ["P0000"]
+
+        # Copies share the chunks; the directory outlives the original until the copy is dropped too
+        clone = store.copy()
+        assert len(os.listdir(spill_dir)) == 1
+        del store
+        gc.collect()
+        assert list(clone.archive.load()["id"]) == ["P0001"]
+        del clone
+        gc.collect()
+        assert os.listdir(spill_dir) == []
+
+        store = spilled_store(spill_dir)
+        store.archive.close()
+        assert os.listdir(spill_dir) == []
+        with pytest.raises(ValueError):
+            store.archive.load()
+
+
+if __name__ == "__main__":
+    test_project_view_fields()
+    test_store_append_rebinds_views()
+    test_broker_queries_match_scan()
+    test_aggregates_track_transitions()
+    test_status_indexes_track_transitions()
+    test_vectorized_stepping_matches_scalar()
+    test_sequential_cap_matches_loop()
+    test_batched_audits_match_loop()
+    test_bulk_creation_budget_and_bookkeeping()
+    test_derived_cache_invalidation()
+    test_debug_aggregates_full_run()
+    test_lifecycle_calendar()
+    test_archive_compaction()
+    test_archive_memory_and_cleanup()
+    print("✓ ProjectsBroker storage tests passed")
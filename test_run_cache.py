@@ -0,0 +1,155 @@
+"""
+Test Run Cache
+
+Verifies the content-addressed cache of simulation runs:
+1. A repeated run is read back identical; any configuration change misses
+2. Unseeded runs, setups without a key and unkeyable stop conditions bypass the cache
+3. The cache evicts least recently used runs past its size limit
+4. Caches sharing a directory see each other's entries
+5. Code versions follow the contents of the hashed files
+"""
+
+import io
+import os
+import contextlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import run_cache
+from gcr_model import GCR_ABM_Simulation, StopCondition, TargetReached
+from run_cache import RunCache, cached_run, run_key, condition_key, code_version
+
+
+CONFIG = dict(years=25, output_profile="metrics-only")
+
+
+def _run(*args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return cached_run(*args, **kwargs)
+
+
+def test_repeated_run_hits_cache(tmp_path):
+    """Hits return the simulated frame; configuration, seed and stop conditions are part of the key"""
+    cache = RunCache(str(tmp_path))
+    first = _run(CONFIG, 7, cache=cache)
+    again = _run(CONFIG, 7, cache=cache)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    pd.testing.assert_frame_equal(again, first)
+    expected = GCR_ABM_Simulation(seed=7, **CONFIG)
+    with contextlib.redirect_stdout(io.StringIO()):
+        pd.testing.assert_frame_equal(first, expected.run_simulation())
+
+    # Defaults are filled in before hashing
+    assert run_key(CONFIG, 7) == run_key(dict(CONFIG, price_floor=100.0), 7)
+    assert run_key(CONFIG, 7) != run_key(dict(CONFIG, price_floor=120.0), 7)
+    assert run_key(CONFIG, 7) != run_key(CONFIG, 8)
+    assert run_key(CONFIG, 7) != run_key(CONFIG, 7, stop_conditions=[TargetReached(400.0)])
+
+    # A new cache on the same directory reads the index back
+    reopened = RunCache(str(tmp_path))
+    pd.testing.assert_frame_equal(_run(CONFIG, 7, cache=reopened), first)
+    assert reopened.hits == 1
+
+
+def test_uncacheable_runs_bypass_cache(tmp_path):
+    """Runs without a seed, or with an unnamed setup, always simulate"""
+    cache = RunCache(str(tmp_path))
+    np.random.seed(3)
+    _run(CONFIG, None, cache=cache)
+    _run(CONFIG, 3, setup=lambda sim: setattr(sim.central_bank, "cqe_ratio", 0.01), cache=cache)
+    assert len(cache) == 0 and cache.misses == 0
+
+    _run(CONFIG, 3, setup=lambda sim: setattr(sim.central_bank, "cqe_ratio", 0.01),
+         setup_key="tight_cqe", cache=cache)
+    assert len(cache) == 1 and run_key(CONFIG, 3, setup_key="tight_cqe") in cache
+
+    with pytest.raises(ValueError):
+        cached_run(dict(CONFIG, seed=3), cache=cache)
+
+
+class _Unnamed(StopCondition):
+    def __call__(self, record):
+        return record["Year"] >= 10
+
+
+def test_stop_conditions_keyed_by_value(tmp_path):
+    """Built-in conditions key by value; address-based reprs need an explicit stop_key"""
+    assert condition_key(TargetReached(400.0)) == condition_key(TargetReached(400.0))
+    assert condition_key(_Unnamed()) is None
+    assert condition_key(lambda record: False) is None
+    with pytest.raises(ValueError):
+        run_key(CONFIG, 7, stop_conditions=[_Unnamed()])
+
+    cache = RunCache(str(tmp_path))
+    for _ in range(2):
+        _run(CONFIG, 7, stop_conditions=[_Unnamed()], cache=cache)
+    assert len(cache) == 0 and cache.misses == 0
+
+    for _ in range(2):
+        df = _run(CONFIG, 7, stop_conditions=[_Unnamed()], stop_key="year>=10", cache=cache)
+    assert (cache.hits, cache.misses, len(df)) == (1, 1, 11)
+    assert run_key(CONFIG, 7, stop_conditions=[_Unnamed()], stop_key="year>=10") in cache
+
+
+def test_lru_eviction(tmp_path, monkeypatch):
+    """Past max_bytes the least recently used entries go first, even on a clock that never ticks"""
+    monkeypatch.setattr(run_cache.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+    cache = RunCache(str(tmp_path))
+    _run(CONFIG, 1, cache=cache)
+    entry_bytes = cache.size_bytes()
+
+    cache = RunCache(str(tmp_path / "small"), max_bytes=int(entry_bytes * 2.5))
+    for seed in (1, 2):
+        _run(CONFIG, seed, cache=cache)
+    _run(CONFIG, 1, cache=cache)  # Seed 1 is now the most recently used
+    _run(CONFIG, 3, cache=cache)
+    keys = {seed: run_key(CONFIG, seed) for seed in (1, 2, 3)}
+    assert keys[1] in cache and keys[3] in cache and keys[2] not in cache
+    assert cache.size_bytes() <= cache.max_bytes
+    assert sorted(os.listdir(cache.directory)) == sorted(f"{keys[s]}.npz" for s in (1, 3))
+
+    # An entry whose file disappeared is dropped and recomputed
+    os.unlink(os.path.join(cache.directory, f"{keys[3]}.npz"))
+    _run(CONFIG, 3, cache=cache)
+    assert keys[3] in cache and cache.misses == 4
+
+    with pytest.raises(ValueError):
+        RunCache(str(tmp_path), max_bytes=0)
+
+
+def test_shared_directory(tmp_path):
+    """Two caches on one directory (e.g. dashboard and harness) keep both writers' entries"""
+    first, second = RunCache(str(tmp_path)), RunCache(str(tmp_path))
+    _run(CONFIG, 1, cache=first)
+    _run(CONFIG, 2, cache=second)
+    _run(CONFIG, 1, cache=second)
+    _run(CONFIG, 3, cache=first)
+    assert len(first) == len(second) == 3
+    assert second.hits == 1 and first.misses == 2
+
+
+def test_code_version_tracks_contents(tmp_path):
+    """Editing a hashed file changes the code version"""
+    path = tmp_path / "scenario.py"
+    path.write_text("A = 1\n")
+    before = code_version(str(path))
+    path.write_text("A = 2\n")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+    assert code_version(str(path)) != before
+    assert code_version() == code_version()
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+    for test in (test_repeated_run_hits_cache, test_uncacheable_runs_bypass_cache,
+                 test_stop_conditions_keyed_by_value, test_lru_eviction, test_shared_directory,
+                 test_code_version_tracks_contents):
+        with tempfile.TemporaryDirectory() as directory, pytest.MonkeyPatch.context() as monkeypatch:
+            if test is test_lru_eviction:
+                test(Path(directory), monkeypatch)
+            else:
+                test(Path(directory))
+    print("✓ Run cache tests passed")
@@ -0,0 +1,91 @@
+"""
+Test Year-Indexed Schedule Tables
+
+Verifies that the precomputed time-only policy curves give the same values
+as the original scalar formulas:
+1. CEA roadmap target and the system capacity ramp
+2. CDR capacity ramp and conventional utilization/time taper
+3. Tables rebuild when their parameters change
+"""
+
+import numpy as np
+
+from gcr_model import GCR_ABM_Simulation, ChannelType, YearTable
+
+
+def _capacity_reference(year, start, full):
+    if year < start:
+        return 0.0
+    since = year - start
+    if since >= full:
+        return 1.0
+    return 0.2 + (1.0 - 0.2) * (since / full)
+
+
+def _utilization_reference(year, limit_year, limit):
+    if year <= 0:
+        return 0.0
+    if year >= limit_year:
+        return limit
+    progress = year / limit_year
+    s0 = 1.0 / (1.0 + np.exp(-8.0 * (0.0 - 0.5)))
+    s1 = 1.0 / (1.0 + np.exp(-8.0 * (1.0 - 0.5)))
+    s = 1.0 / (1.0 + np.exp(-8.0 * (progress - 0.5)))
+    return np.clip((s - s0) / max(s1 - s0, 1e-6), 0.0, 1.0) * limit
+
+
+def test_simulation_schedules_match_formulas():
+    """Roadmap and capacity ramp lookups equal the scalar formulas"""
+    sim = GCR_ABM_Simulation(years=80, xcr_start_year=3, years_to_full_capacity=7)
+    for year in range(0, 200):
+        expected_roadmap = 420.0 - (420.0 - 350.0) * (year / 80)
+        assert sim.cea.calculate_roadmap_target(year, 80) == expected_roadmap
+        assert sim.get_capacity_multiplier(year) == _capacity_reference(year, 3, 7)
+
+    # Parameter change triggers a rebuild
+    sim.years_to_full_capacity = 2
+    assert sim.get_capacity_multiplier(4) == _capacity_reference(4, 3, 2)
+    sim.years_to_full_capacity = 0
+    assert sim.get_capacity_multiplier(3) == 1.0
+
+
+def test_broker_schedules_match_formulas():
+    """CDR ramp and conventional taper lookups equal the scalar formulas"""
+    broker = GCR_ABM_Simulation(years=50).projects_broker
+    for year in range(0, 150):
+        ramp = broker.max_capacity_gt_per_year[ChannelType.CDR] / (1.0 + np.exp(-0.15 * (year - 30.0)))
+        assert broker.get_cdr_capacity_limit(year) == ramp * broker.get_cdr_material_capacity_factor()
+
+        utilization = _utilization_reference(year, 60, 0.80)
+        assert broker.get_conventional_capacity_utilization(year) == utilization
+        time_factor = max(0.10, 1.0 - min(utilization / 0.80, 1.0))
+        assert broker.get_conventional_capacity_factor(year) == max(0.10, min(time_factor, 1.0))
+
+    broker.max_capacity_gt_per_year[ChannelType.CDR] = 30.0
+    assert np.isclose(broker.get_cdr_capacity_limit(30), 15.0)
+    broker.conventional_capacity_limit_year = 40
+    assert broker.get_conventional_capacity_utilization(40) == 0.80
+
+    # A zero-length window jumps straight to the limit without dividing by zero
+    broker.conventional_capacity_limit_year = 0
+    with np.errstate(all="raise"):
+        assert broker.get_conventional_capacity_utilization(0) == 0.0
+        assert broker.get_conventional_capacity_utilization(5) == 0.80
+        assert broker.get_conventional_capacity_factor(5) == 0.10
+
+
+def test_year_table_fallbacks():
+    """Fractional and negative years bypass the table"""
+    table = YearTable(lambda years, scale: years * scale)
+    assert table(3, 2.0) == 6.0
+    assert table(2.5, 2.0) == 5.0
+    assert table(-1, 2.0) == -2.0
+    assert table(500, 2.0) == 1000.0
+    assert len(table.values) > 500
+
+
+if __name__ == "__main__":
+    test_simulation_schedules_match_formulas()
+    test_broker_schedules_match_formulas()
+    test_year_table_fallbacks()
+    print("✓ Schedule table tests passed")
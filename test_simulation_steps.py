@@ -0,0 +1,409 @@
+"""
+Test Incremental Simulation API
+
+Verifies the year-by-year interface of GCR_ABM_Simulation:
+1. step_year()/iter_years() reproduce run_simulation() exactly
+2. Stop conditions end runs early on target, sustained inflation and floor breach
+3. Stateful stop conditions reset between runs
+4. The results recorder follows RESULT_SCHEMA and hands its arrays to pandas
+5. Output profiles and every-k-th-year recording keep the recorded values
+6. Snapshots restore and forks branch a run without changing its continuation
+7. The event log records typed events with level filtering and a bounded buffer
+8. Per-simulation random streams make a seed reproduce a run in any thread layout
+9. Common random numbers pair scenarios on shared draws, optionally antithetic
+10. Countries live in a registry of columns over one shared read-only table
+11. Observer hooks fire around each phase without changing the run
+12. The memoized BAU path matches stepping the BAU cycle, including after divergence
+"""
+
+import io
+import os
+import pickle
+import tempfile
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gcr_model import (
+    GCR_ABM_Simulation, TargetReached, SustainedAbove, FloorBreach, ResultsRecorder, RESULT_SCHEMA,
+    EventLog, EventType, EVENT_COLUMNS, CommonRandomNumbers, COUNTRY_TABLE, FOUNDING_COUNTRIES,
+    HOOK_POINTS, PhaseProfiler, bau_trajectory, clear_bau_cache
+)
+from stress_harness import run_stress_suite, _paired_differences
+
+
+def _quiet(fn, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+def test_step_year_matches_run_simulation():
+    """Stepping by hand or through the generator gives the run_simulation frame"""
+    np.random.seed(4)
+    expected = _quiet(GCR_ABM_Simulation(years=40).run_simulation)
+
+    np.random.seed(4)
+    sim = GCR_ABM_Simulation(years=40)
+    records = [dict(_quiet(sim.step_year)) for _ in range(10)]
+    records += [dict(record) for record in _quiet(list, sim.iter_years())]
+    assert sim.next_year == 40 and sim.stop_reason is None
+    pd.testing.assert_frame_equal(pd.DataFrame(records).astype(expected.dtypes), expected)
+
+    # A finished simulation returns its recorded years without stepping further
+    pd.testing.assert_frame_equal(_quiet(sim.run_simulation), expected)
+    assert sim.next_year == 40
+
+
+def test_stop_conditions_end_runs_early():
+    """Runs stop after the first year a condition holds, and record why"""
+    np.random.seed(4)
+    full = _quiet(GCR_ABM_Simulation(years=120).run_simulation)
+
+    target = float(full["CO2_ppm"].iloc[60])
+    np.random.seed(4)
+    sim = GCR_ABM_Simulation(years=120)
+    condition = TargetReached(target)
+    df = _quiet(sim.run_simulation, stop_conditions=[condition])
+    first = int(np.flatnonzero(full["CO2_ppm"] <= target)[0])
+    assert len(df) == first + 1 and sim.stop_reason is condition
+    pd.testing.assert_frame_equal(df, full.iloc[:first + 1])
+
+    threshold = float(full["Inflation"].quantile(0.5))
+    above = (full["Inflation"] > threshold).to_numpy()
+    streak = np.zeros(len(above), dtype=int)
+    for k, hit in enumerate(above):
+        streak[k] = streak[k - 1] + 1 if hit and k > 0 else int(hit)
+    np.random.seed(4)
+    df = _quiet(GCR_ABM_Simulation(years=120).run_simulation,
+                stop_conditions=[SustainedAbove("Inflation", threshold, years=2)])
+    assert len(df) == int(np.flatnonzero(streak >= 2)[0]) + 1
+
+    # Floor breach: consecutive years below the floor net of tolerance; GOVT records never breach
+    breach = FloorBreach(tolerance=0.05, years=2)
+    prices = [100.0, 94.0, 96.0, 94.0, 90.0]
+    hits = [breach({"Market_Price": p, "Price_Floor": 100.0}) for p in prices]
+    assert hits == [False, False, False, False, True]
+    assert FloorBreach()({"Market_Price": 0.0, "Price_Floor": 100.0}) is False
+
+
+def test_stop_conditions_reset_between_runs():
+    """A SustainedAbove instance starts counting afresh in each run"""
+    condition = SustainedAbove("Inflation", -1.0, years=3)
+    for _ in range(2):
+        np.random.seed(1)
+        sim = GCR_ABM_Simulation(years=20)
+        df = _quiet(sim.run_simulation, stop_conditions=[condition])
+        assert len(df) == 3 and sim.next_year == 3
+
+
+def test_results_recorder_schema():
+    """Output columns follow the declared schema and share the recorder's memory"""
+    np.random.seed(2)
+    sim = GCR_ABM_Simulation(years=12)
+    df = _quiet(sim.run_simulation)
+    assert list(df.columns) == [name for name, _ in RESULT_SCHEMA]
+    assert all(df[name].dtype == np.dtype(dtype) for name, dtype in RESULT_SCHEMA)
+    assert np.shares_memory(df["CO2_ppm"].to_numpy(), sim.results.columns["CO2_ppm"])
+    assert len(df) == len(sim.results) == 12
+
+    # Rows beyond the preallocated length grow the columns
+    recorder = ResultsRecorder(2, schema=(("Year", np.int32), ("CO2_ppm", np.float64)))
+    for year in range(5):
+        i = recorder.new_row()
+        recorder.columns["Year"][i] = year
+        recorder.columns["CO2_ppm"][i] = 400.0 - year
+    assert recorder.row(4)["CO2_ppm"] == 396.0 and dict(recorder.row(1)) == {"Year": 1, "CO2_ppm": 399.0}
+    assert recorder.to_frame()["Year"].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_output_profiles():
+    """Reduced profiles record a subset of the full output with identical values"""
+    np.random.seed(6)
+    full = _quiet(GCR_ABM_Simulation(years=30).run_simulation)
+
+    for profile in ("metrics-only", "dashboard", ["CO2_ppm", "CDR_Cost_Per_Tonne"]):
+        np.random.seed(6)
+        df = _quiet(GCR_ABM_Simulation(years=30, output_profile=profile).run_simulation)
+        assert "Year" in df.columns and len(df.columns) < len(full.columns)
+        pd.testing.assert_frame_equal(df, full[df.columns])
+
+    np.random.seed(6)
+    sim = GCR_ABM_Simulation(years=30, output_profile="metrics-only", record_every=4)
+    df = _quiet(sim.run_simulation)
+    assert df["Year"].tolist() == [0, 4, 8, 12, 16, 20, 24, 28, 29]
+    expected = full.loc[full["Year"].isin(df["Year"]), df.columns].reset_index(drop=True)
+    pd.testing.assert_frame_equal(df, expected)
+
+    with pytest.raises(ValueError):
+        GCR_ABM_Simulation(years=5, output_profile="everything")
+    with pytest.raises(ValueError):
+        GCR_ABM_Simulation(years=5, output_profile=["Not_A_Column"])
+    with pytest.raises(RuntimeError):
+        sim.set_output_profile("full")
+
+
+def test_snapshot_restore_and_fork():
+    """Restored snapshots and forks continue exactly like the original run"""
+    np.random.seed(8)
+    expected = _quiet(GCR_ABM_Simulation(years=40).run_simulation)
+
+    np.random.seed(8)
+    sim = GCR_ABM_Simulation(years=40)
+    for _ in range(15):
+        _quiet(sim.step_year)
+    blob = sim.snapshot()
+    branch = sim.fork()
+
+    pd.testing.assert_frame_equal(_quiet(sim.run_simulation), expected)
+
+    # Forks and snapshots carry the random streams of the branch point
+    pd.testing.assert_frame_equal(_quiet(branch.run_simulation), expected)
+    pd.testing.assert_frame_equal(_quiet(GCR_ABM_Simulation.from_snapshot(blob).run_simulation), expected)
+
+    # Changing a fork leaves its parent untouched
+    np.random.seed(8)
+    parent = GCR_ABM_Simulation(years=40)
+    for _ in range(10):
+        _quiet(parent.step_year)
+    child = parent.fork()
+    child.central_bank.cqe_ratio = 0.01
+    _quiet(child.step_year)
+    assert parent.next_year == 10 and child.next_year == 11
+    assert parent.central_bank.cqe_ratio == 0.05
+    assert len(parent.results) == 10 and parent.projects_broker.projects is not child.projects_broker.projects
+
+    with pytest.raises(ValueError):
+        parent.restore(pickle.dumps({"version": 0}))
+
+
+def test_event_log():
+    """Events are typed, filtered by level, bounded, and returned with the results"""
+    np.random.seed(1)
+    sim = GCR_ABM_Simulation(years=30)
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        df, events = sim.run_simulation(return_events=True)
+    assert out.getvalue() == ""
+    assert list(events.columns) == EVENT_COLUMNS
+    adoptions = events[events["Event"] == "adoption"]
+    for year, data in zip(adoptions["Year"], adoptions["Data"]):
+        assert sim.countries[data["country"]]["adoption_year"] == year
+    assert adoptions["Data"].map(lambda d: d["country"]).is_unique
+    assert (events.loc[events["Event"] == "policy_revision", "Year"] % sim.cea.revision_interval == 0).all()
+
+    # Silent and filtered runs keep the same results
+    np.random.seed(1)
+    quiet = GCR_ABM_Simulation(years=30, event_level=None)
+    pd.testing.assert_frame_equal(_quiet(quiet.run_simulation), df)
+    assert len(quiet.events) == 0 and quiet.events.recorded == 0
+
+    log = EventLog(level="warning", capacity=2)
+    assert not log.enabled(EventType.ADOPTION) and log.enabled(EventType.NET_ZERO)
+    for year in range(3):
+        log.record(year, EventType.NET_ZERO, "net zero", ratio=1.0)
+    assert log.recorded == 3 and log.to_frame()["Year"].tolist() == [1, 2]
+
+    with pytest.raises(ValueError):
+        EventLog(level="verbose")
+
+
+def test_seeded_random_streams():
+    """A seed fixes the run whatever the global NumPy state or thread layout"""
+    def run(seed):
+        sim = GCR_ABM_Simulation(years=30, output_profile="metrics-only", seed=seed)
+        return _quiet(sim.run_simulation)
+
+    np.random.seed(0)
+    expected = [run(seed) for seed in (10, 11, 12)]
+    np.random.seed(99)
+    pd.testing.assert_frame_equal(run(11), expected[1])
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        for df, reference in zip(pool.map(run, (10, 11, 12)), expected):
+            pd.testing.assert_frame_equal(df, reference)
+    assert not expected[0].equals(expected[1])
+
+    # Agents draw from separate child streams of one SeedSequence
+    sim = GCR_ABM_Simulation(years=5, seed=np.random.SeedSequence(3))
+    streams = [sim.rng, sim.projects_broker.rng, sim.projects_broker.projects.rng, sim.auditor.rng]
+    assert len({id(rng) for rng in streams}) == len(streams)
+    assert len({rng.random() for rng in streams}) == len(streams)
+
+    # Without a seed, np.random.seed() still reproduces runs
+    np.random.seed(5)
+    first = run(None)
+    np.random.seed(5)
+    pd.testing.assert_frame_equal(run(None), first)
+
+
+def test_common_random_numbers():
+    """Scenarios on one seed share exogenous events and difference with less noise"""
+    def run(seed, price_floor=100.0, **kwargs):
+        sim = GCR_ABM_Simulation(years=30, seed=seed, price_floor=price_floor,
+                                 common_random_numbers=True, **kwargs)
+        _quiet(sim.run_simulation)
+        return sim
+
+    low, high = run(3, price_floor=80.0), run(3, price_floor=120.0)
+    for kind in ("adoption", "shock"):
+        a, b = (sim.events.to_frame() for sim in (low, high))
+        a, b = a[a["Event"] == kind], b[b["Event"] == kind]
+        assert a["Year"].tolist() == b["Year"].tolist() and a["Message"].tolist() == b["Message"].tolist()
+
+    # Draws are keyed by slot, so the vectorized and scalar stepping paths agree
+    sim = GCR_ABM_Simulation(years=30, seed=3, common_random_numbers=True)
+    sim.projects_broker.vectorized_stepping = False
+    scalar = _quiet(sim.run_simulation)
+    vectorized = _quiet(GCR_ABM_Simulation(years=30, seed=3, common_random_numbers=True).run_simulation)
+    pd.testing.assert_frame_equal(scalar, vectorized, check_exact=False)
+
+    # Antithetic streams mirror every uniform and normal
+    crn, mirror = CommonRandomNumbers(5), CommonRandomNumbers(5, antithetic=True)
+    slots = np.arange(8)
+    np.testing.assert_allclose(crn.uniforms("decay", slots, width=2) + mirror.uniforms("decay", slots, width=2), 1.0)
+    np.testing.assert_allclose(crn.normals("inflation_noise", slots), -mirror.normals("inflation_noise", slots))
+    with pytest.raises(ValueError):
+        GCR_ABM_Simulation(years=5, antithetic=True)
+
+    # Paired differences are tighter than those of runs on different seeds
+    kwargs = dict(runs=24, years=40, cache=False)
+    scenarios = ["baseline", "high_bau_emissions"]
+    paired = _paired_differences(_quiet(run_stress_suite, seed=20, scenario_filter=scenarios,
+                                        common_random_numbers=True, **kwargs))
+    independent = _paired_differences(pd.concat([
+        _quiet(run_stress_suite, seed=20, scenario_filter=scenarios[:1], **kwargs),
+        _quiet(run_stress_suite, seed=10_020, scenario_filter=scenarios[1:], **kwargs),
+    ]))
+    for metric in ("final_co2", "total_xcr_minted"):
+        stderr = [frame.loc[frame["metric"] == metric, "stderr"].iloc[0] for frame in (paired, independent)]
+        assert stderr[0] < 0.8 * stderr[1]
+    kwargs = dict(runs=6, years=20, seed=20, scenario_filter=scenarios, cache=False)
+    antithetic = _quiet(run_stress_suite, antithetic=True, **kwargs)
+    assert antithetic["pair"].tolist()[:6] == [0, 0, 1, 1, 2, 2]
+
+
+def test_country_registry():
+    """Countries live in registry columns over the shared table; active totals track adoption"""
+    assert len(COUNTRY_TABLE) == 54 and set(FOUNDING_COUNTRIES) <= set(COUNTRY_TABLE)
+    with pytest.raises(TypeError):
+        COUNTRY_TABLE["USA"]["gdp_tril"] = 1.0
+
+    np.random.seed(3)
+    sim = GCR_ABM_Simulation(years=30)
+    registry = sim.all_countries
+    assert list(sim.countries) == list(FOUNDING_COUNTRIES)
+    for name, country in registry.items():
+        assert {key: country[key] for key in COUNTRY_TABLE[name]} == COUNTRY_TABLE[name]
+    _quiet(sim.run_simulation)
+
+    # Active countries iterate in adoption order; totals match a fresh sum
+    years = [sim.countries[name]["adoption_year"] for name in sim.countries]
+    assert len(sim.countries) > len(FOUNDING_COUNTRIES) and years == sorted(years)
+    assert registry.active_gdp_tril == sum(country["gdp_tril"] for country in sim.countries.values())
+    assert "China" in registry and ("China" in sim.countries) == registry["China"]["active"]
+    purchased = registry.xcr_purchased_equiv.copy()
+    registry.attribute_cqe_purchase(1000.0)
+    added = registry.xcr_purchased_equiv - purchased
+    assert np.isclose(added.sum(), 1000.0) and (added[~registry.active_mask] == 0).all()
+    with pytest.raises(TypeError):
+        registry["USA"]["gdp_tril"] = 1.0
+    with pytest.raises(TypeError):
+        registry["USA"]["active"] = False
+
+    # Reference columns are shared read-only arrays; per-run state is fresh
+    fresh = GCR_ABM_Simulation(years=30)
+    assert fresh.all_countries.gdp_tril is registry.gdp_tril and not registry.gdp_tril.flags.writeable
+    assert list(fresh.countries) == list(FOUNDING_COUNTRIES)
+    assert all(country["xcr_earned"] == 0.0 and not country["projects"] for country in fresh.all_countries.values())
+    assert not np.shares_memory(fresh.all_countries.xcr_earned, registry.xcr_earned)
+
+
+def test_observer_hooks():
+    """Hooks fire in phase order every year, see the phase state, and leave results unchanged"""
+    expected = _quiet(GCR_ABM_Simulation(years=12, seed=5).run_simulation)
+
+    sim = GCR_ABM_Simulation(years=12, seed=5)
+    fired = []
+    for hook in HOOK_POINTS:
+        sim.observe(hook, lambda sim, year, state, hook=hook: fired.append((year, hook)))
+    minted = []
+    sim.observe("after_audit_mint", lambda sim, year, state: minted.append(state["xcr_minted"]))
+    profiler = PhaseProfiler().attach(sim)
+    pd.testing.assert_frame_equal(_quiet(sim.run_simulation), expected)
+
+    assert fired == [(year, hook) for year in range(12) for hook in HOOK_POINTS]
+    assert minted == expected["XCR_Minted"].tolist()
+    table = profiler.to_frame()
+    assert (table["Calls"] == 12).all() and np.isclose(table["Share"].sum(), 1.0)
+
+    # Unknown hooks are rejected; unobserving the last callback empties the table
+    with pytest.raises(ValueError):
+        sim.observe("after_everything", print)
+    quiet = GCR_ABM_Simulation(years=12, seed=5)
+    callback = lambda sim, year, state: None
+    quiet.observe("before_cqe", callback)
+    quiet.unobserve("before_cqe", callback)
+    assert quiet._hooks == {}
+
+    # Observers belong to one simulation object, not to its state
+    branch = sim.fork()
+    restored = GCR_ABM_Simulation.from_snapshot(sim.snapshot())
+    assert branch._hooks == {} and restored._hooks == {} and sim._hooks
+
+
+def test_memoized_bau_trajectory():
+    """BAU columns equal the stepped cycle's, and a diverging BAU flow continues from the shared path"""
+    def run(memoize, setup=None):
+        sim = GCR_ABM_Simulation(years=30, seed=8)
+        sim.memoize_bau = memoize
+        if setup is not None:
+            setup(sim)
+        return sim, _quiet(sim.run_simulation)
+
+    clear_bau_cache()
+    sim, memoized = run(True)
+    _, stepped = run(False)
+    pd.testing.assert_frame_equal(memoized, stepped)
+    assert sim.bau_carbon_cycle.years_elapsed == 0  # Never stepped
+    assert sim._bau_path is run(True)[0]._bau_path  # One path per settings, shared across runs
+
+    # Lowering the BAU flow mid-run (as the post-net-zero ratchet does) switches to stepping
+    def halve_bau(sim):
+        sim.observe("after_climate", lambda sim, year, state: year == 12 and setattr(
+            sim, "bau_emissions_gt_per_year", sim.bau_emissions_gt_per_year / 2))
+    diverged, diverged_frame = run(True, halve_bau)
+    _, stepped = run(False, halve_bau)
+    pd.testing.assert_frame_equal(diverged_frame, stepped)
+    assert diverged._bau_path is None and diverged.bau_carbon_cycle.years_elapsed == 30
+    assert not np.allclose(diverged_frame["BAU_CO2_ppm"], memoized["BAU_CO2_ppm"])
+
+    # Other settings get their own path; trajectories round-trip through the disk cache
+    _, higher = run(True, lambda sim: setattr(sim, "bau_emissions_gt_per_year", 50.0))
+    assert (higher["BAU_CO2_ppm"].iloc[1:] > memoized["BAU_CO2_ppm"].iloc[1:]).all()
+    with tempfile.TemporaryDirectory() as directory:
+        args = (sim.carbon_cycle.params, 30, 420.0, 40.0, 6, 0.01, 60, 0.0, -0.002, 1.0)
+        clear_bau_cache()
+        computed = bau_trajectory(*args, cache_dir=directory)
+        assert len(os.listdir(directory)) == 1
+        clear_bau_cache()
+        loaded = bau_trajectory(*args, cache_dir=directory)
+        assert loaded is not computed
+        np.testing.assert_array_equal(loaded.states, computed.states)
+
+
+if __name__ == "__main__":
+    test_step_year_matches_run_simulation()
+    test_stop_conditions_end_runs_early()
+    test_stop_conditions_reset_between_runs()
+    test_results_recorder_schema()
+    test_output_profiles()
+    test_snapshot_restore_and_fork()
+    test_event_log()
+    test_seeded_random_streams()
+    test_common_random_numbers()
+    test_country_registry()
+    test_observer_hooks()
+    test_memoized_bau_trajectory()
+    print("✓ Simulation step API tests passed")